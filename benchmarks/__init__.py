@@ -0,0 +1,13 @@
+"""Benchmarks for gwbase — not shipped in the wheel.
+
+Run from the repo root::
+
+    uv run python -m benchmarks actors --out actors.json
+    uv run python -m benchmarks codec --out codec.json
+    uv run python -m benchmarks compare baseline.json actors.json
+
+Every suite writes one machine-readable JSON document (see ``report``);
+``compare`` diffs two of them and exits non-zero on a regression beyond the
+threshold, so a transport change can be judged against a stored baseline
+before it reaches the fleet.
+"""
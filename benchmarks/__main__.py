@@ -0,0 +1,59 @@
+"""``python -m benchmarks <suite> ...`` — see ``benchmarks/__init__.py``."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from benchmarks import actors, codec
+from benchmarks.report import compare_reports, print_comparison
+
+
+def _compare(args: argparse.Namespace) -> int:
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    if baseline.get("Suite") != current.get("Suite"):
+        print(
+            f"suite mismatch: {baseline.get('Suite')!r} vs {current.get('Suite')!r}",
+            file=sys.stderr,
+        )
+        return 2
+    deltas = compare_reports(baseline, current)
+    if not deltas:
+        print("no metrics in common", file=sys.stderr)
+        return 2
+    return 1 if print_comparison(deltas, args.threshold) else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    sub = parser.add_subparsers(dest="suite", required=True)
+
+    p = sub.add_parser("actors", help="actor-tier throughput and latency")
+    actors.add_arguments(p)
+    p.set_defaults(func=actors.main)
+
+    p = sub.add_parser("codec", help="per-type GwBaseSemaCodec cost")
+    codec.add_arguments(p)
+    p.set_defaults(func=codec.main)
+
+    p = sub.add_parser("compare", help="diff two reports; exit 1 on regression")
+    p.add_argument("baseline", type=Path)
+    p.add_argument("current", type=Path)
+    p.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="fractional worsening that counts as a regression (default 0.10)",
+    )
+    p.set_defaults(func=_compare)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
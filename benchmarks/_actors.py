@@ -0,0 +1,330 @@
+"""Bench actors for the three tiers and the fabric that starts them.
+
+The bench actors are thin: every application delivery is handed to a
+``Sink`` (a counter + latency recorder that the driving thread waits on).
+They run on either broker:
+
+- ``loopback`` — ``gwbase.loopback.LoopbackBroker``, in-process, no RabbitMQ.
+  Measures the actor tiers' own cost (routing-key parse, dispatch, codec,
+  ioloop hand-offs) with the network taken out.
+- ``rabbit`` — a real broker at ``--url``; the topology is provisioned from
+  ``gwbase.topology`` before any actor starts, as dev/prod do.
+"""
+
+import json
+import struct
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pika
+from pydantic import SecretStr
+
+from gwbase import topology
+from gwbase.actor_base import ActorBase, ConnectionFactory
+from gwbase.config import GNodeSettings, ServiceSettings
+from gwbase.config.rabbit_settings import RabbitBrokerClient
+from gwbase.gridworks_actor import GridworksActor
+from gwbase.loopback import LoopbackBroker
+from gwbase.orchestrator import Orchestrator
+from gwbase.transport_encoding import RoutingEnvelope, TransportClass
+
+BROKERS = ("loopback", "rabbit")
+
+# Application traffic type: NOT a control-plane type, so Orchestrator
+# forwards it straight to process_message without decoding.
+BENCH_TYPE_NAME = "bench.payload"
+
+# Every one-way bench body starts with (seq, perf_counter_ns at send).
+_STAMP = struct.Struct(">QQ")
+
+
+def stamped_body(seq: int, payload_bytes: int) -> bytes:
+    """A bench body of at least ``payload_bytes`` carrying its send time."""
+    pad = max(0, payload_bytes - _STAMP.size)
+    return _STAMP.pack(seq, time.perf_counter_ns()) + b"\x00" * pad
+
+
+class Sink:
+    """Thread-safe delivery counter the driving thread waits on.
+
+    ``arm(n)`` resets it and sets the target; the ioloop thread calls the
+    sink per delivery; ``wait`` returns once ``n`` deliveries have landed.
+    With ``stamped=True`` each body's embedded send time yields a one-way
+    latency sample.
+    """
+
+    def __init__(self, *, stamped: bool) -> None:
+        self.stamped = stamped
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._target = 0
+        self.count = 0
+        self.samples_ns: list[int] = []
+
+    def arm(self, target: int) -> None:
+        with self._lock:
+            self._target = target
+            self.count = 0
+            self.samples_ns = []
+            self._done.clear()
+
+    def __call__(self, envelope: RoutingEnvelope, body: bytes) -> None:
+        now = time.perf_counter_ns()
+        with self._lock:
+            if self.stamped:
+                _, sent_ns = _STAMP.unpack_from(body)
+                self.samples_ns.append(now - sent_ns)
+            self.count += 1
+            if self._target and self.count >= self._target:
+                self._done.set()
+
+    def wait(self, timeout_s: float) -> bool:
+        return self._done.wait(timeout_s)
+
+
+AppCallback = Callable[[RoutingEnvelope, bytes], None]
+Binder = Callable[[ActorBase], None]
+
+
+class _BenchMixin:
+    """Shared by the three bench tiers: forward application traffic to
+    ``on_app`` and run the scenario's bindings once the queue exists."""
+
+    def _init_bench(
+        self, on_app: AppCallback | None, bindings: list[Binder] | None
+    ) -> None:
+        self.on_app: AppCallback | None = on_app
+        self.bindings: list[Binder] = bindings or []
+
+    def local_rabbit_startup(self) -> None:
+        for bind in self.bindings:
+            bind(self)  # type: ignore[arg-type]
+
+    def process_message(self, *, envelope: RoutingEnvelope, body: bytes) -> None:
+        if self.on_app is not None:
+            self.on_app(envelope, body)
+
+
+class BenchTap(_BenchMixin, ActorBase):
+    """An ``ActorBase`` ear-tap; its bindings pick the slice it consumes."""
+
+    def __init__(
+        self,
+        *,
+        settings: ServiceSettings,
+        on_app: AppCallback | None = None,
+        bindings: list[Binder] | None = None,
+        connection_factory: ConnectionFactory | None = None,
+    ):
+        super().__init__(settings=settings, connection_factory=connection_factory)
+        self._init_bench(on_app, bindings)
+
+    def dispatch_message(self, *, envelope: RoutingEnvelope, body: bytes) -> None:
+        self.process_message(envelope=envelope, body=body)
+
+
+class BenchOrchestrator(_BenchMixin, Orchestrator):
+    """A non-GNode ``Orchestrator`` (Supervisor, TimeCoordinator, ...)."""
+
+    def __init__(  # noqa: PLR0913 — the tier's own keywords plus bench hooks
+        self,
+        *,
+        settings: ServiceSettings,
+        transport_class: TransportClass,
+        my_super_alias: str,
+        my_time_coordinator_alias: str,
+        on_app: AppCallback | None = None,
+        bindings: list[Binder] | None = None,
+        connection_factory: ConnectionFactory | None = None,
+    ):
+        super().__init__(
+            settings=settings,
+            transport_class=transport_class,
+            my_super_alias=my_super_alias,
+            my_time_coordinator_alias=my_time_coordinator_alias,
+            connection_factory=connection_factory,
+        )
+        self._init_bench(on_app, bindings)
+
+
+class BenchGNode(_BenchMixin, GridworksActor):
+    """A ``GridworksActor`` with a real, Sema-validated g.node.gt.json.
+
+    ``ready_on_timestep`` makes it answer every new simulated timestep with
+    ``sim.ready`` — the time coordinator's fan-out/fan-in rhythm.
+    """
+
+    def __init__(  # noqa: PLR0913 — the tier's own keywords plus bench hooks
+        self,
+        *,
+        settings: GNodeSettings,
+        transport_class: TransportClass,
+        my_super_alias: str,
+        my_time_coordinator_alias: str,
+        on_app: AppCallback | None = None,
+        bindings: list[Binder] | None = None,
+        ready_on_timestep: bool = False,
+        connection_factory: ConnectionFactory | None = None,
+    ):
+        super().__init__(
+            settings=settings,
+            transport_class=transport_class,
+            my_super_alias=my_super_alias,
+            my_time_coordinator_alias=my_time_coordinator_alias,
+            connection_factory=connection_factory,
+        )
+        self._init_bench(on_app, bindings)
+        self.ready_on_timestep = ready_on_timestep
+
+    def on_simulated_time(
+        self, *, time_unix_s: int, from_alias: str, is_new: bool
+    ) -> None:
+        if self.ready_on_timestep and is_new:
+            self.send_ready()
+
+
+# ---------------------------------------------------------------------------
+# Fabric: broker + actor construction + lifecycle
+# ---------------------------------------------------------------------------
+
+
+def provision_rabbit(url: str) -> None:
+    """Declare every exchange + binding from ``gwbase.topology`` on a live
+    broker. Actors only passively assert their consume exchange, so this
+    must run before any of them start."""
+    conn = pika.BlockingConnection(pika.URLParameters(url))
+    try:
+        ch = conn.channel()
+        for ex in topology.exchanges():
+            ch.exchange_declare(
+                exchange=ex.name,
+                exchange_type=ex.exchange_type,
+                durable=ex.durable,
+                internal=ex.internal,
+            )
+        for b in topology.exchange_bindings():
+            ch.exchange_bind(
+                destination=b.destination, source=b.source, routing_key=b.routing_key
+            )
+    finally:
+        conn.close()
+
+
+class Fabric:
+    """Builds bench actors wired to one broker and tears them all down.
+
+    Use as a context manager; ``start`` waits until every actor consumes
+    and its scenario bindings have landed.
+    """
+
+    def __init__(self, *, broker: str, url: str, workdir: Path) -> None:
+        if broker not in BROKERS:
+            raise ValueError(f"broker must be one of {BROKERS}, got {broker!r}")
+        self.broker_name = broker
+        self.workdir = workdir
+        self._rabbit = RabbitBrokerClient(url=SecretStr(url))
+        self.loopback: LoopbackBroker | None = None
+        if broker == "loopback":
+            self.loopback = LoopbackBroker.provisioned()
+        else:
+            provision_rabbit(url)
+        self._actors: list[ActorBase] = []
+
+    @property
+    def connection_factory(self) -> ConnectionFactory | None:
+        return self.loopback.connect if self.loopback is not None else None
+
+    def _service_settings(self, alias: str) -> ServiceSettings:
+        return ServiceSettings(service_alias=alias, rabbit=self._rabbit)
+
+    def _gnode_settings(self, alias: str, g_node_class: str) -> GNodeSettings:
+        path = self.workdir / f"{alias}.g.node.gt.json"
+        path.write_text(
+            json.dumps({
+                "GNodeId": str(uuid.uuid4()),
+                "Alias": alias,
+                "GNodeClass": g_node_class,
+                "BaseClass": g_node_class,
+                "PositionPointId": str(uuid.uuid4()),
+                "Status": "Active",
+                "TypeName": "g.node.gt",
+                "Version": "004",
+            })
+        )
+        return GNodeSettings(service_alias=alias, g_node_path=path, rabbit=self._rabbit)
+
+    def tap(self, alias: str, **kwargs) -> BenchTap:
+        actor = BenchTap(
+            settings=self._service_settings(alias),
+            connection_factory=self.connection_factory,
+            **kwargs,
+        )
+        self._actors.append(actor)
+        return actor
+
+    def orchestrator(self, alias: str, **kwargs) -> BenchOrchestrator:
+        actor = BenchOrchestrator(
+            settings=self._service_settings(alias),
+            connection_factory=self.connection_factory,
+            **kwargs,
+        )
+        self._actors.append(actor)
+        return actor
+
+    def gnode(
+        self, alias: str, *, g_node_class: str = "LeafTransactiveNode", **kwargs
+    ) -> BenchGNode:
+        actor = BenchGNode(
+            settings=self._gnode_settings(alias, g_node_class),
+            connection_factory=self.connection_factory,
+            **kwargs,
+        )
+        self._actors.append(actor)
+        return actor
+
+    def start(self, timeout_s: float = 10.0) -> None:
+        for actor in self._actors:
+            actor.start()
+        deadline = time.monotonic() + timeout_s
+        while not all(a.consuming for a in self._actors):
+            if time.monotonic() > deadline:
+                raise TimeoutError("bench actors did not start consuming")
+            time.sleep(0.005)
+        self.settle()
+
+    def settle(self) -> None:
+        """Let in-flight traffic and pending bindings drain."""
+        if self.loopback is not None:
+            self.loopback.wait_idle()
+        else:
+            time.sleep(0.25)
+
+    def close(self) -> None:
+        for actor in self._actors:
+            actor.stop()
+        self._actors.clear()
+
+    @contextmanager
+    def running(self) -> Iterator["Fabric"]:
+        self.start()
+        try:
+            yield self
+        finally:
+            self.close()
+
+
+def prime(send: Callable[[], object], sink: Sink, timeout_s: float) -> None:
+    """Send until one message lands — bindings made in
+    ``local_rabbit_startup`` are asynchronous on a real broker."""
+    sink.arm(1)
+    deadline = time.monotonic() + timeout_s
+    while True:
+        send()
+        if sink.wait(0.05):
+            return
+        if time.monotonic() > deadline:
+            raise TimeoutError("no bench traffic reached the receiver")
@@ -0,0 +1,363 @@
+"""Per-type cost of ``GwBaseSemaCodec`` and the ``gw`` envelope helpers.
+
+For every sample in ``benchmarks.samples`` (every type in
+``gwbase.sema.types.__all__``) this times, in ns/op:
+
+- ``ToBytesNs``            ``codec.to_bytes``
+- ``FromBytesNs``          ``codec.from_bytes`` (strict, current version)
+- ``FromBytesTrustedNs``   ``codec.from_bytes`` from a sender whose
+                           ``ValidationPolicy`` rule is ``never`` (built by
+                           ``trusted_from_dict`` where the type allows it)
+- ``BinaryBytes``, ``ToBinaryNs`` / ``FromBinaryNs``  ``codec.to_binary`` /
+                           ``codec.from_binary`` (the ``s`` category's body)
+- ``LazyFieldNs``          ``codec.from_bytes_lazy`` and a read of the first
+                           non-header field (what a pass-through tap pays)
+- ``PeekTypeNs``           ``peek_type`` (TypeName/Version only)
+- ``ProjectNs``            ``project`` of the index fields (``INDEX_FIELDS``)
+- ``FromDictStrictNs``     ``codec.from_dict`` on an already-parsed dict
+- ``FromDictDegradedNs``   ``codec.from_dict(mode="degraded")`` on the same
+                           body at an unknown version with an extra field
+- ``WrapBytesNs`` / ``UnwrapBytesNs``  the sample as a ``gw`` inner payload
+- ``WrapEncodedNs``        ``wrap_encoded`` of the sample's ``to_bytes``
+                           (header template cached)
+- ``UnwrapViewNs``         ``unwrap_view`` of the same envelope (the payload
+                           checked, not decoded)
+- ``DecodeWrappedNs``      ``codec.decode_wrapped`` of the same envelope
+                           (header and typed payload)
+- ``ProjectWrappedNs``     ``project`` of the same envelope's ``Header``
+                           index fields (``WRAPPED_INDEX_FIELDS``)
+
+and splits ``from_bytes`` into the stages it runs for the sample
+(``Stages``): ``ScanTypeNs`` (``scan_type``, TypeName/Version from the
+bytes), then ``ValidateJsonNs`` (the compiled ``validate_json``) where the
+type validates straight from JSON, else ``JsonParseNs`` (the JSON backend)
+and ``FromDictNs`` (``from_dict``); ``DispatchNs`` is whatever is left
+(registry lookup, version check, calls). ``Share`` gives each stage as a
+fraction of ``FromBytesNs``. The samples are current versions, so the
+upgrade stage is timed by ``upgrade`` below.
+
+``formats`` times each ``gwbase.sema.property_format`` check on a valid
+value (``<Check>Ns``): they run once per field of every decode.
+
+``upgrade`` times old-version decode through a synthetic three-step chain
+(``bench.upgrade`` 000 -> 003) injected into a private codec, since the
+shipped tree has no old versions yet.
+
+The decode paths that parse to a dict first use the JSON backend of
+``--json-backend`` (see ``gwbase.sema.json_backend``); run once per backend
+and ``compare`` the reports to choose one.
+
+Each figure is the best of ``--repeat`` runs of an auto-sized loop (the
+``timeit`` convention: the minimum is the least noisy estimate).
+"""
+
+import argparse
+import json
+import logging
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Literal
+
+from benchmarks.report import build_report, write_report
+from benchmarks.samples import sample_instances
+from gwbase.sema import (
+    GwBaseSemaCodec,
+    GwBaseSemaType,
+    ValidationPolicy,
+    ValidationRule,
+    default_registry,
+    json_backend,
+    peek_type,
+    project,
+    property_format,
+)
+from gwbase.sema.codec import logger as codec_logger
+from gwbase.sema.peek import scan_type
+from gwbase.sema.wrapped import unwrap_bytes, unwrap_view, wrap_bytes, wrap_encoded
+
+# what a journal indexer reads from each stored body
+INDEX_FIELDS = ["TypeName", "Version", "MessageId", "FromGNodeAlias", "TimeUnixS"]
+WRAPPED_INDEX_FIELDS = [
+    "TypeName",
+    "Header.MessageType",
+    "Header.MessageId",
+    "Header.Src",
+]
+
+
+def time_ns(fn: Callable[[], object], *, min_time_s: float, repeat: int) -> float:
+    """Best-of-``repeat`` ns per call, each run sized to ``min_time_s``."""
+    number = 1
+    while True:
+        t0 = time.perf_counter_ns()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter_ns() - t0
+        if elapsed >= min_time_s * 1e9:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter_ns()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter_ns() - t0) / number)
+    return round(best, 1)
+
+
+@contextmanager
+def _quiet_codec_logger():
+    """Degraded decode warns (rate-limited per TypeName/Version). Keep
+    paying for whatever it emits (part of the path) but don't print it."""
+    handler = logging.NullHandler()
+    propagate = codec_logger.propagate
+    codec_logger.addHandler(handler)
+    codec_logger.propagate = False
+    try:
+        yield
+    finally:
+        codec_logger.removeHandler(handler)
+        codec_logger.propagate = propagate
+
+
+# ---------------------------------------------------------------------------
+# Synthetic upgrade chain
+# ---------------------------------------------------------------------------
+
+
+class BenchUpgrade003(GwBaseSemaType):
+    value: int
+    unit: str
+    note: str | None = None
+    type_name: Literal["bench.upgrade"] = "bench.upgrade"
+    version: Literal["003"] = "003"
+
+
+class BenchUpgrade002(GwBaseSemaType):
+    value: int
+    unit: str
+    type_name: Literal["bench.upgrade"] = "bench.upgrade"
+    version: Literal["002"] = "002"
+
+    def upgrade(self) -> GwBaseSemaType:
+        return BenchUpgrade003(value=self.value, unit=self.unit)
+
+
+class BenchUpgrade001(GwBaseSemaType):
+    value: int
+    type_name: Literal["bench.upgrade"] = "bench.upgrade"
+    version: Literal["001"] = "001"
+
+    def upgrade(self) -> GwBaseSemaType:
+        return BenchUpgrade002(value=self.value, unit="W")
+
+
+class BenchUpgrade000(GwBaseSemaType):
+    value_kw: int
+    type_name: Literal["bench.upgrade"] = "bench.upgrade"
+    version: Literal["000"] = "000"
+
+    def upgrade(self) -> GwBaseSemaType:
+        return BenchUpgrade001(value=self.value_kw * 1000)
+
+
+def upgrade_codec() -> GwBaseSemaCodec:
+    """A private codec that knows ``bench.upgrade`` 000..003."""
+    return GwBaseSemaCodec(
+        registry=default_registry().extended(
+            BenchUpgrade003,
+            old_versions=(BenchUpgrade000, BenchUpgrade001, BenchUpgrade002),
+        )
+    )
+
+
+# ---------------------------------------------------------------------------
+# Suite
+# ---------------------------------------------------------------------------
+
+
+TRUSTED_ALIAS = "d1.isone.ver.keene.holly.scada"
+
+
+def _degraded_variant(d: dict[str, Any]) -> dict[str, Any]:
+    """The same body from a future producer: unknown version, new field."""
+    return {**d, "Version": "999", "FutureField": 1}
+
+
+def bench_sample(
+    codec: GwBaseSemaCodec, obj: GwBaseSemaType, *, min_time_s: float, repeat: int
+) -> dict[str, Any]:
+    def t(fn: Callable[[], object]) -> float:
+        return time_ns(fn, min_time_s=min_time_s, repeat=repeat)
+
+    body = codec.to_bytes(obj)
+    d = json.loads(body)
+    degraded = _degraded_variant(d)
+    cls = type(obj)
+    trusted_codec = GwBaseSemaCodec(
+        codec.sema_registry,
+        validation=ValidationPolicy({("*", TRUSTED_ALIAS): ValidationRule("never")}),
+    )
+
+    from_bytes = t(lambda: codec.from_bytes(body))
+    binary = codec.to_binary(obj)
+    first_field = next(
+        name for name in cls.model_fields if name not in {"type_name", "version"}
+    )
+    # the stages from_bytes runs for this body
+    stages = {"ScanTypeNs": t(lambda: scan_type(body))}
+    if scan_type(body) is not None and cls.compiled_from_json(body) is not None:
+        stages["ValidateJsonNs"] = t(lambda: cls.compiled_from_json(body))
+    else:
+        stages["JsonParseNs"] = t(lambda: json_backend.loads(body.decode("utf-8")))
+        stages["FromDictNs"] = t(lambda: codec.from_dict(d))
+    stages["DispatchNs"] = round(max(0.0, from_bytes - sum(stages.values())), 1)
+
+    result: dict[str, Any] = {
+        "BodyBytes": len(body),
+        "ToBytesNs": t(lambda: codec.to_bytes(obj)),
+        "FromBytesNs": from_bytes,
+        "FromBytesTrustedNs": t(
+            lambda: trusted_codec.from_bytes(body, from_alias=TRUSTED_ALIAS)
+        ),
+        "PeekTypeNs": t(lambda: peek_type(body)),
+        "ProjectNs": t(lambda: project(body, INDEX_FIELDS)),
+        "LazyFieldNs": t(lambda: getattr(codec.from_bytes_lazy(body), first_field)),
+        "FromDictStrictNs": t(lambda: codec.from_dict(d)),
+        "FromDictDegradedNs": t(lambda: codec.from_dict(degraded, mode="degraded")),
+        "BinaryBytes": len(binary),
+        "ToBinaryNs": t(lambda: codec.to_binary(obj)),
+        "FromBinaryNs": t(lambda: codec.from_binary(binary)),
+        "Stages": stages,
+        "Share": {
+            name.removesuffix("Ns"): round(ns / from_bytes, 3)
+            for name, ns in stages.items()
+        },
+    }
+    if obj.type_name != "gw":
+        wrapped = wrap_bytes(
+            src="d1.isone.ver.keene.holly.scada",
+            dst="d1.isone.ver.keene.holly.ta",
+            inner_type_name=obj.type_name,
+            inner_payload_dict=d,
+        )
+        result["WrapBytesNs"] = t(
+            lambda: wrap_bytes(
+                src="d1.isone.ver.keene.holly.scada",
+                dst="d1.isone.ver.keene.holly.ta",
+                inner_type_name=obj.type_name,
+                inner_payload_dict=d,
+            )
+        )
+        result["WrapEncodedNs"] = t(
+            lambda: wrap_encoded(
+                src="d1.isone.ver.keene.holly.scada",
+                dst="d1.isone.ver.keene.holly.ta",
+                inner_type_name=obj.type_name,
+                inner_bytes=body,
+            )
+        )
+        result["UnwrapBytesNs"] = t(lambda: unwrap_bytes(wrapped))
+        result["UnwrapViewNs"] = t(lambda: unwrap_view(wrapped))
+        result["DecodeWrappedNs"] = t(lambda: codec.decode_wrapped(wrapped))
+        result["ProjectWrappedNs"] = t(lambda: project(wrapped, WRAPPED_INDEX_FIELDS))
+    return result
+
+
+def bench_upgrade(*, min_time_s: float, repeat: int) -> dict[str, Any]:
+    codec = upgrade_codec()
+    current = BenchUpgrade003(value=5000, unit="W").to_dict()
+    one_step = BenchUpgrade002(value=5000, unit="W").to_dict()
+    three_steps = BenchUpgrade000(value_kw=5).to_dict()
+    if codec.from_dict(three_steps) != codec.from_dict(current):
+        raise RuntimeError("bench.upgrade chain does not reach the current version")
+
+    def t(fn: Callable[[], object]) -> float:
+        return time_ns(fn, min_time_s=min_time_s, repeat=repeat)
+
+    return {
+        "CurrentNs": t(lambda: codec.from_dict(current)),
+        "OneStepNs": t(lambda: codec.from_dict(one_step)),
+        "ThreeStepsNs": t(lambda: codec.from_dict(three_steps)),
+        "ThreeStepsNoUpgradeNs": t(
+            lambda: codec.from_dict(three_steps, auto_upgrade=False)
+        ),
+    }
+
+
+def bench_formats(*, min_time_s: float, repeat: int) -> dict[str, Any]:
+    def t(fn: Callable[[], object]) -> float:
+        return time_ns(fn, min_time_s=min_time_s, repeat=repeat)
+
+    uuid4 = "a5e9ab0b-4a55-47e6-b3b6-3e5ad5d0f1c2"
+    return {
+        "HexCharNs": t(lambda: property_format.is_hex_char("a")),
+        "LeftRightDotNs": t(
+            lambda: property_format.is_left_right_dot("d1.isone.ver.keene.holly")
+        ),
+        "UTCMillisecondsNs": t(
+            lambda: property_format.is_utc_milliseconds(1_700_000_000_000)
+        ),
+        "UTCSecondsNs": t(lambda: property_format.is_utc_seconds(1_700_000_000)),
+        "UUID4StrNs": t(lambda: property_format.is_uuid4_str(uuid4)),
+    }
+
+
+def run(
+    *,
+    min_time_s: float = 0.2,
+    repeat: int = 5,
+    only: list[str] | None = None,
+    log: Callable[[str], None] = print,
+) -> dict[str, Any]:
+    codec = GwBaseSemaCodec()
+    results: dict[str, Any] = {}
+    with _quiet_codec_logger():
+        for label, obj in sample_instances().items():
+            if only and label not in only:
+                continue
+            log(f"{label} ...")
+            results[label] = bench_sample(
+                codec, obj, min_time_s=min_time_s, repeat=repeat
+            )
+        if not only or "formats" in only:
+            log("formats ...")
+            results["formats"] = bench_formats(min_time_s=min_time_s, repeat=repeat)
+        if not only or "upgrade" in only:
+            log("upgrade ...")
+            results["upgrade"] = bench_upgrade(min_time_s=min_time_s, repeat=repeat)
+    return build_report("codec", results)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--min-time-s",
+        type=float,
+        default=0.2,
+        help="minimum duration of each timed loop",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        metavar="LABEL",
+        help="sample labels to run (e.g. heartbeat.a g.node.gt/logical formats upgrade)",
+    )
+    parser.add_argument(
+        "--json-backend",
+        choices=["stdlib", "pydantic", "orjson"],
+        help="parser for the dict paths (default: $GWBASE_JSON_BACKEND or stdlib)",
+    )
+    parser.add_argument("--out", type=Path, help="write JSON here (default stdout)")
+
+
+def main(args: argparse.Namespace) -> int:
+    if args.json_backend:
+        json_backend.set_json_backend(args.json_backend)
+    write_report(
+        run(min_time_s=args.min_time_s, repeat=args.repeat, only=args.only),
+        args.out,
+    )
+    return 0
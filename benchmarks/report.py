@@ -0,0 +1,149 @@
+"""Shared result shape, percentile math and baseline comparison.
+
+A report is one JSON object::
+
+    {
+        "Suite": "actors",
+        "CreatedAt": "2026-01-01T00:00:00Z",
+        "Environment": {"Python": "3.12.3", "Platform": "...", ...},
+        "Results": {
+            "rj": {"MsgsPerS": 41000.0, "LatencyUs": {"P50": 80.1, ...}},
+            ...
+        }
+    }
+
+Metric direction is carried by the name: anything ending in ``PerS`` is
+higher-is-better; everything else (latencies, costs) is lower-is-better.
+"""
+
+import json
+import math
+import platform
+import sys
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+PERCENTILES: dict[str, float] = {"P50": 0.50, "P99": 0.99, "P999": 0.999}
+
+
+def percentile(sorted_samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already-sorted sample list."""
+    if not sorted_samples:
+        return math.nan
+    rank = max(1, math.ceil(q * len(sorted_samples)))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+def latency_summary(samples_ns: list[int]) -> dict[str, float]:
+    """P50/P99/P999 (plus mean) of nanosecond samples, in microseconds."""
+    ordered = sorted(s / 1_000 for s in samples_ns)
+    summary = {
+        name: round(percentile(ordered, q), 3) for name, q in PERCENTILES.items()
+    }
+    summary["Mean"] = round(sum(ordered) / len(ordered), 3) if ordered else math.nan
+    return summary
+
+
+def build_report(
+    suite: str, results: dict[str, Any], **environment: Any
+) -> dict[str, Any]:
+    return {
+        "Suite": suite,
+        "CreatedAt": datetime.now(tz=UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "Environment": {
+            "Python": platform.python_version(),
+            "Implementation": sys.implementation.name,
+            "Platform": platform.platform(),
+            **environment,
+        },
+        "Results": results,
+    }
+
+
+def write_report(report: dict[str, Any], out: Path | None) -> None:
+    text = json.dumps(report, indent=2, sort_keys=False)
+    if out is None:
+        print(text)
+    else:
+        out.write_text(text + "\n")
+        print(f"wrote {out}")
+
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+
+def flatten(results: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    """``{"rj": {"LatencyUs": {"P99": 3}}}`` -> ``{"rj.LatencyUs.P99": 3}``;
+    non-numeric leaves (counts are numeric and kept) are dropped."""
+    flat: dict[str, float] = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, prefix=name + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = float(value)
+    return flat
+
+
+def higher_is_better(metric: str) -> bool:
+    return metric.rsplit(".", 1)[-1].endswith("PerS")
+
+
+def is_compared(metric: str) -> bool:
+    """Only rates and latency/cost figures gate; sample counts are context."""
+    leaf = metric.rsplit(".", 1)[-1]
+    return leaf.endswith(("PerS", "Us", "Ns")) or leaf in PERCENTILES or leaf == "Mean"
+
+
+@dataclass(frozen=True)
+class MetricDelta:
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Signed fractional change, positive == better."""
+        if self.baseline == 0:
+            return 0.0
+        ratio = (self.current - self.baseline) / self.baseline
+        return ratio if higher_is_better(self.metric) else -ratio
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.change < -threshold
+
+
+def compare_reports(
+    baseline: dict[str, Any], current: dict[str, Any]
+) -> list[MetricDelta]:
+    """Pair every gating metric present in both reports."""
+    base = flatten(baseline["Results"])
+    cur = flatten(current["Results"])
+    return [
+        MetricDelta(metric, base[metric], cur[metric])
+        for metric in sorted(base.keys() & cur.keys())
+        if is_compared(metric)
+    ]
+
+
+def print_comparison(deltas: list[MetricDelta], threshold: float) -> int:
+    """Print a diff table; return the number of regressions."""
+    width = max((len(d.metric) for d in deltas), default=10)
+    regressions = 0
+    for d in deltas:
+        flag = ""
+        if d.is_regression(threshold):
+            flag = "  REGRESSION"
+            regressions += 1
+        elif d.change > threshold:
+            flag = "  improved"
+        print(
+            f"{d.metric:<{width}}  {d.baseline:>14.3f}  {d.current:>14.3f}  "
+            f"{d.change:>+8.1%}{flag}"
+        )
+    print(f"\n{regressions} regression(s) beyond {threshold:.0%}")
+    return regressions
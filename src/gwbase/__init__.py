@@ -5,12 +5,17 @@ from gwbase.actor_base import (
     OnReceiveMessageDiagnostic,
     OnSendMessageDiagnostic,
 )
+from gwbase.actor_host import ActorHost
 from gwbase.config import GNodeSettings, ServiceSettings
+from gwbase.fleet import ActorSpec, Fleet
 from gwbase.gridworks_actor import GridworksActor
 from gwbase.orchestrator import Orchestrator
 
 __all__ = [
     "ActorBase",
+    "ActorHost",
+    "ActorSpec",
+    "Fleet",
     "GNodeSettings",
     "GridworksActor",
     "OnReceiveMessageDiagnostic",
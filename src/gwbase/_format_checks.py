@@ -0,0 +1,78 @@
+"""The property-format checks behind ``gwbase.sema.property_format`` and
+``gwbase.transport_format``.
+
+Both modules expose these as pydantic ``BeforeValidator``s, so every check
+runs once per field of every decoded message. They do the least work that
+keeps the accepted values, results and error messages of the original
+implementations: bounds are module constants (not ``datetime`` arithmetic
+per call), and the UUID4 check is the pattern alone. The pattern only
+admits the canonical lowercase text of a version-4 UUID, which is exactly
+what ``str(uuid.UUID(v))`` returned.
+
+Lives outside ``gwbase.sema`` so the transport layer can share it without
+depending on the codec (see ``transport_format``).
+"""
+
+import re
+
+HEX_CHAR_PATTERN = re.compile(r"^[0-9a-fA-F]$")
+HEX_CHARS = frozenset("0123456789abcdefABCDEF")  # what HEX_CHAR_PATTERN matches
+
+LEFT_RIGHT_DOT_PATTERN = re.compile(r"^[a-z][a-z0-9]*(\.[a-z0-9]+)*$")
+
+UUID4_STR_PATTERN = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$"
+)
+
+# 2000-01-01T00:00:00Z and 3000-01-01T00:00:00Z
+UTC_SECONDS_MIN = 946_684_800
+UTC_SECONDS_MAX = 32_503_680_000
+UTC_MILLISECONDS_MIN = UTC_SECONDS_MIN * 1000
+UTC_MILLISECONDS_MAX = UTC_SECONDS_MAX * 1000
+
+_fullmatch_left_right_dot = LEFT_RIGHT_DOT_PATTERN.fullmatch
+_fullmatch_uuid4 = UUID4_STR_PATTERN.fullmatch
+
+
+def is_hex_char(v: str) -> str:
+    if not isinstance(v, str):
+        raise ValueError(f"<{v}>: hex.char must be a string.")
+    if v not in HEX_CHARS:
+        raise ValueError(f"<{v}>: Fails hex.char format.")
+    return v
+
+
+def is_left_right_dot(v: str) -> str:
+    if not isinstance(v, str):
+        raise ValueError(f"<{v}>: LeftRightDot must be a string.")
+    if _fullmatch_left_right_dot(v) is None:
+        raise ValueError(f"<{v}>: Fails LeftRightDot format.")
+    return v
+
+
+def is_utc_milliseconds(v: int) -> int:
+    if not isinstance(v, int):
+        raise TypeError("Not an int!")
+    if v < UTC_MILLISECONDS_MIN:
+        raise ValueError(f"{v} must be after Jan 1 2000")
+    if v > UTC_MILLISECONDS_MAX:
+        raise ValueError(f"{v} must be before Jan 1 3000")
+    return v
+
+
+def is_utc_seconds(v: int) -> int:
+    if not isinstance(v, int):
+        raise ValueError("Not an int!")
+    if v < UTC_SECONDS_MIN:
+        raise ValueError(f"{v}: Fails UTCSeconds format! Must be after Jan 1 2000")
+    if v > UTC_SECONDS_MAX:
+        raise ValueError(f"{v}: Fails UTCSeconds format! Must be before Jan 1 3000")
+    return v
+
+
+def is_uuid4_str(v: str) -> str:
+    if not isinstance(v, str):
+        raise ValueError(f"<{v}>: uuid4.str must be a string.")
+    if _fullmatch_uuid4(v) is None:
+        raise ValueError(f"<{v}>: Fails uuid4.str format.")
+    return v
@@ -0,0 +1,20 @@
+"""Resolve ``"package.module:attr"`` references given on command lines and
+in specs.
+
+Lives outside ``gwbase.fleet`` so ``gwbase.sema`` tools can load a registry
+by name without depending on the actor tier.
+"""
+
+import importlib
+from typing import Any
+
+
+def resolve(target: str) -> Any:
+    """Import ``"package.module:attr"`` (``attr`` may be dotted)."""
+    module_name, sep, attr = target.partition(":")
+    if not sep or not module_name or not attr:
+        raise ValueError(f"<{target}>: expected 'package.module:callable'")
+    obj: Any = importlib.import_module(module_name)
+    for part in attr.split("."):
+        obj = getattr(obj, part)
+    return obj
@@ -4,9 +4,10 @@ import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
-from typing import no_type_check
+from typing import TYPE_CHECKING, Any, no_type_check
 
 import pika
 from pika.channel import Channel as PikaChannel
@@ -25,6 +26,9 @@ from gwbase.transport_encoding import (
     routing_code,
 )
 
+if TYPE_CHECKING:
+    from gwbase.actor_host import ActorHost
+
 
 class OnSendMessageDiagnostic(Enum):
     CHANNEL_NOT_OPEN = "ChannelNotOpen"
@@ -43,6 +47,12 @@ class OnReceiveMessageDiagnostic(Enum):
 
 LOGGER = logging.getLogger(__name__)
 
+# Builds the consumer connection. Called with ``pika.SelectConnection``'s
+# keywords (``parameters``, ``on_open_callback``, ``on_open_error_callback``,
+# ``on_close_callback``); ``pika.SelectConnection`` itself is the default and
+# ``gwbase.loopback.LoopbackBroker.connect`` the broker-free stand-in.
+ConnectionFactory = Callable[..., Any]
+
 
 @dataclass(frozen=True)
 class _PublishRequest:
@@ -80,6 +90,17 @@ class ActorBase(ABC):
     filter control-plane traffic and forward application messages to the
     subclass's ``process_message``; a bare tap implements
     ``dispatch_message`` directly.
+
+    ``connection_factory`` swaps the transport under the consumer: it is
+    called in place of ``pika.SelectConnection`` with the same keywords.
+    Tests and benchmarks pass ``LoopbackBroker.connect``
+    (``gwbase.loopback``) to run with no RabbitMQ at all.
+
+    An actor may instead be *hosted* (``gwbase.actor_host.ActorHost``): it
+    then owns no thread or connection, only its own channel on one of the
+    host's shared connections. Queue, bindings, ``send`` and the channel
+    callback chain are unchanged; ``start`` belongs to the host and ``stop``
+    detaches the actor from it.
     """
 
     @abstractmethod
@@ -91,6 +112,7 @@ class ActorBase(ABC):
         self,
         *,
         settings: ServiceSettings,
+        connection_factory: ConnectionFactory | None = None,
     ):
         self.settings: ServiceSettings = settings
 
@@ -117,8 +139,14 @@ class ActorBase(ABC):
         self._consume_exchange: str = EAR_EXCHANGE
         self._publish_exchange: str | None = None
         self._url: str = settings.rabbit.url.get_secret_value()
+        self._connection_factory: ConnectionFactory = (
+            connection_factory or pika.SelectConnection
+        )
 
         self.latest_routing_key: str | None = None
+        # AMQP content_type of the latest delivery: the codec's marker for a
+        # compact body (see GwBaseSemaCodec.from_bytes), None for plain JSON.
+        self.latest_content_type: str | None = None
         self.shutting_down: bool = False
         self._main_loop_running: bool = False
 
@@ -141,17 +169,23 @@ class ActorBase(ABC):
         self._stopping: bool = False
         self._stopped: bool = True
         self._latest_on_message_diagnostic: OnReceiveMessageDiagnostic | None = None
+        self._host: ActorHost | None = None
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
     def start(self) -> None:
+        if self._host is not None:
+            raise RuntimeError(f"{self.alias} is hosted; start its ActorHost instead")
         self.local_start()
         self._stopped = False
         self.consuming_thread.start()
 
     def stop(self) -> None:
+        if self._host is not None:
+            self._host.remove(self)
+            return
         self.shutting_down = True
         self.stop_consumer()
         self.local_stop()
@@ -233,7 +267,8 @@ class ActorBase(ABC):
         }
 
     def connect_consumer(self) -> pika.SelectConnection:
-        """Connect to RabbitMQ. When the connection is established, pika
+        """Connect to RabbitMQ through ``connection_factory`` (by default a
+        ``pika.SelectConnection``). When the connection is established, pika
         will invoke ``on_consumer_connection_open``.
 
         :rtype: pika.SelectConnection
@@ -244,11 +279,11 @@ class ActorBase(ABC):
         # connect time so the broker (via the FIS auth backend) can
         # authorize. GridworksActor decorates this with GNodeClass.
         params.client_properties = self._client_properties()
-        return pika.SelectConnection(
+        return self._connection_factory(  # type: ignore[no-any-return]
             parameters=params,
-            on_open_callback=self.on_consumer_connection_open,  # type: ignore[arg-type]
-            on_open_error_callback=self.on_consumer_connection_open_error,  # type: ignore[arg-type]
-            on_close_callback=self.on_consumer_connection_closed,  # type: ignore[arg-type]
+            on_open_callback=self.on_consumer_connection_open,
+            on_open_error_callback=self.on_consumer_connection_open_error,
+            on_close_callback=self.on_consumer_connection_closed,
         )
 
     def close_consumer_connection(self) -> None:
@@ -312,6 +347,10 @@ class ActorBase(ABC):
         """Invoked by pika when the channel opens. Records the channel and
         kicks off exchange declaration."""
         LOGGER.info("Channel opened")
+        if self._host is not None and self._closing_consumer:
+            # Detached from the host while the channel was opening.
+            channel.close()
+            return
         self._single_channel = channel
         self.add_on_single_channel_close_callback()
         self.setup_exchange()
@@ -334,6 +373,12 @@ class ActorBase(ABC):
         different parameters). We close the connection so the actor shuts
         down cleanly rather than retrying the channel."""
         LOGGER.warning("Consume channel %i was closed: %s", channel, reason)
+        if self._host is not None:
+            # The connection is shared: only this actor's channel is gone.
+            self._single_channel = None
+            self._consuming = False
+            self._host.on_actor_channel_closed(self, reason)
+            return
         self.close_consumer_connection()
 
     @no_type_check
@@ -517,6 +562,51 @@ class ActorBase(ABC):
                 self._consume_connection.ioloop.stop()  # type: ignore[union-attr]
             LOGGER.info("Consumer connection stopped")
 
+    # ------------------------------------------------------------------
+    # Hosted mode — driven by ActorHost on the shared connection's ioloop
+    # ------------------------------------------------------------------
+
+    @property
+    def host(self) -> "ActorHost | None":
+        return self._host
+
+    @host.setter
+    def host(self, host: "ActorHost | None") -> None:
+        self._host = host
+
+    def attach_to_connection(self, connection: Any) -> None:
+        """Open this actor's channel on a connection owned by its host. The
+        normal chain follows (passive exchange assert, queue, bind, QoS,
+        consume, ``local_rabbit_startup``). Runs on that connection's ioloop."""
+        self.flush_consumer()
+        self._consume_connection = connection
+        self._stopped = False
+        self.open_single_channel()
+
+    def detach_from_connection(self) -> bool:
+        """Cancel the consumer and close this actor's channel, leaving the
+        shared connection open. The host learns the channel is gone through
+        ``on_actor_channel_closed``; returns False if there was no channel to
+        close. Runs on the connection's ioloop."""
+        self._closing_consumer = True
+        if self._consuming:
+            self.stop_consuming()
+            return True
+        channel = self._single_channel
+        if channel is not None and not channel.is_closing and not channel.is_closed:
+            channel.close()
+            return True
+        return False
+
+    def mark_detached(self) -> None:
+        """Host bookkeeping once this actor's channel is gone. Unlike
+        ``flush_consumer`` it leaves ``_closing_consumer`` set, so a channel
+        that was still opening is closed on arrival."""
+        self._single_channel = None
+        self._consume_connection = None
+        self._consuming = False
+        self._stopped = True
+
     # ------------------------------------------------------------------
     # Receive
     # ------------------------------------------------------------------
@@ -534,6 +624,7 @@ class ActorBase(ABC):
         hands the envelope plus raw body to ``dispatch_message`` for
         subclass-defined dispatch."""
         self.latest_routing_key = basic_deliver.routing_key
+        self.latest_content_type = properties.content_type
         LOGGER.debug(
             f"{self.alias}: Got {basic_deliver.routing_key} with delivery tag {basic_deliver.delivery_tag}",
         )
@@ -670,10 +761,13 @@ class ActorBase(ABC):
         envelope: RoutingEnvelope,
         body: bytes,
         correlation_id: str | None = None,
+        content_type: str | None = None,
     ) -> OnSendMessageDiagnostic:
         """Publish pre-encoded ``body`` bytes on rabbit. The envelope
         carries the routing metadata (category, type_name, addressing);
-        ActorBase does not open the body.
+        ActorBase does not open the body. ``content_type`` goes on the AMQP
+        properties as is: pass ``gwbase.sema.compact.CONTENT_TYPE`` with a
+        ``to_compact`` body.
 
         pika is **not thread-safe** and the connection/channel are owned by the
         consumer thread's ioloop, so the actual ``basic_publish`` is marshaled
@@ -712,6 +806,7 @@ class ActorBase(ABC):
             app_id=self.alias,
             type=envelope.category.value,
             correlation_id=correlation_id or str(uuid.uuid4()),
+            content_type=content_type,
         )
 
         def _publish_on_ioloop() -> None:
@@ -0,0 +1,439 @@
+"""Run many actors in one process over a small pool of shared connections.
+
+A stand-alone ``ActorBase`` owns a consumer thread, a ``SelectConnection``
+and a log file handle. At fleet-simulation scale (thousands of
+TerminalAssets and LTNs) that is thousands of TCP connections and threads.
+``ActorHost`` multiplexes instead:
+
+- ``connections`` shared connections, each with ONE ioloop thread;
+- each hosted actor gets its OWN channel on one of them, so its queue,
+  prefetch, bindings (``bind_queue`` + ``local_rabbit_startup``), consumer
+  and ``send`` are exactly what they are stand-alone;
+- reconnect is per connection: when a shared connection drops, the host
+  reconnects once and re-attaches every actor on it; when only an actor's
+  channel closes (e.g. a broker-side 404), only that channel is reopened,
+  with the actor's own backoff;
+- every hosted actor logs to the host's single rotating file, each line
+  still stamped with the actor's own alias.
+
+Usage::
+
+    host = ActorHost(settings=ServiceSettings(service_alias="d1.host"))
+    for s in ta_settings:
+        host.add(MyTerminalAsset(settings=s, ...))
+    host.start()
+    ...
+    host.stop()
+
+The shared connections identify as the host (its ``ServiceAlias`` /
+``ServiceInstanceId``) in the FIS handshake, and use the host's
+``settings.rabbit`` URL; hosted actors' own ``rabbit`` settings are not
+used. One connection carries at most ``max_channels_per_connection``
+actors (RabbitMQ's default ``channel_max`` is 2047).
+"""
+
+import logging
+import threading
+import uuid
+from collections import Counter
+from typing import Any
+
+import pika
+
+from gwbase.actor_base import ActorBase, ConnectionFactory
+from gwbase.config import ServiceSettings
+from gwbase.logging_setup import _attach_to_shared_handler, _build_shared_handler
+
+LOGGER = logging.getLogger(__name__)
+
+MAX_RECONNECT_DELAY_S = 30
+
+
+class _SharedConnection:
+    """One pooled connection, its ioloop thread and the actors riding it."""
+
+    def __init__(self, host: "ActorHost", index: int) -> None:
+        self.host = host
+        self.index = index
+        self.connection: Any = None
+        self._lock = threading.Lock()
+        self._actors: list[ActorBase] = []
+        self._detaching: dict[int, tuple[ActorBase, threading.Event]] = {}
+        self._attached: set[int] = set()  # channel opened on self.connection
+        self._stopping = False
+        self._should_reconnect = False
+        self._was_open = False
+        self._reconnect_delay = 0
+        self._wake = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"{host.alias}-conn{index}", daemon=True
+        )
+
+    # -- membership --------------------------------------------------------
+
+    @property
+    def actors(self) -> list[ActorBase]:
+        with self._lock:
+            return list(self._actors)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._actors)
+
+    @property
+    def is_open(self) -> bool:
+        conn = self.connection
+        return conn is not None and conn.is_open
+
+    def add(self, actor: ActorBase) -> None:
+        with self._lock:
+            self._actors.append(actor)
+        self._on_ioloop(lambda: self._attach(actor))
+
+    def detach(self, actor: ActorBase) -> threading.Event:
+        """Start detaching ``actor``; the event is set once its channel is
+        closed (immediately if it has none)."""
+        done = threading.Event()
+        with self._lock:
+            if actor not in self._actors:
+                done.set()
+                return done
+            self._actors.remove(actor)
+            self._detaching[id(actor)] = (actor, done)
+        if not self._on_ioloop(lambda: self._detach(actor)):
+            self._finish_detach(actor)
+        return done
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout_s: float) -> None:
+        """Detach every actor (consumers cancelled, channels closed), then
+        close the connection and join the ioloop thread."""
+        waits = [self.detach(actor) for actor in self.actors]
+        for done in waits:
+            done.wait(timeout_s)
+        self._stopping = True
+        self._wake.set()
+        if not self._on_ioloop(self._close_connection):
+            conn = self.connection
+            if conn is not None:
+                try:
+                    conn.ioloop.add_callback_threadsafe(conn.ioloop.stop)
+                except Exception:
+                    LOGGER.debug("ioloop already gone for %s", self._thread.name)
+        if self._thread.is_alive():
+            self._thread.join(timeout_s)
+
+    def _run(self) -> None:
+        """Connection thread: connect, run the ioloop, reconnect on loss."""
+        while not self._stopping:
+            self._should_reconnect = False
+            self.connection = self.host._connect(
+                on_open=self._on_open,
+                on_open_error=self._on_open_error,
+                on_close=self._on_close,
+            )
+            self.connection.ioloop.start()
+            if self._stopping or not self._should_reconnect:
+                break
+            delay = self._next_reconnect_delay()
+            LOGGER.info("%s reconnecting after %d seconds", self._thread.name, delay)
+            self._wake.wait(delay)
+
+    def _next_reconnect_delay(self) -> int:
+        if self._was_open:
+            self._reconnect_delay = 0
+        else:
+            self._reconnect_delay = min(
+                self._reconnect_delay + 1, MAX_RECONNECT_DELAY_S
+            )
+        self._was_open = False
+        return self._reconnect_delay
+
+    def _on_ioloop(self, callback: Any) -> bool:
+        """Schedule ``callback`` on the live connection's ioloop; False if
+        there is no open connection to run it (it will run on reconnect)."""
+        conn = self.connection
+        if conn is None or not conn.is_open:
+            return False
+        try:
+            conn.ioloop.add_callback_threadsafe(callback)
+        except Exception:
+            LOGGER.exception("Could not schedule on %s", self._thread.name)
+            return False
+        return True
+
+    # -- connection callbacks (ioloop thread) ------------------------------
+
+    def _on_open(self, connection: Any) -> None:
+        LOGGER.info("%s open; attaching %d actors", self._thread.name, len(self))
+        self._was_open = True
+        self._attached.clear()
+        for actor in self.actors:
+            self._attach(actor)
+
+    def _on_open_error(self, connection: Any, err: Exception) -> None:
+        LOGGER.error("%s open failed: %s", self._thread.name, err)
+        self._should_reconnect = True
+        connection.ioloop.stop()
+
+    def _on_close(self, connection: Any, reason: Exception) -> None:
+        self._attached.clear()
+        for actor in self.actors:
+            actor.flush_consumer()
+        with self._lock:
+            pending = [actor for actor, _ in self._detaching.values()]
+        for actor in pending:
+            self._finish_detach(actor)
+        if not self._stopping:
+            LOGGER.warning(
+                "%s closed, reconnect necessary: %s", self._thread.name, reason
+            )
+            self._should_reconnect = True
+        connection.ioloop.stop()
+
+    def _close_connection(self) -> None:
+        conn = self.connection
+        if conn is not None and not conn.is_closing and not conn.is_closed:
+            conn.close()
+
+    # -- per-actor channel (ioloop thread) ---------------------------------
+
+    def _attach(self, actor: ActorBase) -> None:
+        """Open ``actor``'s channel once per connection: ``add`` and
+        ``_on_open`` may both get here for an actor added mid-connect."""
+        with self._lock:
+            member = actor in self._actors
+        if member and self.is_open and id(actor) not in self._attached:
+            self._attached.add(id(actor))
+            actor.attach_to_connection(self.connection)
+
+    def _detach(self, actor: ActorBase) -> None:
+        if not actor.detach_from_connection():
+            self._finish_detach(actor)
+
+    def _finish_detach(self, actor: ActorBase) -> None:
+        self._attached.discard(id(actor))
+        actor.mark_detached()
+        self._release(id(actor))
+
+    def _release(self, actor_id: int) -> None:
+        with self._lock:
+            entry = self._detaching.pop(actor_id, None)
+        if entry is not None:
+            entry[1].set()
+
+    def on_actor_channel_closed(self, actor: ActorBase, reason: Exception) -> None:
+        with self._lock:
+            detaching = id(actor) in self._detaching
+            attached = actor in self._actors
+        if detaching:
+            self._finish_detach(actor)
+            return
+        if not attached or self._stopping or not self.is_open:
+            return  # connection-level loss: _on_close/_on_open re-attach
+        delay = actor._get_reconnect_delay()  # the actor's own backoff
+        LOGGER.warning(
+            "%s channel closed (%s); reopening in %d seconds",
+            actor.alias,
+            reason,
+            delay,
+        )
+        connection = self.connection
+        connection.ioloop.call_later(delay, lambda: self._reopen(actor, connection))
+
+    def _reopen(self, actor: ActorBase, connection: Any) -> None:
+        with self._lock:
+            attached = actor in self._actors
+        if attached and connection is self.connection and connection.is_open:
+            actor.attach_to_connection(connection)
+
+
+class ActorHost:
+    """Hosts many actors over ``connections`` shared broker connections.
+
+    ``settings`` is the host's own identity (alias, instance id, rabbit URL,
+    log settings). ``log_handler`` replaces the host's log file as the sink
+    for the host and every hosted actor. Add actors with ``add`` — before or after ``start`` —
+    and remove them with ``remove`` (or the actor's own ``stop``). Actors are
+    placed on the least-loaded connection.
+    """
+
+    SHUTDOWN_TIMEOUT_S: float = 5.0
+
+    def __init__(
+        self,
+        *,
+        settings: ServiceSettings,
+        connections: int = 4,
+        max_channels_per_connection: int = 2000,
+        connection_factory: ConnectionFactory | None = None,
+        log_handler: logging.Handler | None = None,
+    ):
+        if connections < 1:
+            raise ValueError(f"connections must be >= 1, got {connections}")
+        self.settings: ServiceSettings = settings
+        self.alias: str = settings.service_alias
+        self.instance_id: str = settings.instance_id or str(uuid.uuid4())
+        self.max_channels_per_connection: int = max_channels_per_connection
+        self._url: str = settings.rabbit.url.get_secret_value()
+        self._connection_factory: ConnectionFactory = (
+            connection_factory or pika.SelectConnection
+        )
+
+        # One log file for the host and everything on it, unless the caller
+        # supplies the sink (e.g. a fleet worker forwarding to its parent);
+        # a supplied handler is the caller's to close.
+        self._owns_log_handler = log_handler is None
+        self._log_handler = log_handler or _build_shared_handler(
+            service_name=settings.service_name,
+            service_alias=self.alias,
+            instance_id=self.instance_id,
+            rotate_bytes=settings.log_rotate_bytes,
+            rotate_count=settings.log_rotate_count,
+        )
+        self.logger: logging.Logger = logging.getLogger(f"gwbase.host.{self.alias}")
+        self.logger.setLevel(getattr(logging, settings.log_level.upper()))
+        self.logger.propagate = False
+        _attach_to_shared_handler(
+            self.logger,
+            service_alias=self.alias,
+            instance_id=self.instance_id,
+            handler=self._log_handler,
+        )
+
+        self._lock = threading.Lock()
+        self._slots: list[_SharedConnection] = [
+            _SharedConnection(self, i) for i in range(connections)
+        ]
+        self._slot_of: dict[int, _SharedConnection] = {}
+        self._running = False
+
+    def __repr__(self) -> str:
+        return f"ActorHost({self.alias}, actors={len(self)}, connections={len(self._slots)})"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._slot_of)
+
+    # ------------------------------------------------------------------
+    # Membership
+    # ------------------------------------------------------------------
+
+    @property
+    def actors(self) -> list[ActorBase]:
+        return [actor for slot in self._slots for actor in slot.actors]
+
+    def add(self, actor: ActorBase) -> None:
+        """Host ``actor``: re-point its logger at the host's file, place it on
+        the least-loaded connection and, if the host is running, open its
+        channel now."""
+        if actor.host is not None:
+            raise ValueError(f"{actor.alias} is already hosted by {actor.host!r}")
+        if actor.consuming_thread.is_alive():
+            raise ValueError(f"{actor.alias} is running stand-alone; stop it first")
+        with self._lock:
+            # Count placements, not slot membership: slot.add runs outside
+            # the lock, so concurrent adds would otherwise see stale loads.
+            load = Counter(id(s) for s in self._slot_of.values())
+            slot = min(self._slots, key=lambda s: load[id(s)])
+            if load[id(slot)] >= self.max_channels_per_connection:
+                raise RuntimeError(
+                    f"host {self.alias} is full: {len(self._slots)} connections x "
+                    f"{self.max_channels_per_connection} channels"
+                )
+            self._slot_of[id(actor)] = slot
+            actor.host = self
+        _attach_to_shared_handler(
+            actor.logger,
+            service_alias=actor.alias,
+            instance_id=actor.instance_id,
+            handler=self._log_handler,
+        )
+        if self._running:
+            actor.local_start()
+        slot.add(actor)
+
+    def remove(self, actor: ActorBase, timeout_s: float | None = None) -> None:
+        """Cancel ``actor``'s consumer and close its channel (the shared
+        connection stays up), then run its ``local_stop``. Blocks until the
+        channel is closed or ``timeout_s`` passes."""
+        with self._lock:
+            slot = self._slot_of.get(id(actor))
+        if slot is None:
+            return
+        actor.shutting_down = True
+        slot.detach(actor).wait(timeout_s or self.SHUTDOWN_TIMEOUT_S)
+        with self._lock:
+            self._slot_of.pop(id(actor), None)
+        actor.local_stop()
+        actor.host = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        self.logger.info(
+            "Starting %d actors over %d connections", len(self), len(self._slots)
+        )
+        self._running = True
+        for actor in self.actors:
+            actor.local_start()
+        for slot in self._slots:
+            slot.start()
+
+    def stop(self) -> None:
+        timeout_s = self.SHUTDOWN_TIMEOUT_S
+        hosted = self.actors
+        for actor in hosted:
+            actor.shutting_down = True
+        for slot in self._slots:
+            slot.stop(timeout_s)
+        with self._lock:
+            self._slot_of.clear()
+        for actor in hosted:
+            actor.local_stop()
+            actor.host = None
+        self._running = False
+        if self._owns_log_handler:
+            self._log_handler.close()
+
+    @property
+    def consuming(self) -> bool:
+        """True when every hosted actor is consuming."""
+        return all(actor.consuming for actor in self.actors)
+
+    @property
+    def open_connections(self) -> int:
+        return sum(1 for slot in self._slots if slot.is_open)
+
+    # ------------------------------------------------------------------
+    # Shared-connection plumbing
+    # ------------------------------------------------------------------
+
+    def _client_properties(self) -> dict[str, str]:
+        return {
+            "ServiceAlias": self.alias,
+            "ServiceInstanceId": self.instance_id,
+        }
+
+    def _connect(self, *, on_open: Any, on_open_error: Any, on_close: Any) -> Any:
+        params = pika.URLParameters(self._url)
+        params.client_properties = self._client_properties()
+        return self._connection_factory(
+            parameters=params,
+            on_open_callback=on_open,
+            on_open_error_callback=on_open_error,
+            on_close_callback=on_close,
+        )
+
+    def on_actor_channel_closed(self, actor: ActorBase, reason: Exception) -> None:
+        """Called by a hosted actor (on the ioloop) when its channel closes."""
+        with self._lock:
+            slot = self._slot_of.get(id(actor))
+        if slot is not None:
+            slot.on_actor_channel_closed(actor, reason)
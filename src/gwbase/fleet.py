@@ -0,0 +1,520 @@
+"""Shard a fleet of actors across worker processes, one ``ActorHost`` each.
+
+One ``ActorHost`` removes the per-actor connection and thread, but one
+process is still GIL-bound for pydantic validation and handler work. A
+``Fleet`` spreads the actors over ``workers`` processes:
+
+- each actor is described by an ``ActorSpec`` (a ``"module:callable"``
+  factory, its settings, extra constructor kwargs) and built inside its
+  worker, so nothing but the spec crosses the process boundary;
+- an actor's worker is ``shard_of(alias, workers)``, a stable hash (NOT
+  Python's per-process ``hash``), so an alias lands on the same worker
+  across restarts and deployments with the same worker count;
+- the parent supervises: a worker that dies is restarted with its shard
+  (backoff grows by one second per restart, up to ``MAX_RESTART_DELAY_S``,
+  and resets once a worker has stayed up for ``HEALTHY_AFTER_S``);
+- workers report status (actors, consuming, open connections, CPU time)
+  every ``status_interval_s``; ``Fleet.metrics()`` aggregates the latest;
+- every worker's log records (its hosted actors, plus WARNING and above
+  from any other logger) are forwarded to the parent and written to ONE
+  rotating file, ``log_dir(service_name)/<fleet alias>.log``, each line
+  stamped with the emitting actor's alias;
+- ``stop()`` drains: each worker stops its host (consumers cancelled,
+  channels and connections closed, ``local_stop`` run) before exiting.
+
+Usage::
+
+    specs = [
+        ActorSpec(
+            factory="myservice.ta:TerminalAsset",
+            settings=GNodeSettings(service_alias=alias, g_node_path=path),
+        )
+        for alias, path in fleet_definition
+    ]
+    Fleet(specs, settings=ServiceSettings(service_alias="d1.fleet")).serve()
+
+Workers are started with the ``spawn`` method, so factories must be
+importable by name and specs picklable. A worker is itself an
+``ActorHost`` aliased ``<fleet alias>.w<index>``.
+"""
+
+import hashlib
+import logging
+import logging.handlers
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import threading
+import time
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from gwbase._imports import resolve
+from gwbase.actor_base import ActorBase, ConnectionFactory
+from gwbase.actor_host import ActorHost
+from gwbase.config import ServiceSettings
+from gwbase.logging_setup import _attach_to_shared_handler, _build_shared_handler
+
+LOGGER = logging.getLogger(__name__)
+
+MAX_RESTART_DELAY_S = 30
+HEALTHY_AFTER_S = 60.0
+
+_DRAIN = "drain"
+
+
+def shard_of(alias: str, shards: int) -> int:
+    """The worker index for ``alias``: stable across processes and runs."""
+    digest = hashlib.blake2b(alias.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shards
+
+
+@dataclass(frozen=True)
+class ActorSpec:
+    """How a worker builds one actor: ``resolve(factory)(settings=settings,
+    **kwargs)``. For a ``GridworksActor`` the ``g.node.gt.json`` location is
+    ``settings.g_node_path``."""
+
+    factory: str
+    settings: ServiceSettings
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def alias(self) -> str:
+        return self.settings.service_alias
+
+    def build(self) -> ActorBase:
+        actor: ActorBase = resolve(self.factory)(settings=self.settings, **self.kwargs)
+        return actor
+
+
+# ---------------------------------------------------------------------------
+# Worker process
+# ---------------------------------------------------------------------------
+
+
+class _Uplink:
+    """The worker's end of its pipe. ``send`` is called from the main loop
+    and from every ioloop thread that logs, so it is serialized here."""
+
+    def __init__(self, conn: multiprocessing.connection.Connection) -> None:
+        self.conn = conn
+        self._lock = threading.Lock()
+
+    def send(self, message: tuple[str, Any]) -> None:
+        with self._lock:
+            try:
+                self.conn.send(message)
+            except OSError:
+                pass  # parent gone; the main loop sees EOF and drains
+
+
+class _ForwardingHandler(logging.handlers.QueueHandler):
+    """Ships records to the parent. ``QueueHandler.prepare`` renders the
+    message and exception text so the record pickles; records from loggers
+    with no actor context are stamped with the worker's own."""
+
+    def __init__(self, uplink: _Uplink, service_alias: str, instance_id: str):
+        super().__init__(None)  # type: ignore[arg-type]
+        self._uplink = uplink
+        self._context = {"service_alias": service_alias, "instance_id": instance_id}
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        for key, value in self._context.items():
+            record.__dict__.setdefault(key, value)
+        prepared: logging.LogRecord = super().prepare(record)
+        return prepared
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self._uplink.send(("log", record))
+
+
+def _status(host: ActorHost, index: int) -> dict[str, Any]:
+    actors = host.actors
+    return {
+        "Worker": index,
+        "Pid": os.getpid(),
+        "Actors": len(actors),
+        "Consuming": sum(1 for actor in actors if actor.consuming),
+        "OpenConnections": host.open_connections,
+        "CpuS": round(time.process_time(), 3),
+    }
+
+
+def _report_until_drained(
+    host: ActorHost,
+    index: int,
+    uplink: _Uplink,
+    stopping: threading.Event,
+    status_interval_s: float,
+) -> None:
+    """Send status every ``status_interval_s`` until the parent says drain,
+    the pipe closes (parent gone) or SIGTERM sets ``stopping``."""
+    conn = uplink.conn
+    while not stopping.is_set():
+        uplink.send(("status", _status(host, index)))
+        try:
+            if conn.poll(status_interval_s) and conn.recv() == _DRAIN:
+                return
+        except (EOFError, OSError):
+            return
+
+
+def _worker_main(  # noqa: PLR0913 — process entry point; everything arrives pickled
+    *,
+    index: int,
+    settings: ServiceSettings,
+    specs: list[ActorSpec],
+    connections: int,
+    connection_factory: str | None,
+    status_interval_s: float,
+    conn: multiprocessing.connection.Connection,
+) -> None:
+    """Worker entry point: host the shard, report status, drain on request
+    (or SIGTERM, or the parent going away)."""
+    # The parent owns shutdown: Ctrl-C goes to the whole process group.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopping.set())
+
+    uplink = _Uplink(conn)
+    handler = _ForwardingHandler(
+        uplink, settings.service_alias, settings.instance_id or "-"
+    )
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(logging.WARNING)
+
+    factory: ConnectionFactory | None = (
+        resolve(connection_factory)() if connection_factory else None
+    )
+    host = ActorHost(
+        settings=settings,
+        connections=connections,
+        connection_factory=factory,
+        log_handler=handler,
+    )
+    for spec in specs:
+        host.add(spec.build())
+    host.start()
+    try:
+        _report_until_drained(host, index, uplink, stopping, status_interval_s)
+    finally:
+        host.stop()
+        uplink.send(("status", _status(host, index) | {"Drained": True}))
+        root.removeHandler(handler)
+        conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Parent
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Worker:
+    """Parent-side record of one shard and the process currently serving it."""
+
+    index: int
+    alias: str
+    specs: list[ActorSpec]
+    process: Any = None
+    conn: multiprocessing.connection.Connection | None = None
+    started_at: float = 0.0
+    restarts: int = 0
+    restart_at: float | None = None
+    gave_up: bool = False
+    status: dict[str, Any] = field(default_factory=dict)
+
+    def send(self, message: str) -> None:
+        if self.conn is None:
+            return
+        try:
+            self.conn.send(message)
+        except OSError:
+            pass  # already gone
+
+
+class Fleet:
+    """Runs ``specs`` across ``workers`` processes, each an ``ActorHost``.
+
+    ``settings`` is the fleet's own identity: its alias names the log file
+    and prefixes the worker aliases, and its ``rabbit`` URL is the one every
+    worker connects with. ``connection_factory`` is an optional
+    ``"module:callable"`` each worker calls (no arguments) to get its
+    ``ConnectionFactory``; by default workers use ``pika.SelectConnection``.
+    """
+
+    SHUTDOWN_TIMEOUT_S: float = 10.0
+
+    def __init__(  # noqa: PLR0913 — launcher knobs, all keyword-only
+        self,
+        specs: Sequence[ActorSpec],
+        *,
+        settings: ServiceSettings,
+        workers: int | None = None,
+        connections_per_worker: int = 2,
+        connection_factory: str | None = None,
+        status_interval_s: float = 1.0,
+        max_restarts: int = 10,
+    ):
+        aliases = [spec.alias for spec in specs]
+        duplicates = sorted({a for a in aliases if aliases.count(a) > 1})
+        if duplicates:
+            raise ValueError(f"duplicate actor aliases: {duplicates}")
+        for target in {spec.factory for spec in specs} | {connection_factory}:
+            if target is not None:
+                resolve(target)  # fail here, not in a restart loop
+
+        self.settings: ServiceSettings = settings
+        self.alias: str = settings.service_alias
+        self.instance_id: str = settings.instance_id or str(uuid.uuid4())
+        self.workers: int = workers or os.cpu_count() or 1
+        self.connections_per_worker: int = connections_per_worker
+        self.connection_factory: str | None = connection_factory
+        self.status_interval_s: float = status_interval_s
+        self.max_restarts: int = max_restarts
+
+        shards: list[list[ActorSpec]] = [[] for _ in range(self.workers)]
+        for spec in specs:
+            shards[shard_of(spec.alias, self.workers)].append(spec)
+        self._workers: list[_Worker] = [
+            _Worker(index=i, alias=f"{self.alias}.w{i}", specs=shard)
+            for i, shard in enumerate(shards)
+            if shard  # no process for an empty shard
+        ]
+
+        self._log_handler = _build_shared_handler(
+            service_name=settings.service_name,
+            service_alias=self.alias,
+            instance_id=self.instance_id,
+            rotate_bytes=settings.log_rotate_bytes,
+            rotate_count=settings.log_rotate_count,
+        )
+        self.logger: logging.Logger = logging.getLogger(f"gwbase.fleet.{self.alias}")
+        self.logger.setLevel(getattr(logging, settings.log_level.upper()))
+        self.logger.propagate = False
+        _attach_to_shared_handler(
+            self.logger,
+            service_alias=self.alias,
+            instance_id=self.instance_id,
+            handler=self._log_handler,
+        )
+
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._draining = threading.Event()
+        self._supervisor = threading.Thread(
+            target=self._supervise, name=f"{self.alias}-supervisor", daemon=True
+        )
+
+    def __repr__(self) -> str:
+        return f"Fleet({self.alias}, workers={len(self._workers)})"
+
+    def worker_of(self, alias: str) -> int:
+        return shard_of(alias, self.workers)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        self.logger.info(
+            "Starting %d workers for %d actors",
+            len(self._workers),
+            sum(len(w.specs) for w in self._workers),
+        )
+        for worker in self._workers:
+            self._spawn(worker)
+        self._supervisor.start()
+
+    def stop(self, timeout_s: float | None = None) -> None:
+        """Drain every worker, then close the fleet log. Workers that have
+        not exited within ``timeout_s`` are terminated."""
+        if self._draining.is_set():
+            return
+        timeout_s = timeout_s or self.SHUTDOWN_TIMEOUT_S
+        self._draining.set()
+        with self._lock:
+            live = [w for w in self._workers if w.process is not None]
+        for worker in live:
+            worker.send(_DRAIN)
+        deadline = time.monotonic() + timeout_s
+        for worker in live:
+            worker.process.join(max(0.0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                self.logger.error("%s did not drain; terminating", worker.alias)
+                worker.process.terminate()
+                worker.process.join(1.0)
+        if self._supervisor.is_alive():
+            self._supervisor.join(timeout_s)
+        self.logger.info("Fleet stopped")
+        self._log_handler.close()
+
+    def serve(self) -> None:
+        """``start``, block until SIGINT or SIGTERM, then ``stop``. Call from
+        the main thread."""
+        stop = threading.Event()
+        previous = {
+            sig: signal.signal(sig, lambda *_: stop.set())
+            for sig in (signal.SIGINT, signal.SIGTERM)
+        }
+        try:
+            self.start()
+            while not stop.wait(0.5):
+                pass
+        finally:
+            self.stop()
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> dict[str, Any]:
+        """The latest status from every worker, plus fleet-wide totals."""
+        with self._lock:
+            per_worker = [
+                {
+                    **w.status,
+                    "Worker": w.index,
+                    "Alive": w.process is not None and w.process.is_alive(),
+                    "Shard": len(w.specs),
+                    "Restarts": w.restarts,
+                    "GaveUp": w.gave_up,
+                }
+                for w in self._workers
+            ]
+        totals = {
+            key: sum(w.get(key, 0) for w in per_worker)
+            for key in ("Actors", "Consuming", "OpenConnections", "CpuS", "Restarts")
+        }
+        return {"Alias": self.alias, **totals, "Workers": per_worker}
+
+    @property
+    def consuming(self) -> bool:
+        """True when every worker is up and reports all its actors consuming."""
+        return all(
+            w["Alive"] and w.get("Consuming") == w["Shard"]
+            for w in self.metrics()["Workers"]
+        )
+
+    # ------------------------------------------------------------------
+    # Supervision (supervisor thread)
+    # ------------------------------------------------------------------
+
+    def _spawn(self, worker: _Worker) -> None:
+        parent_end, child_end = self._ctx.Pipe(duplex=True)
+        process = self._ctx.Process(
+            target=_worker_main,
+            name=worker.alias,
+            kwargs={
+                "index": worker.index,
+                "settings": self.settings.model_copy(
+                    update={
+                        "service_alias": worker.alias,
+                        "instance_id": str(uuid.uuid4()),  # fresh per incarnation
+                    }
+                ),
+                "specs": worker.specs,
+                "connections": self.connections_per_worker,
+                "connection_factory": self.connection_factory,
+                "status_interval_s": self.status_interval_s,
+                "conn": child_end,
+            },
+            daemon=True,
+        )
+        process.start()
+        child_end.close()
+        with self._lock:
+            worker.process = process
+            worker.conn = parent_end
+            worker.started_at = time.monotonic()
+            worker.restart_at = None
+            worker.status = {}
+        self.logger.info(
+            "%s started (pid %s, %d actors)",
+            worker.alias,
+            process.pid,
+            len(worker.specs),
+        )
+
+    def _supervise(self) -> None:
+        """Pump worker pipes (status + log records) and restart the dead.
+        Runs until draining and every worker has exited."""
+        while True:
+            with self._lock:
+                conns = {w.conn: w for w in self._workers if w.conn is not None}
+            ready = multiprocessing.connection.wait(list(conns), timeout=0.2)
+            for conn in ready:
+                self._receive(conns[conn])  # type: ignore[index]
+            if self._check_workers():
+                return
+
+    def _receive(self, worker: _Worker) -> None:
+        conn = worker.conn
+        if conn is None:  # closed since the wait
+            return
+        try:
+            kind, payload = conn.recv()
+        except (EOFError, OSError):
+            conn.close()
+            with self._lock:
+                worker.conn = None
+            return
+        if kind == "status":
+            with self._lock:
+                worker.status = payload
+        elif kind == "log":
+            self._log_handler.handle(payload)
+
+    def _check_workers(self) -> bool:
+        """Restart or schedule restarts; True once draining and all exited."""
+        now = time.monotonic()
+        all_done = True
+        for worker in self._workers:
+            process = worker.process
+            if process is not None and process.is_alive():
+                all_done = False
+                continue
+            if worker.conn is not None:
+                all_done = False  # drain its pipe to EOF first
+                continue
+            if self._draining.is_set() or worker.gave_up:
+                continue
+            all_done = False
+            if worker.restart_at is None:
+                self._on_worker_died(worker, now)
+            elif now >= worker.restart_at:
+                self._spawn(worker)
+        return all_done and self._draining.is_set()
+
+    def _on_worker_died(self, worker: _Worker, now: float) -> None:
+        exitcode = worker.process.exitcode if worker.process is not None else None
+        if now - worker.started_at >= HEALTHY_AFTER_S:
+            worker.restarts = 0
+        if worker.restarts >= self.max_restarts:
+            self.logger.error(
+                "%s exited (code %s) %d times; giving up on its %d actors",
+                worker.alias,
+                exitcode,
+                worker.restarts + 1,
+                len(worker.specs),
+            )
+            with self._lock:
+                worker.gave_up = True
+            return
+        delay = min(worker.restarts, MAX_RESTART_DELAY_S)
+        with self._lock:
+            worker.restarts += 1
+            worker.restart_at = now + delay
+        self.logger.warning(
+            "%s exited (code %s); restarting in %d seconds",
+            worker.alias,
+            exitcode,
+            delay,
+        )
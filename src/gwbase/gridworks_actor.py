@@ -2,6 +2,7 @@ import json
 import logging
 from abc import ABC
 
+from gwbase.actor_base import ConnectionFactory
 from gwbase.config import GNodeSettings
 from gwbase.orchestrator import Orchestrator
 from gwbase.sema import GwBaseSemaCodec
@@ -34,12 +35,14 @@ class GridworksActor(Orchestrator, ABC):
         transport_class: TransportClass,
         my_super_alias: str,
         my_time_coordinator_alias: str,
+        connection_factory: ConnectionFactory | None = None,
     ):
         super().__init__(
             settings=settings,
             transport_class=transport_class,
             my_super_alias=my_super_alias,
             my_time_coordinator_alias=my_time_coordinator_alias,
+            connection_factory=connection_factory,
         )
 
         # Load + Sema-validate the GNode identity at the boundary.
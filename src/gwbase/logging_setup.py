@@ -116,3 +116,50 @@ def _build_actor_logger(  # noqa: PLR0913 — logger builder fans out logging se
     handler.flush()
 
     return logger
+
+
+def _build_shared_handler(
+    *,
+    service_name: str,
+    service_alias: str,
+    instance_id: str,
+    rotate_bytes: int,
+    rotate_count: int,
+) -> logging.Handler:
+    """A RotatingFileHandler to ``log_dir(service_name)/<alias>.log`` that many
+    actor loggers share (``ActorHost``). It carries NO context filter: each
+    logger attached with ``_attach_to_shared_handler`` stamps its own alias,
+    so one file still reads per-actor in the bijective format."""
+    paths.mkdirs(service_name)
+    handler = logging.handlers.RotatingFileHandler(
+        paths.log_dir(service_name) / f"{service_alias}.log",
+        maxBytes=rotate_bytes,
+        backupCount=rotate_count,
+    )
+    handler.setFormatter(_HumanFormatter())
+    print(
+        f"=== gwbase log: alias={service_alias} instance={instance_id} "
+        f"started={_iso(datetime.now(tz=UTC).timestamp())} ===",
+        file=handler.stream,
+    )
+    handler.flush()
+    return handler
+
+
+def _attach_to_shared_handler(
+    logger: logging.Logger,
+    *,
+    service_alias: str,
+    instance_id: str,
+    handler: logging.Handler,
+) -> logging.Logger:
+    """Re-point ``logger`` at a shared handler: close and drop its own file
+    handler and stamp records with ``service_alias``/``instance_id`` at the
+    logger instead. Level and ``propagate`` are left as built."""
+    for own in logger.handlers:
+        own.close()
+    logger.handlers.clear()
+    logger.filters.clear()
+    logger.addFilter(_ContextFilter(service_alias, instance_id))
+    logger.addHandler(handler)
+    return logger
@@ -0,0 +1,953 @@
+"""In-process loopback broker — a pure-Python stand-in for RabbitMQ.
+
+Implements the slice of AMQP 0-9-1 that gwbase actors actually use, so the
+tier suite and throughput benchmarks run on a machine with no broker:
+
+  - topic exchanges (``*`` / ``#`` binding keys) and the default exchange,
+  - exchange-to-exchange bindings (the cross-class ``mic_tx -> _tx`` fabric
+    and the ear taps),
+  - the ``internal`` flag (publishing to an internal exchange closes the
+    channel with ``403 ACCESS_REFUSED``, as RabbitMQ does),
+  - auto-delete queues (deleted when their last consumer goes away),
+  - per-consumer prefetch and explicit acks (unacked deliveries are
+    requeued when their channel closes).
+
+The fabric comes from the same source as the dev/prod definitions —
+``topology.exchanges()`` / ``topology.exchange_bindings()`` — via
+``LoopbackBroker.provisioned()``, so a loopback run cannot drift from what
+the real broker is provisioned with.
+
+``LoopbackBroker.connect`` has the keyword signature of
+``pika.SelectConnection`` and is passed to an actor as its
+``connection_factory``. The returned connection runs a real (blocking)
+ioloop on the actor's consuming thread and invokes every pika callback the
+actor registers asynchronously, in the same order pika would, so the
+``ActorBase`` callback chain (passive exchange declare -> queue declare ->
+bind -> QoS -> consume) runs unchanged::
+
+    broker = LoopbackBroker.provisioned()
+    actor = MyActor(settings=..., connection_factory=broker.connect)
+    actor.start()
+
+Not implemented: persistence, publisher confirms, mandatory returns,
+exclusive queues, headers/fanout/direct exchange types (other than the
+default exchange) and TTLs.
+"""
+
+import functools
+import itertools
+import logging
+import queue
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from pika import frame, spec
+from pika.exceptions import (
+    AMQPConnectionError,
+    ChannelClosedByBroker,
+    ChannelClosedByClient,
+    ChannelWrongStateError,
+    ConnectionClosedByBroker,
+    ConnectionClosedByClient,
+    ConnectionWrongStateError,
+)
+
+from gwbase import topology
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_EXCHANGE = ""
+
+# AMQP reply codes used when the broker closes a channel.
+_NOT_FOUND = 404
+_ACCESS_REFUSED = 403
+_PRECONDITION_FAILED = 406
+_CONNECTION_FORCED = 320
+
+
+class LoopbackChannelError(Exception):
+    """A channel-level AMQP error raised inside the broker; the owning
+    channel is closed with ``reply_code`` / ``reply_text``."""
+
+    def __init__(self, reply_code: int, reply_text: str) -> None:
+        super().__init__(f"{reply_code}: {reply_text}")
+        self.reply_code = reply_code
+        self.reply_text = reply_text
+
+
+# ---------------------------------------------------------------------------
+# Topic matching
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=4096)
+def _topic_regex(binding_key: str) -> re.Pattern[str]:
+    parts: list[str] = []
+    for word in binding_key.split("."):
+        if word == "#":
+            parts.append("#")
+        elif word == "*":
+            parts.append(r"[^.]+")
+        else:
+            parts.append(re.escape(word))
+    pattern = r"\.".join(parts)
+    # '#' matches zero or more words, absorbing one adjacent separator.
+    pattern = pattern.replace(r"\.#", r"(?:\.[^.]+)*")
+    pattern = pattern.replace(r"#\.", r"(?:[^.]+\.)*")
+    pattern = pattern.replace("#", r".*")
+    return re.compile(pattern)
+
+
+def topic_matches(binding_key: str, routing_key: str) -> bool:
+    """AMQP topic-exchange matching: ``*`` is exactly one word, ``#`` is
+    zero or more words."""
+    return _topic_regex(binding_key).fullmatch(routing_key) is not None
+
+
+# ---------------------------------------------------------------------------
+# Broker state
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _Binding:
+    destination: str
+    routing_key: str
+    to_queue: bool
+
+
+@dataclass
+class _Exchange:
+    name: str
+    exchange_type: str
+    internal: bool
+    durable: bool
+    bindings: list[_Binding] = field(default_factory=list)
+
+
+@dataclass
+class _Message:
+    exchange: str
+    routing_key: str
+    body: bytes
+    properties: spec.BasicProperties
+    redelivered: bool = False
+
+
+@dataclass
+class _Consumer:
+    tag: str
+    queue: "_Queue"
+    channel: "LoopbackChannel"
+    callback: Callable[..., Any]
+    prefetch_count: int
+    auto_ack: bool
+    unacked: int = 0
+
+    def has_capacity(self) -> bool:
+        return self.prefetch_count == 0 or self.unacked < self.prefetch_count
+
+
+@dataclass
+class _Queue:
+    name: str
+    auto_delete: bool
+    messages: deque[_Message] = field(default_factory=deque)
+    consumers: list[_Consumer] = field(default_factory=list)
+    next_consumer: int = 0
+    had_consumer: bool = False
+
+
+class LoopbackBroker:
+    """An in-memory topic broker shared by every connection made through
+    ``connect``. All state is guarded by one lock; deliveries are scheduled
+    onto the consuming connection's ioloop."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._exchanges: dict[str, _Exchange] = {}
+        self._queues: dict[str, _Queue] = {}
+        self._connections: list[LoopbackConnection] = []
+        self._queue_counter = itertools.count(1)
+        self._tag_counter = itertools.count(1)
+        self._available = True
+        # Built-ins every RabbitMQ vhost carries.
+        self._exchanges[DEFAULT_EXCHANGE] = _Exchange(
+            DEFAULT_EXCHANGE, "direct", internal=False, durable=True
+        )
+        self._exchanges[topology.AMQP_TOPIC] = _Exchange(
+            topology.AMQP_TOPIC, "topic", internal=False, durable=True
+        )
+
+    @classmethod
+    def provisioned(cls) -> "LoopbackBroker":
+        """A broker with the full gwbase fabric already declared — the
+        loopback equivalent of loading the generated definitions."""
+        broker = cls()
+        broker.provision_topology()
+        return broker
+
+    def provision_topology(self) -> None:
+        """Declare every exchange + binding from ``gwbase.topology``."""
+        for ex in topology.exchanges():
+            self.exchange_declare(
+                ex.name,
+                exchange_type=ex.exchange_type,
+                internal=ex.internal,
+                durable=ex.durable,
+            )
+        for b in topology.exchange_bindings():
+            self.exchange_bind(
+                destination=b.destination, source=b.source, routing_key=b.routing_key
+            )
+
+    # ------------------------------------------------------------------
+    # Admin API (also used by LoopbackChannel)
+    # ------------------------------------------------------------------
+
+    def exchange_declare(
+        self,
+        name: str,
+        *,
+        exchange_type: str = "topic",
+        internal: bool = False,
+        durable: bool = True,
+        passive: bool = False,
+    ) -> None:
+        with self._lock:
+            existing = self._exchanges.get(name)
+            if passive:
+                if existing is None:
+                    raise LoopbackChannelError(
+                        _NOT_FOUND, f"NOT_FOUND - no exchange '{name}'"
+                    )
+                return
+            if existing is not None:
+                if (
+                    existing.exchange_type != exchange_type
+                    or existing.internal != internal
+                    or existing.durable != durable
+                ):
+                    raise LoopbackChannelError(
+                        _PRECONDITION_FAILED,
+                        f"PRECONDITION_FAILED - inequivalent arg for exchange '{name}'",
+                    )
+                return
+            if exchange_type != "topic":
+                raise LoopbackChannelError(
+                    _PRECONDITION_FAILED,
+                    f"loopback supports only topic exchanges, got {exchange_type!r}",
+                )
+            self._exchanges[name] = _Exchange(name, exchange_type, internal, durable)
+
+    def exchange_bind(self, *, destination: str, source: str, routing_key: str) -> None:
+        with self._lock:
+            self._require_exchange(source)
+            self._require_exchange(destination)
+            binding = _Binding(destination, routing_key, to_queue=False)
+            if binding not in self._exchanges[source].bindings:
+                self._exchanges[source].bindings.append(binding)
+
+    def queue_declare(self, name: str, *, auto_delete: bool = False) -> str:
+        with self._lock:
+            if not name:
+                name = f"amq.gen-loopback-{next(self._queue_counter)}"
+            if name not in self._queues:
+                self._queues[name] = _Queue(name, auto_delete)
+            return name
+
+    def queue_bind(self, *, queue: str, exchange: str, routing_key: str) -> None:
+        with self._lock:
+            self._require_queue(queue)
+            self._require_exchange(exchange)
+            binding = _Binding(queue, routing_key, to_queue=True)
+            if binding not in self._exchanges[exchange].bindings:
+                self._exchanges[exchange].bindings.append(binding)
+
+    def publish(
+        self,
+        *,
+        exchange: str,
+        routing_key: str,
+        body: bytes,
+        properties: spec.BasicProperties | None = None,
+    ) -> int:
+        """Route ``body`` from ``exchange`` and return how many queues it
+        reached. Publishing to an internal exchange is refused."""
+        with self._lock:
+            ex = self._require_exchange(exchange)
+            if ex.internal:
+                raise LoopbackChannelError(
+                    _ACCESS_REFUSED,
+                    f"ACCESS_REFUSED - cannot publish to internal exchange '{exchange}'",
+                )
+            targets = self._route(exchange, routing_key)
+            for q in targets:
+                q.messages.append(
+                    _Message(
+                        exchange,
+                        routing_key,
+                        body,
+                        properties or spec.BasicProperties(),
+                    )
+                )
+                self._dispatch(q)
+            return len(targets)
+
+    def set_available(self, available: bool) -> None:
+        """Simulate a broker outage: while unavailable, new connections fail
+        through their ``on_open_error_callback``."""
+        self._available = available
+
+    def drop_connections(self) -> None:
+        """Force-close every open connection (``320 CONNECTION_FORCED``), as a
+        broker restart would. Actors see an unexpected close and reconnect."""
+        with self._lock:
+            conns = [c for c in self._connections if c.is_open]
+        for conn in conns:
+            conn._close(
+                ConnectionClosedByBroker(_CONNECTION_FORCED, "CONNECTION_FORCED")
+            )
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def queue_names(self) -> list[str]:
+        with self._lock:
+            return sorted(self._queues)
+
+    def queue_depth(self, name: str) -> int:
+        """Messages ready (not yet delivered) on queue ``name``."""
+        with self._lock:
+            return len(self._require_queue(name).messages)
+
+    def consumer_count(self, name: str) -> int:
+        with self._lock:
+            return len(self._require_queue(name).consumers)
+
+    def queue_bindings(self, name: str) -> list[tuple[str, str]]:
+        """``(exchange, routing_key)`` pairs bound to queue ``name``."""
+        with self._lock:
+            return [
+                (ex.name, b.routing_key)
+                for ex in self._exchanges.values()
+                for b in ex.bindings
+                if b.to_queue and b.destination == name
+            ]
+
+    def open_connections(self) -> list["LoopbackConnection"]:
+        with self._lock:
+            return [c for c in self._connections if c.is_open]
+
+    def is_idle(self) -> bool:
+        """True when no message is queued, unacked or waiting on an open
+        connection's ioloop."""
+        with self._lock:
+            for q in self._queues.values():
+                if q.messages or any(c.unacked for c in q.consumers):
+                    return False
+            return all(c.ioloop.pending == 0 for c in self._connections if c.is_open)
+
+    def wait_idle(self, timeout_s: float = 5.0, interval_s: float = 0.001) -> None:
+        """Block until ``is_idle`` — the loopback replacement for polling
+        recorder state with ``wait_for``."""
+        deadline = time.monotonic() + timeout_s
+        while time.monotonic() < deadline:
+            if self.is_idle():
+                return
+            time.sleep(interval_s)
+        raise TimeoutError(f"Loopback broker not idle after {timeout_s}s")
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def connect(
+        self,
+        *,
+        parameters: Any = None,
+        on_open_callback: Callable[..., Any] | None = None,
+        on_open_error_callback: Callable[..., Any] | None = None,
+        on_close_callback: Callable[..., Any] | None = None,
+    ) -> "LoopbackConnection":
+        """``pika.SelectConnection``-compatible factory: pass as an actor's
+        ``connection_factory``."""
+        conn = LoopbackConnection(
+            self,
+            parameters=parameters,
+            on_open_callback=on_open_callback,
+            on_open_error_callback=on_open_error_callback,
+            on_close_callback=on_close_callback,
+        )
+        with self._lock:
+            self._connections = [c for c in self._connections if not c.is_closed]
+            self._connections.append(conn)
+        if self._available:
+            conn._open()
+        else:
+            conn._fail(AMQPConnectionError("loopback broker unavailable"))
+        return conn
+
+    # ------------------------------------------------------------------
+    # Internals (caller holds the lock)
+    # ------------------------------------------------------------------
+
+    def _require_exchange(self, name: str) -> _Exchange:
+        ex = self._exchanges.get(name)
+        if ex is None:
+            raise LoopbackChannelError(_NOT_FOUND, f"NOT_FOUND - no exchange '{name}'")
+        return ex
+
+    def _require_queue(self, name: str) -> _Queue:
+        q = self._queues.get(name)
+        if q is None:
+            raise LoopbackChannelError(_NOT_FOUND, f"NOT_FOUND - no queue '{name}'")
+        return q
+
+    def _route(self, exchange: str, routing_key: str) -> list[_Queue]:
+        """Every queue reachable from ``exchange`` for ``routing_key``,
+        following exchange-to-exchange bindings. A queue receives at most one
+        copy however many paths reach it; exchange cycles are cut."""
+        if exchange == DEFAULT_EXCHANGE:
+            q = self._queues.get(routing_key)
+            return [q] if q is not None else []
+        seen: set[str] = set()
+        found: dict[str, _Queue] = {}
+        pending = [exchange]
+        while pending:
+            name = pending.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            for b in self._exchanges[name].bindings:
+                if not topic_matches(b.routing_key, routing_key):
+                    continue
+                if b.to_queue:
+                    q = self._queues.get(b.destination)
+                    if q is not None:
+                        found.setdefault(q.name, q)
+                else:
+                    pending.append(b.destination)
+        return list(found.values())
+
+    @staticmethod
+    def _dispatch(q: _Queue) -> None:
+        """Hand ready messages to consumers with prefetch capacity,
+        round-robin."""
+        while q.messages and q.consumers:
+            consumer = None
+            for _ in range(len(q.consumers)):
+                candidate = q.consumers[q.next_consumer % len(q.consumers)]
+                q.next_consumer += 1
+                if candidate.has_capacity():
+                    consumer = candidate
+                    break
+            if consumer is None:
+                return
+            consumer.channel._deliver(consumer, q.messages.popleft())
+
+    def _add_consumer(self, consumer: _Consumer) -> None:
+        consumer.queue.consumers.append(consumer)
+        consumer.queue.had_consumer = True
+        self._dispatch(consumer.queue)
+
+    def _remove_consumer(self, consumer: _Consumer) -> None:
+        q = consumer.queue
+        if consumer in q.consumers:
+            q.consumers.remove(consumer)
+        if q.auto_delete and q.had_consumer and not q.consumers:
+            self._delete_queue(q)
+
+    def _delete_queue(self, q: _Queue) -> None:
+        self._queues.pop(q.name, None)
+        for ex in self._exchanges.values():
+            ex.bindings = [
+                b for b in ex.bindings if not (b.to_queue and b.destination == q.name)
+            ]
+
+    def _requeue(self, q: _Queue, messages: list[_Message]) -> None:
+        if q.name not in self._queues:
+            return
+        for msg in reversed(messages):
+            msg.redelivered = True
+            q.messages.appendleft(msg)
+        self._dispatch(q)
+
+
+# ---------------------------------------------------------------------------
+# pika-shaped connection / channel / ioloop
+# ---------------------------------------------------------------------------
+
+
+_STOP = object()
+
+
+class LoopbackIOLoop:
+    """A callback queue drained by ``start`` on the thread that calls it —
+    the loopback analogue of pika's ``IOLoop``. ``add_callback_threadsafe``
+    is the only cross-thread entry point, as with pika."""
+
+    def __init__(self) -> None:
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Callbacks scheduled but not yet finished."""
+        return self._pending
+
+    def add_callback_threadsafe(self, callback: Callable[[], Any]) -> None:
+        with self._pending_lock:
+            self._pending += 1
+        self._queue.put(callback)
+
+    # pika's SelectConnection ioloop exposes both names.
+    add_callback = add_callback_threadsafe
+
+    def call_later(self, delay: float, callback: Callable[[], Any]) -> threading.Timer:
+        timer = threading.Timer(delay, self.add_callback_threadsafe, (callback,))
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def start(self) -> None:
+        """Run callbacks until ``stop``. Exceptions are logged, never raised
+        out of the loop."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            self._run(item)
+
+    def stop(self) -> None:
+        self._queue.put(_STOP)
+
+    def process_pending(self) -> int:
+        """Run every callback already queued (and any they schedule) on the
+        calling thread without blocking; return how many ran. For
+        single-threaded tests that drive the loop by hand."""
+        ran = 0
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return ran
+            if item is _STOP:
+                continue
+            self._run(item)
+            ran += 1
+
+    def _run(self, callback: Callable[[], Any]) -> None:
+        try:
+            callback()
+        except Exception:
+            LOGGER.exception("Loopback ioloop callback raised")
+        finally:
+            with self._pending_lock:
+                self._pending -= 1
+
+
+class LoopbackConnection:
+    """Stands in for ``pika.SelectConnection``: owns an ioloop and hands out
+    ``LoopbackChannel`` objects."""
+
+    def __init__(
+        self,
+        broker: LoopbackBroker,
+        *,
+        parameters: Any,
+        on_open_callback: Callable[..., Any] | None,
+        on_open_error_callback: Callable[..., Any] | None,
+        on_close_callback: Callable[..., Any] | None,
+    ) -> None:
+        self._broker = broker
+        self.ioloop = LoopbackIOLoop()
+        self.client_properties: dict[str, Any] = dict(
+            getattr(parameters, "client_properties", None) or {}
+        )
+        self._on_open_callback = on_open_callback
+        self._on_open_error_callback = on_open_error_callback
+        self._on_close_callback = on_close_callback
+        self._channels: dict[int, LoopbackChannel] = {}
+        self._channel_numbers = itertools.count(1)
+        self._state = "opening"
+
+    @property
+    def is_open(self) -> bool:
+        return self._state == "open"
+
+    @property
+    def is_closing(self) -> bool:
+        return self._state == "closing"
+
+    @property
+    def is_closed(self) -> bool:
+        return self._state == "closed"
+
+    def channel(
+        self,
+        channel_number: int | None = None,
+        on_open_callback: Callable[..., Any] | None = None,
+    ) -> "LoopbackChannel":
+        if not self.is_open:
+            raise ConnectionWrongStateError("Connection is not open")
+        number = channel_number or next(self._channel_numbers)
+        ch = LoopbackChannel(self, number)
+        self._channels[number] = ch
+        if on_open_callback is not None:
+            self._schedule(on_open_callback, ch)
+        return ch
+
+    def close(self, reply_code: int = 200, reply_text: str = "Normal shutdown") -> None:
+        if self.is_closing or self.is_closed:
+            raise ConnectionWrongStateError("Connection is already closing/closed")
+        self._close(ConnectionClosedByClient(reply_code, reply_text))
+
+    # -- internals --------------------------------------------------------
+
+    def _schedule(self, callback: Callable[..., Any], *args: Any) -> None:
+        self.ioloop.add_callback_threadsafe(functools.partial(callback, *args))
+
+    def _open(self) -> None:
+        self._state = "open"
+        if self._on_open_callback is not None:
+            self._schedule(self._on_open_callback, self)
+
+    def _fail(self, err: Exception) -> None:
+        self._state = "closed"
+        if self._on_open_error_callback is not None:
+            self._schedule(self._on_open_error_callback, self, err)
+
+    def _close(self, reason: Exception) -> None:
+        self._state = "closing"
+        for ch in list(self._channels.values()):
+            if not ch.is_closed:
+                ch._close(reason)
+        self._channels.clear()
+        self._state = "closed"
+        if self._on_close_callback is not None:
+            self._schedule(self._on_close_callback, self, reason)
+
+
+class LoopbackChannel:
+    """Stands in for ``pika.channel.Channel``. Broker state changes happen
+    immediately (under the broker lock); completion callbacks are scheduled
+    onto the connection's ioloop, as pika delivers them."""
+
+    def __init__(self, connection: LoopbackConnection, channel_number: int) -> None:
+        self.connection = connection
+        self.channel_number = channel_number
+        self._broker = connection._broker
+        self._state = "open"
+        self._prefetch_count = 0
+        self._consumers: dict[str, _Consumer] = {}
+        self._unacked: dict[int, tuple[_Consumer, _Message]] = {}
+        self._delivery_tags = itertools.count(1)
+        self._on_close_callbacks: list[Callable[..., Any]] = []
+        self._on_cancel_callbacks: list[Callable[..., Any]] = []
+
+    def __int__(self) -> int:
+        return self.channel_number
+
+    def __repr__(self) -> str:
+        return f"<LoopbackChannel number={self.channel_number} state={self._state}>"
+
+    @property
+    def is_open(self) -> bool:
+        return self._state == "open"
+
+    @property
+    def is_closing(self) -> bool:
+        return self._state == "closing"
+
+    @property
+    def is_closed(self) -> bool:
+        return self._state == "closed"
+
+    @property
+    def consumer_tags(self) -> list[str]:
+        return list(self._consumers)
+
+    def add_on_close_callback(self, callback: Callable[..., Any]) -> None:
+        self._on_close_callbacks.append(callback)
+
+    def add_on_cancel_callback(self, callback: Callable[..., Any]) -> None:
+        self._on_cancel_callbacks.append(callback)
+
+    # -- declarations -----------------------------------------------------
+
+    def exchange_declare(  # noqa: PLR0913, PLR0917 — mirrors pika's signature
+        self,
+        exchange: str,
+        exchange_type: str = "direct",
+        passive: bool = False,
+        durable: bool = False,
+        auto_delete: bool = False,
+        internal: bool = False,
+        arguments: dict[str, Any] | None = None,
+        callback: Callable[..., Any] | None = None,
+    ) -> None:
+        self._rpc(
+            lambda: self._broker.exchange_declare(
+                exchange,
+                exchange_type=str(exchange_type),
+                internal=internal,
+                durable=durable,
+                passive=passive,
+            ),
+            spec.Exchange.DeclareOk(),
+            callback,
+        )
+
+    def exchange_bind(
+        self,
+        destination: str,
+        source: str,
+        routing_key: str = "",
+        arguments: dict[str, Any] | None = None,
+        callback: Callable[..., Any] | None = None,
+    ) -> None:
+        self._rpc(
+            lambda: self._broker.exchange_bind(
+                destination=destination, source=source, routing_key=routing_key
+            ),
+            spec.Exchange.BindOk(),
+            callback,
+        )
+
+    def queue_declare(  # noqa: PLR0913, PLR0917 — mirrors pika's signature
+        self,
+        queue: str,
+        passive: bool = False,
+        durable: bool = False,
+        exclusive: bool = False,
+        auto_delete: bool = False,
+        arguments: dict[str, Any] | None = None,
+        callback: Callable[..., Any] | None = None,
+    ) -> None:
+        def declare() -> None:
+            if passive:
+                self._broker._require_queue(queue)
+                name = queue
+            else:
+                name = self._broker.queue_declare(queue, auto_delete=auto_delete)
+            q = self._broker._queues[name]
+            ok.queue = name
+            ok.message_count = len(q.messages)
+            ok.consumer_count = len(q.consumers)
+
+        ok = spec.Queue.DeclareOk()
+        self._rpc(declare, ok, callback)
+
+    def queue_bind(
+        self,
+        queue: str,
+        exchange: str,
+        routing_key: str | None = None,
+        arguments: dict[str, Any] | None = None,
+        callback: Callable[..., Any] | None = None,
+    ) -> None:
+        self._rpc(
+            lambda: self._broker.queue_bind(
+                queue=queue,
+                exchange=exchange,
+                routing_key=queue if routing_key is None else routing_key,
+            ),
+            spec.Queue.BindOk(),
+            callback,
+        )
+
+    # -- consuming --------------------------------------------------------
+
+    def basic_qos(
+        self,
+        prefetch_size: int = 0,
+        prefetch_count: int = 0,
+        global_qos: bool = False,
+        callback: Callable[..., Any] | None = None,
+    ) -> None:
+        def apply() -> None:
+            self._prefetch_count = prefetch_count
+
+        self._rpc(apply, spec.Basic.QosOk(), callback)
+
+    def basic_consume(  # noqa: PLR0913, PLR0917 — mirrors pika's signature
+        self,
+        queue: str,
+        on_message_callback: Callable[..., Any],
+        auto_ack: bool = False,
+        exclusive: bool = False,
+        consumer_tag: str | None = None,
+        arguments: dict[str, Any] | None = None,
+        callback: Callable[..., Any] | None = None,
+    ) -> str:
+        tag = consumer_tag or f"ctag-loopback-{next(self._broker._tag_counter)}"
+
+        def consume() -> None:
+            q = self._broker._require_queue(queue)
+            consumer = _Consumer(
+                tag=tag,
+                queue=q,
+                channel=self,
+                callback=on_message_callback,
+                prefetch_count=self._prefetch_count,
+                auto_ack=auto_ack,
+            )
+            self._consumers[tag] = consumer
+            self._broker._add_consumer(consumer)
+
+        # pika-stubs types consumer_tag as int; on the wire it is a str.
+        ok = spec.Basic.ConsumeOk(tag)  # type: ignore[arg-type]
+        self._rpc(consume, ok, callback)
+        return tag
+
+    def basic_cancel(
+        self, consumer_tag: str = "", callback: Callable[..., Any] | None = None
+    ) -> None:
+        def cancel() -> None:
+            consumer = self._consumers.pop(consumer_tag, None)
+            if consumer is not None:
+                self._broker._remove_consumer(consumer)
+
+        ok = spec.Basic.CancelOk(consumer_tag)  # type: ignore[arg-type]
+        self._rpc(cancel, ok, callback)
+
+    def basic_ack(self, delivery_tag: int = 0, multiple: bool = False) -> None:
+        self._settle(delivery_tag, multiple=multiple, requeue=None)
+
+    def basic_nack(
+        self, delivery_tag: int = 0, multiple: bool = False, requeue: bool = True
+    ) -> None:
+        self._settle(delivery_tag, multiple=multiple, requeue=requeue)
+
+    def basic_reject(self, delivery_tag: int = 0, requeue: bool = True) -> None:
+        self._settle(delivery_tag, multiple=False, requeue=requeue)
+
+    # -- publishing -------------------------------------------------------
+
+    def basic_publish(
+        self,
+        exchange: str,
+        routing_key: str,
+        body: bytes,
+        properties: spec.BasicProperties | None = None,
+        mandatory: bool = False,
+    ) -> None:
+        self._require_open()
+        try:
+            self._broker.publish(
+                exchange=exchange,
+                routing_key=routing_key,
+                body=body,
+                properties=properties,
+            )
+        except LoopbackChannelError as e:
+            self._close(ChannelClosedByBroker(e.reply_code, e.reply_text))
+
+    def close(self, reply_code: int = 0, reply_text: str = "Normal shutdown") -> None:
+        if self.is_closing or self.is_closed:
+            raise ChannelWrongStateError("Channel is already closing/closed")
+        self._close(ChannelClosedByClient(reply_code, reply_text))
+
+    # -- internals --------------------------------------------------------
+
+    def _require_open(self) -> None:
+        if not self.is_open:
+            raise ChannelWrongStateError("Channel is closed.")
+
+    def _rpc(
+        self,
+        action: Callable[[], None],
+        reply: Any,
+        callback: Callable[..., Any] | None,
+    ) -> None:
+        """Apply ``action`` to the broker now; on success schedule
+        ``callback(Method(reply))``, on an AMQP error close the channel."""
+        self._require_open()
+        try:
+            with self._broker._lock:
+                action()
+        except LoopbackChannelError as e:
+            self._close(ChannelClosedByBroker(e.reply_code, e.reply_text))
+            return
+        if callback is not None:
+            self.connection._schedule(
+                callback, frame.Method(self.channel_number, reply)
+            )
+
+    def _deliver(self, consumer: _Consumer, msg: _Message) -> None:
+        """Called by the broker (lock held) to hand ``msg`` to ``consumer``."""
+        delivery_tag = next(self._delivery_tags)
+        if not consumer.auto_ack:
+            consumer.unacked += 1
+            self._unacked[delivery_tag] = (consumer, msg)
+        deliver = spec.Basic.Deliver(
+            consumer_tag=consumer.tag,
+            delivery_tag=delivery_tag,
+            redelivered=msg.redelivered,
+            exchange=msg.exchange,
+            routing_key=msg.routing_key,
+        )
+
+        def on_ioloop() -> None:
+            if self.is_open and consumer.tag in self._consumers:
+                consumer.callback(self, deliver, msg.properties, msg.body)
+
+        self.connection._schedule(on_ioloop)
+
+    def _settle(
+        self, delivery_tag: int, *, multiple: bool, requeue: bool | None
+    ) -> None:
+        self._require_open()
+        with self._broker._lock:
+            if multiple:
+                tags = [
+                    t for t in self._unacked if delivery_tag == 0 or t <= delivery_tag
+                ]
+            elif delivery_tag in self._unacked:
+                tags = [delivery_tag]
+            else:
+                err = LoopbackChannelError(
+                    _PRECONDITION_FAILED,
+                    f"PRECONDITION_FAILED - unknown delivery tag {delivery_tag}",
+                )
+                self._close(ChannelClosedByBroker(err.reply_code, err.reply_text))
+                return
+            touched: dict[str, _Queue] = {}
+            for tag in tags:
+                consumer, msg = self._unacked.pop(tag)
+                consumer.unacked -= 1
+                touched[consumer.queue.name] = consumer.queue
+                if requeue:
+                    self._broker._requeue(consumer.queue, [msg])
+            for q in touched.values():
+                self._broker._dispatch(q)
+
+    def _close(self, reason: Exception) -> None:
+        """Close the channel: cancel its consumers (auto-delete fires),
+        requeue unacked deliveries, then schedule the close callbacks."""
+        if self.is_closed:
+            return
+        self._state = "closing"
+        with self._broker._lock:
+            pending: dict[str, tuple[_Queue, list[_Message]]] = {}
+            for consumer, msg in self._unacked.values():
+                pending.setdefault(consumer.queue.name, (consumer.queue, []))[1].append(
+                    msg
+                )
+            self._unacked.clear()
+            for consumer in self._consumers.values():
+                self._broker._remove_consumer(consumer)
+            self._consumers.clear()
+            for q, msgs in pending.values():
+                self._broker._requeue(q, msgs)
+        self._state = "closed"
+        for callback in self._on_close_callbacks:
+            self.connection._schedule(callback, self, reason)
@@ -4,15 +4,18 @@ import random
 from abc import ABC, abstractmethod
 from typing import no_type_check
 
-from gwbase.actor_base import ActorBase
+from gwbase.actor_base import ActorBase, ConnectionFactory
 from gwbase.config import ServiceSettings
 from gwbase.sema import GwBaseSemaCodec
-from gwbase.sema.types import HeartbeatA, Ready, SimTimestep
+from gwbase.sema.fast_types import FastHeartbeatA, FastReady, FastSimTimestep
+from gwbase.sema.types import HeartbeatA, SimTimestep
 from gwbase.transport_encoding import (
     BroadcastRoutingEnvelope,
     DirectRoutingEnvelope,
     MessageCategory,
+    PayloadEncoding,
     RoutingEnvelope,
+    SerialRoutingEnvelope,
     TransportClass,
     routing_code,
 )
@@ -29,8 +32,9 @@ class Orchestrator(ActorBase, ABC):
     explicit ``__init__`` param (intrinsic to the actor's role, not
     deployment config — like ``my_super_alias``). From it, ``Orchestrator``
     names its class exchanges (``<rc>_tx`` consume / ``<rc>mic_tx`` publish)
-    and binds its queue direct-to-me, and it gains ``direct_envelope`` /
-    ``broadcast_envelope`` (which stamp ``from_class``).
+    and binds its queue direct-to-me (JsonDirect and Serial), and it gains
+    ``direct_envelope`` / ``serial_envelope`` / ``broadcast_envelope`` (which
+    stamp ``from_class``).
 
     Used by Supervisor and TimeCoordinator (non-GNode orchestration
     participants, ``ServiceSettings``) and, with GNode identity added, by
@@ -43,6 +47,11 @@ class Orchestrator(ActorBase, ABC):
     """
 
     _CONTROL_PLANE_TYPES: frozenset[str] = frozenset({"heartbeat.a", "sim.timestep"})
+    # plain JSON bodies of these types skip pydantic when plainly valid
+    _FAST_CONTROL_PLANE: dict[str, type[FastHeartbeatA] | type[FastSimTimestep]] = {
+        FastHeartbeatA.type_name: FastHeartbeatA,
+        FastSimTimestep.type_name: FastSimTimestep,
+    }
 
     def __init__(
         self,
@@ -51,8 +60,9 @@ class Orchestrator(ActorBase, ABC):
         transport_class: TransportClass,
         my_super_alias: str,
         my_time_coordinator_alias: str,
+        connection_factory: ConnectionFactory | None = None,
     ):
-        super().__init__(settings=settings)
+        super().__init__(settings=settings, connection_factory=connection_factory)
 
         # Class routing: override the ear-tap defaults with this actor's
         # class consume/publish exchanges (infra owns the fabric, §3.5–§3.6).
@@ -80,12 +90,19 @@ class Orchestrator(ActorBase, ABC):
 
     @no_type_check
     def bind_queue(self) -> None:
-        """Bind the queue to this actor's consume exchange with a routing-key
-        pattern matching direct messages addressed to it. When the bind
-        completes pika invokes ``on_direct_message_bindok`` (which sets QoS)."""
+        """Bind the queue to this actor's consume exchange with routing-key
+        patterns matching direct messages (JsonDirect and Serial) addressed to
+        it. When the JsonDirect bind completes pika invokes
+        ``on_direct_message_bindok`` (which sets QoS)."""
         lrh_alias = self.alias.replace(".", "-")
         rj = MessageCategory.JsonDirect.value
         direct_message_to_me_binding = f"{rj}.*.*.*.*.{lrh_alias}"
+        s = MessageCategory.Serial.value
+        self._single_channel.queue_bind(
+            self.queue_name,
+            self._consume_exchange,
+            routing_key=f"{s}.*.*.*.*.{lrh_alias}",
+        )
         LOGGER.info(
             "Binding %s to %s with %s",
             self._consume_exchange,
@@ -122,6 +139,21 @@ class Orchestrator(ActorBase, ABC):
             to_alias=to_alias,
         )
 
+    def serial_envelope(
+        self,
+        *,
+        type_name: str,
+        to_class: TransportClass,
+        to_alias: str,
+    ) -> SerialRoutingEnvelope:
+        return SerialRoutingEnvelope.from_classes(
+            type_name=type_name,
+            from_alias=self.alias,
+            from_class=self.transport_class,
+            to_class=to_class,
+            to_alias=to_alias,
+        )
+
     def broadcast_envelope(
         self,
         *,
@@ -152,14 +184,28 @@ class Orchestrator(ActorBase, ABC):
     def _dispatch_control_plane(
         self, *, envelope: RoutingEnvelope, body: bytes
     ) -> None:
-        try:
-            obj = self._control_plane_codec.from_bytes(body)
-        except Exception as e:
-            LOGGER.warning(f"Failed to decode control-plane {envelope.type_name}: {e}")
-            return
-        if isinstance(obj, HeartbeatA):
+        codec = self._control_plane_codec
+        obj: object = None
+        if (
+            envelope.payload_encoding == PayloadEncoding.Json
+            and self.latest_content_type is None
+        ):
+            obj = self._FAST_CONTROL_PLANE[envelope.type_name].try_from_bytes(body)
+        if obj is None:
+            try:
+                obj = (
+                    codec.from_binary(body)
+                    if envelope.payload_encoding == PayloadEncoding.Binary
+                    else codec.from_bytes(body, content_type=self.latest_content_type)
+                )
+            except Exception as e:
+                LOGGER.warning(
+                    f"Failed to decode control-plane {envelope.type_name}: {e}"
+                )
+                return
+        if isinstance(obj, (HeartbeatA, FastHeartbeatA)):
             self._handle_heartbeat(obj, envelope=envelope, body=body)
-        elif isinstance(obj, SimTimestep):
+        elif isinstance(obj, (SimTimestep, FastSimTimestep)):
             self._handle_timestep(obj, from_alias=envelope.from_alias)
 
     # ------------------------------------------------------------------
@@ -167,7 +213,11 @@ class Orchestrator(ActorBase, ABC):
     # ------------------------------------------------------------------
 
     def _handle_heartbeat(
-        self, ping: HeartbeatA, *, envelope: RoutingEnvelope, body: bytes
+        self,
+        ping: HeartbeatA | FastHeartbeatA,
+        *,
+        envelope: RoutingEnvelope,
+        body: bytes,
     ) -> None:
         # Only a ping from THIS actor's supervisor is handled internally
         # (pong + on_supervisor_heartbeat hook). Any other heartbeat.a — e.g.
@@ -179,7 +229,9 @@ class Orchestrator(ActorBase, ABC):
         self.on_supervisor_heartbeat(from_alias=envelope.from_alias)
         self._send_heartbeat_response(ping=ping)
 
-    def _handle_timestep(self, ts: SimTimestep, *, from_alias: str) -> None:
+    def _handle_timestep(
+        self, ts: SimTimestep | FastSimTimestep, *, from_alias: str
+    ) -> None:
         if ts.time_unix_s < self._sim_time_unix_s:
             return
         is_new = ts.time_unix_s > self._sim_time_unix_s
@@ -212,8 +264,8 @@ class Orchestrator(ActorBase, ABC):
     # then handed to ActorBase as bytes + type_name
     # ------------------------------------------------------------------
 
-    def _send_heartbeat_response(self, ping: HeartbeatA) -> None:
-        pong = HeartbeatA(
+    def _send_heartbeat_response(self, ping: HeartbeatA | FastHeartbeatA) -> None:
+        pong = FastHeartbeatA(
             my_hex=random.choice("0123456789abcdef"),
             your_last_hex=ping.my_hex,
         )
@@ -223,7 +275,7 @@ class Orchestrator(ActorBase, ABC):
                 to_class=TransportClass.Supervisor,
                 to_alias=self._my_super_alias,
             ),
-            body=self._control_plane_codec.to_bytes(pong),
+            body=pong.to_bytes(),
         )
         LOGGER.debug(
             f"[{self.alias}] Sent HB pong: SuHex {pong.your_last_hex}, MyHex {pong.my_hex}"
@@ -232,7 +284,7 @@ class Orchestrator(ActorBase, ABC):
     def send_ready(self, *, time_unix_s: int | None = None) -> None:
         """Announce readiness for a simulated timestep to the time
         coordinator. Defaults to the latest received simulated time."""
-        msg = Ready(
+        msg = FastReady(
             from_g_node_alias=self.alias,
             from_g_node_instance_id=self.instance_id,
             time_unix_s=time_unix_s
@@ -245,7 +297,7 @@ class Orchestrator(ActorBase, ABC):
                 to_class=TransportClass.TimeCoordinator,
                 to_alias=self._my_time_coordinator_alias,
             ),
-            body=self._control_plane_codec.to_bytes(msg),
+            body=msg.to_bytes(),
         )
 
     # ------------------------------------------------------------------
@@ -6,10 +6,26 @@ from gwbase.sema.codec import (
     GwBaseSemaCodec,
     get_current_types,
 )
+from gwbase.sema.peek import peek_type
+from gwbase.sema.project import project, project_many
+from gwbase.sema.registry import (
+    SemaRegistry,
+    default_registry,
+    register_types,
+)
+from gwbase.sema.validation import ValidationPolicy, ValidationRule
 
 __all__ = [
     "GwBaseSemaType",
     "GwBaseSemaCodec",
     "GwBaseSemaError",
+    "SemaRegistry",
+    "ValidationPolicy",
+    "ValidationRule",
+    "default_registry",
     "get_current_types",
+    "peek_type",
+    "project",
+    "project_many",
+    "register_types",
 ]
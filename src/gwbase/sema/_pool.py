@@ -0,0 +1,69 @@
+"""The process-pool plumbing shared by ``gwbase.sema.migrate`` and
+``gwbase.sema.archive``: archives cut into chunks of lines, a registry
+named on the command line, and chunks run in a ``spawn`` pool with their
+results kept in input order.
+"""
+
+import itertools
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, TypeVar
+
+from gwbase._imports import resolve
+from gwbase.sema.registry import SemaRegistry
+
+IN_FLIGHT_PER_WORKER = 2
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunks(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """``items`` in lists of ``size`` (the last one shorter)."""
+    it = iter(items)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+def load_registry(registry: str | None) -> SemaRegistry | None:
+    """The ``SemaRegistry`` named ``"package.module:attr"``, or None for
+    gwbase's own."""
+    if registry is None:
+        return None
+    loaded = resolve(registry)
+    if not isinstance(loaded, SemaRegistry):
+        raise TypeError(f"<{registry}> is {type(loaded).__name__}, not SemaRegistry")
+    return loaded
+
+
+def map_in_order(
+    fn: Callable[..., R],
+    jobs: Iterable[tuple[Any, ...]],
+    *,
+    workers: int,
+    initializer: Callable[..., None],
+    initargs: tuple[Any, ...],
+) -> Iterator[R]:
+    """``fn(*job)`` for each job, run in a ``spawn`` pool of ``workers``
+    processes with at most ``IN_FLIGHT_PER_WORKER`` jobs in flight per
+    worker, yielded in input order. Jobs not yet run are cancelled when
+    the caller stops early."""
+    with ProcessPoolExecutor(
+        workers,
+        mp_context=get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    ) as pool:
+        pending: deque[Future[R]] = deque()
+        try:
+            for job in jobs:
+                pending.append(pool.submit(fn, *job))
+                if len(pending) >= workers * IN_FLIGHT_PER_WORKER:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,419 @@
+"""Write and stream Sema message archives: NDJSON in independent blocks.
+
+An archive holds one Sema body (``to_bytes``) per line. ``ArchiveWriter``
+writes it in blocks of ``block_lines`` lines, each compressed on its own
+with ``compression="gzip"`` or ``"zlib"``, so a block decodes without the
+ones before it:
+
+- a ``gzip`` archive is a multi-member gzip file, which ``gzip -dc`` and
+  ``gzip.open`` read whole as plain NDJSON;
+- a ``zlib`` archive is concatenated zlib streams (smaller block headers;
+  only this module reads it).
+
+Next to the archive the writer leaves its block index, ``<name>.idx``: the
+byte offset, size, first line and line count of each block.
+``read_index`` loads it, or rebuilds it by scanning the archive when it is
+missing or stale. A plain or ``.gz`` NDJSON file written elsewhere (by
+``migrate``, say) scans as blocks of ``block_lines`` lines, or as one
+block per gzip member.
+
+``read_bodies`` yields the raw bodies, decompressing as it goes, and
+``read_messages`` decodes them through ``GwBaseSemaCodec.from_bytes_many``
+``block_lines`` at a time, so memory is bounded by a block, not the
+archive. Both start at any line, seeking straight to its block. Blank
+lines count as lines but are not yielded. With ``workers > 1``,
+``read_messages`` decodes whole blocks in a ``spawn`` process pool (each
+worker reads its blocks from the file itself) and yields them in order; as
+in ``migrate``, application types reach the workers through
+``registry="package.module:attr"``::
+
+    python -m gwbase.sema.archive journal-2025.ndjson.gz --write-index
+"""
+
+import argparse
+import bisect
+import gzip
+import io
+import itertools
+import json
+import sys
+import zlib
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Literal, Self
+
+from gwbase.sema._pool import chunks, load_registry, map_in_order
+from gwbase.sema.base import DegradedSemaType, GwBaseSemaType
+from gwbase.sema.codec import GwBaseSemaCodec
+
+DEFAULT_BLOCK_LINES = 2000
+COMPRESS_LEVEL = 6
+
+Compression = Literal["none", "gzip", "zlib"]
+Decoded = GwBaseSemaType | DegradedSemaType | Exception
+
+_READ_SIZE = 1 << 16
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZLIB_CMF = b"\x78"
+_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "zlib": zlib.MAX_WBITS}
+
+
+@dataclass(frozen=True)
+class Block:
+    """Where one block sits in the archive file, and which lines it holds."""
+
+    offset: int
+    size: int
+    first_line: int
+    lines: int
+
+
+@dataclass(frozen=True)
+class ArchiveIndex:
+    compression: Compression
+    blocks: tuple[Block, ...]
+
+    @property
+    def lines(self) -> int:
+        return self.blocks[-1].first_line + self.blocks[-1].lines if self.blocks else 0
+
+    def block_at(self, line: int) -> int:
+        """The position in ``blocks`` of the block holding ``line``."""
+        if not 0 <= line < self.lines:
+            raise IndexError(f"line {line} is not in the archive")
+        return bisect.bisect_right([b.first_line for b in self.blocks], line) - 1
+
+
+class ArchiveWriter:
+    """Writes an archive and, on ``close``, its block index (see module
+    docstring). The compression defaults to gzip for a ``.gz`` path and
+    none otherwise."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        compression: Compression | None = None,
+        block_lines: int = DEFAULT_BLOCK_LINES,
+        codec: GwBaseSemaCodec | None = None,
+    ) -> None:
+        self.path = Path(path)
+        if compression is None:
+            compression = "gzip" if self.path.suffix == ".gz" else "none"
+        self.compression: Compression = compression
+        self.block_lines = block_lines
+        self.codec = codec or GwBaseSemaCodec()
+        self._file = self.path.open("wb")
+        self._pending: list[bytes] = []
+        self._blocks: list[Block] = []
+        self._offset = 0
+        self._lines = 0
+
+    def write(self, msg: GwBaseSemaType) -> None:
+        self.write_body(self.codec.to_bytes(msg))
+
+    def write_body(self, body: bytes) -> None:
+        """Append one encoded body. Raises ValueError for a body that would
+        not read back as one line."""
+        if b"\n" in body or not body.strip():
+            raise ValueError("An archive line must be one non-blank body")
+        self._pending.append(body)
+        if len(self._pending) >= self.block_lines:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        data = b"\n".join(self._pending) + b"\n"
+        if self.compression == "gzip":
+            data = gzip.compress(data, COMPRESS_LEVEL, mtime=0)
+        elif self.compression == "zlib":
+            data = zlib.compress(data, COMPRESS_LEVEL)
+        self._file.write(data)
+        self._blocks.append(
+            Block(self._offset, len(data), self._lines, len(self._pending))
+        )
+        self._offset += len(data)
+        self._lines += len(self._pending)
+        self._pending.clear()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._flush()
+        self._file.close()
+        _write_index(self.path, ArchiveIndex(self.compression, tuple(self._blocks)))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+# ============================================================================
+# INDEX
+# ============================================================================
+
+
+def index_path(path: Path) -> Path:
+    return path.with_name(path.name + ".idx")
+
+
+def read_index(path: Path, *, block_lines: int = DEFAULT_BLOCK_LINES) -> ArchiveIndex:
+    """The block index of the archive at ``path``: its ``.idx`` file if that
+    matches the archive's size, else a scan of the archive (plain NDJSON is
+    cut every ``block_lines`` lines)."""
+    path = Path(path)
+    size = path.stat().st_size
+    try:
+        saved = json.loads(index_path(path).read_bytes())
+    except FileNotFoundError:
+        saved = None
+    if saved is not None and saved["Size"] == size:
+        blocks = tuple(Block(*b) for b in saved["Blocks"])
+        return ArchiveIndex(saved["Compression"], blocks)
+    with path.open("rb") as f:
+        compression = _detect(f)
+        if compression == "none":
+            return ArchiveIndex(compression, tuple(_scan_lines(f, block_lines)))
+        return ArchiveIndex(compression, tuple(_scan_members(f, compression)))
+
+
+def _write_index(path: Path, index: ArchiveIndex) -> None:
+    saved = {
+        "Compression": index.compression,
+        "Size": sum(b.size for b in index.blocks),
+        "Blocks": [[b.offset, b.size, b.first_line, b.lines] for b in index.blocks],
+    }
+    index_path(path).write_text(json.dumps(saved, separators=(",", ":")))
+
+
+def _detect(f: BinaryIO) -> Compression:
+    """The compression of ``f``, from its first bytes (a JSON line starts
+    with neither magic)."""
+    head = f.read(2)
+    f.seek(0)
+    if head == _GZIP_MAGIC:
+        return "gzip"
+    # a zlib header (RFC 1950) is a multiple of 31; deflate, 32 KiB window
+    if head.startswith(_ZLIB_CMF) and int.from_bytes(head) % 31 == 0:
+        return "zlib"
+    return "none"
+
+
+def _scan_lines(f: BinaryIO, block_lines: int) -> Iterator[Block]:
+    offset = first_line = 0
+    while lines := list(itertools.islice(f, block_lines)):
+        size = sum(map(len, lines))
+        yield Block(offset, size, first_line, len(lines))
+        offset += size
+        first_line += len(lines)
+
+
+def _scan_members(f: BinaryIO, compression: Compression) -> Iterator[Block]:
+    """One block per compressed member, found by decompressing (and
+    discarding) the archive once."""
+    offset = first_line = lines = fed = 0
+    ends_line = True
+    d = zlib.decompressobj(_WBITS[compression])
+    data = f.read(_READ_SIZE)
+    while data:
+        fed += len(data)
+        out = _decompress(d, data, compression)
+        lines += out.count(b"\n")
+        ends_line = out.endswith(b"\n") if out else ends_line
+        if not d.eof:
+            data = f.read(_READ_SIZE)
+            continue
+        data = d.unused_data or f.read(_READ_SIZE)
+        size = fed - len(d.unused_data)
+        lines += not ends_line  # a last line without its newline
+        yield Block(offset, size, first_line, lines)
+        offset += size
+        first_line += lines
+        lines = fed = 0
+        ends_line = True
+        d = zlib.decompressobj(_WBITS[compression])
+    if fed:
+        raise ValueError(f"Truncated {compression} block at byte {offset}")
+
+
+# ============================================================================
+# READING
+# ============================================================================
+
+
+def _decompress(d: "zlib._Decompress", data: bytes, compression: Compression) -> bytes:
+    try:
+        return d.decompress(data)
+    except zlib.error as e:
+        raise ValueError(f"Invalid {compression} data: {e}") from e
+
+
+def _stream(f: BinaryIO, compression: Compression) -> Iterator[bytes]:
+    """The decompressed bytes of ``f`` from its position on, in pieces."""
+    if compression == "none":
+        while data := f.read(_READ_SIZE):
+            yield data
+        return
+    d = zlib.decompressobj(_WBITS[compression])
+    started = False
+    while data := f.read(_READ_SIZE):
+        while data:
+            started = True
+            yield _decompress(d, data, compression)
+            if not d.eof:
+                break
+            data, started = d.unused_data, False
+            d = zlib.decompressobj(_WBITS[compression])
+    if started:
+        raise ValueError(f"Truncated {compression} block")
+
+
+def _lines(pieces: Iterable[bytes]) -> Iterator[bytes]:
+    rest = b""
+    for piece in pieces:
+        lines = (rest + piece).split(b"\n")
+        rest = lines.pop()
+        yield from lines
+    if rest:
+        yield rest
+
+
+def _bodies(lines: Iterable[bytes]) -> Iterator[bytes]:
+    for line in lines:
+        body = line.rstrip(b"\r")
+        if body.strip():
+            yield body
+
+
+def read_bodies(
+    path: Path, *, start_line: int = 0, index: ArchiveIndex | None = None
+) -> Iterator[bytes]:
+    """The bodies of the archive at ``path``, in order, from line
+    ``start_line`` (0-based) on (see module docstring). The index, read
+    with ``read_index`` unless given, is only needed to start past line 0."""
+    path = Path(path)
+    with path.open("rb") as f:
+        skip = start_line
+        if start_line:
+            index = index or read_index(path)
+            if start_line >= index.lines:
+                return
+            block = index.blocks[index.block_at(start_line)]
+            f.seek(block.offset)
+            skip -= block.first_line
+            compression = index.compression
+        else:
+            compression = _detect(f)
+        lines = _lines(_stream(f, compression))
+        yield from _bodies(itertools.islice(lines, skip, None))
+
+
+def read_messages(  # noqa: PLR0913 — keyword-only options
+    path: Path,
+    *,
+    start_line: int = 0,
+    mode: Literal["strict", "degraded"] = "strict",
+    codec: GwBaseSemaCodec | None = None,
+    workers: int = 1,
+    registry: str | None = None,
+    block_lines: int = DEFAULT_BLOCK_LINES,
+) -> Iterator[Decoded]:
+    """The messages of the archive at ``path``, in order, from line
+    ``start_line`` on, decoded as ``from_bytes_many`` decodes them: a body
+    that fails yields its exception, in its slot. ``codec`` decodes in this
+    process; workers build theirs from ``registry`` (default: gwbase's)."""
+    path = Path(path)
+    if workers <= 1:
+        codec = codec or GwBaseSemaCodec(load_registry(registry))
+        bodies = read_bodies(path, start_line=start_line)
+        for chunk in chunks(bodies, block_lines):
+            yield from codec.from_bytes_many(chunk, mode=mode)
+        return
+    if codec is not None:
+        raise ValueError("Workers decode with registry=..., not a codec")
+    index = read_index(path, block_lines=block_lines)
+    if start_line >= index.lines:
+        return
+    first = index.block_at(start_line)
+    skips = itertools.chain(
+        [start_line - index.blocks[first].first_line], itertools.repeat(0)
+    )
+    jobs = (
+        (path, index.compression, block, skip, mode)
+        for block, skip in zip(index.blocks[first:], skips, strict=False)
+    )
+    for decoded in map_in_order(
+        _decode_in_worker,
+        jobs,
+        workers=workers,
+        initializer=_init_worker,
+        initargs=(registry,),
+    ):
+        yield from decoded
+
+
+_worker_codec: GwBaseSemaCodec | None = None
+
+
+def _init_worker(registry: str | None) -> None:
+    global _worker_codec  # noqa: PLW0603 — one codec per pool process
+    _worker_codec = GwBaseSemaCodec(load_registry(registry))
+
+
+def _decode_in_worker(
+    path: Path,
+    compression: Compression,
+    block: Block,
+    skip: int,
+    mode: Literal["strict", "degraded"],
+) -> list[Decoded]:
+    if _worker_codec is None:
+        raise RuntimeError("pool initializer did not run")
+    with path.open("rb") as f:
+        f.seek(block.offset)
+        data = io.BytesIO(f.read(block.size))
+    lines = itertools.islice(_lines(_stream(data, compression)), skip, None)
+    return _worker_codec.from_bytes_many(list(_bodies(lines)), mode=mode)
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m gwbase.sema.archive")
+    parser.add_argument("path", type=Path, help="archive (NDJSON, gzip or zlib)")
+    parser.add_argument("--block-lines", type=int, default=DEFAULT_BLOCK_LINES)
+    parser.add_argument(
+        "--write-index",
+        action="store_true",
+        help="save the block index next to the archive",
+    )
+    args = parser.parse_args(argv)
+    try:
+        index = read_index(args.path, block_lines=args.block_lines)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    if args.write_index:
+        _write_index(args.path, index)
+    print(
+        f"{index.lines} lines in {len(index.blocks)} blocks ({index.compression})",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
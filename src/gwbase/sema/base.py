@@ -1,8 +1,15 @@
-import json
+import functools
 import re
-from typing import Any, Self, TypeVar
+import types
+import weakref
+from collections.abc import Callable, Mapping
+from enum import Enum
+from typing import Annotated, Any, Literal, Self, TypeVar, Union, get_args, get_origin
 
-from pydantic import BaseModel, ConfigDict, ValidationError
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+
+from gwbase.sema import json_backend
+from gwbase.sema.enums.gw_str_enum import GwStrEnum
 
 # ============================================================================
 # UTILITY FUNCTIONS
@@ -49,6 +56,20 @@ class GwBaseSemaError(Exception):
 T = TypeVar("T", bound="GwBaseSemaType")
 
 
+# ============================================================================
+# MEMOIZED ENCODING
+# ============================================================================
+#
+# ``memoized()`` keeps (bytes, dict) in the instance ``__dict__`` under a key
+# that is not a field: pydantic's dump, ``==`` and ``hash`` only read the
+# fields. ``interned()`` maps (class, field values) to one canonical instance.
+
+_ENCODED = "_gwbase_encoded"
+_interned: "weakref.WeakValueDictionary[tuple[Any, ...], GwBaseSemaType]" = (
+    weakref.WeakValueDictionary()
+)
+
+
 # ============================================================================
 # STRICT SEMA TYPE
 # ============================================================================
@@ -74,21 +95,70 @@ class GwBaseSemaType(BaseModel):
     # ------------------------------------------------------------------------
 
     def to_bytes(self) -> bytes:
+        memo = self.__dict__.get(_ENCODED)
+        if memo is not None:
+            return memo[0]  # type: ignore[no-any-return]
         return self.model_dump_json(exclude_none=True, by_alias=True).encode()
 
     def to_dict(self) -> dict[str, Any]:
+        memo = self.__dict__.get(_ENCODED)
+        if memo is not None:
+            return dict(memo[1])
         return self.model_dump(exclude_none=True, by_alias=True)
 
+    def memoized(self) -> Self:
+        """This instance, with ``to_bytes()`` and ``to_dict()`` computed once
+        and reused from then on: for an object sent many times (a broadcast
+        to every subscriber). The model is frozen, so the encoding cannot go
+        stale -- unless a mutable field value (a dict, a list) is changed in
+        place. ``to_dict()`` copies the top level only."""
+        if _ENCODED not in self.__dict__:
+            self.__dict__[_ENCODED] = (
+                self.model_dump_json(exclude_none=True, by_alias=True).encode(),
+                self.model_dump(exclude_none=True, by_alias=True),
+            )
+        return self
+
+    def interned(self) -> Self:
+        """The process-wide canonical instance equal to this one, memoized:
+        constant messages built over and over are encoded once. The table
+        holds instances weakly, so an entry lives as long as some caller
+        keeps it. Instances with unhashable field values are only
+        memoized."""
+        key = (type(self), *(self.__dict__[name] for name in type(self).model_fields))
+        try:
+            canonical = _interned.get(key)
+        except TypeError:  # a dict or list field value
+            return self.memoized()
+        if canonical is None:
+            canonical = _interned.setdefault(key, self.memoized())
+        return canonical  # type: ignore[return-value] # keyed by type(self)
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop(_ENCODED, None)  # describes the original
+        return copied
+
     @classmethod
     def from_bytes(cls, json_bytes: bytes) -> Self:
+        if isinstance(json_bytes, bytes):
+            decoded = cls.compiled_from_json(json_bytes)
+            if decoded is not None:
+                return decoded
         try:
-            d = json.loads(json_bytes)
+            d = json_backend.loads(json_bytes)
         except TypeError as e:
             raise GwBaseSemaError("Type must be string or bytes!") from e
         return cls.from_dict(d)
 
     @classmethod
     def from_dict(cls, d: dict) -> Self:
+        decoded = cls.compiled_from_dict(d)
+        if decoded is not None:
+            return decoded
+        # Slow path: also the one that raises, with today's exact errors.
         if not recursively_pascal(d):
             raise GwBaseSemaError("Dictionary must be recursively PascalCase")
         try:
@@ -96,6 +166,112 @@ class GwBaseSemaType(BaseModel):
         except ValidationError as e:
             raise GwBaseSemaError(f"Validation failed: {e}") from e
 
+    @classmethod
+    def compiled_from_dict(cls, d: Any) -> Self | None:
+        """Single-pass strict decode: validate by alias only, then walk just
+        the free-form subtrees (``Any``, ``dict``, ``extra="allow"`` models)
+        for PascalCase. Accepts exactly what ``from_dict`` accepts; returns
+        None instead of raising, so callers fall back to the slow path for
+        the error."""
+        check = _strict_check(cls)
+        if check is _UNCOMPILABLE or not isinstance(d, dict):
+            return None
+        try:
+            decoded: Self = cls.__pydantic_validator__.validate_python(
+                d, by_alias=True, by_name=False
+            )
+        except Exception:  # a format check may raise TypeError: from_dict reports it
+            return None
+        if check is not None and not check(d):
+            return None
+        return decoded
+
+    @classmethod
+    def validates_from_json(cls) -> bool:
+        """Whether pydantic alone, from JSON, accepts exactly what
+        ``from_dict`` accepts (no free-form subtrees to walk), so that
+        ``compiled_from_json`` can decode it."""
+        return _strict_check(cls) is None
+
+    @classmethod
+    def may_hold_field_names(cls, body: bytes) -> bool:
+        """Whether ``body`` may spell a key as a field name (``my_hex``)
+        rather than its alias. pydantic's JSON validator accepts such a key
+        next to the alias even with ``by_name=False``; ``from_dict`` does
+        not, so a JSON fast path must step aside (a false positive only
+        costs the slow path)."""
+        every_key, one_word_keys = _field_name_keys(cls)
+        find = body.find  # faster than ``in`` for bytes
+        # most bodies hold no "_" or "\\" at all: only one-word names remain
+        keys = one_word_keys if find(b"_") < 0 and find(b"\\") < 0 else every_key
+        for key in keys:
+            if find(key) >= 0:
+                return True
+        return False
+
+    @classmethod
+    def compiled_from_json(cls, body: bytes) -> Self | None:
+        """``compiled_from_dict`` straight from JSON bytes, with no Python
+        dict built in between. Only for classes with no free-form subtrees
+        (those need the parsed dict); None means "take the slow path"."""
+        if not cls.validates_from_json() or cls.may_hold_field_names(body):
+            return None
+        try:
+            decoded: Self = cls.__pydantic_validator__.validate_json(
+                body, by_alias=True, by_name=False
+            )
+        except ValidationError:
+            return None
+        return decoded
+
+    @classmethod
+    def compiled_from_dicts(cls, ds: list[Any]) -> list[Self | None]:
+        """``compiled_from_dict`` over a batch, validated as ONE
+        ``list[cls]`` by pydantic. Items it does not accept come back as
+        None (the rest are unaffected), for the caller's slow path."""
+        out: list[Self | None] = [None] * len(ds)
+        check = _strict_check(cls)
+        if check is _UNCOMPILABLE:
+            return out
+        todo = [i for i, d in enumerate(ds) if isinstance(d, dict)]
+        adapter = _list_adapter(cls)
+        try:
+            decoded: list[Self] = adapter.validate_python(
+                [ds[i] for i in todo], by_alias=True, by_name=False
+            )
+        except ValidationError as e:
+            # One more bulk pass over the items that did not fail.
+            bad = {err["loc"][0] for err in e.errors() if err["loc"]}
+            todo = [i for n, i in enumerate(todo) if n not in bad]
+            try:
+                decoded = adapter.validate_python(
+                    [ds[i] for i in todo], by_alias=True, by_name=False
+                )
+            except ValidationError:
+                return [cls.compiled_from_dict(d) for d in ds]
+        except Exception:  # a format check raised TypeError: find it item by item
+            return [cls.compiled_from_dict(d) for d in ds]
+        for i, obj in zip(todo, decoded, strict=True):
+            if check is None or check(ds[i]):
+                out[i] = obj
+        return out
+
+    @classmethod
+    def trusted_from_dict(cls, d: Any) -> Self | None:
+        """Build WITHOUT validation, for a trusted sender (see
+        ``gwbase.sema.validation``). Only the shape is checked: no unknown
+        keys, required keys present, None only where allowed, Literal and
+        enum values known, nested Sema models likewise. None when the shape
+        does not match or the class cannot be built this way (free-form
+        models, unions of models, default factories...)."""
+        build = _construct_plan(cls)
+        if build is None:
+            return None
+        try:
+            return build(d)  # type: ignore[no-any-return]
+        except (KeyError, TypeError, ValueError):
+            return None
+
     # ------------------------------------------------------------------------
     # Introspection
     # ------------------------------------------------------------------------
@@ -118,7 +294,7 @@ class GwBaseSemaType(BaseModel):
         )
 
     def to_latest(
-        self, registry: dict[str, type["GwBaseSemaType"]]
+        self, registry: Mapping[str, type["GwBaseSemaType"]]
     ) -> "GwBaseSemaType":
         current = self
         type_name = self.type_name_value()
@@ -157,6 +333,340 @@ class GwBaseSemaType(BaseModel):
         return current
 
 
+# ============================================================================
+# COMPILED STRICT DECODE
+# ============================================================================
+#
+# ``from_dict`` used to walk the whole input with ``recursively_pascal`` and
+# then ``model_validate`` it with ``populate_by_name``. Validating by alias
+# ONLY (``by_name=False``) with ``extra="forbid"`` already rejects every
+# non-alias key at each strict-model level, and the aliases are PascalCase,
+# so the walk is only needed where validation does not pin the keys: ``Any``
+# and ``dict`` values, non-Sema models (``extra="allow"``), and ambiguous
+# unions. ``_strict_check`` compiles, once per class, a checker over just
+# those subtrees (or None when there are none).
+
+_PascalCheck = Callable[[Any], bool]
+_UNCOMPILABLE: Any = object()  # alias that is not PascalCase, etc.
+_SCALARS = (str, bytes, int, float, bool, Enum, type(None))
+_strict_checks: dict[type, Any] = {}
+_list_adapters: dict[type, TypeAdapter[Any]] = {}
+_field_name_key_cache: dict[type, tuple[tuple[bytes, ...], tuple[bytes, ...]]] = {}
+
+
+class _NotCompilableError(Exception):
+    pass
+
+
+def _strict_check(cls: type["GwBaseSemaType"]) -> Any:
+    try:
+        return _strict_checks[cls]
+    except KeyError:
+        pass
+    try:
+        check: Any = _model_check(cls, frozenset())
+    except _NotCompilableError:
+        check = _UNCOMPILABLE
+    _strict_checks[cls] = check
+    return check
+
+
+def _list_adapter(cls: type["GwBaseSemaType"]) -> TypeAdapter[Any]:
+    try:
+        return _list_adapters[cls]
+    except KeyError:
+        adapter: TypeAdapter[Any] = TypeAdapter(list[cls])  # type: ignore[valid-type]
+        _list_adapters[cls] = adapter
+        return adapter
+
+
+def _field_name_keys(
+    cls: type["GwBaseSemaType"],
+) -> tuple[tuple[bytes, ...], tuple[bytes, ...]]:
+    """``b'"my_hex"'`` for each field of ``cls`` and of the Sema models
+    under it whose name is not its alias (plus ``b"\\u"``: an escaped key
+    could spell one too), and the subset without an underscore."""
+    try:
+        return _field_name_key_cache[cls]
+    except KeyError:
+        pass
+    keys = {b"\\u"}
+    todo, seen = [cls], set()
+    while todo:
+        model = todo.pop()
+        if model in seen:
+            continue
+        seen.add(model)
+        for name, field in model.model_fields.items():
+            if (field.alias or name) != name:
+                keys.add(b'"%s"' % name.encode())
+            todo.extend(_sema_models_in(field.annotation))
+    found = tuple(sorted(keys)), tuple(sorted(k for k in keys if b"_" not in k))
+    _field_name_key_cache[cls] = found
+    return found
+
+
+def _sema_models_in(tp: Any) -> list[type["GwBaseSemaType"]]:
+    if isinstance(tp, type) and issubclass(tp, GwBaseSemaType):
+        return [tp]
+    return [m for arg in get_args(tp) for m in _sema_models_in(arg)]
+
+
+def _model_check(
+    cls: type["GwBaseSemaType"], seen: frozenset[type]
+) -> _PascalCheck | None:
+    if cls.model_config.get("extra") != "forbid":
+        raise _NotCompilableError(cls.__name__)
+    members: list[tuple[str, _PascalCheck]] = []
+    for name, field in cls.model_fields.items():
+        alias = field.alias or name
+        if field.validation_alias not in {None, alias}:
+            raise _NotCompilableError(f"{cls.__name__}.{name}")
+        if alias and alias[0].isalpha() and not is_pascal_case(alias):
+            raise _NotCompilableError(f"{cls.__name__}.{name}")
+        check = _annotation_check(field.annotation, seen | {cls})
+        if check is not None:
+            members.append((alias, check))
+    if not members:
+        return None
+
+    def check_model(value: Any) -> bool:
+        if not isinstance(value, dict):
+            return True  # validation already pinned a non-dict value
+        return all(check(value.get(alias)) for alias, check in members)
+
+    return check_model
+
+
+def _annotation_check(tp: Any, seen: frozenset[type]) -> _PascalCheck | None:  # noqa: PLR0911 — one return per annotation shape
+    origin = get_origin(tp)
+    if origin is Annotated:
+        return _annotation_check(get_args(tp)[0], seen)
+    if origin is Literal:
+        return None
+    if origin in {Union, types.UnionType}:
+        return _union_check(get_args(tp), seen)
+    if origin in {list, tuple}:
+        return _items_check(get_args(tp), seen)
+    if isinstance(tp, type) and origin is None:
+        if issubclass(tp, GwBaseSemaType) and tp not in seen:
+            return _model_check(tp, seen)
+        if issubclass(tp, _SCALARS):
+            return None
+    return recursively_pascal  # Any, dict, non-Sema models, anything else
+
+
+def _union_check(args: tuple[Any, ...], seen: frozenset[type]) -> _PascalCheck | None:
+    members = [a for a in args if a is not type(None)]
+    if len(members) == 1:
+        return _annotation_check(members[0], seen)
+    if all(_annotation_check(a, seen) is None for a in members):
+        return None
+    return recursively_pascal  # which member matched is unknown
+
+
+def _items_check(args: tuple[Any, ...], seen: frozenset[type]) -> _PascalCheck | None:
+    items = [a for a in args if a is not Ellipsis]
+    if len(items) != 1:
+        return recursively_pascal
+    item_check = _annotation_check(items[0], seen)
+    if item_check is None:
+        return None
+    check = item_check
+
+    def check_items(value: Any) -> bool:
+        return not isinstance(value, list) or all(check(v) for v in value)
+
+    return check_items
+
+
+# ============================================================================
+# TRUSTED CONSTRUCT
+# ============================================================================
+#
+# ``model_construct`` skips validation but is slower than validating a small
+# model (it resolves aliases and defaults in Python on every call). A
+# construct plan does that once per class: each field's alias, default,
+# nullability and value converter (enum lookup, Literal check, nested plan).
+# The instance is then filled the way ``model_construct`` fills it, with
+# ``__dict__`` in field order so ``to_bytes`` is unchanged.
+
+_Build = Callable[[Any], Any]
+_REQUIRED: Any = object()
+_NOT_CONSTRUCTIBLE: Any = object()
+_construct_plans: dict[type, Any] = {}
+_object_setattr = object.__setattr__
+
+
+def _construct_plan(cls: type["GwBaseSemaType"]) -> _Build | None:
+    plan = _construct_plans.get(cls)
+    if plan is None:
+        try:
+            plan = _model_plan(cls, frozenset())
+        except _NotCompilableError:
+            plan = _NOT_CONSTRUCTIBLE
+        _construct_plans[cls] = plan
+    return None if plan is _NOT_CONSTRUCTIBLE else plan
+
+
+# Each value is checked by ``kind`` (an isinstance check, for the scalars
+# that dominate payloads) or converted by ``convert`` (Literal check, enum
+# lookup, nested plan...), or stored as is when both are None.
+_Check = tuple[bool, type | None, _Build | None]  # nullable, kind, convert
+_Member = tuple[str, str, Any, bool, type | None, _Build | None]
+
+
+def _model_plan(cls: type["GwBaseSemaType"], seen: frozenset[type]) -> _Build:
+    if (
+        cls.model_config.get("extra") != "forbid"
+        or cls.__private_attributes__
+        or cls.__pydantic_post_init__ is not None
+    ):
+        raise _NotCompilableError(cls.__name__)
+    members: list[_Member] = []
+    for name, field in cls.model_fields.items():
+        if field.default_factory is not None:
+            raise _NotCompilableError(f"{cls.__name__}.{name}")
+        default = _REQUIRED if field.is_required() else field.default
+        members.append((
+            name,
+            field.alias or name,
+            default,
+            *_value_plan(field.annotation, seen | {cls}),
+        ))
+    return functools.partial(
+        _construct, cls, tuple(members), frozenset(m[1] for m in members)
+    )
+
+
+def _construct(
+    cls: type["GwBaseSemaType"],
+    members: tuple[_Member, ...],
+    aliases: frozenset[str],
+    value: Any,
+) -> Any:
+    if not isinstance(value, dict) or not aliases.issuperset(value):
+        raise ValueError("shape")
+    fields: dict[str, Any] = {}
+    fields_set: set[str] = set()
+    for name, alias, default, nullable, kind, convert in members:
+        if alias not in value:
+            if default is _REQUIRED:
+                raise KeyError(alias)
+            fields[name] = default
+            continue
+        v = value[alias]
+        if v is None:
+            if not nullable:
+                raise ValueError(alias)
+        elif kind is not None:
+            if not isinstance(v, kind):
+                raise TypeError(alias)
+        elif convert is not None:
+            v = convert(v)
+        fields[name] = v
+        fields_set.add(name)
+    obj = cls.__new__(cls)
+    _object_setattr(obj, "__dict__", fields)
+    _object_setattr(obj, "__pydantic_fields_set__", fields_set)
+    _object_setattr(obj, "__pydantic_extra__", None)
+    _object_setattr(obj, "__pydantic_private__", None)
+    return obj
+
+
+def _value_plan(tp: Any, seen: frozenset[type]) -> _Check:
+    origin = get_origin(tp)
+    if origin is Annotated:
+        return _value_plan(get_args(tp)[0], seen)  # validators: trusted
+    if origin in {Union, types.UnionType}:
+        return _optional_plan(get_args(tp), seen)
+    if origin is Literal:
+        allowed = frozenset(get_args(tp))
+        return None in allowed, None, _literal_check(allowed)
+    if origin is list:
+        (item,) = get_args(tp) or (Any,)
+        return False, None, _items_convert(_value_plan(item, seen))
+    if tp is Any or origin is dict or tp is dict:
+        return True, None, None
+    if isinstance(tp, type) and origin is None:
+        return _class_plan(tp, seen)
+    raise _NotCompilableError(str(tp))
+
+
+def _optional_plan(args: tuple[Any, ...], seen: frozenset[type]) -> _Check:
+    members = [a for a in args if a is not type(None)]
+    if len(members) != 1:
+        raise _NotCompilableError(str(args))  # which member applies is unknown
+    _, kind, convert = _value_plan(members[0], seen)
+    return True, kind, convert
+
+
+def _class_plan(tp: type, seen: frozenset[type]) -> _Check:
+    if issubclass(tp, GwBaseSemaType) and tp not in seen:
+        return False, None, _model_plan(tp, seen)
+    if issubclass(tp, GwStrEnum):
+        return False, None, functools.partial(_enum_lookup, tp)
+    if issubclass(tp, Enum):
+        return False, None, tp
+    if tp is float:
+        return False, None, _float
+    if tp is int:
+        return False, None, _int
+    if issubclass(tp, (str, int, bool)):
+        return False, tp, None
+    raise _NotCompilableError(tp.__name__)
+
+
+def _enum_lookup(enum_cls: type[GwStrEnum], value: Any) -> GwStrEnum:
+    member = enum_cls.lookup(value)
+    if member is None:
+        raise ValueError(value)
+    return member
+
+
+def _int(value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):  # True is an int
+        raise TypeError(type(value).__name__)
+    return value
+
+
+def _float(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(type(value).__name__)
+    return float(value)
+
+
+def _literal_check(allowed: frozenset[Any]) -> _Build:
+    def check(value: Any) -> Any:
+        if value not in allowed:
+            raise ValueError(value)
+        return value
+
+    return check
+
+
+def _items_convert(item: _Check) -> _Build:
+    nullable, kind, convert = item
+
+    def convert_items(value: Any) -> list[Any]:
+        if not isinstance(value, list):
+            raise TypeError(type(value).__name__)
+        out = []
+        for v in value:
+            if v is None:
+                if not nullable:
+                    raise ValueError("item")
+            elif kind is not None:
+                if not isinstance(v, kind):
+                    raise TypeError(type(v).__name__)
+            elif convert is not None:
+                v = convert(v)  # noqa: PLW2901 — the converted item
+            out.append(v)
+        return out
+
+    return convert_items
+
+
 # ============================================================================
 # DEGRADED TYPE
 # ============================================================================
@@ -167,22 +677,100 @@ class DegradedSemaType:
     Best-effort decoded Sema-like object.
 
     This is NOT a valid SemaType and MUST NOT be used for control logic.
+
+    ``known_fields`` / ``unknown_fields`` split ``raw`` against the fields of
+    ``current_cls`` on first access (all unknown without one). ``raw_bytes``
+    is the body as received, when it was decoded from bytes.
     """
 
-    def __init__(
+    __slots__ = (
+        "_current_cls",
+        "_known_fields",
+        "_unknown_fields",
+        "raw",
+        "raw_bytes",
+        "type_name",
+        "version",
+    )
+
+    def __init__(  # noqa: PLR0913 — keyword-only record
         self,
         *,
         type_name: str,
         version: str | None,
         raw: dict[str, Any],
-        known_fields: dict[str, Any],
-        unknown_fields: dict[str, Any],
+        known_fields: dict[str, Any] | None = None,
+        unknown_fields: dict[str, Any] | None = None,
+        current_cls: type[GwBaseSemaType] | None = None,
+        raw_bytes: bytes | None = None,
     ):
         self.type_name = type_name
         self.version = version
         self.raw = raw
-        self.known_fields = known_fields
-        self.unknown_fields = unknown_fields
+        self.raw_bytes = raw_bytes
+        self._current_cls = current_cls
+        self._known_fields = known_fields
+        self._unknown_fields = unknown_fields
+
+    @property
+    def known_fields(self) -> dict[str, Any]:
+        if self._known_fields is None:
+            self._split()
+        return self._known_fields  # type: ignore[return-value] # set by _split
+
+    @property
+    def unknown_fields(self) -> dict[str, Any]:
+        if self._unknown_fields is None:
+            self._split()
+        return self._unknown_fields  # type: ignore[return-value] # set by _split
+
+    def _split(self) -> None:
+        known: dict[str, Any] = {}
+        unknown: dict[str, Any] = {}
+        cls = self._current_cls
+        for key, value in self.raw.items():
+            if cls is not None and _is_known_field(cls, key):
+                known[key] = value
+            else:
+                unknown[key] = value
+        if self._known_fields is None:
+            self._known_fields = known
+        if self._unknown_fields is None:
+            self._unknown_fields = unknown
 
     def to_dict(self) -> dict[str, Any]:
         return self.raw
+
+
+# ============================================================================
+# DEGRADED FIELD TABLES
+# ============================================================================
+#
+# A degraded decode sorts each top-level key of the body into known (a field
+# of the current class, by PascalCase name, snake name or alias, or a key
+# whose snake form is one of those) and unknown. The names are built once per
+# class and the verdict cached per (class, key): rollout traffic repeats the
+# same few keys.
+
+_known_field_names: dict[type, frozenset[str]] = {}
+
+
+def _field_names(cls: type[GwBaseSemaType]) -> frozenset[str]:
+    try:
+        return _known_field_names[cls]
+    except KeyError:
+        pass
+    names: set[str] = set()
+    for field_name, field_info in cls.model_fields.items():
+        names.add(snake_to_pascal(field_name))
+        names.add(field_name)
+        if field_info.alias:
+            names.add(field_info.alias)
+    frozen = _known_field_names[cls] = frozenset(names)
+    return frozen
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_known_field(cls: type[GwBaseSemaType], key: str) -> bool:
+    names = _field_names(cls)
+    return key in names or pascal_to_snake(key) in names
@@ -0,0 +1,404 @@
+"""Compact binary form of Sema messages, the payload of the ``s`` (Serial)
+transport category.
+
+The layout of each class is derived from its pydantic fields, once, and the
+body carries no keys::
+
+    0xB1                        marker (never the first byte of a JSON body)
+    varint + utf-8              TypeName
+    varint + utf-8              Version (length + 1; 0 for no Version)
+    fields                      as below, in declaration order
+
+A model's fields start with a presence bitmap, one bit per optional field
+(``X | None``) in declaration order, so absent optionals take no bytes.
+Then each present field, by annotation:
+
+- ``UTCSeconds`` / ``UTCMilliseconds``: 8-byte signed int;
+- ``UUID4Str``: 16 bytes;
+- ``GwStrEnum``: ``to_index`` (1 byte; 2 past 256 members);
+- ``bool``: 1 byte; ``float``: 8-byte double; ``int``: zigzag varint;
+- ``str`` (``LeftRightDot``, ...): varint length + utf-8;
+- a one-value ``Literal`` (``TypeName``, ``Version``): nothing; a wider
+  one, the index of its value;
+- a nested Sema type: its fields (bitmap first); ``list[T]``: varint count
+  + items;
+- anything else (``Any``, ``dict``, free-form models): varint length +
+  JSON.
+
+Integers are little-endian. Decoding rebuilds the dict ``to_dict`` returns
+and validates it as ``from_dict`` does (compiled where the type allows), so a binary body decodes to exactly
+what its JSON form decodes to, and is rejected when that would be.
+"""
+
+import struct
+import types
+from collections.abc import Callable
+from enum import Enum
+from typing import Annotated, Any, Literal, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
+from gwbase._format_checks import is_utc_milliseconds, is_utc_seconds, is_uuid4_str
+from gwbase.sema.base import GwBaseSemaType
+from gwbase.sema.enums.gw_str_enum import GwStrEnum
+
+MARKER = 0xB1
+_MAX_ONE_BYTE_INDEX = 256
+
+_Encode = Callable[[Any, bytearray], None]
+_Decode = Callable[[bytes, int], tuple[Any, int]]
+_Field = tuple[str, bool, _Encode, _Decode]  # alias, optional, encode, decode
+
+T = TypeVar("T", bound=GwBaseSemaType)
+
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_U16 = struct.Struct("<H")
+
+
+def is_binary(body: bytes) -> bool:
+    """Whether ``body`` is in this binary form (rather than JSON)."""
+    return body[:1] == b"\xb1"
+
+
+def to_binary(msg: GwBaseSemaType) -> bytes:
+    """``msg`` in the binary form (see module docstring). Raises ValueError
+    for a required field (an ``Any``) set to None."""
+    cls = type(msg)
+    out = bytearray(_head(cls))
+    _model_codec(cls)[0](msg.to_dict(), out)
+    return bytes(out)
+
+
+def peek_binary_type(body: bytes) -> tuple[str, str | None]:
+    """``(TypeName, Version)`` of a binary body. Raises ValueError if it is
+    not one."""
+    try:
+        return _read_head(body)[:2]
+    except (IndexError, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Malformed binary Sema body: {e}") from e
+
+
+def from_binary(body: bytes, cls: type[T]) -> T:
+    """Decode a binary body of ``cls`` (whose TypeName and Version it must
+    carry). Raises ValueError for a malformed body, and what ``from_dict``
+    raises for an invalid message."""
+    head = _head(cls)
+    try:
+        if not body.startswith(head):
+            type_name, version, _ = _read_head(body)
+            raise ValueError(f"{type_name} v{version} is not a {cls.__name__}")
+        d, pos = _model_codec(cls)[1](body, len(head))
+    except (IndexError, UnicodeDecodeError, struct.error, ValueError) as e:
+        raise ValueError(f"Malformed binary Sema body: {e}") from e
+    if pos != len(body):
+        raise ValueError(f"Malformed binary Sema body: extra data at {pos}")
+    return cls.compiled_from_dict(d) or cls.from_dict(d)
+
+
+_heads: dict[type, bytes] = {}
+
+
+def _head(cls: type[GwBaseSemaType]) -> bytes:
+    """Marker, TypeName and Version: the same leading bytes for every body
+    of ``cls``."""
+    try:
+        return _heads[cls]
+    except KeyError:
+        pass
+    out = bytearray((MARKER,))
+    _encode_str(cls.type_name_value(), out)
+    version = cls.version_value()
+    if version is None:
+        _write_varint(0, out)
+    else:
+        _write_varint(len(version.encode()) + 1, out)
+        out += version.encode()
+    head = _heads[cls] = bytes(out)
+    return head
+
+
+def _read_head(body: bytes) -> tuple[str, str | None, int]:
+    if body[0] != MARKER:
+        raise ValueError("no binary marker")
+    type_name, pos = _decode_str(body, 1)
+    n, pos = _read_varint(body, pos)
+    if n == 0:
+        return type_name, None, pos
+    return type_name, _slice(body, pos, n - 1).decode(), pos + n - 1
+
+
+# ----------------------------------------------------------------------------
+# Schema compilation: one (encode, decode) pair per model class, over the
+# PascalCase dicts to_dict produces and from_dict consumes.
+# ----------------------------------------------------------------------------
+
+_model_codecs: dict[type, tuple[_Encode, _Decode]] = {}
+
+
+def _model_codec(cls: type[GwBaseSemaType]) -> tuple[_Encode, _Decode]:
+    try:
+        return _model_codecs[cls]
+    except KeyError:
+        pass
+    fields: list[_Field] = []
+    for name, field in cls.model_fields.items():
+        tp, optional = _unwrap_optional(field.annotation)
+        encode, decode = _value_codec(tp, field.metadata)
+        fields.append((field.alias or name, optional, encode, decode))
+    codec = _fields_codec(tuple(fields))
+    _model_codecs[cls] = codec
+    return codec
+
+
+def _fields_codec(fields: tuple[_Field, ...]) -> tuple[_Encode, _Decode]:  # noqa: C901 — encoder and decoder kept side by side
+    optional = [alias for alias, is_optional, _, _ in fields if is_optional]
+    bitmap_len = (len(optional) + 7) // 8
+
+    def encode(d: Any, out: bytearray) -> None:
+        bits = 0
+        for i, alias in enumerate(optional):
+            if d.get(alias) is not None:
+                bits |= 1 << i
+        out += bits.to_bytes(bitmap_len, "little")
+        bit = 0
+        for alias, is_optional, encode_value, _ in fields:
+            if is_optional:
+                bit += 1
+                if not bits >> (bit - 1) & 1:
+                    continue
+            try:
+                value = d[alias]
+            except KeyError:
+                raise ValueError(
+                    f"Cannot encode required {alias} of None: to_dict drops it, "
+                    "so neither the binary nor the JSON form would decode"
+                ) from None
+            encode_value(value, out)
+
+    def decode(body: bytes, pos: int) -> tuple[dict[str, Any], int]:
+        bits = int.from_bytes(_slice(body, pos, bitmap_len), "little")
+        pos += bitmap_len
+        d: dict[str, Any] = {}
+        bit = 0
+        for alias, is_optional, _, decode_value in fields:
+            if is_optional:
+                bit += 1
+                if not bits >> (bit - 1) & 1:
+                    continue
+            d[alias], pos = decode_value(body, pos)
+        return d, pos
+
+    return encode, decode
+
+
+def _unwrap_optional(tp: Any) -> tuple[Any, bool]:
+    if get_origin(tp) in {Union, types.UnionType}:
+        args = [a for a in get_args(tp) if a is not type(None)]
+        if len(args) == 1 and len(args) < len(get_args(tp)):
+            return args[0], True
+    return tp, False
+
+
+def _value_codec(tp: Any, metadata: list[Any]) -> tuple[_Encode, _Decode]:  # noqa: C901, PLR0911 — one branch per annotation shape
+    origin = get_origin(tp)
+    if origin is Annotated:
+        inner, *extra = get_args(tp)
+        return _value_codec(inner, [*metadata, *extra])
+    checks = {getattr(m, "func", None) for m in metadata}
+    if is_uuid4_str in checks:
+        return _encode_uuid, _decode_uuid
+    if checks & {is_utc_seconds, is_utc_milliseconds}:
+        return _encode_i64, _decode_i64
+    if origin is Literal:
+        return _literal_codec(get_args(tp))
+    if origin is list:
+        (item,) = get_args(tp) or (Any,)
+        return _list_codec(_value_codec(item, []))
+    if isinstance(tp, type) and origin is None:
+        if issubclass(tp, GwBaseSemaType):
+            return _nested_codec(tp)
+        if issubclass(tp, GwStrEnum):
+            return _enum_codec(tp)
+        if tp is bool:
+            return _encode_bool, _decode_bool
+        if tp is int:
+            return _encode_int, _decode_int
+        if tp is float:
+            return _encode_f64, _decode_f64
+        if tp is str:
+            return _encode_str, _decode_str
+    return _encode_json, _decode_json
+
+
+def _nested_codec(cls: type[GwBaseSemaType]) -> tuple[_Encode, _Decode]:
+    # resolved on first use: a model may refer to itself
+    def encode(value: Any, out: bytearray) -> None:
+        _model_codec(cls)[0](value, out)
+
+    def decode(body: bytes, pos: int) -> tuple[Any, int]:
+        return _model_codec(cls)[1](body, pos)
+
+    return encode, decode
+
+
+def _literal_codec(values: tuple[Any, ...]) -> tuple[_Encode, _Decode]:
+    if len(values) == 1:
+        (only,) = values
+
+        def encode_constant(value: Any, out: bytearray) -> None:
+            return
+
+        def decode_constant(body: bytes, pos: int) -> tuple[Any, int]:
+            return only, pos
+
+        return encode_constant, decode_constant
+    index = {v: i for i, v in enumerate(values)}
+
+    def encode(value: Any, out: bytearray) -> None:
+        out.append(index[value])
+
+    def decode(body: bytes, pos: int) -> tuple[Any, int]:
+        return values[body[pos]], pos + 1
+
+    return encode, decode
+
+
+def _enum_codec(enum_cls: type[GwStrEnum]) -> tuple[_Encode, _Decode]:
+    if len(enum_cls) <= _MAX_ONE_BYTE_INDEX:
+
+        def encode(value: Any, out: bytearray) -> None:
+            out.append(enum_cls.to_index(value))
+
+        def decode(body: bytes, pos: int) -> tuple[Any, int]:
+            return enum_cls.from_index(body[pos]), pos + 1
+
+        return encode, decode
+
+    def encode_wide(value: Any, out: bytearray) -> None:
+        out += _U16.pack(enum_cls.to_index(value))
+
+    def decode_wide(body: bytes, pos: int) -> tuple[Any, int]:
+        return enum_cls.from_index(_U16.unpack_from(body, pos)[0]), pos + 2
+
+    return encode_wide, decode_wide
+
+
+def _list_codec(item: tuple[_Encode, _Decode]) -> tuple[_Encode, _Decode]:
+    encode_item, decode_item = item
+
+    def encode(value: Any, out: bytearray) -> None:
+        _write_varint(len(value), out)
+        for v in value:
+            encode_item(v, out)
+
+    def decode(body: bytes, pos: int) -> tuple[Any, int]:
+        n, pos = _read_varint(body, pos)
+        items = []
+        for _ in range(n):
+            v, pos = decode_item(body, pos)
+            items.append(v)
+        return items, pos
+
+    return encode, decode
+
+
+# ----------------------------------------------------------------------------
+# Scalars
+# ----------------------------------------------------------------------------
+
+
+def _slice(body: bytes, pos: int, n: int) -> bytes:
+    if pos + n > len(body):
+        raise ValueError(f"truncated at {len(body)}")
+    return body[pos : pos + n]
+
+
+def _write_varint(n: int, out: bytearray) -> None:
+    while n >= 0x80:  # noqa: PLR2004 — 7 bits per byte
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(body: bytes, pos: int) -> tuple[int, int]:
+    n = shift = 0
+    while True:
+        b = body[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:  # noqa: PLR2004 — continuation bit clear
+            return n, pos
+        shift += 7
+
+
+def _encode_int(value: int, out: bytearray) -> None:
+    _write_varint(value << 1 if value >= 0 else (-value << 1) - 1, out)
+
+
+def _decode_int(body: bytes, pos: int) -> tuple[int, int]:
+    n, pos = _read_varint(body, pos)
+    return (n >> 1) if not n & 1 else -((n + 1) >> 1), pos
+
+
+def _encode_i64(value: int, out: bytearray) -> None:
+    out += _I64.pack(value)
+
+
+def _decode_i64(body: bytes, pos: int) -> tuple[int, int]:
+    return _I64.unpack_from(body, pos)[0], pos + 8
+
+
+def _encode_f64(value: float, out: bytearray) -> None:
+    out += _F64.pack(value)
+
+
+def _decode_f64(body: bytes, pos: int) -> tuple[float, int]:
+    return _F64.unpack_from(body, pos)[0], pos + 8
+
+
+def _encode_bool(value: bool, out: bytearray) -> None:
+    out.append(1 if value else 0)
+
+
+def _decode_bool(body: bytes, pos: int) -> tuple[bool, int]:
+    b = body[pos]
+    if b > 1:
+        raise ValueError(f"bad bool at {pos}")
+    return b == 1, pos + 1
+
+
+def _encode_str(value: str, out: bytearray) -> None:
+    raw = value.encode()
+    _write_varint(len(raw), out)
+    out += raw
+
+
+def _decode_str(body: bytes, pos: int) -> tuple[str, int]:
+    n, pos = _read_varint(body, pos)
+    return _slice(body, pos, n).decode(), pos + n
+
+
+def _encode_uuid(value: str, out: bytearray) -> None:
+    out += bytes.fromhex(value.replace("-", ""))
+
+
+def _decode_uuid(body: bytes, pos: int) -> tuple[str, int]:
+    h = _slice(body, pos, 16).hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}", pos + 16
+
+
+def _encode_json(value: Any, out: bytearray) -> None:
+    if isinstance(value, BaseModel):
+        value = value.model_dump(exclude_none=True, by_alias=True)
+    elif isinstance(value, Enum):
+        value = value.value
+    raw = to_json(value)
+    _write_varint(len(raw), out)
+    out += raw
+
+
+def _decode_json(body: bytes, pos: int) -> tuple[Any, int]:
+    n, pos = _read_varint(body, pos)
+    return from_json(_slice(body, pos, n)), pos + n
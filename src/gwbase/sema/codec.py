@@ -1,35 +1,109 @@
-import json
 import logging
+import time
+import warnings
 from collections import defaultdict
-from importlib import import_module
-from pathlib import Path
-from typing import Literal
+from collections.abc import Iterator, Mapping, MutableMapping, Sequence
+from typing import Annotated, Any, Literal, Union, cast
 
+from pydantic import BaseModel, Field, ValidationError, create_model
+from pydantic_core import from_json
+
+from gwbase.sema import binary, compact, json_backend
 from gwbase.sema.base import (
     DegradedSemaType,
     GwBaseSemaType,
-    pascal_to_snake,
     recursively_pascal,
-    snake_to_pascal,
 )
+from gwbase.sema.lazy import LazySema
+from gwbase.sema.peek import peek_type, scan_type
+from gwbase.sema.registry import SemaRegistry, default_registry
+from gwbase.sema.types.gridworks_header import GridworksHeader
+from gwbase.sema.validation import ValidationPolicy
+from gwbase.sema.wrapped import unwrap_bytes
 
 logger = logging.getLogger(__name__)
 
+DEGRADED_WARNING_INTERVAL_S = 60.0
+
 
 class GwBaseSemaCodec:
-    def __init__(self) -> None:
-        self.registry = get_current_types()
-        self.old_versions = get_old_versions()
+    """Decode/encode Sema types against a ``SemaRegistry`` snapshot.
+
+    By default the codec follows the process-wide registry
+    (``default_registry()``, extended by ``register_types``), so building a
+    codec is free. Pass ``registry=`` to pin a private snapshot.
+
+    ``validation=`` lets current-version messages from trusted senders skip
+    full validation (see ``gwbase.sema.validation``); it applies to decodes
+    that name their sender with ``from_alias=``.
+    """
+
+    def __init__(
+        self,
+        registry: SemaRegistry | None = None,
+        *,
+        validation: ValidationPolicy | None = None,
+    ) -> None:
+        self._pinned = registry
+        self.validation = validation
+        self._envelope: tuple[SemaRegistry, type["_GwEnvelope"] | None] | None = None
+
+    @property
+    def sema_registry(self) -> SemaRegistry:
+        return self._pinned or default_registry()
+
+    @property
+    def registry(self) -> MutableMapping[str, type[GwBaseSemaType]]:
+        """The current class of each TypeName. Assigning to it, or to one of
+        its items, is deprecated (see ``_LegacyView``)."""
+        return _LegacyView(self, "registry")
+
+    @registry.setter
+    def registry(self, current: Mapping[str, type[GwBaseSemaType]]) -> None:
+        self._repin(current, self.sema_registry.old_versions)
+
+    @property
+    def old_versions(
+        self,
+    ) -> MutableMapping[str, Mapping[str | None, type[GwBaseSemaType]]]:
+        """TypeName -> Version -> old class. Assigning to it, or to one
+        TypeName's versions, is deprecated (see ``_LegacyView``)."""
+        return _LegacyView(self, "old_versions")
+
+    @old_versions.setter
+    def old_versions(
+        self, old_versions: Mapping[str, Mapping[str | None, type[GwBaseSemaType]]]
+    ) -> None:
+        self._repin(self.sema_registry.current, old_versions)
+
+    def _repin(
+        self,
+        current: Mapping[str, type[GwBaseSemaType]],
+        old_versions: Mapping[str, Mapping[str | None, type[GwBaseSemaType]]],
+        stacklevel: int = 3,
+    ) -> None:
+        warnings.warn(
+            "Changing GwBaseSemaCodec.registry / .old_versions is deprecated: "
+            "pass registry=default_registry().extended(...) instead",
+            DeprecationWarning,
+            stacklevel=stacklevel,
+        )
+        self._pinned = SemaRegistry.build(
+            current.values(),
+            old_versions=[c for by in old_versions.values() for c in by.values()],
+        )
 
     # ------------------------------------------------------------------------
     # Decode
     # ------------------------------------------------------------------------
 
-    def from_dict(  # noqa: C901, PLR0912 — single decode dispatch, kept inline on purpose
+    def from_dict(  # noqa: C901 — single decode dispatch, kept inline on purpose
         self,
         data: dict,
         mode: Literal["strict", "degraded"] = "strict",
         auto_upgrade: bool = True,
+        *,
+        from_alias: str | None = None,
     ) -> GwBaseSemaType | DegradedSemaType:
 
         if not isinstance(data, dict):
@@ -38,13 +112,35 @@ class GwBaseSemaCodec:
         if "TypeName" not in data:
             raise ValueError("Missing TypeName")
 
+        sema_registry = self.sema_registry
+        registry, old_versions = sema_registry.current, sema_registry.old_versions
+
+        # Compiled path: a current-version message of a known type is
+        # validated in one pass, with no copy and no full PascalCase walk
+        # (from a trusted sender, the validation policy may skip that).
+        # Anything it does not accept takes the path below, which raises.
+        type_name = data["TypeName"]
+        current_cls = registry.get(type_name) if isinstance(type_name, str) else None
+        if (
+            current_cls is not None
+            and data.get("Version") == current_cls.version_value()
+        ):
+            if from_alias is not None and self.validation is not None:
+                trusted = self._decode_trusted(
+                    self.validation, current_cls, type_name, data, from_alias
+                )
+                if trusted is not None:
+                    return trusted
+            decoded = current_cls.compiled_from_dict(data)
+            if decoded is not None:
+                return decoded
+
         if not recursively_pascal(data := dict(data)):
             raise ValueError("Input must be PascalCase")
 
-        type_name = data["TypeName"]
         version = data.get("Version")
 
-        if type_name not in self.registry:
+        if type_name not in registry:
             if mode == "degraded":
                 return DegradedSemaType(
                     type_name=type_name,
@@ -55,7 +151,7 @@ class GwBaseSemaCodec:
                 )
             raise ValueError(f"Unknown type {type_name}")
 
-        current_cls = self.registry[type_name]
+        current_cls = registry[type_name]
         current_version = current_cls.version_value()
 
         # Fast path
@@ -63,11 +159,15 @@ class GwBaseSemaCodec:
             return current_cls.from_dict(data)
 
         # Old version
-        if type_name in self.old_versions and version in self.old_versions[type_name]:
-            old_cls = self.old_versions[type_name][version]
+        if (
+            type_name in old_versions
+            and isinstance(version, str)
+            and version in old_versions[type_name]
+        ):
+            old_cls = old_versions[type_name][version]
             old_instance = old_cls.from_dict(data)
             return (
-                old_instance.to_latest(self.registry) if auto_upgrade else old_instance
+                sema_registry.to_latest(old_instance) if auto_upgrade else old_instance
             )
 
         # Unknown version
@@ -78,89 +178,393 @@ class GwBaseSemaCodec:
         # DEGRADED MODE
         # --------------------------------------------------------------------
 
-        logger.warning(
-            "Degraded decode for %s v%s (current v%s)",
-            type_name,
-            version,
-            current_version,
-        )
-
-        valid_fields = set()
-        for field_name, field_info in current_cls.model_fields.items():
-            valid_fields.add(snake_to_pascal(field_name))
-            valid_fields.add(field_name)
-            if field_info.alias:
-                valid_fields.add(field_info.alias)
-
-        known = {}
-        unknown = {}
-
-        for key, value in data.items():
-            if key in valid_fields or pascal_to_snake(key) in valid_fields:
-                known[key] = value
-            else:
-                unknown[key] = value
-
+        _warn_degraded(type_name, version, current_version)
         return DegradedSemaType(
             type_name=type_name,
             version=version,
             raw=data,
-            known_fields=known,
-            unknown_fields=unknown,
+            current_cls=current_cls,
         )
 
     def from_bytes(
         self,
         data: bytes,
         mode: Literal["strict", "degraded"] = "strict",
+        *,
+        from_alias: str | None = None,
+        content_type: str | None = None,
     ) -> GwBaseSemaType | DegradedSemaType:
+        """Decode a JSON body. ``content_type`` is the AMQP property it
+        arrived with: ``compact.CONTENT_TYPE`` selects ``from_compact``."""
+        if content_type == compact.CONTENT_TYPE:
+            return self.from_compact(data)
+
+        # Peek at the tail for TypeName/Version and, for a current-version
+        # message of a known type, apply the validation policy or validate
+        # the bytes directly.
+        peeked = scan_type(data) if isinstance(data, (bytes, bytearray)) else None
+        if peeked is not None:
+            current_cls = self.sema_registry.current.get(peeked[0])
+            if current_cls is not None and peeked[1] == current_cls.version_value():
+                if from_alias is not None and self.validation is not None:
+                    trusted = self._decode_trusted(
+                        self.validation, current_cls, peeked[0], data, from_alias
+                    )
+                    if trusted is not None:
+                        return trusted
+                decoded = current_cls.compiled_from_json(data)
+                if decoded is not None:
+                    return decoded
 
         try:
-            d = json.loads(data.decode("utf-8"))
+            d = json_backend.loads(data.decode("utf-8"))
         except Exception as e:
             raise ValueError(f"Invalid JSON: {e}") from e
 
-        return self.from_dict(d, mode=mode)
+        # the policy has had its say if the peek found the type
+        result = self.from_dict(
+            d, mode=mode, from_alias=from_alias if peeked is None else None
+        )
+        if isinstance(result, DegradedSemaType):
+            result.raw_bytes = data
+        return result
+
+    def from_bytes_lazy(self, data: bytes) -> LazySema:
+        """A ``LazySema`` over ``data``: fields validated one at a time, on
+        first access, and the full strict decode deferred to
+        ``materialize()``. Raises ValueError (as strict ``from_bytes`` does)
+        for a body without a TypeName, or of an unknown type or version."""
+        return LazySema(data, self._schema_class(*peek_type(data)), self)
+
+    def _decode_trusted(
+        self,
+        validation: ValidationPolicy,
+        current_cls: type[GwBaseSemaType],
+        type_name: str,
+        data: dict[str, Any] | bytes,
+        from_alias: str,
+    ) -> GwBaseSemaType | None:
+        """Decode a current-version message per the validation policy, or
+        None: validate as usual. (Upgrades and degraded decodes never get
+        here.)"""
+        verdict = validation.verdict(type_name, from_alias)
+        if verdict == "skip":
+            trusted = current_cls.trusted_from_dict(
+                data if isinstance(data, dict) else _loads_or_none(data)
+            )
+            if trusted is None:
+                validation.unskipped()
+            return trusted
+        if verdict == "sample":
+            try:
+                decoded = (
+                    self.from_dict(data)
+                    if isinstance(data, dict)
+                    else self.from_bytes(data)
+                )
+            except Exception as e:  # a trusted sender sent an invalid message
+                validation.report_failure(type_name, from_alias, e)
+                raise
+            return cast(GwBaseSemaType, decoded)  # current version: strict
+        return None
+
+    def from_bytes_many(
+        self,
+        bodies: Sequence[bytes],
+        mode: Literal["strict", "degraded"] = "strict",
+    ) -> list[GwBaseSemaType | DegradedSemaType | Exception]:
+        """Decode a batch (a journal replay, a tap drain) in input order.
+
+        Every body is parsed once (pydantic-core's JSON parser); those that
+        are current-version messages of a known type are grouped by type and
+        each group is validated in one ``list[T]`` call
+        (``compiled_from_dicts``). Everything else goes through
+        ``from_bytes`` one at a time. A body that fails yields the exception
+        ``from_bytes`` would have raised, in its slot, instead of aborting
+        the batch.
+        """
+        parsed, groups = self._parse_and_group(bodies)
+        batched: dict[int, GwBaseSemaType] = {}
+        for current_cls, indices in groups.items():
+            decoded = current_cls.compiled_from_dicts([parsed[i] for i in indices])
+            for i, obj in zip(indices, decoded, strict=True):
+                if obj is not None:
+                    batched[i] = obj
+
+        results: list[GwBaseSemaType | DegradedSemaType | Exception] = []
+        for i, body in enumerate(bodies):
+            if i in batched:
+                results.append(batched[i])
+                continue
+            try:
+                results.append(self.from_bytes(body, mode=mode))
+            except Exception as e:  # reported in the item's slot
+                results.append(e)
+        return results
+
+    def _parse_and_group(
+        self, bodies: Sequence[bytes]
+    ) -> tuple[list[object], dict[type[GwBaseSemaType], list[int]]]:
+        """Each body parsed (None if it is not JSON), and the indices of the
+        current-version messages of known types, grouped by type. Parsed by
+        pydantic whatever the JSON backend, as the fast path it batches
+        would; a body it rejects is left to ``from_bytes``."""
+        current = self.sema_registry.current
+        parsed: list[object] = []
+        groups: defaultdict[type[GwBaseSemaType], list[int]] = defaultdict(list)
+        for i, body in enumerate(bodies):
+            try:
+                d = from_json(body)
+            except ValueError:  # from_bytes reports it
+                d = None
+            parsed.append(d)
+            if not isinstance(d, dict) or not isinstance(d.get("TypeName"), str):
+                continue
+            current_cls = current.get(d["TypeName"])
+            if (
+                current_cls is not None
+                and d.get("Version") == current_cls.version_value()
+            ):
+                groups[current_cls].append(i)
+        return parsed, groups
+
+    def decode_wrapped(
+        self,
+        body: bytes,
+        mode: Literal["strict", "degraded"] = "strict",
+    ) -> tuple[GridworksHeader, GwBaseSemaType | DegradedSemaType]:
+        """Decode a ``gw`` envelope and its payload: ``(header, payload)``,
+        checked as ``unwrap_bytes`` checks them and with the payload decoded
+        as ``from_dict`` would.
+
+        A current-version payload of a registered type takes one pass:
+        pydantic parses the body and validates the payload against the
+        union of those types, picked by ``TypeName``, so no payload dict is
+        built. Anything else (old or unknown versions, unknown types,
+        free-form types, invalid messages) goes through ``unwrap_bytes``
+        and ``from_dict``, which upgrade, degrade or raise.
+        """
+        decoded = self._decode_envelope(body)
+        if decoded is not None:
+            header = GridworksHeader.from_dict(decoded.header)
+            payload: GwBaseSemaType = decoded.payload  # type: ignore[attr-defined]
+            if header.message_type != payload.type_name:
+                raise ValueError(
+                    f"gw header.message_type {header.message_type!r} does not "
+                    f"match payload TypeName {payload.type_name!r}"
+                )
+            return header, payload
+        header, payload_dict = unwrap_bytes(body)
+        return header, self.from_dict(payload_dict, mode=mode)
+
+    def _decode_envelope(self, body: bytes) -> "_GwEnvelope | None":
+        """The one-pass decode, or None: take the slow path."""
+        envelope = self._envelope_model()
+        if envelope is None:
+            return None
+        try:
+            decoded = envelope.model_validate_json(body, by_alias=True, by_name=False)
+        except ValidationError:
+            return None
+        if decoded.payload.may_hold_field_names(body):  # type: ignore[attr-defined]
+            return None
+        return decoded
+
+    def _envelope_model(self) -> type["_GwEnvelope"] | None:
+        """The one-pass ``gw`` validator for the current registry snapshot
+        (built on first use and again after ``register_types``)."""
+        sema_registry = self.sema_registry
+        if self._envelope is None or self._envelope[0] is not sema_registry:
+            self._envelope = sema_registry, _envelope_model(sema_registry)
+        return self._envelope[1]
 
     def to_bytes(self, msg: GwBaseSemaType) -> bytes:  # noqa: PLR6301 — codec API symmetry with from_bytes
         return msg.to_bytes()
 
+    # ------------------------------------------------------------------------
+    # Schema-bound forms: binary (the ``s`` transport category) and compact
+    # JSON. Unlike plain JSON, these bodies can only be read with their class,
+    # so unknown types and versions raise (there is no degraded mode); an old
+    # version is read with its own class and upgraded.
+    # ------------------------------------------------------------------------
+
+    def from_binary(self, data: bytes) -> GwBaseSemaType:
+        """Decode a body in the binary form (``gwbase.sema.binary``)."""
+        cls = self._schema_class(*binary.peek_binary_type(data))
+        return self._latest(binary.from_binary(data, cls))
+
+    def to_binary(self, msg: GwBaseSemaType) -> bytes:  # noqa: PLR6301 — codec API symmetry with from_binary
+        return binary.to_binary(msg)
+
+    def from_compact(self, data: bytes) -> GwBaseSemaType:
+        """Decode a body in the compact JSON form (``gwbase.sema.compact``)."""
+        cls = self._schema_class(*peek_type(data))
+        return self._latest(compact.from_compact(data, cls))
+
+    def to_compact(self, msg: GwBaseSemaType) -> bytes:  # noqa: PLR6301 — codec API symmetry with from_compact
+        return compact.to_compact(msg)
+
+    def _schema_class(
+        self, type_name: str, version: str | None
+    ) -> type[GwBaseSemaType]:
+        current_cls = self.sema_registry.current.get(type_name)
+        if current_cls is None:
+            raise ValueError(f"Unknown type {type_name}")
+        if version == current_cls.version_value():
+            return current_cls
+        old_cls = self.sema_registry.old_versions.get(type_name, {}).get(version)
+        if old_cls is None:
+            raise ValueError(f"Unsupported version {version} for {type_name}")
+        return old_cls
+
+    def _latest(self, msg: GwBaseSemaType) -> GwBaseSemaType:
+        if type(msg) is self.sema_registry.current.get(msg.type_name):
+            return msg
+        return self.sema_registry.to_latest(msg)
+
+
+def _loads_or_none(data: bytes) -> object:
+    # pydantic's parser, as compiled_from_json: None leaves it to from_bytes
+    try:
+        return from_json(data)
+    except ValueError:  # the full decode reports it
+        return None
+
+
+def _envelope_model(sema_registry: SemaRegistry) -> type["_GwEnvelope"] | None:
+    """``{"TypeName": "gw", "Header": dict, "Payload": <type by TypeName>}``
+    over the current types that validate straight from JSON, or None if
+    there are none. Old versions fail their ``Version`` Literal and take
+    the slow path."""
+    payload_types = tuple(
+        cls
+        for type_name, cls in sema_registry.current.items()
+        if type_name != "gw" and cls.validates_from_json()
+    )
+    if not payload_types:
+        return None
+    payload: Any = payload_types[0]
+    if len(payload_types) > 1:
+        payload = Annotated[
+            Union[payload_types],
+            Field(discriminator="type_name"),
+        ]
+    return create_model(
+        "GwEnvelope", __base__=_GwEnvelope, payload=(payload, Field(alias="Payload"))
+    )
+
+
+class _GwEnvelope(BaseModel):
+    type_name: Literal["gw"] = Field(alias="TypeName")
+    header: dict[str, Any] = Field(alias="Header")
+
+
+class _LegacyView(MutableMapping[str, Any]):
+    """``codec.registry`` / ``codec.old_versions``, which were plain dicts
+    that applications filled in. Reads go to the codec's registry; a write
+    (``codec.registry[name] = AppType``, ``.update(...)``, ``del``) pins the
+    codec to a registry rebuilt with the change, with a DeprecationWarning.
+    The versions of one TypeName are read-only: assign them whole."""
+
+    def __init__(self, codec: GwBaseSemaCodec, attr: str) -> None:
+        self._codec = codec
+        self._attr = attr
+
+    def _mapping(self) -> Mapping[str, Any]:
+        sema_registry = self._codec.sema_registry
+        if self._attr == "registry":
+            return sema_registry.current
+        return sema_registry.old_versions
+
+    def __getitem__(self, key: str) -> Any:
+        return self._mapping()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._mapping())
+
+    def __len__(self) -> int:
+        return len(self._mapping())
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._replace({**self._mapping(), key: value})
+
+    def __delitem__(self, key: str) -> None:
+        changed = dict(self._mapping())
+        del changed[key]
+        self._replace(changed)
+
+    def _replace(self, changed: Mapping[str, Any]) -> None:
+        sema_registry = self._codec.sema_registry
+        if self._attr == "registry":
+            self._codec._repin(changed, sema_registry.old_versions, stacklevel=4)
+        else:
+            self._codec._repin(sema_registry.current, changed, stacklevel=4)
+
+    def __repr__(self) -> str:
+        return repr(dict(self._mapping()))
+
+
+# ============================================================================
+# DEGRADED WARNINGS
+# ============================================================================
+#
+# One warning per message floods the log during a rollout, when a large share
+# of traffic is at a version this process does not know yet. Each
+# TypeName/Version warns on its first degraded decode and then at most once
+# per DEGRADED_WARNING_INTERVAL_S, with the count it held back.
+
+_MAX_WARNING_KEYS = 1024
+_degraded_warnings: dict[tuple[str, str | None], tuple[float, int]] = {}
+
+
+def _warn_degraded(type_name: str, version: Any, current_version: str | None) -> None:
+    now = time.monotonic()
+    # Version is whatever the producer sent: key a list or dict by its repr
+    key = (
+        type_name,
+        version if version is None or isinstance(version, str) else repr(version),
+    )
+    last = _degraded_warnings.get(key)  # (warned at, held back since)
+    if last is not None and now - last[0] < DEGRADED_WARNING_INTERVAL_S:
+        _degraded_warnings[key] = (last[0], last[1] + 1)
+        return
+    if last is None and len(_degraded_warnings) >= _MAX_WARNING_KEYS:
+        _degraded_warnings.clear()  # versions are producer-controlled
+    held_back = last[1] if last is not None else 0
+    _degraded_warnings[key] = (now, 0)
+    if held_back:
+        logger.warning(
+            "Degraded decode for %s v%s (current v%s), %d more since last warning",
+            type_name,
+            version,
+            current_version,
+            held_back,
+        )
+    else:
+        logger.warning(
+            "Degraded decode for %s v%s (current v%s)",
+            type_name,
+            version,
+            current_version,
+        )
+
 
 # ============================================================================
-# AUTO-DISCOVERY
+# REGISTRY VIEWS
 # ============================================================================
 
 
 def get_current_types() -> dict[str, type[GwBaseSemaType]]:
-    # lazy import breaks a cycle with gwbase.sema.types
-    from gwbase.sema import types  # noqa: PLC0415
-
-    return {
-        getattr(types, name).type_name_value(): getattr(types, name)
-        for name in types.__all__
-    }
+    """TypeName -> current class, from the process-wide registry."""
+    return dict(default_registry().current)
 
 
 def get_old_versions() -> dict[str, dict[str | None, type[GwBaseSemaType]]]:
-    registry: dict[str, dict[str | None, type[GwBaseSemaType]]] = defaultdict(dict)
-    old_versions_dir = Path(__file__).resolve().parent / "types" / "old_versions"
-
-    for path in sorted(old_versions_dir.glob("*.py")):
-        if path.stem == "__init__":
-            continue
-        module = import_module(f"gwbase.sema.types.old_versions.{path.stem}")
-        for name in dir(module):
-            obj = getattr(module, name)
-            if (
-                isinstance(obj, type)
-                and issubclass(obj, GwBaseSemaType)
-                and obj is not GwBaseSemaType
-            ):
-                version = obj.version_value()
-                if version is not None:
-                    registry[obj.type_name_value()][version] = obj
-
-    return registry
+    """TypeName -> Version -> old class, from the process-wide registry."""
+    return {
+        type_name: dict(by_version)
+        for type_name, by_version in default_registry().old_versions.items()
+    }
 
 
 default_codec = GwBaseSemaCodec()
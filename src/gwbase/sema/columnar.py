@@ -0,0 +1,458 @@
+"""Batches of same-type Sema messages held as one array per field.
+
+Analytics and the time coordinator's ready tracking aggregate over
+thousands of messages per step (who is ready for which ``TimeUnixS``, the
+latest ``ConnectedAtUnixMs`` per GNode...). ``ColumnarBatch`` holds such a
+batch by field, so those become NumPy expressions instead of Python loops
+over models::
+
+    batch = ColumnarBatch.from_messages(readies)
+    ready = batch["from_g_node_alias"].codes[batch["time_unix_s"] == t]
+
+Each field's column, by annotation:
+
+- ``UTCSeconds`` / ``UTCMilliseconds``, ``int``: ``int64`` array;
+  ``float``: ``float64``; ``bool``: ``bool``;
+- ``LeftRightDot`` and ``GwStrEnum`` fields: a ``Categorical`` (``int32``
+  codes into a tuple of distinct strings, -1 for None). An enum's
+  categories are its values in ``to_index`` order, so codes are indices;
+- anything else (``UUID4Str``, ``str``, nested types, lists): an object
+  array of the values.
+
+An optional numeric field is a ``numpy.ma`` masked array, masked where the
+field is None. ``TypeName`` and ``Version`` are the batch's, not columns.
+
+``from_messages`` reads already-validated models. ``from_dicts`` builds the
+batch from wire dicts (``to_dict``, ``project_many`` rows...) without
+building models, checking each column at once: timestamp bounds as array
+comparisons, aliases and enum values once per distinct string, and the
+other columns value by value against their annotation. Model validators
+(cross-field axioms) do not run there; ``to_messages`` runs the full
+``from_dict`` validation.
+
+Needs ``numpy``, which gridworks-base only depends on with the
+``columnar`` extra (``pip install gridworks-base[columnar]``): this module
+is not imported by ``gwbase.sema``.
+"""
+
+import types
+from collections.abc import Iterator, Sequence
+from typing import (
+    Annotated,
+    Any,
+    Generic,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+
+from gwbase._format_checks import (
+    UTC_MILLISECONDS_MAX,
+    UTC_MILLISECONDS_MIN,
+    UTC_SECONDS_MAX,
+    UTC_SECONDS_MIN,
+    is_left_right_dot,
+    is_utc_milliseconds,
+    is_utc_seconds,
+)
+from gwbase.sema.base import GwBaseSemaError, GwBaseSemaType
+from gwbase.sema.enums.gw_str_enum import GwStrEnum
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError("gwbase.sema.columnar needs numpy installed") from e
+
+T = TypeVar("T", bound=GwBaseSemaType)
+
+_HEADER_FIELDS = frozenset({"type_name", "version"})
+_NUMERIC = {int: np.int64, float: np.float64, bool: np.bool_}
+# what each numeric column accepts from a wire dict (JSON has no int/float
+# distinction for whole floats, so a float column takes ints)
+_WIRE_TYPES: dict[type, tuple[type, ...]] = {
+    int: (int,),
+    float: (float, int),
+    bool: (bool,),
+}
+_BOUNDS = {
+    is_utc_seconds: (UTC_SECONDS_MIN, UTC_SECONDS_MAX),
+    is_utc_milliseconds: (UTC_MILLISECONDS_MIN, UTC_MILLISECONDS_MAX),
+}
+
+
+class Categorical:
+    """A dictionary-encoded string column: ``categories[codes[i]]`` is row
+    i's value, and code -1 is None."""
+
+    __slots__ = ("categories", "codes")
+
+    def __init__(self, codes: Any, categories: Sequence[str]) -> None:
+        self.codes = codes
+        self.categories = tuple(categories)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[str | None]:
+        return iter(self.decode())
+
+    def __repr__(self) -> str:
+        return f"Categorical({len(self)} rows, {len(self.categories)} categories)"
+
+    def code(self, value: str) -> int:
+        """The code of ``value`` (for comparisons against ``codes``), -1 if
+        it is not a category."""
+        try:
+            return self.categories.index(value)
+        except ValueError:
+            return -1
+
+    def decode(self) -> list[str | None]:
+        """The column's values, one per row."""
+        lookup = [*self.categories, None]  # code -1 reads the last entry
+        return [lookup[c] for c in self.codes.tolist()]
+
+    def counts(self) -> dict[str, int]:
+        """Rows per category (None rows are not counted)."""
+        present = self.codes[self.codes >= 0]
+        n = np.bincount(present, minlength=len(self.categories))
+        return dict(zip(self.categories, n.tolist(), strict=True))
+
+
+class ColumnarBatch(Generic[T]):
+    """Messages of one Sema type, by field (see module docstring).
+    ``batch[name]`` is the column of field ``name``."""
+
+    def __init__(
+        self, sema_class: type[T], columns: dict[str, Any], length: int
+    ) -> None:
+        self.sema_class = sema_class
+        self.type_name = sema_class.type_name_value()
+        self.version = sema_class.version_value()
+        self.columns = columns
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise KeyError(
+                f"{self.sema_class.__name__} has no column {name!r}"
+            ) from None
+
+    def __repr__(self) -> str:
+        return f"ColumnarBatch({self.type_name!r}, {len(self)} rows)"
+
+    @classmethod
+    def from_messages(
+        cls, messages: Sequence[T], sema_class: type[T] | None = None
+    ) -> "ColumnarBatch[T]":
+        """The batch of ``messages``, which must all be ``sema_class``
+        (default: the first message's class; required for an empty
+        batch). Raises ValueError for a message of another class."""
+        if sema_class is None:
+            if not messages:
+                raise ValueError("An empty batch needs its sema_class")
+            sema_class = type(messages[0])
+        for i, msg in enumerate(messages):
+            if type(msg) is not sema_class:
+                raise ValueError(
+                    f"Row {i} is a {type(msg).__name__}, not a {sema_class.__name__}"
+                )
+        columns = {
+            name: column.from_values([getattr(m, name) for m in messages])
+            for name, column in _plan(sema_class).items()
+        }
+        return cls(sema_class, columns, len(messages))
+
+    @classmethod
+    def from_dicts(
+        cls, sema_class: type[T], rows: Sequence[dict[str, Any]]
+    ) -> "ColumnarBatch[T]":
+        """The batch of ``rows``, wire (PascalCase) dicts of ``sema_class``,
+        with each column checked against its field's format (see module
+        docstring). Raises GwBaseSemaError naming the first failing field
+        and row."""
+        type_name, version = sema_class.type_name_value(), sema_class.version_value()
+        for i, row in enumerate(rows):
+            if row.get("TypeName") != type_name or row.get("Version") != version:
+                raise GwBaseSemaError(
+                    f"Validation failed: row {i} is {row.get('TypeName')!r} "
+                    f"v{row.get('Version')}, not {type_name!r} v{version}"
+                )
+        columns = {}
+        for name, column in _plan(sema_class).items():
+            values = [row.get(column.alias, column.missing) for row in rows]
+            try:
+                columns[name] = column.from_wire(values)
+            except _RowError as e:
+                raise GwBaseSemaError(
+                    f"Validation failed: {column.alias} of row {e.row}: {e.reason}"
+                ) from e
+        return cls(sema_class, columns, len(rows))
+
+    def to_dicts(self) -> Iterator[dict[str, Any]]:
+        """The batch as wire dicts, one per row, not validated. Like
+        ``to_dict``, a row leaves out its None fields."""
+        plan = _plan(self.sema_class)
+        by_field = [
+            ("TypeName", [self.type_name] * len(self)),
+            ("Version", [self.version] * len(self)),
+        ]
+        by_field += [
+            (plan[name].alias, plan[name].to_values(column))
+            for name, column in self.columns.items()
+        ]
+        for row in zip(*(values for _, values in by_field), strict=True):
+            yield {
+                alias: v
+                for (alias, _), v in zip(by_field, row, strict=True)
+                if v is not None
+            }
+
+    def to_messages(self) -> list[T]:
+        """The batch as models, each validated in full by ``from_dict``."""
+        return [self.sema_class.from_dict(d) for d in self.to_dicts()]
+
+
+# ----------------------------------------------------------------------------
+# Columns: one per field of a class, chosen from its annotation once.
+# ----------------------------------------------------------------------------
+
+_MISSING: Any = object()
+
+
+class _RowError(Exception):
+    def __init__(self, row: int, reason: str) -> None:
+        super().__init__(row, reason)
+        self.row = row
+        self.reason = reason
+
+
+class _Column:
+    """How one field becomes a column. ``missing`` stands in for an absent
+    key: the field's default, or _MISSING when it is required."""
+
+    def __init__(self, alias: str, optional: bool, missing: Any) -> None:
+        self.alias = alias
+        self.optional = optional
+        self.missing = missing
+
+    def from_values(self, values: list[Any]) -> Any:
+        raise NotImplementedError
+
+    def from_wire(self, values: list[Any]) -> Any:
+        raise NotImplementedError
+
+    def to_values(self, column: Any) -> list[Any]:  # noqa: PLR6301 — overridden per column kind
+        return list(column)
+
+    def _check_present(self, values: list[Any]) -> None:
+        for i, v in enumerate(values):
+            if v is _MISSING:
+                raise _RowError(i, "missing")
+            if v is None and not self.optional:
+                raise _RowError(i, "None for a required field")
+
+
+class _NumericColumn(_Column):
+    def __init__(
+        self, alias: str, optional: bool, missing: Any, tp: type, bounds: Any
+    ) -> None:
+        super().__init__(alias, optional, missing)
+        self.tp = tp
+        self.dtype = _NUMERIC[tp]
+        self.bounds = bounds  # (check, (low, high)) for a timestamp
+
+    def from_values(self, values: list[Any]) -> Any:
+        if not self.optional:
+            return np.array(values, dtype=self.dtype)
+        mask = np.fromiter(
+            (v is None for v in values), dtype=np.bool_, count=len(values)
+        )
+        filled = [self.dtype(0) if v is None else v for v in values]
+        return np.ma.MaskedArray(np.array(filled, dtype=self.dtype), mask=mask)
+
+    def from_wire(self, values: list[Any]) -> Any:
+        self._check_present(values)
+        accepted = _WIRE_TYPES[self.tp]
+        for i, v in enumerate(values):
+            if v is not None and (type(v) not in accepted):
+                raise _RowError(i, f"{v!r} is not {self.tp.__name__}")
+        try:
+            column = self.from_values(values)
+        except OverflowError as e:
+            raise _RowError(_first_overflow(values), str(e)) from e
+        if self.bounds is not None:
+            check, (low, high) = self.bounds
+            data = np.ma.getdata(column)
+            bad = (data < low) | (data > high)
+            if self.optional:
+                bad &= ~np.ma.getmaskarray(column)
+            if bad.any():
+                i = int(np.argmax(bad))
+                try:
+                    check(values[i])
+                except ValueError as e:
+                    raise _RowError(i, str(e)) from e
+        return column
+
+    def to_values(self, column: Any) -> list[Any]:
+        if self.optional:
+            return list(column.tolist(fill_value=None))  # masked rows -> None
+        return list(column.tolist())
+
+
+class _CategoricalColumn(_Column):
+    def __init__(
+        self, alias: str, optional: bool, missing: Any, enum_cls: type[GwStrEnum] | None
+    ) -> None:
+        super().__init__(alias, optional, missing)
+        self.enum_cls = enum_cls
+
+    def from_values(self, values: list[Any]) -> Categorical:
+        if self.enum_cls is not None:
+            categories = self.enum_cls.values()
+            index = {v: i for i, v in enumerate(categories)}
+        else:
+            index = {}
+        codes = np.empty(len(values), dtype=np.int32)
+        for i, v in enumerate(values):
+            if v is None:
+                codes[i] = -1
+            else:
+                code = index.get(v)
+                if code is None:
+                    code = index[v] = len(index)
+                codes[i] = code
+        return Categorical(codes, list(index))
+
+    def from_wire(self, values: list[Any]) -> Categorical:
+        self._check_present(values)
+        for i, v in enumerate(values):
+            if v is not None and not isinstance(v, str):
+                raise _RowError(i, f"{v!r} is not a string")
+        if self.enum_cls is None:
+            column = self.from_values(values)
+            for code, v in enumerate(column.categories):
+                try:
+                    is_left_right_dot(v)
+                except ValueError as e:
+                    raise _RowError(_first_code(column, code), str(e)) from e
+            return column
+        # an unknown value reads as the enum's default, as in the model
+        enum_cls = self.enum_cls
+        distinct = dict.fromkeys(v for v in values if v is not None)
+        members = {v: enum_cls.lookup(v) for v in distinct}
+        for v, member in members.items():
+            if member is None:
+                raise _RowError(
+                    values.index(v), f"'{v}' is not valid {enum_cls.__name__}"
+                )
+        return self.from_values([None if v is None else members[v] for v in values])
+
+    def to_values(self, column: Any) -> list[Any]:  # noqa: PLR6301 — overrides _Column's
+        return column.decode()  # type: ignore[no-any-return]
+
+
+class _ObjectColumn(_Column):
+    def __init__(
+        self, alias: str, optional: bool, missing: Any, annotation: Any
+    ) -> None:
+        super().__init__(alias, optional, missing)
+        self.adapter: TypeAdapter[Any] = TypeAdapter(annotation)
+
+    def from_values(self, values: list[Any]) -> Any:  # noqa: PLR6301 — overrides _Column's
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+        return column
+
+    def from_wire(self, values: list[Any]) -> Any:
+        checked = []
+        for i, v in enumerate(values):
+            if v is _MISSING:
+                raise _RowError(i, "missing")
+            try:
+                checked.append(
+                    self.adapter.validate_python(v, by_alias=True, by_name=False)
+                )
+            except ValidationError as e:
+                raise _RowError(i, str(e)) from e
+        return self.from_values(checked)
+
+    def to_values(self, column: Any) -> list[Any]:
+        return [self.adapter.dump_python(v, by_alias=True) for v in column]
+
+
+def _first_code(column: Categorical, code: int) -> int:
+    return int(np.argmax(column.codes == code))
+
+
+def _first_overflow(values: list[Any]) -> int:
+    limit = np.iinfo(np.int64)
+    return next(
+        i
+        for i, v in enumerate(values)
+        if v is not None and not limit.min <= v <= limit.max
+    )
+
+
+_plans: dict[type, dict[str, _Column]] = {}
+
+
+def _plan(cls: type[GwBaseSemaType]) -> dict[str, _Column]:
+    try:
+        return _plans[cls]
+    except KeyError:
+        pass
+    plan = {}
+    for name, field in cls.model_fields.items():
+        if name in _HEADER_FIELDS:
+            continue
+        plan[name] = _column(field.alias or name, field)
+    _plans[cls] = plan
+    return plan
+
+
+def _unwrap(tp: Any, metadata: list[Any]) -> tuple[Any, set[Any], bool]:
+    """The annotation without ``Annotated`` and ``| None``, the checks its
+    validators run, and whether it admits None."""
+    optional = False
+    while True:
+        origin = get_origin(tp)
+        if origin is Annotated:
+            tp, *extra = get_args(tp)
+            metadata = [*metadata, *extra]
+        elif origin in {Union, types.UnionType} and type(None) in get_args(tp):
+            args = [a for a in get_args(tp) if a is not type(None)]
+            optional = True
+            if len(args) != 1:
+                return tp, set(), optional
+            tp = args[0]
+        else:
+            return tp, {getattr(m, "func", None) for m in metadata}, optional
+
+
+def _column(alias: str, field: FieldInfo) -> _Column:
+    missing = (
+        _MISSING
+        if field.is_required()
+        else field.get_default(call_default_factory=True)
+    )
+    tp, checks, optional = _unwrap(field.annotation, field.metadata)
+    if is_left_right_dot in checks:
+        return _CategoricalColumn(alias, optional, missing, None)
+    if get_origin(tp) is None and isinstance(tp, type):
+        if issubclass(tp, GwStrEnum):
+            return _CategoricalColumn(alias, optional, missing, tp)
+        if tp in _NUMERIC:
+            bounds = next(((c, _BOUNDS[c]) for c in checks if c in _BOUNDS), None)
+            return _NumericColumn(alias, optional, missing, tp, bounds)
+    return _ObjectColumn(alias, optional, missing, field.rebuild_annotation())
@@ -0,0 +1,212 @@
+"""Compact JSON form of Sema messages, selected by the ``CONTENT_TYPE``
+marker on the AMQP properties.
+
+The body stays a JSON object with the same keys as ``to_bytes``, but:
+
+- a ``GwStrEnum`` field holds the member's index (``to_index``), or its
+  symbol for a ``SymbolizedEnum``;
+- a ``LeftRightDot`` value (a GNode alias, say) that occurs more than once
+  in the message is written once, in a top-level ``"~Aliases"`` list, and
+  referred to by its position there.
+
+Which fields those are comes from the class's annotations (read once per
+class), so nothing else in the body changes and a type without enum or
+alias fields encodes exactly as ``to_bytes`` does. ``TypeName`` and
+``Version`` stay in place: ``peek_type`` reads a compact body as it reads a
+plain one.
+
+Decoding expands the body back to the plain dict and validates it as
+``from_dict`` does, so a compact body is accepted exactly when its plain
+form would be. An enum index or symbol this end does not know decodes to
+the enum's ``default()``, as an unknown plain value does.
+"""
+
+import types
+from collections import Counter
+from typing import Annotated, Any, Literal, TypeVar, Union, get_args, get_origin
+
+from pydantic_core import to_json
+
+from gwbase._format_checks import is_left_right_dot
+from gwbase.sema import json_backend
+from gwbase.sema.base import GwBaseSemaType
+from gwbase.sema.enums.gw_str_enum import GwStrEnum, SymbolizedEnum
+
+CONTENT_TYPE = "application/vnd.gridworks.sema.compact+json"
+ALIASES_KEY = "~Aliases"
+
+T = TypeVar("T", bound=GwBaseSemaType)
+
+# Plan nodes, per annotation: ("model", ((alias, node), ...)),
+# ("list", node), ("enum", enum class) or ("alias",). Fields that are none
+# of these are left out of their model's plan.
+_Node = tuple[Any, ...]
+_ALIAS: _Node = ("alias",)
+_plans: dict[type, _Node | None] = {}
+
+
+def to_compact(msg: GwBaseSemaType) -> bytes:
+    """``msg`` in the compact form (see module docstring)."""
+    plan = _model_plan(type(msg))
+    if plan is None:
+        return msg.to_bytes()
+    d = msg.to_dict()
+    counts: Counter[str] = Counter()
+    _count_aliases(plan, d, counts)
+    table = [alias for alias, n in counts.items() if n > 1]
+    out = _encode(plan, d, {alias: i for i, alias in enumerate(table)})
+    if table:
+        out[ALIASES_KEY] = table
+    return to_json(out)
+
+
+def from_compact(body: bytes, cls: type[T]) -> T:
+    """Decode a compact body of ``cls``. Raises ValueError for a body that
+    is not a compact JSON object (bad JSON, an index out of range...), and
+    what ``from_dict`` raises for an invalid message."""
+    try:
+        d = json_backend.loads(body)
+    except Exception as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
+    if not isinstance(d, dict):
+        raise ValueError("Input must be dict")
+    plan = _model_plan(cls)
+    if plan is not None:
+        table = d.pop(ALIASES_KEY, [])
+        if not isinstance(table, list) or not all(isinstance(a, str) for a in table):
+            raise ValueError(f"{ALIASES_KEY} must be a list of strings")
+        try:
+            d = _decode(plan, d, table)
+        except (IndexError, KeyError, TypeError) as e:
+            raise ValueError(f"Malformed compact Sema body: {e!r}") from e
+    return cls.compiled_from_dict(d) or cls.from_dict(d)
+
+
+# ----------------------------------------------------------------------------
+# Plans
+# ----------------------------------------------------------------------------
+
+
+def _model_plan(cls: type[GwBaseSemaType]) -> _Node | None:
+    try:
+        return _plans[cls]
+    except KeyError:
+        pass
+    _plans[cls] = None  # where a model refers to itself, its fields pass as is
+    fields = []
+    for name, field in cls.model_fields.items():
+        node = _value_plan(field.annotation, field.metadata)
+        if node is not None:
+            fields.append((field.alias or name, node))
+    plan = ("model", tuple(fields)) if fields else None
+    _plans[cls] = plan
+    return plan
+
+
+def _value_plan(tp: Any, metadata: list[Any]) -> _Node | None:  # noqa: PLR0911 — one return per annotation shape
+    origin = get_origin(tp)
+    if origin is Annotated:
+        inner, *extra = get_args(tp)
+        return _value_plan(inner, [*metadata, *extra])
+    if is_left_right_dot in {getattr(m, "func", None) for m in metadata}:
+        return _ALIAS
+    if origin in {Union, types.UnionType}:
+        args = [a for a in get_args(tp) if a is not type(None)]
+        return _value_plan(args[0], metadata) if len(args) == 1 else None
+    if origin is list:
+        (item,) = get_args(tp) or (Any,)
+        node = _value_plan(item, [])
+        return None if node is None else ("list", node)
+    if origin is Literal or not isinstance(tp, type) or origin is not None:
+        return None
+    if issubclass(tp, GwStrEnum):
+        return ("enum", tp)
+    if issubclass(tp, GwBaseSemaType):
+        return _model_plan(tp)
+    return None
+
+
+# ----------------------------------------------------------------------------
+# Walks over the plain dict (to_dict) and the compact one. Values the plan
+# does not expect (a None, a wrong type) are passed through for validation to
+# judge.
+# ----------------------------------------------------------------------------
+
+
+def _count_aliases(node: _Node, value: Any, counts: Counter[str]) -> None:
+    kind = node[0]
+    if kind == "alias":
+        if isinstance(value, str):
+            counts[value] += 1
+    elif kind == "list":
+        if isinstance(value, list):
+            for v in value:
+                _count_aliases(node[1], v, counts)
+    elif kind == "model" and isinstance(value, dict):
+        for alias, child in node[1]:
+            if alias in value:
+                _count_aliases(child, value[alias], counts)
+
+
+def _encode(node: _Node, value: Any, refs: dict[str, int]) -> Any:
+    kind = node[0]
+    if kind == "alias":
+        return refs.get(value, value) if isinstance(value, str) else value
+    if kind == "enum":
+        enum_cls = node[1]
+        if issubclass(enum_cls, SymbolizedEnum):
+            return enum_cls.value_to_symbol(value)
+        return enum_cls.to_index(value)
+    if kind == "list":
+        return [_encode(node[1], v, refs) for v in value]
+    out = dict(value)
+    for alias, child in node[1]:
+        v = out.get(alias)
+        if v is not None:
+            out[alias] = _encode(child, v, refs)
+    return out
+
+
+def _decode(node: _Node, value: Any, table: list[str]) -> Any:  # noqa: PLR0911 — one return per node kind
+    kind = node[0]
+    if kind == "alias":
+        if isinstance(value, int) and not isinstance(value, bool):
+            if value < 0:
+                raise IndexError(value)
+            return table[value]
+        return value
+    if kind == "enum":
+        return _decode_enum(node[1], value)
+    if kind == "list":
+        if not isinstance(value, list):
+            return value
+        return [_decode(node[1], v, table) for v in value]
+    if not isinstance(value, dict):
+        return value
+    out = dict(value)
+    for alias, child in node[1]:
+        v = out.get(alias)
+        if v is not None:
+            out[alias] = _decode(child, v, table)
+    return out
+
+
+def _decode_enum(enum_cls: type[GwStrEnum], value: Any) -> Any:
+    """The member value for an index or symbol. One this end does not know
+    (a newer sender's member) decodes to ``default()``, as the plain value
+    does, and is malformed only where there is no default."""
+    try:
+        if issubclass(enum_cls, SymbolizedEnum):
+            if not isinstance(value, str):
+                return value
+            return enum_cls.symbol_to_value(value)
+        if not isinstance(value, int) or isinstance(value, bool):
+            return value
+        if value < 0:
+            raise IndexError(value)
+        return enum_cls.from_index(value)
+    except (IndexError, KeyError):
+        default = enum_cls.default()
+        if default is None:
+            raise
+        return default.value
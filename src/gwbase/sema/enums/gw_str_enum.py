@@ -1,5 +1,5 @@
 from enum import StrEnum
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
 
 class GwStrEnum(StrEnum):
@@ -19,12 +19,17 @@ class GwStrEnum(StrEnum):
 
     """
 
+    # filled in by _init_index_maps on first use
+    _value_to_member: ClassVar[dict[str, Any]]
+    _value_to_index: ClassVar[dict[str, int]]
+    _index_to_value: ClassVar[list[str]]
+
     @staticmethod
     def _generate_next_value_(
         name: str,
-        start: int,  # noqa: ARG004
-        count: int,  # noqa: ARG004
-        last_values: list[Any],  # noqa: ARG004
+        start: int,
+        count: int,
+        last_values: list[Any],
     ) -> str:
         return name
 
@@ -38,8 +43,9 @@ class GwStrEnum(StrEnum):
             return
 
         values = [m.value for m in cls]
-        cls._index_to_value = values
+        cls._value_to_member = {m.value: m for m in cls}
         cls._value_to_index = {v: i for i, v in enumerate(values)}
+        cls._index_to_value = values
 
     @classmethod
     def to_index(cls, value: str) -> int:
@@ -51,6 +57,18 @@ class GwStrEnum(StrEnum):
         cls._init_index_maps()
         return cls._index_to_value[idx]
 
+    @classmethod
+    def lookup(cls, value: Any) -> Self | None:
+        """The member for ``value``, else ``default()`` (which may be None):
+        what ``cls(value)`` returns, read from a table instead of going
+        through ``_missing_`` and an exception for an unknown value."""
+        cls._init_index_maps()
+        try:
+            member: Self | None = cls._value_to_member.get(value)
+        except TypeError:  # unhashable: never a value
+            member = None
+        return member if member is not None else cls.default()
+
     @classmethod
     def default(cls) -> Self | None:
         return None
@@ -81,14 +99,38 @@ class SemaEnum(GwStrEnum):
 
 
 class SymbolizedEnum(SemaEnum):
+    """
+    A SemaEnum whose members also have short symbols (for compact
+    encodings). Subclasses implement symbols(), one per member in
+    definition order; the lookups in both directions are tables built from
+    it on first use.
+    """
+
+    _symbol_to_value: ClassVar[dict[str, str]]
+    _value_to_symbol: ClassVar[dict[str, str]]
+
+    @classmethod
+    def _init_symbol_maps(cls) -> None:
+        if hasattr(cls, "_symbol_to_value"):
+            return
+
+        symbols = cls.symbols()
+        values = cls.values()
+        if len(symbols) != len(values) or len(set(symbols)) != len(symbols):
+            raise ValueError(f"{cls.__name__}.symbols() must be one per member")
+        cls._value_to_symbol = dict(zip(values, symbols, strict=True))
+        cls._symbol_to_value = dict(zip(symbols, values, strict=True))  # guard: last
+
     @classmethod
     def symbol_to_value(cls, symbol: str) -> str:
-        raise NotImplementedError
+        cls._init_symbol_maps()
+        return cls._symbol_to_value[symbol]
 
     @classmethod
     def value_to_symbol(cls, value: str) -> str:
-        raise NotImplementedError
+        cls._init_symbol_maps()
+        return cls._value_to_symbol[value]
 
     @classmethod
     def symbols(cls) -> list[str]:
-        raise NotImplementedError
+        raise NotImplementedError(f"{cls.__name__} must implement symbols()")
@@ -0,0 +1,730 @@
+"""Plain slotted twins of hot Sema types (see ``gwbase.sema.fastgen``).
+
+GENERATED by ``python -m gwbase.sema.fastgen`` from ``gwbase.sema.types``:
+do not edit by hand.
+"""
+
+from typing import Any, ClassVar, Self
+
+from pydantic import TypeAdapter
+from pydantic_core import from_json, to_json
+
+from gwbase._format_checks import (
+    HEX_CHARS,
+    LEFT_RIGHT_DOT_PATTERN,
+    UTC_MILLISECONDS_MAX,
+    UTC_MILLISECONDS_MIN,
+    UTC_SECONDS_MAX,
+    UTC_SECONDS_MIN,
+    UUID4_STR_PATTERN,
+)
+from gwbase.sema.base import recursively_pascal
+from gwbase.sema.types import GridworksHeader, HeartbeatA, Ready, SimTimestep
+
+__all__ = [
+    "FastGridworksHeader",
+    "FastHeartbeatA",
+    "FastReady",
+    "FastSimTimestep",
+]
+
+_new = object.__new__
+_set = object.__setattr__
+_left_right_dot = LEFT_RIGHT_DOT_PATTERN.fullmatch
+_uuid4 = UUID4_STR_PATTERN.fullmatch
+_ANY: TypeAdapter[Any] = TypeAdapter(Any)
+_JSON_BOOL = {True: "true", False: "false"}
+_PLAIN_JSON_STR = frozenset(
+    chr(c) for c in range(0x20, 0x80) if chr(c) not in {'"', "\\"}
+)
+
+
+def _json_str(v: str) -> str:
+    """``v`` as the model's encoder writes it."""
+    if v.isascii() and _PLAIN_JSON_STR.issuperset(v):
+        return f'"{v}"'
+    return to_json(v).decode()
+
+
+def _json_any(v: Any) -> str:
+    return to_json(v).decode()
+
+
+class _FastSema:
+    """Frozen, compared and hashed by field value, like the models."""
+
+    __slots__: tuple[str, ...] = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen")
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._values()))
+
+    def __repr__(self) -> str:
+        values = zip(self.__slots__, self._values(), strict=True)
+        return f"{type(self).__name__}({', '.join(f'{n}={v!r}' for n, v in values)})"
+
+    def _values(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+
+class FastHeartbeatA(_FastSema):
+    """``HeartbeatA`` (heartbeat.a 000) as a plain slotted class."""
+
+    __slots__ = (
+        "my_hex",
+        "your_last_hex",
+    )
+
+    type_name: ClassVar[str] = "heartbeat.a"
+    version: ClassVar[str | None] = "000"
+    sema_class: ClassVar[type[HeartbeatA]] = HeartbeatA
+    _keys: ClassVar[frozenset[str]] = frozenset((
+        "TypeName",
+        "Version",
+        "MyHex",
+        "YourLastHex",
+    ))
+
+    my_hex: str
+    your_last_hex: str | None
+
+    def __init__(
+        self,
+        *,
+        my_hex: str,
+        your_last_hex: str | None = None,
+    ) -> None:
+        if not (
+            (type(my_hex) is str and my_hex in HEX_CHARS)
+            and (
+                your_last_hex is None
+                or (type(your_last_hex) is str and your_last_hex in HEX_CHARS)
+            )
+        ):
+            # not plainly valid: the model validates (or raises) as usual
+            model = HeartbeatA(
+                my_hex=my_hex,
+                your_last_hex=your_last_hex,
+            )
+            my_hex = model.my_hex
+            your_last_hex = model.your_last_hex
+        _set(self, "my_hex", my_hex)
+        _set(self, "your_last_hex", your_last_hex)
+
+    @classmethod
+    def from_dict(cls, d: Any) -> Self:
+        """``HeartbeatA.from_dict``: accepts and raises the same."""
+        return cls._checked(d) or cls.from_model(HeartbeatA.from_dict(d))
+
+    @classmethod
+    def from_bytes(cls, body: bytes) -> Self:
+        """``HeartbeatA.from_bytes``: accepts and raises the same."""
+        fast = cls.try_from_bytes(body)
+        return fast or cls.from_model(HeartbeatA.from_bytes(body))
+
+    @classmethod
+    def try_from_bytes(cls, body: bytes) -> Self | None:
+        """``from_bytes`` where the body is plainly valid, TypeName and
+        Version included; None where the model has to decide (and may
+        accept, or raise)."""
+        try:
+            return cls._checked(from_json(body))
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def _checked(cls, d: Any) -> Self | None:
+        if type(d) is not dict or not cls._keys.issuperset(d):
+            return None
+        try:
+            my_hex = d["MyHex"]
+        except KeyError:
+            return None
+        your_last_hex = d.get("YourLastHex")
+        if not (
+            d.get("TypeName") == "heartbeat.a"
+            and d.get("Version") == "000"
+            and (type(my_hex) is str and my_hex in HEX_CHARS)
+            and (
+                your_last_hex is None
+                or (type(your_last_hex) is str and your_last_hex in HEX_CHARS)
+            )
+        ):
+            return None
+        obj = _new(cls)
+        _set(obj, "my_hex", my_hex)
+        _set(obj, "your_last_hex", your_last_hex)
+        return obj
+
+    @classmethod
+    def from_model(cls, model: HeartbeatA) -> Self:
+        """The fast twin of ``model``, which is already valid."""
+        obj = _new(cls)
+        _set(obj, "my_hex", model.my_hex)
+        _set(obj, "your_last_hex", model.your_last_hex)
+        return obj
+
+    def to_model(self) -> HeartbeatA:
+        """This message as a ``HeartbeatA``, built without validating it
+        again (as ``trusted_from_dict`` builds one)."""
+        model = _new(HeartbeatA)
+        values = {
+            "type_name": "heartbeat.a",
+            "version": "000",
+            "my_hex": self.my_hex,
+            "your_last_hex": self.your_last_hex,
+        }
+        _set(model, "__dict__", values)
+        fields_set = {k for k, v in values.items() if v is not None}
+        _set(model, "__pydantic_fields_set__", fields_set)
+        _set(model, "__pydantic_extra__", None)
+        _set(model, "__pydantic_private__", None)
+        return model
+
+    def to_bytes(self) -> bytes:
+        """``HeartbeatA.to_bytes``, byte for byte."""
+        out = f'{{"TypeName":"heartbeat.a","Version":"000","MyHex":"{self.my_hex}"'
+        if self.your_last_hex is not None:
+            out += f',"YourLastHex":"{self.your_last_hex}"'
+        return (out + "}").encode()
+
+    def to_dict(self) -> dict[str, Any]:
+        """``HeartbeatA.to_dict``."""
+        d: dict[str, Any] = {
+            "TypeName": "heartbeat.a",
+            "Version": "000",
+            "MyHex": self.my_hex,
+        }
+        if self.your_last_hex is not None:
+            d["YourLastHex"] = self.your_last_hex
+        return d
+
+
+class FastReady(_FastSema):
+    """``Ready`` (sim.ready 000) as a plain slotted class."""
+
+    __slots__ = (
+        "from_g_node_alias",
+        "from_g_node_instance_id",
+        "time_unix_s",
+    )
+
+    type_name: ClassVar[str] = "sim.ready"
+    version: ClassVar[str | None] = "000"
+    sema_class: ClassVar[type[Ready]] = Ready
+    _keys: ClassVar[frozenset[str]] = frozenset((
+        "TypeName",
+        "Version",
+        "FromGNodeAlias",
+        "FromGNodeInstanceId",
+        "TimeUnixS",
+    ))
+
+    from_g_node_alias: str
+    from_g_node_instance_id: str
+    time_unix_s: int
+
+    def __init__(
+        self,
+        *,
+        from_g_node_alias: str,
+        from_g_node_instance_id: str,
+        time_unix_s: int,
+    ) -> None:
+        if not (
+            (
+                type(from_g_node_alias) is str
+                and _left_right_dot(from_g_node_alias) is not None
+            )
+            and (
+                type(from_g_node_instance_id) is str
+                and _uuid4(from_g_node_instance_id) is not None
+            )
+            and (
+                type(time_unix_s) is int
+                and UTC_SECONDS_MIN <= time_unix_s <= UTC_SECONDS_MAX
+            )
+        ):
+            # not plainly valid: the model validates (or raises) as usual
+            model = Ready(
+                from_g_node_alias=from_g_node_alias,
+                from_g_node_instance_id=from_g_node_instance_id,
+                time_unix_s=time_unix_s,
+            )
+            from_g_node_alias = model.from_g_node_alias
+            from_g_node_instance_id = model.from_g_node_instance_id
+            time_unix_s = model.time_unix_s
+        _set(self, "from_g_node_alias", from_g_node_alias)
+        _set(self, "from_g_node_instance_id", from_g_node_instance_id)
+        _set(self, "time_unix_s", time_unix_s)
+
+    @classmethod
+    def from_dict(cls, d: Any) -> Self:
+        """``Ready.from_dict``: accepts and raises the same."""
+        return cls._checked(d) or cls.from_model(Ready.from_dict(d))
+
+    @classmethod
+    def from_bytes(cls, body: bytes) -> Self:
+        """``Ready.from_bytes``: accepts and raises the same."""
+        fast = cls.try_from_bytes(body)
+        return fast or cls.from_model(Ready.from_bytes(body))
+
+    @classmethod
+    def try_from_bytes(cls, body: bytes) -> Self | None:
+        """``from_bytes`` where the body is plainly valid, TypeName and
+        Version included; None where the model has to decide (and may
+        accept, or raise)."""
+        try:
+            return cls._checked(from_json(body))
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def _checked(cls, d: Any) -> Self | None:
+        if type(d) is not dict or not cls._keys.issuperset(d):
+            return None
+        try:
+            from_g_node_alias = d["FromGNodeAlias"]
+            from_g_node_instance_id = d["FromGNodeInstanceId"]
+            time_unix_s = d["TimeUnixS"]
+        except KeyError:
+            return None
+        if not (
+            d.get("TypeName") == "sim.ready"
+            and d.get("Version") == "000"
+            and (
+                type(from_g_node_alias) is str
+                and _left_right_dot(from_g_node_alias) is not None
+            )
+            and (
+                type(from_g_node_instance_id) is str
+                and _uuid4(from_g_node_instance_id) is not None
+            )
+            and (
+                type(time_unix_s) is int
+                and UTC_SECONDS_MIN <= time_unix_s <= UTC_SECONDS_MAX
+            )
+        ):
+            return None
+        obj = _new(cls)
+        _set(obj, "from_g_node_alias", from_g_node_alias)
+        _set(obj, "from_g_node_instance_id", from_g_node_instance_id)
+        _set(obj, "time_unix_s", time_unix_s)
+        return obj
+
+    @classmethod
+    def from_model(cls, model: Ready) -> Self:
+        """The fast twin of ``model``, which is already valid."""
+        obj = _new(cls)
+        _set(obj, "from_g_node_alias", model.from_g_node_alias)
+        _set(obj, "from_g_node_instance_id", model.from_g_node_instance_id)
+        _set(obj, "time_unix_s", model.time_unix_s)
+        return obj
+
+    def to_model(self) -> Ready:
+        """This message as a ``Ready``, built without validating it
+        again (as ``trusted_from_dict`` builds one)."""
+        model = _new(Ready)
+        values = {
+            "type_name": "sim.ready",
+            "version": "000",
+            "from_g_node_alias": self.from_g_node_alias,
+            "from_g_node_instance_id": self.from_g_node_instance_id,
+            "time_unix_s": self.time_unix_s,
+        }
+        _set(model, "__dict__", values)
+        fields_set = {k for k, v in values.items() if v is not None}
+        _set(model, "__pydantic_fields_set__", fields_set)
+        _set(model, "__pydantic_extra__", None)
+        _set(model, "__pydantic_private__", None)
+        return model
+
+    def to_bytes(self) -> bytes:
+        """``Ready.to_bytes``, byte for byte."""
+        out = f'{{"TypeName":"sim.ready","Version":"000","FromGNodeAlias":"{self.from_g_node_alias}","FromGNodeInstanceId":"{self.from_g_node_instance_id}","TimeUnixS":{self.time_unix_s}'
+        return (out + "}").encode()
+
+    def to_dict(self) -> dict[str, Any]:
+        """``Ready.to_dict``."""
+        d: dict[str, Any] = {
+            "TypeName": "sim.ready",
+            "Version": "000",
+            "FromGNodeAlias": self.from_g_node_alias,
+            "FromGNodeInstanceId": self.from_g_node_instance_id,
+            "TimeUnixS": self.time_unix_s,
+        }
+        return d
+
+
+class FastSimTimestep(_FastSema):
+    """``SimTimestep`` (sim.timestep 000) as a plain slotted class."""
+
+    __slots__ = (
+        "from_g_node_alias",
+        "from_g_node_instance_id",
+        "time_unix_s",
+        "timestep_created_ms",
+        "message_id",
+    )
+
+    type_name: ClassVar[str] = "sim.timestep"
+    version: ClassVar[str | None] = "000"
+    sema_class: ClassVar[type[SimTimestep]] = SimTimestep
+    _keys: ClassVar[frozenset[str]] = frozenset((
+        "TypeName",
+        "Version",
+        "FromGNodeAlias",
+        "FromGNodeInstanceId",
+        "TimeUnixS",
+        "TimestepCreatedMs",
+        "MessageId",
+    ))
+
+    from_g_node_alias: str
+    from_g_node_instance_id: str
+    time_unix_s: int
+    timestep_created_ms: int
+    message_id: str
+
+    def __init__(
+        self,
+        *,
+        from_g_node_alias: str,
+        from_g_node_instance_id: str,
+        time_unix_s: int,
+        timestep_created_ms: int,
+        message_id: str,
+    ) -> None:
+        if not (
+            (
+                type(from_g_node_alias) is str
+                and _left_right_dot(from_g_node_alias) is not None
+            )
+            and (
+                type(from_g_node_instance_id) is str
+                and _uuid4(from_g_node_instance_id) is not None
+            )
+            and (
+                type(time_unix_s) is int
+                and UTC_SECONDS_MIN <= time_unix_s <= UTC_SECONDS_MAX
+            )
+            and (
+                type(timestep_created_ms) is int
+                and UTC_MILLISECONDS_MIN <= timestep_created_ms <= UTC_MILLISECONDS_MAX
+            )
+            and (type(message_id) is str and _uuid4(message_id) is not None)
+        ):
+            # not plainly valid: the model validates (or raises) as usual
+            model = SimTimestep(
+                from_g_node_alias=from_g_node_alias,
+                from_g_node_instance_id=from_g_node_instance_id,
+                time_unix_s=time_unix_s,
+                timestep_created_ms=timestep_created_ms,
+                message_id=message_id,
+            )
+            from_g_node_alias = model.from_g_node_alias
+            from_g_node_instance_id = model.from_g_node_instance_id
+            time_unix_s = model.time_unix_s
+            timestep_created_ms = model.timestep_created_ms
+            message_id = model.message_id
+        _set(self, "from_g_node_alias", from_g_node_alias)
+        _set(self, "from_g_node_instance_id", from_g_node_instance_id)
+        _set(self, "time_unix_s", time_unix_s)
+        _set(self, "timestep_created_ms", timestep_created_ms)
+        _set(self, "message_id", message_id)
+
+    @classmethod
+    def from_dict(cls, d: Any) -> Self:
+        """``SimTimestep.from_dict``: accepts and raises the same."""
+        return cls._checked(d) or cls.from_model(SimTimestep.from_dict(d))
+
+    @classmethod
+    def from_bytes(cls, body: bytes) -> Self:
+        """``SimTimestep.from_bytes``: accepts and raises the same."""
+        fast = cls.try_from_bytes(body)
+        return fast or cls.from_model(SimTimestep.from_bytes(body))
+
+    @classmethod
+    def try_from_bytes(cls, body: bytes) -> Self | None:
+        """``from_bytes`` where the body is plainly valid, TypeName and
+        Version included; None where the model has to decide (and may
+        accept, or raise)."""
+        try:
+            return cls._checked(from_json(body))
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def _checked(cls, d: Any) -> Self | None:
+        if type(d) is not dict or not cls._keys.issuperset(d):
+            return None
+        try:
+            from_g_node_alias = d["FromGNodeAlias"]
+            from_g_node_instance_id = d["FromGNodeInstanceId"]
+            time_unix_s = d["TimeUnixS"]
+            timestep_created_ms = d["TimestepCreatedMs"]
+            message_id = d["MessageId"]
+        except KeyError:
+            return None
+        if not (
+            d.get("TypeName") == "sim.timestep"
+            and d.get("Version") == "000"
+            and (
+                type(from_g_node_alias) is str
+                and _left_right_dot(from_g_node_alias) is not None
+            )
+            and (
+                type(from_g_node_instance_id) is str
+                and _uuid4(from_g_node_instance_id) is not None
+            )
+            and (
+                type(time_unix_s) is int
+                and UTC_SECONDS_MIN <= time_unix_s <= UTC_SECONDS_MAX
+            )
+            and (
+                type(timestep_created_ms) is int
+                and UTC_MILLISECONDS_MIN <= timestep_created_ms <= UTC_MILLISECONDS_MAX
+            )
+            and (type(message_id) is str and _uuid4(message_id) is not None)
+        ):
+            return None
+        obj = _new(cls)
+        _set(obj, "from_g_node_alias", from_g_node_alias)
+        _set(obj, "from_g_node_instance_id", from_g_node_instance_id)
+        _set(obj, "time_unix_s", time_unix_s)
+        _set(obj, "timestep_created_ms", timestep_created_ms)
+        _set(obj, "message_id", message_id)
+        return obj
+
+    @classmethod
+    def from_model(cls, model: SimTimestep) -> Self:
+        """The fast twin of ``model``, which is already valid."""
+        obj = _new(cls)
+        _set(obj, "from_g_node_alias", model.from_g_node_alias)
+        _set(obj, "from_g_node_instance_id", model.from_g_node_instance_id)
+        _set(obj, "time_unix_s", model.time_unix_s)
+        _set(obj, "timestep_created_ms", model.timestep_created_ms)
+        _set(obj, "message_id", model.message_id)
+        return obj
+
+    def to_model(self) -> SimTimestep:
+        """This message as a ``SimTimestep``, built without validating it
+        again (as ``trusted_from_dict`` builds one)."""
+        model = _new(SimTimestep)
+        values = {
+            "type_name": "sim.timestep",
+            "version": "000",
+            "from_g_node_alias": self.from_g_node_alias,
+            "from_g_node_instance_id": self.from_g_node_instance_id,
+            "time_unix_s": self.time_unix_s,
+            "timestep_created_ms": self.timestep_created_ms,
+            "message_id": self.message_id,
+        }
+        _set(model, "__dict__", values)
+        fields_set = {k for k, v in values.items() if v is not None}
+        _set(model, "__pydantic_fields_set__", fields_set)
+        _set(model, "__pydantic_extra__", None)
+        _set(model, "__pydantic_private__", None)
+        return model
+
+    def to_bytes(self) -> bytes:
+        """``SimTimestep.to_bytes``, byte for byte."""
+        out = f'{{"TypeName":"sim.timestep","Version":"000","FromGNodeAlias":"{self.from_g_node_alias}","FromGNodeInstanceId":"{self.from_g_node_instance_id}","TimeUnixS":{self.time_unix_s},"TimestepCreatedMs":{self.timestep_created_ms},"MessageId":"{self.message_id}"'
+        return (out + "}").encode()
+
+    def to_dict(self) -> dict[str, Any]:
+        """``SimTimestep.to_dict``."""
+        d: dict[str, Any] = {
+            "TypeName": "sim.timestep",
+            "Version": "000",
+            "FromGNodeAlias": self.from_g_node_alias,
+            "FromGNodeInstanceId": self.from_g_node_instance_id,
+            "TimeUnixS": self.time_unix_s,
+            "TimestepCreatedMs": self.timestep_created_ms,
+            "MessageId": self.message_id,
+        }
+        return d
+
+
+class FastGridworksHeader(_FastSema):
+    """``GridworksHeader`` (gridworks.header 001) as a plain slotted class."""
+
+    __slots__ = (
+        "src",
+        "dst",
+        "message_type",
+        "message_id",
+        "ack_required",
+    )
+
+    type_name: ClassVar[str] = "gridworks.header"
+    version: ClassVar[str | None] = "001"
+    sema_class: ClassVar[type[GridworksHeader]] = GridworksHeader
+    _keys: ClassVar[frozenset[str]] = frozenset((
+        "TypeName",
+        "Version",
+        "Src",
+        "Dst",
+        "MessageType",
+        "MessageId",
+        "AckRequired",
+    ))
+
+    src: str
+    dst: Any
+    message_type: str
+    message_id: str
+    ack_required: bool
+
+    def __init__(
+        self,
+        *,
+        src: str,
+        dst: Any,
+        message_type: str,
+        message_id: str,
+        ack_required: bool,
+    ) -> None:
+        if not (
+            (type(src) is str)
+            and (recursively_pascal(dst))
+            and (
+                type(message_type) is str and _left_right_dot(message_type) is not None
+            )
+            and (type(message_id) is str)
+            and (type(ack_required) is bool)
+        ):
+            # not plainly valid: the model validates (or raises) as usual
+            model = GridworksHeader(
+                src=src,
+                dst=dst,
+                message_type=message_type,
+                message_id=message_id,
+                ack_required=ack_required,
+            )
+            src = model.src
+            dst = model.dst
+            message_type = model.message_type
+            message_id = model.message_id
+            ack_required = model.ack_required
+        _set(self, "src", src)
+        _set(self, "dst", dst)
+        _set(self, "message_type", message_type)
+        _set(self, "message_id", message_id)
+        _set(self, "ack_required", ack_required)
+
+    @classmethod
+    def from_dict(cls, d: Any) -> Self:
+        """``GridworksHeader.from_dict``: accepts and raises the same."""
+        return cls._checked(d) or cls.from_model(GridworksHeader.from_dict(d))
+
+    @classmethod
+    def from_bytes(cls, body: bytes) -> Self:
+        """``GridworksHeader.from_bytes``: accepts and raises the same."""
+        fast = cls.try_from_bytes(body)
+        return fast or cls.from_model(GridworksHeader.from_bytes(body))
+
+    @classmethod
+    def try_from_bytes(cls, body: bytes) -> Self | None:
+        """``from_bytes`` where the body is plainly valid, TypeName and
+        Version included; None where the model has to decide (and may
+        accept, or raise)."""
+        try:
+            return cls._checked(from_json(body))
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def _checked(cls, d: Any) -> Self | None:
+        if type(d) is not dict or not cls._keys.issuperset(d):
+            return None
+        try:
+            src = d["Src"]
+            dst = d["Dst"]
+            message_type = d["MessageType"]
+            message_id = d["MessageId"]
+            ack_required = d["AckRequired"]
+        except KeyError:
+            return None
+        if not (
+            d.get("TypeName") == "gridworks.header"
+            and d.get("Version") == "001"
+            and (type(src) is str)
+            and (recursively_pascal(dst))
+            and (
+                type(message_type) is str and _left_right_dot(message_type) is not None
+            )
+            and (type(message_id) is str)
+            and (type(ack_required) is bool)
+        ):
+            return None
+        obj = _new(cls)
+        _set(obj, "src", src)
+        _set(obj, "dst", dst)
+        _set(obj, "message_type", message_type)
+        _set(obj, "message_id", message_id)
+        _set(obj, "ack_required", ack_required)
+        return obj
+
+    @classmethod
+    def from_model(cls, model: GridworksHeader) -> Self:
+        """The fast twin of ``model``, which is already valid."""
+        obj = _new(cls)
+        _set(obj, "src", model.src)
+        _set(obj, "dst", model.dst)
+        _set(obj, "message_type", model.message_type)
+        _set(obj, "message_id", model.message_id)
+        _set(obj, "ack_required", model.ack_required)
+        return obj
+
+    def to_model(self) -> GridworksHeader:
+        """This message as a ``GridworksHeader``, built without validating it
+        again (as ``trusted_from_dict`` builds one)."""
+        model = _new(GridworksHeader)
+        values = {
+            "type_name": "gridworks.header",
+            "version": "001",
+            "src": self.src,
+            "dst": self.dst,
+            "message_type": self.message_type,
+            "message_id": self.message_id,
+            "ack_required": self.ack_required,
+        }
+        _set(model, "__dict__", values)
+        fields_set = {k for k, v in values.items() if v is not None}
+        _set(model, "__pydantic_fields_set__", fields_set)
+        _set(model, "__pydantic_extra__", None)
+        _set(model, "__pydantic_private__", None)
+        return model
+
+    def to_bytes(self) -> bytes:
+        """``GridworksHeader.to_bytes``, byte for byte."""
+        out = f'{{"TypeName":"gridworks.header","Version":"001","Src":{_json_str(self.src)}'
+        if self.dst is not None:
+            out += f',"Dst":{_json_any(self.dst)}'
+        out += f',"MessageType":"{self.message_type}","MessageId":{_json_str(self.message_id)},"AckRequired":{_JSON_BOOL[self.ack_required]}'
+        return (out + "}").encode()
+
+    def to_dict(self) -> dict[str, Any]:
+        """``GridworksHeader.to_dict``."""
+        d: dict[str, Any] = {
+            "TypeName": "gridworks.header",
+            "Version": "001",
+            "Src": self.src,
+            "MessageType": self.message_type,
+            "MessageId": self.message_id,
+            "AckRequired": self.ack_required,
+        }
+        if self.dst is not None:
+            d["Dst"] = _ANY.dump_python(self.dst)
+        return d
@@ -0,0 +1,470 @@
+"""Generate ``gwbase.sema.fast_types``: plain slotted twins of the hottest
+control-plane Sema types.
+
+Every actor builds, encodes and decodes ``HeartbeatA`` and ``Ready`` on
+every sim step, and pydantic's per-instance cost dominates those paths.
+For each class in ``FAST_TYPES`` this writes a ``Fast<Name>`` class with
+``__slots__``, whose checks and encoder are spelled out per field from the
+pydantic definition:
+
+- ``__init__``, ``from_dict`` and ``from_bytes`` accept a value outright
+  only when it is plainly valid (exact ``str``/``int``/``bool`` types, the
+  format check inlined). Anything else goes to the pydantic model, which
+  raises what it always raises or returns the value it coerced, so the
+  fast class accepts and rejects exactly what the model does;
+- ``to_bytes`` is an f-string giving the model's ``to_bytes`` bytes, and
+  ``to_dict`` its ``to_dict``;
+- ``to_model`` / ``from_model`` convert without validating again.
+
+Supported field annotations: one-value ``Literal`` (``TypeName``,
+``Version``), ``HexChar``, ``LeftRightDot``, ``UUID4Str``, ``UTCSeconds``,
+``UTCMilliseconds``, ``str``, ``int``, ``bool`` and ``Any``, each optional
+with a None default. Anything else raises ``TypeError`` here, at
+generation time.
+
+Regenerate after changing one of these types::
+
+    python -m gwbase.sema.fastgen          # rewrite fast_types.py
+    python -m gwbase.sema.fastgen --check  # exit 1 if it is stale
+
+A test fails while ``fast_types.py`` is stale.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Literal, get_args, get_origin
+
+from pydantic.fields import FieldInfo
+
+from gwbase._format_checks import (
+    is_hex_char,
+    is_left_right_dot,
+    is_utc_milliseconds,
+    is_utc_seconds,
+    is_uuid4_str,
+)
+from gwbase.sema.base import GwBaseSemaType
+from gwbase.sema.types import GridworksHeader, HeartbeatA, Ready, SimTimestep
+
+FAST_TYPES: list[type[GwBaseSemaType]] = [
+    HeartbeatA,
+    Ready,
+    SimTimestep,
+    GridworksHeader,
+]
+OUTPUT = Path(__file__).with_name("fast_types.py")
+
+# Per kind: the annotation the fast class declares, the check that accepts
+# a value outright ({v} is the value), and how to_bytes writes it inside
+# the f-string. A value that fails the check is left to the model.
+_KINDS: dict[str, tuple[str, str, str]] = {
+    "hex": ("str", "type({v}) is str and {v} in HEX_CHARS", '"{{{v}}}"'),
+    "alias": (
+        "str",
+        "type({v}) is str and _left_right_dot({v}) is not None",
+        '"{{{v}}}"',
+    ),
+    "uuid4": ("str", "type({v}) is str and _uuid4({v}) is not None", '"{{{v}}}"'),
+    "seconds": (
+        "int",
+        "type({v}) is int and UTC_SECONDS_MIN <= {v} <= UTC_SECONDS_MAX",
+        "{{{v}}}",
+    ),
+    "milliseconds": (
+        "int",
+        "type({v}) is int and UTC_MILLISECONDS_MIN <= {v} <= UTC_MILLISECONDS_MAX",
+        "{{{v}}}",
+    ),
+    "str": ("str", "type({v}) is str", "{{_json_str({v})}}"),
+    "int": ("int", "type({v}) is int", "{{{v}}}"),
+    "bool": ("bool", "type({v}) is bool", "{{_JSON_BOOL[{v}]}}"),
+    "any": ("Any", "recursively_pascal({v})", "{{_json_any({v})}}"),
+}
+_CHECK_KINDS = {
+    is_hex_char: "hex",
+    is_left_right_dot: "alias",
+    is_uuid4_str: "uuid4",
+    is_utc_seconds: "seconds",
+    is_utc_milliseconds: "milliseconds",
+}
+_PLAIN_KINDS = {str: "str", int: "int", bool: "bool", Any: "any"}
+
+_HEADER = '''"""Plain slotted twins of hot Sema types (see ``gwbase.sema.fastgen``).
+
+GENERATED by ``python -m gwbase.sema.fastgen`` from ``gwbase.sema.types``:
+do not edit by hand.
+"""
+
+from typing import Any, ClassVar, Self
+
+from pydantic import TypeAdapter
+from pydantic_core import from_json, to_json
+
+from gwbase._format_checks import (
+    HEX_CHARS,
+    LEFT_RIGHT_DOT_PATTERN,
+    UTC_MILLISECONDS_MAX,
+    UTC_MILLISECONDS_MIN,
+    UTC_SECONDS_MAX,
+    UTC_SECONDS_MIN,
+    UUID4_STR_PATTERN,
+)
+from gwbase.sema.base import recursively_pascal
+from gwbase.sema.types import {imports}
+
+__all__ = [
+{all_names}
+]
+
+_new = object.__new__
+_set = object.__setattr__
+_left_right_dot = LEFT_RIGHT_DOT_PATTERN.fullmatch
+_uuid4 = UUID4_STR_PATTERN.fullmatch
+_ANY: TypeAdapter[Any] = TypeAdapter(Any)
+_JSON_BOOL = {{True: "true", False: "false"}}
+_PLAIN_JSON_STR = frozenset(
+    chr(c) for c in range(0x20, 0x80) if chr(c) not in {{'"', "\\\\"}}
+)
+
+
+def _json_str(v: str) -> str:
+    """``v`` as the model's encoder writes it."""
+    if v.isascii() and _PLAIN_JSON_STR.issuperset(v):
+        return f'"{{v}}"'
+    return to_json(v).decode()
+
+
+def _json_any(v: Any) -> str:
+    return to_json(v).decode()
+
+
+class _FastSema:
+    """Frozen, compared and hashed by field value, like the models."""
+
+    __slots__: tuple[str, ...] = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{{type(self).__name__}} is frozen")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{{type(self).__name__}} is frozen")
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._values()))
+
+    def __repr__(self) -> str:
+        values = zip(self.__slots__, self._values(), strict=True)
+        return f"{{type(self).__name__}}({{', '.join(f'{{n}}={{v!r}}' for n, v in values)}})"
+
+    def _values(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+'''
+
+
+class _Field:
+    def __init__(self, name: str, field: FieldInfo, cls: type) -> None:
+        self.name = name
+        self.alias = field.alias or name
+        self.optional, self.kind = _kind(field, f"{cls.__name__}.{name}")
+        if not field.is_required() and field.default is not None:
+            raise TypeError(f"{cls.__name__}.{name}: only None defaults are supported")
+        declared, check, json = _KINDS[self.kind]
+        self.annotation = f"{declared} | None" if self.optional else declared
+        self.json = json
+        # encoders leave out None values, as the model's exclude_none does
+        self.omit_none = self.optional or self.kind == "any"
+
+    def check(self, v: str) -> "_Expr":
+        check: _Expr = ("and", _KINDS[self.kind][1].format(v=v).split(" and "))
+        return ("or", [f"{v} is None", check]) if self.optional else check
+
+
+def _kind(field: FieldInfo, where: str) -> tuple[bool, str]:
+    tp: Any = field.annotation
+    optional = False
+    if type(None) in get_args(tp) and get_origin(tp) is not Literal:
+        args = [a for a in get_args(tp) if a is not type(None)]
+        if len(args) != 1:
+            raise TypeError(f"{where}: unions are not supported")
+        optional, tp = True, args[0]
+    metadata = list(field.metadata)
+    if hasattr(tp, "__metadata__"):  # Annotated inside Optional
+        metadata += tp.__metadata__
+        tp = tp.__origin__
+    checks = [getattr(m, "func", None) for m in metadata]
+    for check in checks:
+        if check in _CHECK_KINDS:
+            return optional, _CHECK_KINDS[check]
+    if checks:
+        raise TypeError(f"{where}: validator {checks} is not supported")
+    if tp in _PLAIN_KINDS:
+        return optional, _PLAIN_KINDS[tp]
+    raise TypeError(f"{where}: {tp} is not supported")
+
+
+def render(classes: list[type[GwBaseSemaType]] | None = None) -> str:
+    """The source of ``fast_types.py`` for ``classes`` (default
+    ``FAST_TYPES``)."""
+    classes = FAST_TYPES if classes is None else classes
+    names = sorted(c.__name__ for c in classes)
+    out = [
+        _HEADER.format(
+            imports=", ".join(names),
+            all_names="\n".join(f'    "Fast{n}",' for n in names),
+        ).rstrip("\n")
+    ]
+    out.extend(_render_class(cls) for cls in classes)
+    return "\n".join(out) + "\n"
+
+
+def _render_class(cls: type[GwBaseSemaType]) -> str:
+    name = cls.__name__
+    type_name, version = cls.type_name_value(), cls.version_value()
+    fields = [
+        _Field(n, f, cls)
+        for n, f in cls.model_fields.items()
+        if n not in {"type_name", "version"}
+    ]
+    required = [f for f in fields if not f.optional]
+    header = f"{type_name} {version}" if version else type_name
+
+    lines = [
+        "",
+        "",
+        f"class Fast{name}(_FastSema):",
+        f'    """``{name}`` ({header}) as a plain slotted class."""',
+        "",
+        "    __slots__ = (",
+        *(f'        "{f.name}",' for f in fields),
+        "    )",
+        "",
+        f'    type_name: ClassVar[str] = "{type_name}"',
+        f"    version: ClassVar[str | None] = {version!r}".replace("'", '"'),
+        f"    sema_class: ClassVar[type[{name}]] = {name}",
+        "    _keys: ClassVar[frozenset[str]] = frozenset((",
+        *(
+            f'        "{k}",'
+            for k in ["TypeName", "Version", *(f.alias for f in fields)]
+        ),
+        "    ))",
+        "",
+        *(f"    {f.name}: {f.annotation}" for f in fields),
+        "",
+        "    def __init__(",
+        "        self,",
+        "        *,",
+        *(f"        {f.name}: {f.annotation}," for f in required),
+        *(f"        {f.name}: {f.annotation} = None," for f in fields if f.optional),
+        "    ) -> None:",
+        "        if not (",
+        *_conjunction([f.check(f.name) for f in fields]),
+        "        ):",
+        "            # not plainly valid: the model validates (or raises) as usual",
+        f"            model = {name}(",
+        *(f"                {f.name}={f.name}," for f in fields),
+        "            )",
+        *(f"            {f.name} = model.{f.name}" for f in fields),
+        *(f'        _set(self, "{f.name}", {f.name})' for f in fields),
+        "",
+        "    @classmethod",
+        "    def from_dict(cls, d: Any) -> Self:",
+        f'        """``{name}.from_dict``: accepts and raises the same."""',
+        f"        return cls._checked(d) or cls.from_model({name}.from_dict(d))",
+        "",
+        "    @classmethod",
+        "    def from_bytes(cls, body: bytes) -> Self:",
+        f'        """``{name}.from_bytes``: accepts and raises the same."""',
+        "        fast = cls.try_from_bytes(body)",
+        f"        return fast or cls.from_model({name}.from_bytes(body))",
+        "",
+        "    @classmethod",
+        "    def try_from_bytes(cls, body: bytes) -> Self | None:",
+        '        """``from_bytes`` where the body is plainly valid, TypeName and',
+        "        Version included; None where the model has to decide (and may",
+        '        accept, or raise)."""',
+        "        try:",
+        "            return cls._checked(from_json(body))",
+        "        except (TypeError, ValueError):",
+        "            return None",
+        "",
+        "    @classmethod",
+        "    def _checked(cls, d: Any) -> Self | None:",
+        "        if type(d) is not dict or not cls._keys.issuperset(d):",
+        "            return None",
+    ]
+    if required:
+        lines += [
+            "        try:",
+            *(f'            {f.name} = d["{f.alias}"]' for f in required),
+            "        except KeyError:",
+            "            return None",
+        ]
+    lines += [f'        {f.name} = d.get("{f.alias}")' for f in fields if f.optional]
+    # present, not defaulted: the codec needs them to dispatch the body
+    literal_checks = [f'd.get("TypeName") == "{type_name}"']
+    if version is not None:
+        literal_checks.append(f'd.get("Version") == "{version}"')
+    else:
+        literal_checks.append('d.get("Version") is None')
+    lines += [
+        "        if not (",
+        *_conjunction([*literal_checks, *(f.check(f.name) for f in fields)]),
+        "        ):",
+        "            return None",
+        "        obj = _new(cls)",
+        *(f'        _set(obj, "{f.name}", {f.name})' for f in fields),
+        "        return obj",
+        "",
+        "    @classmethod",
+        f"    def from_model(cls, model: {name}) -> Self:",
+        '        """The fast twin of ``model``, which is already valid."""',
+        "        obj = _new(cls)",
+        *(f'        _set(obj, "{f.name}", model.{f.name})' for f in fields),
+        "        return obj",
+        "",
+        f"    def to_model(self) -> {name}:",
+        f'        """This message as a ``{name}``, built without validating it',
+        '        again (as ``trusted_from_dict`` builds one)."""',
+        f"        model = _new({name})",
+        "        values = {",
+        f'            "type_name": "{type_name}",',
+        f'            "version": {version!r},'.replace("'", '"'),
+        *(f'            "{f.name}": self.{f.name},' for f in fields),
+        "        }",
+        '        _set(model, "__dict__", values)',
+        "        fields_set = {k for k, v in values.items() if v is not None}",
+        '        _set(model, "__pydantic_fields_set__", fields_set)',
+        '        _set(model, "__pydantic_extra__", None)',
+        '        _set(model, "__pydantic_private__", None)',
+        "        return model",
+        "",
+        "    def to_bytes(self) -> bytes:",
+        f'        """``{name}.to_bytes``, byte for byte."""',
+        *_render_to_bytes(type_name, version, fields),
+        "",
+        "    def to_dict(self) -> dict[str, Any]:",
+        f'        """``{name}.to_dict``."""',
+        *_render_to_dict(type_name, version, fields),
+    ]
+    return "\n".join(lines)
+
+
+# A check, laid out as ruff formats it: an expression that does not fit on
+# its line is split at its top-level operator, inside its own parentheses.
+_Expr = Any  # str, or (operator, [_Expr, ...])
+_LINE_LENGTH = 88
+
+
+def _conjunction(checks: list[_Expr]) -> list[str]:
+    """The lines of ``checks`` joined by ``and``, inside ``if not (...)``."""
+    return _split(("and", checks), " " * 12)
+
+
+def _flat(expr: _Expr) -> str:
+    if isinstance(expr, str):
+        return expr
+    op, parts = expr
+    return f" {op} ".join(p if isinstance(p, str) else f"({_flat(p)})" for p in parts)
+
+
+def _split(expr: _Expr, pad: str) -> list[str]:
+    op, parts = expr
+    lines: list[str] = []
+    for i, part in enumerate(parts):
+        lines += _layout(part, pad, "" if i == 0 else f"{op} ")
+    return lines
+
+
+def _layout(expr: _Expr, pad: str, prefix: str) -> list[str]:
+    if isinstance(expr, str):
+        return [pad + prefix + expr]
+    text = _flat(expr)
+    if len(pad + prefix + text) + 2 <= _LINE_LENGTH:
+        return [f"{pad}{prefix}({text})"]
+    inner = pad + "    "
+    if len(inner + text) <= _LINE_LENGTH:
+        return [f"{pad}{prefix}(", inner + text, f"{pad})"]
+    return [f"{pad}{prefix}(", *_split(expr, inner), f"{pad})"]
+
+
+def _render_to_bytes(
+    type_name: str, version: str | None, fields: list[_Field]
+) -> list[str]:
+    head = f'{{{{"TypeName":"{type_name}"'
+    if version is not None:
+        head += f',"Version":"{version}"'
+    lines: list[str] = []
+    segment = head
+    started = False
+    for f in fields:
+        piece = f',"{f.alias}":' + f.json.format(v=f"self.{f.name}")
+        if not f.omit_none:
+            segment += piece
+            continue
+        lines.append(
+            ("        out += " if started else "        out = ") + f"f'{segment}'"
+        )
+        started = True
+        segment = ""
+        lines += [
+            f"        if self.{f.name} is not None:",
+            f"            out += f'{piece}'",
+        ]
+    if segment:
+        lines.append(
+            ("        out += " if started else "        out = ") + f"f'{segment}'"
+        )
+    lines.append('        return (out + "}").encode()')
+    return lines
+
+
+def _render_to_dict(
+    type_name: str, version: str | None, fields: list[_Field]
+) -> list[str]:
+    lines = ["        d: dict[str, Any] = {", f'            "TypeName": "{type_name}",']
+    if version is not None:
+        lines.append(f'            "Version": "{version}",')
+    optional = []
+    for f in fields:
+        value = (
+            f"_ANY.dump_python(self.{f.name})" if f.kind == "any" else f"self.{f.name}"
+        )
+        if f.omit_none:
+            optional.append((f, value))
+        else:
+            lines.append(f'            "{f.alias}": {value},')
+    lines.append("        }")
+    for f, value in optional:
+        lines += [
+            f"        if self.{f.name} is not None:",
+            f'            d["{f.alias}"] = {value}',
+        ]
+    lines.append("        return d")
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check", action="store_true", help="exit 1 if fast_types.py is stale"
+    )
+    args = parser.parse_args(argv)
+    source = render()
+    if args.check:
+        stale = not OUTPUT.exists() or OUTPUT.read_text() != source
+        if stale:
+            print(f"{OUTPUT} is stale: run python -m gwbase.sema.fastgen")
+        return int(stale)
+    OUTPUT.write_text(source)
+    print(f"wrote {OUTPUT}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""The JSON parser behind the codec's slow paths and the ``gw`` envelope.
+
+The decode fast paths never build a Python dict: a current-version body of
+a known type goes straight to pydantic (``compiled_from_json``). Everything
+else -- old versions, degraded decodes, free-form types, ``gw`` envelopes,
+``peek_type`` fallbacks -- is parsed to a dict first, by the backend chosen
+here:
+
+- ``stdlib`` (default): ``json.loads``;
+- ``pydantic``: pydantic-core's parser (always installed, 3-4x faster);
+- ``orjson``: if installed.
+
+Choose at startup with ``GWBASE_JSON_BACKEND=<name>`` or
+``set_json_backend(name)``. A document every backend accepts parses to
+equal values, except that ``orjson`` reads ints beyond 64 bits as floats.
+They do not all accept the same documents:
+
+- ``stdlib`` also accepts a lone surrogate escape (``"\\ud800"``) and, in
+  bytes, a leading UTF-8 byte order mark; ``pydantic`` and ``orjson``
+  reject both;
+- ``orjson`` rejects ``NaN``/``Infinity``, which the other two accept.
+
+The error messages differ too. The fast paths (and the batch grouping and
+trusted-sender decodes that feed them) always parse with pydantic; a body
+they reject falls back to the selected backend.
+Encoding is not pluggable: ``to_bytes`` is pydantic's serializer and
+``wrap_bytes`` is ``json.dumps``, whose bytes are the wire format.
+"""
+
+import importlib
+import json
+import os
+from collections.abc import Callable
+from typing import Any
+
+from pydantic_core import from_json
+
+ENV_VAR = "GWBASE_JSON_BACKEND"
+DEFAULT_BACKEND = "stdlib"
+
+_Loads = Callable[[bytes | bytearray | str], Any]
+
+
+def _orjson_loads() -> _Loads:
+    try:
+        orjson = importlib.import_module("orjson")
+    except ImportError as e:
+        raise ValueError("JSON backend 'orjson' needs orjson installed") from e
+    return orjson.loads  # type: ignore[no-any-return]
+
+
+_BACKENDS: dict[str, Callable[[], _Loads]] = {
+    "stdlib": lambda: json.loads,
+    "pydantic": lambda: from_json,
+    "orjson": _orjson_loads,
+}
+
+_name = DEFAULT_BACKEND
+_loads: _Loads = json.loads
+
+
+def set_json_backend(name: str) -> None:
+    """Parse with ``name`` from now on (see module docstring). Raises
+    ValueError for an unknown or uninstalled backend."""
+    global _name, _loads  # noqa: PLW0603 — the process-wide parser
+    if name not in _BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend {name!r} (choose from {', '.join(_BACKENDS)})"
+        )
+    _loads = _BACKENDS[name]()
+    _name = name
+
+
+def get_json_backend() -> str:
+    return _name
+
+
+def loads(data: bytes | bytearray | str) -> Any:
+    """Parse ``data`` with the selected backend. Invalid JSON raises
+    ValueError; a non-text argument, TypeError."""
+    if not isinstance(data, (bytes, bytearray, str)):
+        raise TypeError(f"Expected bytes, bytearray or str, got {type(data).__name__}")
+    return _loads(data)
+
+
+set_json_backend(os.environ.get(ENV_VAR) or DEFAULT_BACKEND)
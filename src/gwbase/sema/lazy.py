@@ -0,0 +1,160 @@
+"""A Sema message that decodes its fields one at a time, on first access.
+
+Ear taps and routers often read one or two fields of a message
+(``from_g_node_alias``, ``time_unix_s``) and then forward or drop it.
+``GwBaseSemaCodec.from_bytes_lazy`` returns a ``LazySema`` over the raw
+bytes instead of a model: ``TypeName`` and ``Version`` come from
+``peek_type``, the body is parsed on the first field read, and each field
+is validated against its own annotation (by alias, as the model validates
+it) when first read, then cached.
+
+What a field read does NOT check is the rest of the message: unknown keys,
+other fields, and the model's cross-field validators only run in
+``materialize()``, which is the codec's strict decode. A message can
+therefore yield valid fields and still fail to materialize. Fields of a
+class with a ``field_validator`` are read from the materialized model.
+"""
+
+from typing import TYPE_CHECKING, Any, Protocol, cast
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+
+from gwbase.sema import json_backend
+from gwbase.sema.base import GwBaseSemaError, GwBaseSemaType
+
+if TYPE_CHECKING:
+    from gwbase.sema.base import DegradedSemaType
+
+
+class _Decoder(Protocol):
+    def from_bytes(self, data: bytes) -> "GwBaseSemaType | DegradedSemaType": ...
+
+
+_NOT_PARSED: Any = object()
+
+# Per class: TypeName, Version, and for each field name its alias, its
+# FieldInfo when it has a default (None when required) and its validator
+# (None: read it from the materialized model), built on first use.
+_Field = tuple[str, FieldInfo | None, TypeAdapter[Any] | None]
+_Plan = tuple[str, str | None, dict[str, _Field]]
+_plans: dict[type, _Plan] = {}
+
+
+class LazySema:
+    """Read-only view of a Sema body, with the model's field names as
+    attributes (see module docstring)."""
+
+    __slots__ = (
+        "_cls",
+        "_decoder",
+        "_fields",
+        "_materialized",
+        "_parsed",
+        "_values",
+        "raw_bytes",
+        "type_name",
+        "version",
+    )
+
+    def __init__(
+        self,
+        raw_bytes: bytes,
+        cls: type[GwBaseSemaType],
+        decoder: _Decoder,
+    ) -> None:
+        self.raw_bytes = raw_bytes
+        self.type_name, self.version, self._fields = _plan(cls)
+        self._cls = cls
+        self._decoder = decoder
+        self._parsed: Any = _NOT_PARSED
+        self._values: dict[str, Any] = {}
+        self._materialized: GwBaseSemaType | None = None
+
+    @property
+    def sema_class(self) -> type[GwBaseSemaType]:
+        """The class whose fields this view exposes (an old version's class
+        for an old-version body; ``materialize`` upgrades it)."""
+        return self._cls
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for names that are not slots or class attributes, or
+        # for an unset slot (copy and pickle build the instance empty)
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        try:
+            alias, optional, adapter = self._fields[name]
+        except KeyError:
+            raise AttributeError(
+                f"{self._cls.__name__} has no field {name!r}"
+            ) from None
+        if adapter is None:
+            value = getattr(self.materialize(), name)
+        else:
+            d = self._dict()
+            if alias in d:
+                try:
+                    value = adapter.validate_python(
+                        d[alias], by_alias=True, by_name=False
+                    )
+                except ValidationError as e:
+                    raise GwBaseSemaError(f"Validation failed: {e}") from e
+            elif optional is None:
+                raise GwBaseSemaError(f"Validation failed: missing {alias}")
+            else:
+                value = optional.get_default(call_default_factory=True)
+        self._values[name] = value
+        return value
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # rebuilt from the body: the per-class plan holds pydantic adapters,
+        # which do not pickle, and the caches are cheap to fill again
+        return (LazySema, (self.raw_bytes, self._cls, self._decoder))
+
+    def materialize(self) -> GwBaseSemaType:
+        """The message as the codec's strict ``from_bytes`` decodes it
+        (validated in full, upgraded to the current version). Raises what
+        ``from_bytes`` raises."""
+        if self._materialized is None:
+            decoded = self._decoder.from_bytes(self.raw_bytes)
+            self._materialized = cast(GwBaseSemaType, decoded)  # strict
+        return self._materialized
+
+    def _dict(self) -> dict[str, Any]:
+        if self._parsed is _NOT_PARSED:
+            try:
+                self._parsed = json_backend.loads(self.raw_bytes)
+            except Exception as e:
+                raise ValueError(f"Invalid JSON: {e}") from e
+        if not isinstance(self._parsed, dict):
+            raise ValueError("Input must be dict")
+        return self._parsed
+
+    def __repr__(self) -> str:
+        return f"LazySema({self.type_name!r}, {self.version!r}, {len(self.raw_bytes)} bytes)"
+
+
+def _plan(cls: type[GwBaseSemaType]) -> _Plan:
+    try:
+        return _plans[cls]
+    except KeyError:
+        pass
+    # a field validator runs only in the model, so those fields materialize
+    validated = {
+        f
+        for decorator in cls.__pydantic_decorators__.field_validators.values()
+        for f in decorator.info.fields
+    }
+    fields: dict[str, _Field] = {}
+    for name, field in cls.model_fields.items():
+        adapter = None
+        if name not in validated and "*" not in validated:
+            adapter = TypeAdapter(field.rebuild_annotation())
+        optional = None if field.is_required() else field
+        fields[name] = (field.alias or name, optional, adapter)
+    plan = _plans[cls] = (cls.type_name_value(), cls.version_value(), fields)
+    return plan
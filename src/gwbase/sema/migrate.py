@@ -0,0 +1,230 @@
+"""Rewrite NDJSON message archives to the current Sema versions.
+
+Each line of an archive is one Sema body. ``migrate_file`` streams SRC to
+DST in order:
+
+- a line already at its type's current version is copied byte for byte
+  (its TypeName/Version are peeked, the body is not validated);
+- an old-version line is decoded, upgraded along the registry's upgrade
+  chain and written back with ``to_bytes``;
+- a line that does not decode (unknown type or version, invalid body) is
+  kept as is, dropped, or stops the run, per ``on_error``, and counted.
+
+With ``workers > 1`` the archive is cut into chunks of ``chunk_lines``
+lines, migrated in a ``spawn`` process pool (at most two chunks in flight
+per worker) and written back in order. Paths ending in ``.gz`` are read
+and written through gzip. Application types reach the workers through
+``registry="package.module:attr"``, a ``SemaRegistry`` importable by name::
+
+    python -m gwbase.sema.migrate journal-2025.ndjson.gz journal-2025.v2.ndjson.gz \\
+        --workers 8 --registry myapp.sema:REGISTRY
+"""
+
+import argparse
+import gzip
+import os
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Literal, cast
+
+from gwbase.sema._pool import chunks, load_registry, map_in_order
+from gwbase.sema.base import GwBaseSemaError, GwBaseSemaType
+from gwbase.sema.codec import GwBaseSemaCodec
+from gwbase.sema.peek import peek_type
+
+DEFAULT_CHUNK_LINES = 2000
+
+OnError = Literal["keep", "drop", "fail"]
+
+
+@dataclass
+class MigrationStats:
+    lines: int = 0
+    current: int = 0
+    upgraded: int = 0
+    failed: int = 0
+
+    def add(self, other: "MigrationStats") -> None:
+        self.lines += other.lines
+        self.current += other.current
+        self.upgraded += other.upgraded
+        self.failed += other.failed
+
+
+@dataclass
+class _ChunkResult:
+    lines: list[bytes]
+    stats: MigrationStats
+    error: tuple[int, str] | None = None  # (line offset, message) if on_error="fail"
+
+
+class _ChunkMigrator:
+    def __init__(self, registry: str | None, on_error: OnError) -> None:
+        self.codec = GwBaseSemaCodec(load_registry(registry))
+        self.on_error = on_error
+
+    def __call__(self, lines: list[bytes]) -> _ChunkResult:
+        out: list[bytes] = []
+        stats = MigrationStats()
+        for offset, line in enumerate(lines):
+            stats.lines += 1
+            body = line.rstrip(b"\r\n")
+            if not body.strip():
+                out.append(line)
+                continue
+            try:
+                migrated = self._migrate(body)
+            except Exception as e:  # counted, and handled per on_error
+                stats.failed += 1
+                if self.on_error == "fail":
+                    return _ChunkResult(out, stats, (offset, str(e)))
+                if self.on_error == "keep":
+                    out.append(line)
+                continue
+            if migrated is None:
+                stats.current += 1
+                out.append(line)
+            else:
+                stats.upgraded += 1
+                out.append(migrated + line[len(body) :])
+        return _ChunkResult(out, stats)
+
+    def _migrate(self, body: bytes) -> bytes | None:
+        """The upgraded body, or None if ``body`` is already current."""
+        type_name, version = peek_type(body)
+        current_cls = self.codec.sema_registry.current.get(type_name)
+        if current_cls is not None and version == current_cls.version_value():
+            return None
+        msg = self.codec.from_bytes(body)
+        return self.codec.to_bytes(cast(GwBaseSemaType, msg))  # strict decode
+
+
+_worker_migrator: _ChunkMigrator | None = None
+
+
+def _init_worker(registry: str | None, on_error: OnError) -> None:
+    global _worker_migrator  # noqa: PLW0603 — one migrator per pool process
+    _worker_migrator = _ChunkMigrator(registry, on_error)
+
+
+def _migrate_in_worker(lines: list[bytes]) -> _ChunkResult:
+    if _worker_migrator is None:
+        raise RuntimeError("pool initializer did not run")
+    return _worker_migrator(lines)
+
+
+def _open(path: Path, mode: Literal["rb", "wb"]) -> gzip.GzipFile | BinaryIO:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode)
+    return path.open(mode)
+
+
+def _results(
+    line_chunks: Iterator[list[bytes]],
+    *,
+    workers: int,
+    registry: str | None,
+    on_error: OnError,
+) -> Iterator[_ChunkResult]:
+    """Migrated chunks, in input order."""
+    if workers <= 1:
+        yield from map(_ChunkMigrator(registry, on_error), line_chunks)
+        return
+    yield from map_in_order(
+        _migrate_in_worker,
+        ((chunk,) for chunk in line_chunks),
+        workers=workers,
+        initializer=_init_worker,
+        initargs=(registry, on_error),
+    )
+
+
+def migrate_file(  # noqa: PLR0913 — keyword-only options
+    src: Path,
+    dst: Path,
+    *,
+    workers: int = 1,
+    chunk_lines: int = DEFAULT_CHUNK_LINES,
+    registry: str | None = None,
+    on_error: OnError = "keep",
+) -> MigrationStats:
+    """Migrate the archive at ``src`` into ``dst`` (see module docstring).
+    With ``on_error="fail"`` the first bad line raises ``GwBaseSemaError``
+    naming its line number; ``dst`` then holds the lines before it."""
+    total = MigrationStats()
+    with _open(src, "rb") as fin, _open(dst, "wb") as fout:
+        results = _results(
+            chunks(fin, chunk_lines),
+            workers=workers,
+            registry=registry,
+            on_error=on_error,
+        )
+        for result in results:
+            fout.writelines(result.lines)
+            if result.error is not None:
+                offset, message = result.error
+                raise GwBaseSemaError(
+                    f"{src} line {total.lines + offset + 1}: {message}"
+                )
+            total.add(result.stats)
+    return total
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("src", type=Path, help="NDJSON archive (.gz ok)")
+    parser.add_argument("dst", type=Path, help="where to write the migrated archive")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="migration processes (default: one per CPU)",
+    )
+    parser.add_argument("--chunk-lines", type=int, default=DEFAULT_CHUNK_LINES)
+    parser.add_argument(
+        "--registry",
+        metavar="MODULE:ATTR",
+        help="a SemaRegistry with the application's types (default: gwbase's)",
+    )
+    parser.add_argument(
+        "--on-error",
+        choices=["keep", "drop", "fail"],
+        default="keep",
+        help="what to do with a line that does not decode (default: keep it)",
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m gwbase.sema.migrate")
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.src.resolve() == args.dst.resolve():
+        parser.error("src and dst must differ")
+    try:
+        stats = migrate_file(
+            args.src,
+            args.dst,
+            workers=args.workers,
+            chunk_lines=args.chunk_lines,
+            registry=args.registry,
+            on_error=args.on_error,
+        )
+    except GwBaseSemaError as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(
+        f"{stats.lines} lines: {stats.current} current, {stats.upgraded} upgraded, "
+        f"{stats.failed} failed",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Read a Sema body's top-level ``TypeName`` and ``Version`` without parsing it.
+
+Routers, taps and the codec only need those two keys to decide what to do
+with a body. ``to_bytes`` emits the base-class fields first (``Version``
+omitted when None), so a body produced by this package starts with::
+
+    {"TypeName":"heartbeat.a","Version":"000", ...
+
+``scan_type`` matches that head with one anchored regex, and the tail
+layout (``..., "TypeName": "x", "Version": "000"}``, what hand-written or
+key-sorted producers tend to emit) with a second one. No object graph is
+built.
+
+A head match is trusted only when the body holds the literal
+``"TypeName"`` exactly once (and ``"Version"`` exactly once, or not at all
+when the head has none). A quote followed by ``TypeName"`` outside the key
+would have to be another key or a string value equal to ``TypeName``;
+either one is counted, so a lone occurrence right after the opening brace
+is the top-level key and the one ``json.loads`` keeps.
+
+A tail match is unambiguous in valid JSON: only escape-free scalars may
+follow it before the final ``}``, so its object is the top-level one and it
+is the last ``TypeName`` there. When ``Version`` is not in the tail, the
+body must not contain ``"Version"`` anywhere for the result to be trusted.
+
+Neither holds for a body with a backslash: a key may then be spelled with
+``\\u`` escapes (``"Type\\u004eame"``), which the counts and regexes do not
+see but ``json.loads`` decodes. Such a body, and anything else, returns
+None, and ``peek_type`` falls back to a full parse.
+Neither function validates the rest of the body.
+"""
+
+import re
+
+from gwbase.sema import json_backend
+
+_WS = rb"[ \t\r\n]*"
+_TYPE_NAME = rb'"TypeName"' + _WS + rb":" + _WS + rb'"([^"\\]*)"'
+_VERSION = rb"," + _WS + rb'"Version"' + _WS + rb":" + _WS + rb'(?:"([^"\\]*)"|(null))'
+_HEAD = re.compile(
+    rb"\A" + _WS + rb"\{" + _WS + _TYPE_NAME + rb"(?:" + _WS + _VERSION + rb")?"
+)
+_TAIL = re.compile(
+    _TYPE_NAME + _WS + rb"(?:" + _VERSION + _WS + rb")?\}" + _WS + rb"\Z"
+)
+
+
+def scan_type(body: bytes) -> tuple[str, str | None] | None:
+    """``(TypeName, Version)`` read from the head or tail of ``body``, or None
+    when neither settles them."""
+    if b"\\" in body:
+        return None  # an escaped key may be a TypeName or Version
+    m = _HEAD.match(body)
+    if m is None or not _lone_head(body, m):
+        # only the last "TypeName" can start a tail
+        m = _TAIL.match(body, max(body.rfind(b'"TypeName"'), 0))
+        if m is None:
+            return None
+        if m.group(2) is None and m.group(3) is None and b'"Version"' in body:
+            return None  # a Version member may sit earlier in the object
+    type_name, version = m.group(1), m.group(2)
+    try:
+        return type_name.decode(), version.decode() if version is not None else None
+    except UnicodeDecodeError:
+        return None
+
+
+def _lone_head(body: bytes, m: re.Match[bytes]) -> bool:
+    """True when the head match holds the body's only ``"TypeName"`` and
+    ``"Version"`` literals, so no later member can override them."""
+    has_version = m.group(2) is not None or m.group(3) is not None
+    return body.count(b'"TypeName"') == 1 and body.count(b'"Version"') == int(
+        has_version
+    )
+
+
+def peek_type(body: bytes) -> tuple[str, str | None]:
+    """``(TypeName, Version)`` of a Sema body, read from its head or tail when
+    the layout allows and by a full JSON parse otherwise. Raises ``ValueError``
+    if the body is not a JSON object with a string ``TypeName``."""
+    scanned = scan_type(body)
+    if scanned is not None:
+        return scanned
+    try:
+        d = json_backend.loads(body)
+    except Exception as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
+    if not isinstance(d, dict) or not isinstance(d.get("TypeName"), str):
+        raise ValueError("Missing TypeName")
+    version = d.get("Version")
+    return d["TypeName"], version if isinstance(version, str) else None
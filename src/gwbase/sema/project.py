@@ -0,0 +1,129 @@
+"""Read a few named members of Sema bodies without decoding them.
+
+Indexing a journal of stored messages needs ``TypeName``, ``Version``, a
+message id, a sender alias and a timestamp per body, not the messages.
+``project(body, ["TypeName", "MessageId", "Header.Src"])`` returns those
+members as plain JSON values::
+
+    {"TypeName": "gw", "MessageId": None, "Header.Src": "d1.time"}
+
+Fields are wire (PascalCase) keys; a dotted field reaches into a nested
+object, as ``Header.*`` does in a ``gw`` envelope. A member that is absent
+projects to None. Nothing is validated against a Sema class.
+
+The body is parsed by pydantic-core against a model built once per field
+list, with every other key ignored, so only the requested values become
+Python objects. It is still checked to be one well-formed JSON object, and
+a repeated key counts once, last wins, as in ``json.loads``.
+``project_many`` runs the same projection over a batch and returns one
+list per field.
+"""
+
+import functools
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, create_model
+
+_CONFIG = ConfigDict(extra="ignore")
+
+# A projection: the model to validate bodies against, and for each
+# requested field the chain of model attributes leading to it.
+_Projection = tuple[type[BaseModel], tuple[tuple[str, ...], ...]]
+
+
+def project(body: bytes, fields: Sequence[str]) -> dict[str, Any]:
+    """The requested members of ``body``, keyed by field (see module
+    docstring). Raises ValueError if ``body`` is not a JSON object, or a
+    dotted field's parent is present but not an object."""
+    model, paths = _projection(tuple(fields))
+    found = _validate(model, body)
+    return {
+        field: _follow(found, path) for field, path in zip(fields, paths, strict=True)
+    }
+
+
+def project_many(
+    bodies: Iterable[bytes], fields: Sequence[str]
+) -> dict[str, list[Any]]:
+    """``project`` over ``bodies``, as parallel lists: ``result[field][i]``
+    is ``field`` of the i-th body. Raises what ``project`` raises, naming
+    the position of the offending body."""
+    model, paths = _projection(tuple(fields))
+    columns: list[list[Any]] = [[] for _ in paths]
+    for i, body in enumerate(bodies):
+        try:
+            found = _validate(model, body)
+        except ValueError as e:
+            raise ValueError(f"Body {i}: {e}") from e
+        for column, path in zip(columns, paths, strict=True):
+            column.append(_follow(found, path))
+    return dict(zip(fields, columns, strict=True))
+
+
+def _validate(model: type[BaseModel], body: bytes) -> BaseModel:
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
+
+
+def _follow(found: BaseModel | None, path: tuple[str, ...]) -> Any:
+    value: Any = found
+    for attr in path:
+        if value is None:
+            return None
+        value = getattr(value, attr)
+    return value
+
+
+@functools.lru_cache(maxsize=128)
+def _projection(fields: tuple[str, ...]) -> _Projection:
+    """The model and attribute paths for ``fields``, built once per field
+    list. Raises ValueError for an empty key, or for a field requested
+    both whole and through a dotted child."""
+    tree: dict[str, Any] = {}  # key -> subtree, or None for a leaf
+    for field in fields:
+        keys = field.split(".")
+        if not all(keys):
+            raise ValueError(f"Invalid field {field!r}")
+        node = tree
+        for depth, key in enumerate(keys):
+            leaf = depth == len(keys) - 1
+            if key not in node:
+                node[key] = None if leaf else {}
+            elif (node[key] is None) != leaf:
+                raise ValueError(
+                    f"Cannot project {'.'.join(keys[: depth + 1])!r} both "
+                    f"whole and by member"
+                )
+            if not leaf:
+                node = node[key]
+    model, attrs = _model(tree)
+    paths = []
+    for field in fields:
+        path, lookup = [], attrs
+        for key in field.split("."):
+            attr, lookup = lookup[key]
+            path.append(attr)
+        paths.append(tuple(path))
+    return model, tuple(paths)
+
+
+def _model(tree: dict[str, Any]) -> tuple[type[BaseModel], dict[str, Any]]:
+    """A model reading the keys of ``tree``, and per key its attribute name
+    and (for a nested object) the same mapping one level down. Attributes
+    are positional, so no wire key can clash with a BaseModel name."""
+    definitions: dict[str, Any] = {}
+    attrs: dict[str, Any] = {}
+    for i, (key, subtree) in enumerate(tree.items()):
+        attr = f"f{i}"
+        if subtree is None:
+            definitions[attr] = (Any, Field(None, alias=key))
+            attrs[key] = (attr, None)
+        else:
+            child, child_attrs = _model(subtree)
+            definitions[attr] = (child | None, Field(None, alias=key))
+            attrs[key] = (attr, child_attrs)
+    model = create_model("Projection", __config__=_CONFIG, **definitions)
+    return model, attrs
@@ -1,90 +1,34 @@
-import re
-import uuid
-from datetime import UTC, datetime
 from typing import Annotated
 
 from pydantic import BeforeValidator
 
-# --- patterns ---
-HEX_CHAR_PATTERN = re.compile(r"^[0-9a-fA-F]$")
-
-LEFT_RIGHT_DOT_PATTERN = re.compile(r"^[a-z][a-z0-9]*(\.[a-z0-9]+)*$")
-
-UUID4_STR_PATTERN = re.compile(
-    r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$"
+# The checks are shared with gwbase.transport_format (see gwbase._format_checks).
+from gwbase._format_checks import (
+    HEX_CHAR_PATTERN,
+    LEFT_RIGHT_DOT_PATTERN,
+    UUID4_STR_PATTERN,
+    is_hex_char,
+    is_left_right_dot,
+    is_utc_milliseconds,
+    is_utc_seconds,
+    is_uuid4_str,
 )
 
-
-# --- methods ---
-def is_hex_char(v: str) -> str:
-    if not isinstance(v, str):
-        raise ValueError(f"<{v}>: hex.char must be a string.")
-
-    if not HEX_CHAR_PATTERN.fullmatch(v):
-        raise ValueError(f"<{v}>: Fails hex.char format.")
-
-    return v
-
-
-def is_left_right_dot(v: str) -> str:
-    if not isinstance(v, str):
-        raise ValueError(f"<{v}>: LeftRightDot must be a string.")
-
-    if not LEFT_RIGHT_DOT_PATTERN.fullmatch(v):
-        raise ValueError(f"<{v}>: Fails LeftRightDot format.")
-
-    return v
-
-
-def is_utc_milliseconds(v: int) -> int:
-    if not isinstance(v, int):
-        raise TypeError("Not an int!")
-    start_date = datetime(2000, 1, 1, tzinfo=UTC)
-    end_date = datetime(3000, 1, 1, tzinfo=UTC)
-
-    start_timestamp_ms = int(start_date.timestamp() * 1000)
-    end_timestamp_ms = int(end_date.timestamp() * 1000)
-
-    if v < start_timestamp_ms:
-        raise ValueError(f"{v} must be after Jan 1 2000")
-    if v > end_timestamp_ms:
-        raise ValueError(f"{v} must be before Jan 1 3000")
-    return v
-
-
-def is_utc_seconds(v: int) -> int:
-    if not isinstance(v, int):
-        raise ValueError("Not an int!")
-    start_date = datetime(2000, 1, 1, tzinfo=UTC)
-    end_date = datetime(3000, 1, 1, tzinfo=UTC)
-
-    start_timestamp = int(start_date.timestamp())
-    end_timestamp = int(end_date.timestamp())
-
-    if v < start_timestamp:
-        raise ValueError(f"{v}: Fails UTCSeconds format! Must be after Jan 1 2000")
-    if v > end_timestamp:
-        raise ValueError(f"{v}: Fails UTCSeconds format! Must be before Jan 1 3000")
-    return v
-
-
-def is_uuid4_str(v: str) -> str:
-    if not isinstance(v, str):
-        raise ValueError(f"<{v}>: uuid4.str must be a string.")
-
-    if not UUID4_STR_PATTERN.fullmatch(v):
-        raise ValueError(f"<{v}>: Fails uuid4.str format.")
-
-    try:
-        u = uuid.UUID(v)
-    except Exception as e:
-        raise ValueError(f"Invalid UUID4: {v}  <{e}>") from e
-    if u.version != 4:  # noqa: PLR2004 — UUID version 4
-        raise ValueError(
-            f"{v} is valid uid, but of version {u.version}. Fails UuidCanonicalTextual"
-        )
-    return str(u)
-
+__all__ = [
+    "HEX_CHAR_PATTERN",
+    "LEFT_RIGHT_DOT_PATTERN",
+    "UUID4_STR_PATTERN",
+    "HexChar",
+    "LeftRightDot",
+    "UTCMilliseconds",
+    "UTCSeconds",
+    "UUID4Str",
+    "is_hex_char",
+    "is_left_right_dot",
+    "is_utc_milliseconds",
+    "is_utc_seconds",
+    "is_uuid4_str",
+]
 
 # --- annotated types ---
 HexChar = Annotated[
@@ -0,0 +1,231 @@
+"""The process-wide Sema type registry.
+
+Discovery (``gwbase.sema.types.__all__`` for the current types, a glob +
+import of ``types/old_versions/*.py`` for the old ones) runs ONCE per
+process, on first use, and produces an immutable ``SemaRegistry``
+snapshot. Every ``GwBaseSemaCodec`` reads that snapshot, so building a
+codec (per Orchestrator, per GridworksActor, in user code) costs nothing.
+
+Applications add their own types with ``register_types``, which swaps in a
+new snapshot (copy-on-write, under a lock) — readers never see a partly
+built registry and never take the lock. A codec built with an explicit
+``registry=`` pins that snapshot instead (e.g. ``default_registry()
+.extended(...)`` for a private set of types).
+"""
+
+import threading
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from importlib import import_module
+from pathlib import Path
+from types import MappingProxyType
+
+from gwbase.sema.base import GwBaseSemaType
+
+OLD_VERSIONS_DIR = Path(__file__).resolve().parent / "types" / "old_versions"
+
+SemaClass = type[GwBaseSemaType]
+
+
+@dataclass(frozen=True)
+class SemaRegistry:
+    """An immutable snapshot of the known Sema types.
+
+    ``current`` maps TypeName -> the current class; ``old_versions`` maps
+    TypeName -> Version -> an older class that can ``upgrade()``.
+    ``upgrade_chains`` maps (TypeName, Version) of each old class to the
+    classes its ``upgrade()`` steps produce, ending at the current class.
+    """
+
+    current: Mapping[str, SemaClass]
+    old_versions: Mapping[str, Mapping[str | None, SemaClass]]
+    upgrade_chains: Mapping[tuple[str, str | None], tuple[SemaClass, ...]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    @classmethod
+    def build(
+        cls,
+        current: Iterable[SemaClass],
+        old_versions: Iterable[SemaClass] = (),
+    ) -> "SemaRegistry":
+        return cls(
+            current=MappingProxyType({}), old_versions=MappingProxyType({})
+        ).extended(*current, old_versions=old_versions)
+
+    @classmethod
+    def discover(cls) -> "SemaRegistry":
+        """Scan ``gwbase.sema.types`` and ``types/old_versions`` (the
+        filesystem walk ``default_registry`` does once per process)."""
+        # lazy import breaks a cycle with gwbase.sema.types
+        from gwbase.sema import types  # noqa: PLC0415
+
+        current = [getattr(types, name) for name in types.__all__]
+        return cls.build(
+            current,
+            # an old-version module may import a current class; skip it
+            old_versions=[c for c in _discover_old_versions() if c not in current],
+        )
+
+    def extended(
+        self,
+        *current: SemaClass,
+        old_versions: Iterable[SemaClass] = (),
+    ) -> "SemaRegistry":
+        """A new snapshot with ``current`` types and ``old_versions`` added.
+
+        Re-registering the same class is a no-op. A TypeName (or TypeName +
+        Version) already held by a DIFFERENT class raises ``ValueError``.
+        """
+        registry = dict(self.current)
+        for sema_cls in current:
+            type_name = _type_name_of(sema_cls)
+            existing = registry.get(type_name)
+            if existing is not None and existing is not sema_cls:
+                raise ValueError(
+                    f"{type_name} is already registered as {existing.__name__}"
+                )
+            registry[type_name] = sema_cls
+
+        old: defaultdict[str, dict[str | None, SemaClass]] = defaultdict(dict)
+        for type_name, by_version in self.old_versions.items():
+            old[type_name].update(by_version)
+        for sema_cls in old_versions:
+            type_name = _type_name_of(sema_cls)
+            version = sema_cls.version_value()
+            if version is None:
+                raise ValueError(f"Old version of {type_name} has no Version")
+            existing = old[type_name].get(version)
+            if existing is not None and existing is not sema_cls:
+                raise ValueError(
+                    f"{type_name} v{version} is already registered as "
+                    f"{existing.__name__}"
+                )
+            old[type_name][version] = sema_cls
+
+        for type_name, by_version in old.items():
+            latest = registry.get(type_name)
+            if latest is not None and latest.version_value() in by_version:
+                raise ValueError(
+                    f"{type_name} v{latest.version_value()} is both current "
+                    "and an old version"
+                )
+
+        return SemaRegistry(
+            current=MappingProxyType(registry),
+            old_versions=MappingProxyType({
+                type_name: MappingProxyType(by_version)
+                for type_name, by_version in old.items()
+            }),
+            upgrade_chains=MappingProxyType(_upgrade_chains(registry, old)),
+        )
+
+    def to_latest(self, msg: GwBaseSemaType) -> GwBaseSemaType:
+        """``msg.to_latest(self.current)``, along the precomputed chain.
+
+        Each step is ``upgrade()`` on the previous result; a step that does
+        not produce the class the chain expects (an upgrade that skips a
+        version, say) hands over to ``GwBaseSemaType.to_latest``, which
+        checks and walks one step at a time.
+        """
+        chain = self.upgrade_chains.get((msg.type_name, msg.version))
+        if chain is None or type(msg) is not self._old_class(msg):
+            return msg.to_latest(self.current)
+        for expected in chain:
+            msg = msg.upgrade()
+            if type(msg) is not expected:
+                return msg.to_latest(self.current)
+        return msg
+
+    def _old_class(self, msg: GwBaseSemaType) -> SemaClass | None:
+        return self.old_versions.get(msg.type_name, {}).get(msg.version)
+
+    def __contains__(self, type_name: object) -> bool:
+        return type_name in self.current
+
+
+def _type_name_of(sema_cls: SemaClass) -> str:
+    if not (isinstance(sema_cls, type) and issubclass(sema_cls, GwBaseSemaType)):
+        raise TypeError(f"{sema_cls!r} is not a GwBaseSemaType subclass")
+    type_name = sema_cls.type_name_value()
+    if not isinstance(type_name, str):
+        raise ValueError(f"{sema_cls.__name__} has no TypeName default")
+    return type_name
+
+
+def _upgrade_chains(
+    current: Mapping[str, SemaClass],
+    old: Mapping[str, Mapping[str | None, SemaClass]],
+) -> dict[tuple[str, str | None], tuple[SemaClass, ...]]:
+    """For every old class below its current version: the registered classes
+    of the later versions, in numeric order, then the current class. Versions
+    that are not integers get no chain (``to_latest`` reports them)."""
+    chains: dict[tuple[str, str | None], tuple[SemaClass, ...]] = {}
+    for type_name, by_version in old.items():
+        latest = current.get(type_name)
+        if latest is None:
+            continue
+        try:
+            latest_int = int(latest.version_value() or "")
+            ladder = sorted((int(v or ""), v) for v in by_version)
+        except ValueError:
+            continue
+        ladder = [(n, v) for n, v in ladder if n < latest_int]
+        for i, (_n, version) in enumerate(ladder):
+            chains[type_name, version] = (
+                *(by_version[v] for _m, v in ladder[i + 1 :]),
+                latest,
+            )
+    return chains
+
+
+def _discover_old_versions() -> list[SemaClass]:
+    found: list[SemaClass] = []
+    for path in sorted(OLD_VERSIONS_DIR.glob("*.py")):
+        if path.stem == "__init__":
+            continue
+        module = import_module(f"gwbase.sema.types.old_versions.{path.stem}")
+        for name in dir(module):
+            obj = getattr(module, name)
+            if (
+                isinstance(obj, type)
+                and issubclass(obj, GwBaseSemaType)
+                and obj is not GwBaseSemaType
+                and obj.version_value() is not None
+            ):
+                found.append(obj)
+    return found
+
+
+# ============================================================================
+# PROCESS-WIDE SNAPSHOT
+# ============================================================================
+
+_lock = threading.Lock()
+_registry: SemaRegistry | None = None
+
+
+def default_registry() -> SemaRegistry:
+    """The process-wide snapshot, discovered on first call."""
+    global _registry  # noqa: PLW0603 — the one process-wide snapshot
+    registry = _registry
+    if registry is None:
+        with _lock:
+            if _registry is None:
+                _registry = SemaRegistry.discover()
+            registry = _registry
+    return registry
+
+
+def register_types(
+    *current: SemaClass,
+    old_versions: Iterable[SemaClass] = (),
+) -> SemaRegistry:
+    """Add application types to the process-wide registry. Every codec
+    without a pinned ``registry=`` sees them on its next decode."""
+    global _registry  # noqa: PLW0603 — the one process-wide snapshot
+    with _lock:
+        base = _registry if _registry is not None else SemaRegistry.discover()
+        _registry = base.extended(*current, old_versions=old_versions)
+        return _registry
@@ -0,0 +1,176 @@
+"""Archives read back in order, block by block, from any line, compressed
+or not, in-process and across a process pool."""
+
+import gzip
+import uuid
+from pathlib import Path
+
+import pytest
+
+from gwbase.sema import GwBaseSemaError, types
+from gwbase.sema.archive import (
+    ArchiveIndex,
+    ArchiveWriter,
+    Block,
+    Compression,
+    index_path,
+    main,
+    read_bodies,
+    read_index,
+    read_messages,
+)
+
+N_LINES = 100
+BLOCK_LINES = 7
+BAD = b'{"TypeName":"heartbeat.a","Version":"000","MyHex":"z"}'
+BAD_AT = 40
+MESSAGES = [
+    types.HeartbeatA(my_hex=f"{i % 16:x}")
+    if i % 2
+    else types.Ready(
+        from_g_node_alias="d1.isone.ltn",
+        from_g_node_instance_id=str(uuid.uuid4()),
+        time_unix_s=1_700_000_000 + i,
+    )
+    for i in range(N_LINES)
+]
+BODIES = [m.to_bytes() for m in MESSAGES]
+
+
+def _archive(path: Path, compression: Compression | None = None) -> None:
+    with ArchiveWriter(path, compression=compression, block_lines=BLOCK_LINES) as w:
+        for i, msg in enumerate(MESSAGES):
+            if i == BAD_AT:
+                w.write_body(BAD)
+            else:
+                w.write(msg)
+
+
+@pytest.mark.parametrize(
+    ("name", "compression"),
+    [("a.ndjson", None), ("a.ndjson.gz", None), ("a.ndjson.zz", "zlib")],
+)
+def test_round_trip(tmp_path: Path, name: str, compression: Compression | None) -> None:
+    path = tmp_path / name
+    _archive(path, compression)
+    expected = [*BODIES[:BAD_AT], BAD, *BODIES[BAD_AT + 1 :]]
+    assert list(read_bodies(path)) == expected
+
+    decoded = list(read_messages(path, block_lines=BLOCK_LINES))
+    assert isinstance(decoded[BAD_AT], GwBaseSemaError)
+    del decoded[BAD_AT]
+    assert decoded == [m for i, m in enumerate(MESSAGES) if i != BAD_AT]
+
+    index = read_index(path)
+    assert index.lines == N_LINES
+    assert len(index.blocks) == -(-N_LINES // BLOCK_LINES)
+    for start in [1, BLOCK_LINES, BLOCK_LINES + 3, N_LINES - 1, N_LINES]:
+        assert list(read_bodies(path, start_line=start)) == expected[start:]
+
+
+def test_gzip_archives_are_plain_gzip(tmp_path: Path) -> None:
+    path = tmp_path / "a.ndjson.gz"
+    _archive(path)
+    with gzip.open(path, "rb") as f:
+        assert f.read().splitlines()[:BAD_AT] == BODIES[:BAD_AT]
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "zlib"])
+def test_index_is_rebuilt_by_scanning(tmp_path: Path, compression: Compression) -> None:
+    path = tmp_path / "a.ndjson"
+    _archive(path, compression)
+    saved = read_index(path)
+    index_path(path).unlink()
+    assert read_index(path, block_lines=BLOCK_LINES) == saved
+
+    # stale: the archive grew after its index was written
+    with ArchiveWriter(path, compression=compression) as w:
+        w.write(MESSAGES[0])
+    with ArchiveWriter(tmp_path / "more", compression=compression) as w:
+        w.write(MESSAGES[1])
+    with path.open("ab") as f:
+        f.write((tmp_path / "more").read_bytes())
+    assert list(read_bodies(path)) == BODIES[:2]
+    assert read_index(path).lines == len(BODIES[:2])
+    assert list(read_bodies(path, start_line=1)) == [BODIES[1]]
+
+
+def test_foreign_files_scan_by_line_or_member(tmp_path: Path) -> None:
+    plain = tmp_path / "plain.ndjson"
+    plain.write_bytes(b"\n".join(BODIES[:10]) + b"\n\n" + BODIES[10])
+    index = read_index(plain, block_lines=4)
+    assert index.compression == "none"
+    assert [b.lines for b in index.blocks] == [4, 4, 4]
+    assert list(read_bodies(plain, start_line=9, index=index)) == BODIES[9:11]
+
+    members = tmp_path / "members.ndjson.gz"
+    members.write_bytes(
+        gzip.compress(b"\n".join(BODIES[:3]) + b"\n") + gzip.compress(BODIES[3])
+    )
+    index = read_index(members)
+    assert [(b.first_line, b.lines) for b in index.blocks] == [(0, 3), (3, 1)]
+    assert list(read_bodies(members, start_line=3)) == [BODIES[3]]
+
+    members.write_bytes(members.read_bytes()[:-5])
+    with pytest.raises(ValueError, match="Truncated gzip block at byte"):
+        read_index(members)
+    with pytest.raises(ValueError, match="Truncated gzip block"):
+        list(read_bodies(members))
+
+
+def test_block_at() -> None:
+    index = ArchiveIndex("none", (Block(0, 10, 0, 2), Block(10, 5, 2, 3)))
+    assert [index.block_at(line) for line in range(index.lines)] == [0, 0, 1, 1, 1]
+    with pytest.raises(IndexError):
+        index.block_at(index.lines)
+
+
+def test_writer_keeps_one_body_per_line(tmp_path: Path) -> None:
+    with ArchiveWriter(tmp_path / "a.ndjson") as w:
+        for body in [b"", b"  ", b'{"A":\n1}']:
+            with pytest.raises(ValueError, match="one non-blank body"):
+                w.write_body(body)
+
+
+def test_workers_decode_blocks_in_order(tmp_path: Path) -> None:
+    path = tmp_path / "a.ndjson.gz"
+    _archive(path)
+    in_process = list(read_messages(path, start_line=3))
+    pooled = list(read_messages(path, start_line=3, workers=2))
+    assert [type(m) for m in pooled] == [type(m) for m in in_process]
+    assert [m for m in pooled if not isinstance(m, Exception)] == [
+        m for m in in_process if not isinstance(m, Exception)
+    ]
+    assert str(pooled[BAD_AT - 3]) == str(in_process[BAD_AT - 3])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_a_format_check_type_error_stays_in_its_slot(
+    tmp_path: Path, workers: int
+) -> None:
+    timestep = types.SimTimestep(
+        from_g_node_alias="d1.time",
+        from_g_node_instance_id=str(uuid.uuid4()),
+        time_unix_s=1_700_000_000,
+        timestep_created_ms=1_700_000_000_000,
+        message_id=str(uuid.uuid4()),
+    )
+    string_ms = timestep.to_bytes().replace(b"1700000000000", b'"1700000000000"')
+    path = tmp_path / "a.ndjson"
+    with ArchiveWriter(path, block_lines=BLOCK_LINES) as w:
+        for body in [*BODIES[:3], string_ms, timestep.to_bytes()]:
+            w.write_body(body)
+    decoded = list(read_messages(path, workers=workers))
+    assert decoded[:3] == MESSAGES[:3]
+    assert isinstance(decoded[3], Exception)
+    assert decoded[4] == timestep
+
+
+def test_command_line(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "a.ndjson"
+    path.write_bytes(b"\n".join(BODIES) + b"\n")
+    assert main([str(path), "--block-lines", str(BLOCK_LINES), "--write-index"]) == 0
+    n_blocks = -(-N_LINES // BLOCK_LINES)
+    assert f"{N_LINES} lines in {n_blocks} blocks (none)" in capsys.readouterr().err
+    assert read_index(path).blocks == read_index(path, block_lines=1).blocks
+    assert main([str(tmp_path / "missing")]) == 1
@@ -0,0 +1,125 @@
+"""``from_bytes_many`` gives, slot for slot, what ``from_bytes`` gives: the
+same object, or the exception ``from_bytes`` raises."""
+
+import random
+import uuid
+from typing import Any, Literal
+
+import pytest
+
+from gwbase.sema import GwBaseSemaCodec, GwBaseSemaType, default_registry, types
+from gwbase.sema.base import DegradedSemaType
+from gwbase.sema.wrapped import wrap_bytes
+
+N_COPIES = 50
+
+
+class AppReading(GwBaseSemaType):
+    watts: int
+    type_name: Literal["app.batch.reading"] = "app.batch.reading"
+    version: Literal["001"] = "001"
+
+
+class AppReading000(GwBaseSemaType):
+    kilowatts: int
+    type_name: Literal["app.batch.reading"] = "app.batch.reading"
+    version: Literal["000"] = "000"
+
+    def upgrade(self) -> GwBaseSemaType:
+        return AppReading(watts=self.kilowatts * 1000)
+
+
+CODEC = GwBaseSemaCodec(
+    registry=default_registry().extended(AppReading, old_versions=[AppReading000])
+)
+HB = types.HeartbeatA(my_hex="a", your_last_hex="3")
+READY = types.Ready(
+    from_g_node_alias="d1.isone.ltn",
+    from_g_node_instance_id=str(uuid.uuid4()),
+    time_unix_s=1_700_000_000,
+)
+TIMESTEP = types.SimTimestep(
+    from_g_node_alias="d1.time",
+    from_g_node_instance_id=str(uuid.uuid4()),
+    time_unix_s=1_700_000_000,
+    timestep_created_ms=1_700_000_000_000,
+    message_id=str(uuid.uuid4()),
+)
+# a format check that raises TypeError, not a ValidationError
+STRING_MS = TIMESTEP.to_bytes().replace(b"1700000000000", b'"1700000000000"')
+GW = wrap_bytes(
+    src="d1.time",
+    dst="d1.isone.ltn",
+    inner_type_name=HB.type_name,
+    inner_payload_dict=HB.to_dict(),
+)
+
+GOOD = [
+    HB.to_bytes(),
+    READY.to_bytes(),
+    TIMESTEP.to_bytes(),
+    GW,
+    AppReading(watts=5).to_bytes(),
+]
+BAD = [
+    b'{"TypeName": "app.batch.reading", "Version": "000", "Kilowatts": 2}',
+    b'{"TypeName": "heartbeat.a", "Version": "000", "MyHex": "z"}',
+    b'{"TypeName": "heartbeat.a", "Version": "000", "MyHex": "a", "Extra": 1}',
+    b'{"TypeName": "heartbeat.a", "Version": "000", "my_hex": "a"}',
+    b'{"TypeName": "heartbeat.a", "Version": "999", "MyHex": "a"}',
+    b'{"TypeName": "heartbeat.a", "MyHex": "a"}',
+    b'{"TypeName": "no.such.type", "Version": "000"}',
+    b'{"TypeName": ["heartbeat.a"], "Version": "000"}',
+    b'{"TypeName": "heartbeat.a", "Version": "000", "MyHex": "a"} trailing',
+    b'\xef\xbb\xbf{"TypeName": "heartbeat.a", "Version": "000", "MyHex": "a"}',
+    b'{"TypeName": "heartbeat.a", "Version": "000", "MyHex": "\xff"}',
+    b'{"TypeName": "heartbeat.a", "Version": "000", "MyHex": "\\ud800"}',
+    b'{"TypeName": "app.batch.reading", "Version": "001", "Watts": NaN}',
+    b'{"TypeName": "x", "TypeName": "heartbeat.a", "Version": "000", "MyHex": "a"}',
+    b"[]",
+    b"not json",
+    b"",
+    STRING_MS,
+]
+
+
+def _outcome(result: Any) -> Any:
+    if isinstance(result, Exception):
+        return type(result), str(result)
+    if isinstance(result, DegradedSemaType):
+        return DegradedSemaType, result.to_dict()
+    return result
+
+
+def _one_by_one(bodies: list[bytes], mode: Literal["strict", "degraded"]) -> Any:
+    out = []
+    for body in bodies:
+        try:
+            out.append(_outcome(CODEC.from_bytes(body, mode=mode)))
+        except Exception as e:  # comparing failures too
+            out.append(_outcome(e))
+    return out
+
+
+@pytest.mark.parametrize("mode", ["strict", "degraded"])
+def test_batch_matches_one_by_one(mode: Literal["strict", "degraded"]) -> None:
+    bodies = (GOOD + BAD) * N_COPIES
+    random.Random(7).shuffle(bodies)
+    many = CODEC.from_bytes_many(bodies, mode=mode)
+    assert [_outcome(r) for r in many] == _one_by_one(bodies, mode)
+
+
+def test_batch_keeps_order_and_reports_per_item() -> None:
+    bodies = [HB.to_bytes(), b"not json", READY.to_bytes(), BAD[0]]
+    many = CODEC.from_bytes_many(bodies)
+    assert many[0] == HB
+    assert isinstance(many[1], ValueError)
+    assert many[2] == READY
+    assert many[3] == AppReading(watts=2000)
+    assert CODEC.from_bytes_many([]) == []
+
+
+def test_a_format_check_type_error_stays_in_its_slot() -> None:
+    many = CODEC.from_bytes_many([HB.to_bytes(), TIMESTEP.to_bytes(), STRING_MS])
+    assert many[:2] == [HB, TIMESTEP]
+    assert isinstance(many[2], TypeError)
@@ -0,0 +1,163 @@
+"""The binary form round-trips every Sema type through the same validation
+as its JSON form, and rejects what is not a well-formed body."""
+
+import uuid
+from typing import Literal
+
+import pytest
+
+from gwbase.sema import (
+    GwBaseSemaCodec,
+    GwBaseSemaError,
+    GwBaseSemaType,
+    default_registry,
+    types,
+)
+from gwbase.sema.binary import from_binary, is_binary, peek_binary_type, to_binary
+from gwbase.sema.enums import BaseGNodeClass, GNodeStatus
+from gwbase.sema.wrapped import wrap_bytes
+
+
+class AppPoint(GwBaseSemaType):
+    watts: int
+    status: GNodeStatus
+    mode: Literal["a", "b"] = "b"
+    readings: list[float] = []
+    type_name: Literal["app.binary.point"] = "app.binary.point"
+    version: Literal["001"] = "001"
+
+
+class AppPoint000(GwBaseSemaType):
+    kilowatts: int
+    type_name: Literal["app.binary.point"] = "app.binary.point"
+    version: Literal["000"] = "000"
+
+    def upgrade(self) -> GwBaseSemaType:
+        return AppPoint(watts=self.kilowatts * 1000, status=GNodeStatus.Active)
+
+
+CODEC = GwBaseSemaCodec(
+    registry=default_registry().extended(AppPoint, old_versions=[AppPoint000])
+)
+READY = types.Ready(
+    from_g_node_alias="d1.isone.ltn",
+    from_g_node_instance_id=str(uuid.uuid4()),
+    time_unix_s=1_700_000_000,
+)
+TIMESTEP = types.SimTimestep(
+    from_g_node_alias="d1.time",
+    from_g_node_instance_id=str(uuid.uuid4()),
+    time_unix_s=1_700_000_000,
+    timestep_created_ms=1_700_000_000_000,
+    message_id=str(uuid.uuid4()),
+)
+SAMPLES = [
+    types.HeartbeatA(my_hex="a", your_last_hex="3"),
+    types.HeartbeatA(my_hex="F"),
+    types.GNodeGt(
+        g_node_id=str(uuid.uuid4()),
+        alias="d1.isone.ltn",
+        base_class=BaseGNodeClass.LeafTransactiveNode,
+        g_node_class="LeafTransactiveNode",
+        status=GNodeStatus.Active,
+        position_point_id=str(uuid.uuid4()),
+    ),
+    READY,
+    TIMESTEP,
+    types.GridworksHeader(
+        src="d1.a",
+        dst={"Node": "d1.b", "Hops": [{"Via": "d1.c"}]},
+        message_type="report.event",
+        message_id=str(uuid.uuid4()),
+        ack_required=False,
+    ),
+    CODEC.from_bytes(
+        wrap_bytes(
+            src="d1.time",
+            dst="d1.isone.ltn",
+            inner_type_name=TIMESTEP.type_name,
+            inner_payload_dict={**TIMESTEP.to_dict(), "Nested": {"InnerKey": [1]}},
+        )
+    ),
+    AppPoint(
+        watts=-(2**70),
+        status=GNodeStatus.Suspended,
+        mode="a",
+        readings=[0.5, -1e300],
+    ),
+]
+
+
+@pytest.mark.parametrize("msg", SAMPLES, ids=lambda m: m.type_name)
+def test_round_trips_smaller_than_json(msg: GwBaseSemaType) -> None:
+    body = to_binary(msg)
+    assert is_binary(body)
+    assert not is_binary(msg.to_bytes())
+    assert peek_binary_type(body) == (msg.type_name, msg.version)
+    decoded = from_binary(body, type(msg))
+    assert decoded == msg
+    assert decoded.to_bytes() == msg.to_bytes()
+    assert len(body) < len(msg.to_bytes())
+
+
+def test_uuid_and_timestamps_are_fixed_width() -> None:
+    marker, type_name, version = 1, 1 + len("sim.ready"), 1 + len("000")
+    alias = 1 + len(READY.from_g_node_alias)
+    assert len(to_binary(READY)) == marker + type_name + version + alias + 16 + 8
+
+
+def test_codec_upgrades_old_versions() -> None:
+    assert CODEC.from_binary(CODEC.to_binary(AppPoint000(kilowatts=2))) == AppPoint(
+        watts=2000, status=GNodeStatus.Active
+    )
+    with pytest.raises(ValueError, match="Unknown type"):
+        GwBaseSemaCodec().from_binary(to_binary(AppPoint000(kilowatts=2)))
+
+
+def test_codec_rejects_unknown_versions() -> None:
+    body = to_binary(types.HeartbeatA(my_hex="a"))
+    bad = body.replace(b"\x04000", b"\x04999")
+    assert peek_binary_type(bad) == ("heartbeat.a", "999")
+    with pytest.raises(ValueError, match="Unsupported version 999"):
+        CODEC.from_binary(bad)
+
+
+@pytest.mark.parametrize("msg", SAMPLES, ids=lambda m: m.type_name)
+def test_truncated_or_extended_bodies_are_rejected(msg: GwBaseSemaType) -> None:
+    body = to_binary(msg)
+    for end in range(len(body)):
+        with pytest.raises(ValueError):
+            from_binary(body[:end], type(msg))
+    with pytest.raises(ValueError, match="extra data"):
+        from_binary(body + b"\x00", type(msg))
+
+
+def test_wrong_class_and_json_bodies_are_rejected() -> None:
+    hb = types.HeartbeatA(my_hex="a")
+    with pytest.raises(ValueError, match="not a Ready"):
+        from_binary(to_binary(hb), types.Ready)
+    with pytest.raises(ValueError, match="no binary marker"):
+        from_binary(hb.to_bytes(), types.HeartbeatA)
+    with pytest.raises(ValueError, match="Malformed"):
+        peek_binary_type(b"")
+
+
+def test_decoded_values_are_validated() -> None:
+    body = bytearray(to_binary(types.HeartbeatA(my_hex="a")))
+    body[-1] = ord("z")  # MyHex is the last byte
+    with pytest.raises(GwBaseSemaError, match="hex.char"):
+        from_binary(bytes(body), types.HeartbeatA)
+
+
+def test_a_required_none_is_a_clear_error() -> None:
+    header = types.GridworksHeader(
+        src="d1.a",
+        dst=None,
+        message_type="heartbeat.a",
+        message_id=str(uuid.uuid4()),
+        ack_required=False,
+    )
+    with pytest.raises(ValueError, match="required Dst of None"):
+        to_binary(header)
+    with pytest.raises(GwBaseSemaError):  # its JSON form does not decode either
+        types.GridworksHeader.from_bytes(header.to_bytes())
@@ -0,0 +1,158 @@
+"""``ColumnarBatch`` holds a batch by field, builds the same columns from
+models and from wire dicts, and checks wire dicts as the models would."""
+
+import uuid
+from typing import Any, Literal
+
+import pytest
+
+from gwbase.sema import GwBaseSemaError, GwBaseSemaType, types
+from gwbase.sema.enums import GNodeInstanceStatus, GNodeInstanceTransport, GNodeStatus
+from gwbase.sema.property_format import LeftRightDot, UTCMilliseconds
+
+np = pytest.importorskip("numpy")
+columnar = pytest.importorskip("gwbase.sema.columnar")
+ColumnarBatch = columnar.ColumnarBatch
+Categorical = columnar.Categorical
+
+
+class AppTelemetry(GwBaseSemaType):
+    about: LeftRightDot
+    watts: float
+    on: bool
+    status: GNodeStatus | None = None
+    sampled_at_ms: UTCMilliseconds | None = None
+    readings: list[int] = []
+    type_name: Literal["app.columnar.telemetry"] = "app.columnar.telemetry"
+    version: Literal["000"] = "000"
+
+
+T0 = 1_700_000_000
+ALIASES = ["d1.isone.ltn0", "d1.isone.ltn1", "d1.isone.ltn2"]
+READIES = [
+    types.Ready(
+        from_g_node_alias=ALIASES[i % 3],
+        from_g_node_instance_id=str(uuid.uuid4()),
+        time_unix_s=T0 + 300 * (i // 3),
+    )
+    for i in range(8)
+]
+INSTANCES = [
+    types.GNodeInstanceGt(
+        g_node_id=str(uuid.uuid4()),
+        g_node_instance_id=str(uuid.uuid4()),
+        status=status,
+        transport=GNodeInstanceTransport.RabbitAmqp,
+        connected_at_unix_ms=T0 * 1000,
+        revoked_at_unix_ms=None if status == GNodeInstanceStatus.Active else T0 * 1000,
+        connection_handle="h" if status == GNodeInstanceStatus.Ended else None,
+    )
+    for status in [GNodeInstanceStatus.Active, GNodeInstanceStatus.Ended]
+]
+TELEMETRY = [
+    AppTelemetry(about="d1.a", watts=1.5, on=True, readings=[1, 2]),
+    AppTelemetry(
+        about="d1.b",
+        watts=2,
+        on=False,
+        status=GNodeStatus.Active,
+        sampled_at_ms=T0 * 1000,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "messages", [READIES, INSTANCES, TELEMETRY], ids=lambda m: m[0].type_name
+)
+def test_models_and_wire_dicts_give_the_same_batch(
+    messages: list[GwBaseSemaType],
+) -> None:
+    batch = ColumnarBatch.from_messages(messages)
+    assert len(batch) == len(messages)
+    assert batch.to_messages() == messages
+    from_wire = ColumnarBatch.from_dicts(
+        type(messages[0]), [m.to_dict() for m in messages]
+    )
+    assert list(from_wire.to_dicts()) == [m.to_dict() for m in messages]
+
+
+def test_columns_by_annotation() -> None:
+    batch = ColumnarBatch.from_messages(READIES)
+    assert batch["time_unix_s"].dtype == np.int64
+    aliases = batch["from_g_node_alias"]
+    assert isinstance(aliases, Categorical)
+    assert aliases.categories == tuple(ALIASES)
+    assert aliases.decode() == [r.from_g_node_alias for r in READIES]
+
+    ready_at_t0 = aliases.codes[batch["time_unix_s"] == T0]
+    assert sorted(aliases.categories[c] for c in ready_at_t0) == ALIASES
+    assert aliases.counts() == {
+        "d1.isone.ltn0": 3,
+        "d1.isone.ltn1": 3,
+        "d1.isone.ltn2": 2,
+    }
+
+
+def test_enum_codes_are_indices_and_optionals_are_masked() -> None:
+    instances = ColumnarBatch.from_messages(INSTANCES)
+    status = instances["status"]
+    assert status.categories == tuple(GNodeInstanceStatus.values())
+    assert status.codes.tolist() == [
+        GNodeInstanceStatus.to_index(i.status) for i in INSTANCES
+    ]
+    revoked = instances["revoked_at_unix_ms"]
+    assert revoked.mask.tolist() == [True, False]
+    assert revoked.max() == T0 * 1000
+
+    telemetry = ColumnarBatch.from_messages(TELEMETRY)
+    assert telemetry["watts"].dtype == np.float64
+    assert telemetry["on"].tolist() == [True, False]
+    assert telemetry["status"].decode() == [None, "Active"]
+    assert telemetry["status"].counts()["Active"] == 1
+
+
+def test_batches_hold_one_type() -> None:
+    with pytest.raises(ValueError, match="not a Ready"):
+        ColumnarBatch.from_messages([READIES[0], INSTANCES[0]])
+    empty = ColumnarBatch.from_messages([], sema_class=types.Ready)
+    assert len(empty) == 0
+    assert empty["from_g_node_alias"].counts() == dict.fromkeys(())
+    with pytest.raises(GwBaseSemaError, match="not 'sim.ready'"):
+        ColumnarBatch.from_dicts(types.Ready, [INSTANCES[0].to_dict()])
+
+
+@pytest.mark.parametrize(
+    ("change", "match"),
+    [
+        ({"TimeUnixS": 5}, "TimeUnixS of row 1: 5: Fails UTCSeconds format"),
+        ({"TimeUnixS": "1700000000"}, "TimeUnixS of row 1: .* is not int"),
+        ({"TimeUnixS": 2**70}, "TimeUnixS of row 1"),
+        ({"FromGNodeAlias": "D1.X"}, "FromGNodeAlias of row 1: .*LeftRightDot"),
+        ({"FromGNodeAlias": None}, "FromGNodeAlias of row 1: None"),
+        ({"FromGNodeInstanceId": "x"}, "FromGNodeInstanceId of row 1: .*uuid4.str"),
+    ],
+)
+def test_wire_dicts_are_checked_by_column(change: dict[str, Any], match: str) -> None:
+    rows = [r.to_dict() for r in READIES[:3]]
+    rows[1].update(change)
+    with pytest.raises(GwBaseSemaError, match=match):
+        ColumnarBatch.from_dicts(types.Ready, rows)
+
+
+def test_missing_fields_take_their_defaults() -> None:
+    rows = [m.to_dict() for m in TELEMETRY]
+    del rows[0]["Readings"]
+    batch = ColumnarBatch.from_dicts(AppTelemetry, rows)
+    assert batch["readings"].tolist() == [[], []]
+    del rows[1]["About"]
+    with pytest.raises(GwBaseSemaError, match="About of row 1: missing"):
+        ColumnarBatch.from_dicts(AppTelemetry, rows)
+
+
+def test_unknown_enum_values_read_as_the_default() -> None:
+    rows = [i.to_dict() for i in INSTANCES]
+    rows[1]["Status"] = "Unheard"
+    batch = ColumnarBatch.from_dicts(types.GNodeInstanceGt, rows)
+    assert batch["status"].decode() == ["Active", "Active"]
+    with pytest.raises(GwBaseSemaError, match="Axiom 1"):
+        batch.to_messages()  # cross-field checks run in the models
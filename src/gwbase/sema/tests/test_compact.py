@@ -0,0 +1,174 @@
+"""The compact JSON form writes enums as indices or symbols and repeated
+aliases once, and decodes to exactly what the plain form decodes to."""
+
+import json
+import uuid
+from collections.abc import Callable
+from enum import auto
+from typing import Any, Literal
+
+import pytest
+
+from gwbase.sema import (
+    GwBaseSemaCodec,
+    GwBaseSemaError,
+    GwBaseSemaType,
+    default_registry,
+    types,
+)
+from gwbase.sema.compact import ALIASES_KEY, CONTENT_TYPE, from_compact, to_compact
+from gwbase.sema.enums import BaseGNodeClass, GNodeStatus
+from gwbase.sema.enums.gw_str_enum import GwStrEnum, SymbolizedEnum
+from gwbase.sema.property_format import LeftRightDot
+
+
+class AppRelayState(SymbolizedEnum):
+    Open = auto()
+    Closed = auto()
+
+    @classmethod
+    def symbols(cls) -> list[str]:
+        return ["o", "c"]
+
+
+class AppLink(GwBaseSemaType):
+    from_alias: LeftRightDot
+    to_alias: LeftRightDot
+    relay: AppRelayState
+    status: GNodeStatus | None = None
+    type_name: Literal["app.compact.link"] = "app.compact.link"
+    version: Literal["000"] = "000"
+
+
+class AppTopology(GwBaseSemaType):
+    owner: LeftRightDot
+    links: list[AppLink]
+    type_name: Literal["app.compact.topology"] = "app.compact.topology"
+    version: Literal["000"] = "000"
+
+
+CODEC = GwBaseSemaCodec(registry=default_registry().extended(AppTopology))
+TOPOLOGY = AppTopology(
+    owner="d1.isone",
+    links=[
+        AppLink(
+            from_alias="d1.isone",
+            to_alias=f"d1.isone.ltn{i}",
+            relay=AppRelayState.Closed if i % 2 else AppRelayState.Open,
+            status=GNodeStatus.Active if i else None,
+        )
+        for i in range(4)
+    ],
+)
+SAMPLES = [
+    TOPOLOGY,
+    types.HeartbeatA(my_hex="a", your_last_hex="3"),
+    types.GNodeGt(
+        g_node_id=str(uuid.uuid4()),
+        alias="d1.isone.ltn",
+        prev_alias="d1.isone.ltn0",
+        base_class=BaseGNodeClass.LeafTransactiveNode,
+        g_node_class="LeafTransactiveNode",
+        status=GNodeStatus.Suspended,
+        position_point_id=str(uuid.uuid4()),
+    ),
+    types.Ready(
+        from_g_node_alias="d1.isone.ltn",
+        from_g_node_instance_id=str(uuid.uuid4()),
+        time_unix_s=1_700_000_000,
+    ),
+]
+
+
+@pytest.mark.parametrize("msg", SAMPLES, ids=lambda m: m.type_name)
+def test_round_trips(msg: GwBaseSemaType) -> None:
+    body = to_compact(msg)
+    assert len(body) <= len(msg.to_bytes())
+    decoded = from_compact(body, type(msg))
+    assert decoded == msg
+    assert decoded.to_bytes() == msg.to_bytes()
+
+
+def test_enums_and_repeated_aliases_are_compacted() -> None:
+    d = json.loads(to_compact(TOPOLOGY))
+    assert d[ALIASES_KEY] == ["d1.isone"]  # the only alias that repeats
+    assert d["Owner"] == 0
+    assert [link["FromAlias"] for link in d["Links"]] == [0, 0, 0, 0]
+    assert d["Links"][1]["ToAlias"] == "d1.isone.ltn1"
+    assert [link["Relay"] for link in d["Links"]] == ["o", "c", "o", "c"]
+    assert d["Links"][1]["Status"] == GNodeStatus.to_index("Active")
+    assert "Status" not in d["Links"][0]
+
+
+def test_types_without_enums_or_aliases_encode_as_plain_json() -> None:
+    hb = types.HeartbeatA(my_hex="a")
+    assert to_compact(hb) == hb.to_bytes()
+
+
+def test_codec_selects_compact_by_content_type() -> None:
+    body = CODEC.to_compact(TOPOLOGY)
+    assert CODEC.from_bytes(body, content_type=CONTENT_TYPE) == TOPOLOGY
+    with pytest.raises(GwBaseSemaError):
+        CODEC.from_bytes(body)
+    with pytest.raises(ValueError, match="Unknown type"):
+        GwBaseSemaCodec().from_bytes(body, content_type=CONTENT_TYPE)
+
+
+@pytest.mark.parametrize(
+    ("mutate", "error", "match"),
+    [
+        (lambda d: d.update({"Owner": 1}), ValueError, "Malformed"),
+        (lambda d: d.update({"Owner": -1}), ValueError, "Malformed"),
+        (lambda d: d["Links"][1].update({"Relay": "x"}), ValueError, "Malformed"),
+        (lambda d: d.update({ALIASES_KEY: [1]}), ValueError, "list of strings"),
+        (lambda d: d.update({"Owner": "D1"}), GwBaseSemaError, "LeftRightDot"),
+    ],
+)
+def test_malformed_bodies_are_rejected(
+    mutate: Callable[[dict[str, Any]], None], error: type[Exception], match: str
+) -> None:
+    d = json.loads(to_compact(TOPOLOGY))
+    mutate(d)
+    with pytest.raises(error, match=match):
+        from_compact(json.dumps(d).encode(), AppTopology)
+
+
+@pytest.mark.parametrize("unknown", [99, -1])
+def test_unknown_enum_index_decodes_to_the_default(unknown: int) -> None:
+    d = json.loads(to_compact(TOPOLOGY))
+    d["Links"][1]["Status"] = unknown
+    plain = json.loads(TOPOLOGY.to_bytes())
+    plain["Links"][1]["Status"] = "NotYetAStatus"
+    decoded = from_compact(json.dumps(d).encode(), AppTopology)
+    assert decoded == AppTopology.from_dict(plain)
+    assert decoded.links[1].status is GNodeStatus.default()
+
+
+@pytest.mark.parametrize(
+    "value", ["Active", "Nope", GNodeStatus.Suspended, 1, None, ["Active"]]
+)
+def test_lookup_matches_the_enum_constructor(value: Any) -> None:
+    assert GNodeStatus.lookup(value) is GNodeStatus(value)
+
+
+def test_lookup_without_default_is_none() -> None:
+    class Color(GwStrEnum):
+        Red = auto()
+
+    assert Color.lookup("Red") is Color.Red
+    assert Color.lookup("Blue") is None
+    with pytest.raises(ValueError, match="not valid Color"):
+        Color("Blue")
+
+
+def test_symbols_must_be_one_per_member() -> None:
+    class Bad(SymbolizedEnum):
+        A = auto()
+        B = auto()
+
+        @classmethod
+        def symbols(cls) -> list[str]:
+            return ["x", "x"]
+
+    with pytest.raises(ValueError, match="one per member"):
+        Bad.value_to_symbol("A")
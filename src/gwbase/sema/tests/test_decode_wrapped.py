@@ -0,0 +1,114 @@
+"""``decode_wrapped`` gives what ``unwrap_bytes`` followed by ``from_dict``
+gives: the same header and payload, or the same exception type."""
+
+import json
+import uuid
+from typing import Any, Literal
+
+import pytest
+
+from gwbase.sema import GwBaseSemaCodec, GwBaseSemaType, default_registry, types
+from gwbase.sema import registry as registry_module
+from gwbase.sema.base import DegradedSemaType
+from gwbase.sema.wrapped import unwrap_bytes
+
+
+class AppSetpoint(GwBaseSemaType):
+    watts: int
+    type_name: Literal["app.wrapped.setpoint"] = "app.wrapped.setpoint"
+    version: Literal["001"] = "001"
+
+
+class AppSetpoint000(GwBaseSemaType):
+    kilowatts: int
+    type_name: Literal["app.wrapped.setpoint"] = "app.wrapped.setpoint"
+    version: Literal["000"] = "000"
+
+    def upgrade(self) -> GwBaseSemaType:
+        return AppSetpoint(watts=self.kilowatts * 1000)
+
+
+CODEC = GwBaseSemaCodec(
+    registry=default_registry().extended(AppSetpoint, old_versions=[AppSetpoint000])
+)
+HB = types.HeartbeatA(my_hex="a", your_last_hex="3")
+READY = types.Ready(
+    from_g_node_alias="d1.isone.ltn",
+    from_g_node_instance_id=str(uuid.uuid4()),
+    time_unix_s=1_700_000_000,
+)
+HEADER = types.GridworksHeader(
+    src="d1.a",
+    dst="d1.b",
+    message_type="heartbeat.a",
+    message_id=str(uuid.uuid4()),
+    ack_required=False,
+)
+
+
+def _gw(payload: Any, message_type: str | None = None, **members: Any) -> bytes:
+    if message_type is None:
+        message_type = payload["TypeName"]
+    header = {**HEADER.to_dict(), "MessageType": message_type}
+    return json.dumps({
+        "TypeName": "gw",
+        "Header": header,
+        "Payload": payload,
+        **members,
+    }).encode()
+
+
+BODIES = [
+    _gw(HB.to_dict()),
+    _gw(READY.to_dict()),
+    _gw(AppSetpoint(watts=5).to_dict()),
+    _gw(AppSetpoint000(kilowatts=2).to_dict()),  # upgraded
+    _gw(HEADER.to_dict()),  # free-form inner type
+    _gw({**HB.to_dict(), "Version": "999"}),  # degraded only
+    _gw({"TypeName": "no.such.type", "Version": "000"}),  # degraded only
+    _gw({**HB.to_dict(), "MyHex": "z"}),
+    _gw({**HB.to_dict(), "Extra": 1}),
+    _gw({**HB.to_dict(), "my_hex": "a"}),
+    _gw({**HB.to_dict(), "MyHex": "\ud800"}),
+    _gw(HB.to_dict(), message_type="sim.ready"),
+    _gw(HB.to_dict(), Header={**HEADER.to_dict(), "Src": "D1"}),
+    _gw(READY.to_dict(), Payload=HB.to_dict()),  # repeated key: last wins
+    _gw(HB.to_dict(), TypeName="gw2"),
+    _gw([HB.to_dict()], message_type="heartbeat.a"),
+    _gw(HB.to_dict())[:-1],
+    b"[]",
+]
+
+
+def _outcome(decode: Any, body: bytes) -> Any:
+    try:
+        header, payload = decode(body)
+    except Exception as e:  # compared by type
+        return type(e)
+    if isinstance(payload, DegradedSemaType):
+        return header, "degraded", payload.type_name, payload.version
+    return header, payload, payload.to_bytes()
+
+
+@pytest.mark.parametrize("mode", ["strict", "degraded"])
+@pytest.mark.parametrize("body", BODIES)
+def test_matches_unwrap_then_from_dict(
+    body: bytes, mode: Literal["strict", "degraded"]
+) -> None:
+    def reference(body: bytes) -> Any:
+        header, payload = unwrap_bytes(body)
+        return header, CODEC.from_dict(payload, mode=mode)
+
+    assert _outcome(lambda b: CODEC.decode_wrapped(b, mode=mode), body) == _outcome(
+        reference, body
+    )
+
+
+def test_follows_the_process_wide_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    codec = GwBaseSemaCodec()
+    body = _gw(AppSetpoint(watts=5).to_dict())
+    with pytest.raises(ValueError, match="Unknown type"):
+        codec.decode_wrapped(body)
+    # what register_types(AppSetpoint) swaps in
+    monkeypatch.setattr(registry_module, "_registry", CODEC.sema_registry)
+    assert codec.decode_wrapped(body)[1] == AppSetpoint(watts=5)
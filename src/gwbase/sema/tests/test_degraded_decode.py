@@ -0,0 +1,84 @@
+"""Degraded decode: cached field tables, lazy known/unknown views, and
+rate-limited warnings."""
+
+import json
+import logging
+from typing import Any
+
+import pytest
+
+from gwbase.sema import GwBaseSemaCodec, types
+from gwbase.sema import codec as codec_module
+from gwbase.sema.base import DegradedSemaType, pascal_to_snake, snake_to_pascal
+
+N_DECODES = 5
+HB = types.HeartbeatA(my_hex="a", your_last_hex="3")
+
+
+def _future(version: str, **extra: Any) -> dict[str, Any]:
+    return {**HB.to_dict(), "Version": version, **extra}
+
+
+def _reference_split(d: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """The per-message split the cached tables replace."""
+    valid = set()
+    for name, info in types.HeartbeatA.model_fields.items():
+        valid |= {snake_to_pascal(name), name, info.alias or name}
+    known = {k: v for k, v in d.items() if k in valid or pascal_to_snake(k) in valid}
+    return known, {k: v for k, v in d.items() if k not in known}
+
+
+def test_known_and_unknown_fields_match_the_reference() -> None:
+    d = _future("901", FutureField=1, MyHexToo=2, Y=3)
+    degraded = GwBaseSemaCodec().from_dict(d, mode="degraded")
+    assert isinstance(degraded, DegradedSemaType)
+    assert degraded.raw == d
+    assert (degraded.known_fields, degraded.unknown_fields) == _reference_split(d)
+    assert not hasattr(degraded, "__dict__")
+
+
+def test_unknown_type_is_all_unknown() -> None:
+    d = {"TypeName": "no.such.type", "Version": "000", "A": 1}
+    degraded = GwBaseSemaCodec().from_dict(d, mode="degraded")
+    assert isinstance(degraded, DegradedSemaType)
+    assert degraded.known_fields == {}
+    assert degraded.unknown_fields == d
+
+
+def test_from_bytes_keeps_the_raw_body() -> None:
+    body = json.dumps(_future("902", FutureField=1)).encode()
+    degraded = GwBaseSemaCodec().from_bytes(body, mode="degraded")
+    assert isinstance(degraded, DegradedSemaType)
+    assert degraded.raw_bytes == body
+    assert degraded.to_dict() == json.loads(body)
+
+
+def test_warnings_are_rate_limited(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    codec = GwBaseSemaCodec()
+    caplog.set_level(logging.WARNING, logger=codec_module.logger.name)
+    for _ in range(N_DECODES):
+        codec.from_dict(_future("903"), mode="degraded")
+    codec.from_dict(_future("904"), mode="degraded")
+    assert [r.getMessage() for r in caplog.records] == [
+        "Degraded decode for heartbeat.a v903 (current v000)",
+        "Degraded decode for heartbeat.a v904 (current v000)",
+    ]
+
+    caplog.clear()
+    monkeypatch.setattr(codec_module, "DEGRADED_WARNING_INTERVAL_S", 0.0)
+    codec.from_dict(_future("903"), mode="degraded")
+    assert [r.getMessage() for r in caplog.records] == [
+        "Degraded decode for heartbeat.a v903 (current v000), "
+        f"{N_DECODES - 1} more since last warning"
+    ]
+
+
+@pytest.mark.parametrize("version", [[], {}, ["901"], 901, None])
+def test_any_version_degrades(version: Any) -> None:
+    d = _future("000", Version=version)
+    for _ in range(2):
+        degraded = GwBaseSemaCodec().from_dict(d, mode="degraded")
+        assert isinstance(degraded, DegradedSemaType)
+        assert degraded.raw == d
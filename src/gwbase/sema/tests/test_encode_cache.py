@@ -0,0 +1,61 @@
+"""Memoized and interned encodings of frozen Sema instances."""
+
+import gc
+import pickle
+import uuid
+import weakref
+
+from gwbase.sema import types
+
+HB = types.HeartbeatA(my_hex="a", your_last_hex="3")
+
+
+def _header() -> types.GridworksHeader:
+    return types.GridworksHeader(
+        src="d1.a",
+        dst={"Node": "d1.b"},
+        message_type="report.event",
+        message_id=str(uuid.uuid4()),
+        ack_required=False,
+    )
+
+
+def test_memoized_encoding_is_reused() -> None:
+    msg = HB.model_copy()
+    assert msg.memoized() is msg
+    assert msg.to_bytes() is msg.to_bytes()
+    assert msg.to_bytes() == HB.to_bytes()
+    assert msg.to_dict() == HB.to_dict()
+    msg.to_dict()["MyHex"] = "f"  # the top level is a copy
+    assert msg.to_dict() == HB.to_dict()
+
+
+def test_memo_is_invisible_to_the_model() -> None:
+    msg = HB.model_copy().memoized()
+    assert msg == HB
+    assert hash(msg) == hash(HB)
+    assert msg.model_dump() == HB.model_dump()
+    assert repr(msg) == repr(HB)
+    assert pickle.loads(pickle.dumps(msg)).to_bytes() == HB.to_bytes()
+    changed = msg.model_copy(update={"my_hex": "b"})
+    assert changed.to_dict()["MyHex"] == "b"
+
+
+def test_interned_returns_one_instance_while_held() -> None:
+    first = types.HeartbeatA(my_hex="c").interned()
+    again = types.HeartbeatA(my_hex="c").interned()
+    assert again is first
+    assert types.HeartbeatA(my_hex="d").interned() is not first
+    assert first.to_bytes() is again.to_bytes()
+
+    ref = weakref.ref(first)
+    del first, again
+    gc.collect()
+    assert ref() is None  # the table does not keep it alive
+
+
+def test_unhashable_fields_are_memoized_not_interned() -> None:
+    header = _header()
+    interned = header.interned()
+    assert interned is header
+    assert interned.to_bytes() is header.to_bytes()
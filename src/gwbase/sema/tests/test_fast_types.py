@@ -0,0 +1,200 @@
+"""The generated ``Fast*`` classes are current, and accept, reject, encode
+and convert exactly as their pydantic models do."""
+
+import json
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Literal
+
+import pytest
+
+from gwbase.sema import GwBaseSemaType, fast_types, fastgen, types
+from gwbase.sema.fast_types import (
+    FastGridworksHeader,
+    FastHeartbeatA,
+    FastReady,
+    FastSimTimestep,
+)
+
+T0 = 1_700_000_000
+MODELS: list[GwBaseSemaType] = [
+    types.HeartbeatA(my_hex="a", your_last_hex="f"),
+    types.HeartbeatA(my_hex="0"),
+    types.Ready(
+        from_g_node_alias="d1.isone.ltn",
+        from_g_node_instance_id=str(uuid.uuid4()),
+        time_unix_s=T0,
+    ),
+    types.SimTimestep(
+        from_g_node_alias="d1.time",
+        from_g_node_instance_id=str(uuid.uuid4()),
+        time_unix_s=T0,
+        timestep_created_ms=T0 * 1000,
+        message_id=str(uuid.uuid4()),
+    ),
+    types.GridworksHeader(
+        src="d1.isone.ltn",
+        dst={"To": ["a", None, 1.5]},
+        message_type="sim.ready",
+        message_id="m-1",
+        ack_required=False,
+    ),
+    types.GridworksHeader(
+        src='é"\\\x01\x7f',
+        dst=None,
+        message_type="sim.ready",
+        message_id=" ",
+        ack_required=True,
+    ),
+]
+FAST: dict[str, Any] = {
+    "heartbeat.a": FastHeartbeatA,
+    "sim.ready": FastReady,
+    "sim.timestep": FastSimTimestep,
+    "gridworks.header": FastGridworksHeader,
+}
+
+# Wire values that are valid, coercible, or invalid for some field
+ODD_VALUES: list[Any] = [
+    None,
+    True,
+    0,
+    5,
+    T0,
+    T0 * 1000,
+    2**70,
+    1.0,
+    float(T0),
+    "",
+    "a",
+    "G",
+    "d1.x",
+    "D1.x",
+    "1700000000",
+    str(uuid.uuid4()),
+    str(uuid.uuid4()).upper(),
+    [],
+    {},
+]
+
+
+def _outcome(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> tuple[Any, ...]:
+    try:
+        obj = fn(*args, **kwargs)
+    except Exception as e:  # the outcome is what is compared
+        return ("raised", type(e), str(e))
+    return ("ok", obj.to_bytes(), obj.to_dict())
+
+
+def _wire_variants(model: GwBaseSemaType) -> list[dict[str, Any]]:
+    d = model.to_dict()
+    variants = [d, {k: v for k, v in d.items() if k not in {"TypeName", "Version"}}]
+    for key in d:
+        variants.append({k: v for k, v in d.items() if k != key})
+        variants.extend({**d, key: value} for value in ODD_VALUES)
+    variants.append({**d, "Extra": 1})
+    variants.append({**d, "TypeName": "other.type"})
+    variants.append({**d, "Version": "999"})
+    snake = model.model_dump(exclude_none=True)
+    variants.append(snake)
+    return variants
+
+
+def _id(model: GwBaseSemaType) -> str:
+    return model.type_name
+
+
+def test_generated_module_is_current() -> None:
+    assert fastgen.render() == Path(fast_types.__file__).read_text()
+    assert fastgen.main(["--check"]) == 0
+
+
+@pytest.mark.parametrize("model", MODELS, ids=_id)
+def test_encodes_and_converts_as_the_model(model: GwBaseSemaType) -> None:
+    fast_class = FAST[model.type_name]
+    fast = fast_class.from_model(model)
+    assert fast.to_bytes() == model.to_bytes()
+    assert fast.to_dict() == model.to_dict()
+    assert fast.to_model() == model
+    # as for the model, a required Dst of None does not survive the round trip
+    body, d = model.to_bytes(), model.to_dict()
+    model_class = type(model)
+    assert _outcome(fast_class.from_bytes, body) == _outcome(
+        model_class.from_bytes, body
+    )
+    assert _outcome(fast_class.from_dict, d) == _outcome(model_class.from_dict, d)
+
+
+@pytest.mark.parametrize("model", MODELS, ids=_id)
+def test_decodes_as_the_model(model: GwBaseSemaType) -> None:
+    fast_class = FAST[model.type_name]
+    model_class = type(model)
+    for d in _wire_variants(model):
+        body = json.dumps(d).encode()
+        assert _outcome(fast_class.from_dict, d) == _outcome(
+            model_class.from_dict, d
+        ), d
+        assert _outcome(fast_class.from_bytes, body) == _outcome(
+            model_class.from_bytes, body
+        ), d
+    for body in [b"", b"[]", b"{", b'"x"', b"{}"]:
+        assert _outcome(fast_class.from_bytes, body) == _outcome(
+            model_class.from_bytes, body
+        ), body
+        assert fast_class.try_from_bytes(body) is None
+
+
+@pytest.mark.parametrize("model", MODELS, ids=_id)
+def test_constructs_as_the_model(model: GwBaseSemaType) -> None:
+    fast_class = FAST[model.type_name]
+    model_class = type(model)
+    kwargs = {
+        name: getattr(model, name)
+        for name in model_class.model_fields
+        if name not in {"type_name", "version"}
+    }
+    assert fast_class(**kwargs) == fast_class.from_model(model)
+    for name in kwargs:
+        for value in ODD_VALUES:
+            changed = {**kwargs, name: value}
+            assert _outcome(fast_class, **changed) == _outcome(
+                model_class, **changed
+            ), changed
+
+
+def test_fast_instances_are_frozen_values() -> None:
+    ping = FastHeartbeatA(my_hex="a")
+    with pytest.raises(AttributeError, match="frozen"):
+        ping.my_hex = "b"
+    with pytest.raises(AttributeError, match="frozen"):
+        del ping.my_hex
+    assert ping == FastHeartbeatA(my_hex="a", your_last_hex=None)
+    assert ping != FastHeartbeatA(my_hex="b")
+    assert ping != types.HeartbeatA(my_hex="a")
+    assert len({ping, FastHeartbeatA(my_hex="a")}) == 1
+    assert repr(ping) == "FastHeartbeatA(my_hex='a', your_last_hex=None)"
+    assert not hasattr(ping, "__dict__")
+
+
+class AppListy(GwBaseSemaType):
+    readings: list[int]
+    type_name: Literal["app.fast.listy"] = "app.fast.listy"
+    version: Literal["000"] = "000"
+
+
+class AppDefaulted(GwBaseSemaType):
+    label: str = "main"
+    type_name: Literal["app.fast.defaulted"] = "app.fast.defaulted"
+    version: Literal["000"] = "000"
+
+
+@pytest.mark.parametrize(
+    ("cls", "match"),
+    [(AppListy, "readings: .* not supported"), (AppDefaulted, "None defaults")],
+)
+def test_generator_rejects_unsupported_fields(
+    cls: type[GwBaseSemaType], match: str
+) -> None:
+    with pytest.raises(TypeError, match=match):
+        fastgen.render([cls])
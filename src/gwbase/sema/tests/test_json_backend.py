@@ -0,0 +1,140 @@
+"""Every JSON backend decodes to the same objects, and none changes a byte
+of what is encoded."""
+
+import json
+import math
+import os
+import subprocess
+import sys
+import uuid
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from gwbase.sema import GwBaseSemaCodec, GwBaseSemaError, json_backend, peek_type, types
+from gwbase.sema.types.gw import Payload
+from gwbase.sema.wrapped import unwrap_bytes, wrap_bytes
+
+HB = types.HeartbeatA(my_hex="a", your_last_hex="3")
+HEADER = types.GridworksHeader(
+    src="d1.a",
+    dst={"Node": "d1.b"},
+    message_type="heartbeat.a",
+    message_id=str(uuid.uuid4()),
+    ack_required=False,
+)
+BODIES = [
+    HB.to_bytes(),  # compiled path: no backend involved
+    types.Gw(header=HEADER, payload=Payload.model_validate(HB.to_dict())).to_bytes(),
+    json.dumps({**HB.to_dict(), "Version": "999", "Extra": [1.5, None]}).encode(),
+    json.dumps({"MyHex": "a", "Version": "000", "TypeName": "heartbeat.a"}).encode(),
+    b' { "TypeName" : "heartbeat.a" , "MyHex" : "\\u0041" } ',
+]
+
+
+@pytest.fixture(params=["stdlib", "pydantic", "orjson"])
+def backend(request: pytest.FixtureRequest) -> Iterator[str]:
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    before = json_backend.get_json_backend()
+    json_backend.set_json_backend(request.param)
+    yield request.param
+    json_backend.set_json_backend(before)
+
+
+def _decode_all(codec: GwBaseSemaCodec) -> list[Any]:
+    out: list[Any] = []
+    for body in BODIES:
+        try:
+            out.append(codec.from_bytes(body, mode="degraded").to_dict())
+        except ValueError as e:
+            out.append(type(e))
+        out.append(peek_type(body))
+    return out
+
+
+def test_backends_decode_alike(backend: str) -> None:
+    json_backend.set_json_backend("stdlib")
+    expected = _decode_all(GwBaseSemaCodec())
+    json_backend.set_json_backend(backend)
+    assert _decode_all(GwBaseSemaCodec()) == expected
+    assert types.HeartbeatA.from_bytes(BODIES[4]).my_hex == "A"
+
+
+def test_gw_envelope_round_trips_byte_for_byte(backend: str) -> None:
+    body = wrap_bytes(
+        src="d1.a",
+        dst="d1.b",
+        inner_type_name="heartbeat.a",
+        inner_payload_dict={**HB.to_dict(), "Note": "café"},
+        message_id=HEADER.message_id,
+    )
+    json_backend.set_json_backend("stdlib")
+    expected = unwrap_bytes(body)
+    json_backend.set_json_backend(backend)
+    assert unwrap_bytes(body) == expected
+    assert (
+        body
+        == json.dumps({
+            "TypeName": "gw",
+            "Header": expected[0].to_dict(),
+            "Payload": expected[1],
+        }).encode()
+    )
+
+
+def test_errors_keep_their_types(backend: str) -> None:
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        GwBaseSemaCodec().from_bytes(b'{"TypeName": "heartbeat.a",')
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        unwrap_bytes(b"\xff")
+    with pytest.raises(GwBaseSemaError, match="string or bytes"):
+        types.HeartbeatA.from_bytes(1)  # type: ignore[arg-type]
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        json_backend.set_json_backend("simdjson")
+    assert json_backend.get_json_backend() == json_backend.DEFAULT_BACKEND
+
+
+def test_backend_is_chosen_from_the_environment() -> None:
+    out = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from gwbase.sema import json_backend; print(json_backend.get_json_backend())",
+        ],
+        env={**os.environ, json_backend.ENV_VAR: "pydantic"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip() == "pydantic"
+
+
+LONE_SURROGATE = b'{"A": "\\ud800"}'
+BOM = b'\xef\xbb\xbf{"A": 1}'
+NAN = b'{"A": NaN}'
+BIG = b'{"A": 18446744073709551616}'
+ACCEPTS: dict[str, set[bytes]] = {
+    "stdlib": {LONE_SURROGATE, BOM, NAN, BIG},
+    "pydantic": {NAN, BIG},
+    "orjson": {BIG},
+}
+
+
+@pytest.mark.parametrize("doc", [LONE_SURROGATE, BOM, NAN, BIG])
+def test_documented_differences(backend: str, doc: bytes) -> None:
+    if doc not in ACCEPTS[backend]:
+        with pytest.raises(ValueError):
+            json_backend.loads(doc)
+        return
+    value = json_backend.loads(doc)["A"]
+    if doc == BIG:
+        assert type(value) is (float if backend == "orjson" else int)
+    elif doc == NAN:
+        assert math.isnan(value)
+    else:
+        assert value == json.loads(doc)["A"]
@@ -0,0 +1,150 @@
+"""``LazySema`` fields match the strict decode, and are validated one at a
+time, on first access."""
+
+import copy
+import json
+import pickle
+import uuid
+from collections.abc import Callable
+from typing import Any, Literal
+
+import pytest
+from pydantic import field_validator
+
+from gwbase.sema import (
+    GwBaseSemaCodec,
+    GwBaseSemaError,
+    GwBaseSemaType,
+    default_registry,
+    types,
+)
+from gwbase.sema.enums import BaseGNodeClass, GNodeStatus
+from gwbase.sema.lazy import LazySema
+
+
+class AppMeter(GwBaseSemaType):
+    watts: int
+    label: str = "main"
+    type_name: Literal["app.lazy.meter"] = "app.lazy.meter"
+    version: Literal["001"] = "001"
+
+    @field_validator("label")
+    @classmethod
+    def _lowercase(cls, v: str) -> str:
+        if v != v.lower():
+            raise ValueError("label must be lowercase")
+        return v
+
+
+class AppMeter000(GwBaseSemaType):
+    kilowatts: int
+    type_name: Literal["app.lazy.meter"] = "app.lazy.meter"
+    version: Literal["000"] = "000"
+
+    def upgrade(self) -> GwBaseSemaType:
+        return AppMeter(watts=self.kilowatts * 1000)
+
+
+CODEC = GwBaseSemaCodec(
+    registry=default_registry().extended(AppMeter, old_versions=[AppMeter000])
+)
+READY = types.Ready(
+    from_g_node_alias="d1.isone.ltn",
+    from_g_node_instance_id=str(uuid.uuid4()),
+    time_unix_s=1_700_000_000,
+)
+SAMPLES = [
+    READY,
+    types.HeartbeatA(my_hex="a"),
+    types.GNodeGt(
+        g_node_id=str(uuid.uuid4()),
+        alias="d1.isone.ltn",
+        base_class=BaseGNodeClass.LeafTransactiveNode,
+        g_node_class="LeafTransactiveNode",
+        status=GNodeStatus.Active,
+        position_point_id=str(uuid.uuid4()),
+    ),
+    types.GridworksHeader(
+        src="d1.a",
+        dst={"Node": "d1.b"},
+        message_type="report.event",
+        message_id=str(uuid.uuid4()),
+        ack_required=False,
+    ),
+    AppMeter(watts=5, label="aux"),
+]
+
+
+@pytest.mark.parametrize("msg", SAMPLES, ids=lambda m: m.type_name)
+def test_fields_match_the_strict_decode(msg: GwBaseSemaType) -> None:
+    lazy = CODEC.from_bytes_lazy(msg.to_bytes())
+    assert (lazy.type_name, lazy.version) == (msg.type_name, msg.version)
+    for name in type(msg).model_fields:
+        assert getattr(lazy, name) == getattr(msg, name)
+    assert lazy.materialize() == msg
+
+
+def test_only_the_fields_read_are_validated() -> None:
+    body = json.dumps({**READY.to_dict(), "TimeUnixS": 5}).encode()
+    lazy = CODEC.from_bytes_lazy(body)
+    assert lazy.from_g_node_alias == "d1.isone.ltn"
+    with pytest.raises(GwBaseSemaError, match="UTCSeconds"):
+        _ = lazy.time_unix_s
+    with pytest.raises(GwBaseSemaError):
+        lazy.materialize()
+
+
+def test_type_is_read_without_parsing_the_body() -> None:
+    lazy = CODEC.from_bytes_lazy(READY.to_bytes()[:-1])  # truncated JSON
+    assert lazy.type_name == "sim.ready"
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        _ = lazy.from_g_node_alias
+
+
+def test_missing_and_unknown_fields() -> None:
+    lazy = CODEC.from_bytes_lazy(b'{"TypeName":"heartbeat.a","Version":"000"}')
+    assert lazy.your_last_hex is None  # optional: its default
+    with pytest.raises(GwBaseSemaError, match="missing MyHex"):
+        _ = lazy.my_hex
+    with pytest.raises(AttributeError, match="no field 'MyHex'"):
+        _ = lazy.MyHex
+
+
+def test_field_validators_run_through_materialize() -> None:
+    body = {"TypeName": "app.lazy.meter", "Version": "001", "Watts": 5, "Label": "AUX"}
+    lazy = CODEC.from_bytes_lazy(json.dumps(body).encode())
+    assert lazy.watts == body["Watts"]
+    with pytest.raises(GwBaseSemaError, match="lowercase"):
+        _ = lazy.label
+
+
+def test_old_versions_expose_their_own_fields_and_materialize_upgraded() -> None:
+    old = AppMeter000(kilowatts=2)
+    lazy = CODEC.from_bytes_lazy(old.to_bytes())
+    assert lazy.sema_class is AppMeter000
+    assert lazy.kilowatts == old.kilowatts
+    assert lazy.materialize() == AppMeter(watts=2000)
+
+
+def test_unknown_types_and_versions_raise() -> None:
+    with pytest.raises(ValueError, match="Unknown type"):
+        GwBaseSemaCodec().from_bytes_lazy(AppMeter(watts=1).to_bytes())
+    with pytest.raises(ValueError, match="Unsupported version"):
+        CODEC.from_bytes_lazy(b'{"TypeName":"heartbeat.a","Version":"999"}')
+
+
+@pytest.mark.parametrize(
+    "copier",
+    [copy.copy, copy.deepcopy, lambda x: pickle.loads(pickle.dumps(x))],
+    ids=["copy", "deepcopy", "pickle"],
+)
+@pytest.mark.parametrize("msg", [READY, SAMPLES[2]], ids=lambda m: m.type_name)
+def test_copies_and_pickles(copier: Callable[[Any], Any], msg: GwBaseSemaType) -> None:
+    lazy = GwBaseSemaCodec().from_bytes_lazy(msg.to_bytes())
+    fields = list(type(msg).model_fields)
+    assert getattr(lazy, fields[0]) == getattr(msg, fields[0])  # one cached
+    copied = copier(lazy)
+    for name in fields:
+        assert getattr(copied, name) == getattr(msg, name)
+    assert copied.materialize() == msg
+    assert not hasattr(LazySema.__new__(LazySema), "my_hex")  # slots unset
@@ -0,0 +1,134 @@
+import json
+import uuid
+from typing import Any
+
+import pytest
+
+from gwbase.sema import GwBaseSemaCodec, peek_type, types
+from gwbase.sema.peek import scan_type
+from gwbase.sema.wrapped import wrap_bytes
+
+HB = types.HeartbeatA(my_hex="a", your_last_hex="3")
+READY = types.Ready(
+    from_g_node_alias="d1.isone.ltn",
+    from_g_node_instance_id=str(uuid.uuid4()),
+    time_unix_s=1_700_000_000,
+)
+GW = wrap_bytes(
+    src="d1.time",
+    dst="d1.isone.ltn",
+    inner_type_name=HB.type_name,
+    inner_payload_dict=HB.to_dict(),
+)
+
+
+def _expected(body: bytes) -> tuple[Any, Any]:
+    d = json.loads(body)
+    return d["TypeName"], d.get("Version")
+
+
+BODIES = [
+    HB.to_bytes(),
+    READY.to_bytes(),
+    GW,
+    json.dumps(HB.to_dict(), indent=2).encode(),
+    json.dumps(dict(reversed(HB.to_dict().items()))).encode(),
+    b'{"TypeName": "a.b"}',
+    b'{"TypeName": "a.b", "Version": null}',
+    b'{"Nested": {"TypeName": "inner", "Version": "001"}, "TypeName": "outer"}',
+    b'{"Version": "001", "Nested": [1, {"Version": "x"}], "TypeName": "outer"}',
+    b'{"TypeName": "first", "Version": "001", "TypeName": "second"}',
+    b'{"Note": "a \\"quoted\\" \\\\", "TypeName": "esc", "Version": "001"}',
+    b'{"TypeName": "t\\u0041", "Version": "001"}',
+    b'{"Count": 12, "On": true, "Off": false, "TypeName": "n", "Version": "002"}',
+    b'  {"Text": "}{,:", "TypeName": "punct", "Version": "000"}\n',
+    b'{"Note": "x\\"", "TypeName": "esc"}',
+    b'{"TypeName": "head", "Version": "001", "Note": "TypeName"}',
+    b'{"TypeName": "head", "Body": {"Version": "002"}}',
+    b'{"TypeName": "head", "Version": null, "Version": "003"}',
+    b'{"TypeName":"heartbeat.a","Version":"000","Type\\u004eame":"sim.ready"}',
+    b'{"TypeName":"heartbeat.a","MyHex":"a","\\u0056ersion":"000"}',
+]
+
+
+@pytest.mark.parametrize("body", BODIES)
+def test_peek_agrees_with_a_full_parse(body: bytes) -> None:
+    assert peek_type(body) == _expected(body)
+    scanned = scan_type(body)
+    assert scanned is None or scanned == _expected(body)
+
+
+def test_own_bodies_are_read_without_a_parse() -> None:
+    assert scan_type(HB.to_bytes()) == ("heartbeat.a", "000")
+    assert scan_type(READY.to_bytes()) == ("sim.ready", "000")
+    assert scan_type(b'{"TypeName": "a.b"}') == ("a.b", None)
+    assert scan_type(b'{"TypeName": "a.b", "Version": null, "X": 1}') == ("a.b", None)
+    assert scan_type(b'{"X": 1, "TypeName": "a.b", "Version": "001"}') == (
+        "a.b",
+        "001",
+    )
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        GW,  # the nested Payload carries a second TypeName
+        b'{"Version": "001", "Nested": {}, "TypeName": "outer"}',
+        b'{"TypeName": "head", "Version": "001", "Note": "TypeName"}',
+        b'{"TypeName": "head", "Body": {"Version": "002"}}',
+        b'{"Nested": {"TypeName": "inner"}}',
+        # an escaped key may be the TypeName or Version json.loads keeps
+        b'{"TypeName":"heartbeat.a","Version":"000","Type\\u004eame":"sim.ready"}',
+        b'{"TypeName":"heartbeat.a","MyHex":"a","\\u0056ersion":"000"}',
+        b'[{"TypeName": "a"}]',
+        b"not json",
+    ],
+)
+def test_ambiguous_layouts_are_not_guessed(body: bytes) -> None:
+    assert scan_type(body) is None
+
+
+@pytest.mark.parametrize("body", [b"not json", b"[]", b'{"Version": "000"}'])
+def test_peek_rejects_non_sema_bodies(body: bytes) -> None:
+    with pytest.raises(ValueError, match="Invalid JSON|Missing TypeName"):
+        peek_type(body)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        HB.to_bytes(),
+        READY.to_bytes(),
+        GW,
+        b'{"MyHex": "a", "MyHex": "b", "TypeName": "heartbeat.a", "Version": "000"}',
+        b'{"my_hex": "a", "TypeName": "heartbeat.a", "Version": "000"}',
+        b'{"MyHex": "a", "Extra": 1, "TypeName": "heartbeat.a", "Version": "000"}',
+        b'{"MyHex": "z", "TypeName": "heartbeat.a", "Version": "000"}',
+        b'{"MyHex": "a", "TypeName": "heartbeat.a", "Version": "999"}',
+        b'{"MyHex": "a", "TypeName": "heartbeat.a", "Version": "000"} trailing',
+        b'\xef\xbb\xbf{"MyHex": "a", "TypeName": "heartbeat.a", "Version": "000"}',
+    ],
+)
+def test_from_bytes_matches_parse_then_decode(body: bytes) -> None:
+    codec = GwBaseSemaCodec()
+
+    def outcome(fn: Any) -> Any:
+        try:
+            return fn()
+        except Exception as e:  # comparing failures too
+            return type(e), str(e)
+
+    def reference() -> Any:
+        try:
+            d = json.loads(body.decode("utf-8"))
+        except Exception as e:
+            raise ValueError(f"Invalid JSON: {e}") from e
+        return codec.from_dict(d)
+
+    assert outcome(lambda: codec.from_bytes(body)) == outcome(reference)
+
+
+@pytest.mark.parametrize("data", [HB.to_bytes().decode(), memoryview(b"{}"), None])
+def test_from_bytes_rejects_non_bytes_as_invalid_json(data: Any) -> None:
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        GwBaseSemaCodec().from_bytes(data)
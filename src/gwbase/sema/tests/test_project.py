@@ -0,0 +1,78 @@
+"""``project`` reads the members a full parse would give, and only those."""
+
+import json
+import uuid
+from typing import Any
+
+import pytest
+
+from gwbase.sema import project, project_many, types
+from gwbase.sema.wrapped import wrap_bytes
+
+READY = types.Ready(
+    from_g_node_alias="d1.isone.ltn",
+    from_g_node_instance_id=str(uuid.uuid4()),
+    time_unix_s=1_700_000_000,
+)
+GW = wrap_bytes(
+    src="d1.time",
+    dst="d1.isone.ltn",
+    inner_type_name=READY.type_name,
+    inner_payload_dict=READY.to_dict(),
+)
+FIELDS = [
+    "TypeName",
+    "Version",
+    "MessageId",
+    "FromGNodeAlias",
+    "TimeUnixS",
+    "Header.MessageId",
+    "Header.Src",
+    "Payload.TimeUnixS",
+]
+
+
+def _expected(body: bytes, field: str) -> Any:
+    value: Any = json.loads(body)
+    for key in field.split("."):
+        if value is None:
+            return None
+        value = value.get(key)
+    return value
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        READY.to_bytes(),
+        GW,
+        json.dumps(READY.to_dict(), indent=2).encode(),
+        b'{"TypeName": "a", "TypeName": "b", "Header": null}',
+        b'{"Header": {"Src": "x", "Src": "y"}, "Note": "}{\\"", "Deep": [[{}]]}',
+    ],
+)
+def test_project_agrees_with_a_full_parse(body: bytes) -> None:
+    assert project(body, FIELDS) == {f: _expected(body, f) for f in FIELDS}
+
+
+def test_project_many_returns_parallel_lists() -> None:
+    bodies = [READY.to_bytes(), GW]
+    got = project_many(bodies, ["TypeName", "Header.Src"])
+    assert got == {"TypeName": ["sim.ready", "gw"], "Header.Src": [None, "d1.time"]}
+    assert project_many([], ["TypeName"]) == {"TypeName": []}
+
+
+@pytest.mark.parametrize(
+    "body", [b"", b"[]", b'{"TypeName": "a"', b'{"Header": "d1.time"}']
+)
+def test_malformed_bodies_are_rejected(body: bytes) -> None:
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        project(body, ["Header.Src"])
+    with pytest.raises(ValueError, match="Body 1"):
+        project_many([GW, body], ["Header.Src"])
+
+
+@pytest.mark.parametrize("fields", [["Header", "Header.Src"], ["Header..Src"]])
+def test_conflicting_or_empty_fields_are_rejected(fields: list[str]) -> None:
+    with pytest.raises(ValueError):
+        project(GW, fields)
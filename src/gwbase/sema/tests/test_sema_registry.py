@@ -0,0 +1,160 @@
+from typing import Literal
+
+import pytest
+
+from gwbase.sema import (
+    GwBaseSemaCodec,
+    GwBaseSemaType,
+    SemaRegistry,
+    default_registry,
+    get_current_types,
+    register_types,
+)
+from gwbase.sema import registry as registry_module
+from gwbase.sema.types import HeartbeatA
+
+
+class AppReading(GwBaseSemaType):
+    watts: int
+    type_name: Literal["app.reading"] = "app.reading"
+    version: Literal["001"] = "001"
+
+
+class AppReading000(GwBaseSemaType):
+    kilowatts: int
+    type_name: Literal["app.reading"] = "app.reading"
+    version: Literal["000"] = "000"
+
+    def upgrade(self) -> GwBaseSemaType:
+        return AppReading(watts=self.kilowatts * 1000)
+
+
+class OtherHeartbeat(GwBaseSemaType):
+    type_name: Literal["heartbeat.a"] = "heartbeat.a"
+    version: Literal["100"] = "100"
+
+
+@pytest.fixture
+def restore_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """register_types mutates the process-wide snapshot; put it back."""
+    monkeypatch.setattr(registry_module, "_registry", default_registry())
+
+
+def test_default_registry_is_built_once_and_shared() -> None:
+    snapshot = default_registry()
+    assert default_registry() is snapshot
+    assert GwBaseSemaCodec().sema_registry is snapshot
+    assert GwBaseSemaCodec().registry == snapshot.current
+    assert snapshot.current["heartbeat.a"] is HeartbeatA
+    assert get_current_types() == dict(snapshot.current)
+
+
+def test_snapshot_is_immutable() -> None:
+    snapshot = default_registry()
+    with pytest.raises(TypeError):
+        snapshot.current["app.reading"] = AppReading  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        snapshot.current = {}  # type: ignore[misc]
+
+
+def test_register_types_reaches_existing_codecs(restore_registry: None) -> None:
+    codec = GwBaseSemaCodec()
+    before = default_registry()
+    with pytest.raises(ValueError, match="Unknown type app.reading"):
+        codec.from_dict(AppReading(watts=5).to_dict())
+
+    register_types(AppReading, old_versions=[AppReading000])
+
+    assert default_registry() is not before
+    assert "app.reading" not in before  # old snapshots are untouched
+    assert codec.from_dict(AppReading000(kilowatts=2).to_dict()) == AppReading(
+        watts=2000
+    )
+    register_types(AppReading)  # idempotent
+
+
+def test_register_types_rejects_conflicts(restore_registry: None) -> None:
+    with pytest.raises(ValueError, match="already registered as HeartbeatA"):
+        register_types(OtherHeartbeat)
+    with pytest.raises(ValueError, match="both current and an old version"):
+        register_types(AppReading, old_versions=[AppReading])
+    with pytest.raises(TypeError, match="not a GwBaseSemaType"):
+        register_types(dict)  # type: ignore[arg-type]
+    assert "app.reading" not in default_registry()
+
+
+def test_pinned_registry_is_private() -> None:
+    private = SemaRegistry.build([AppReading])
+    codec = GwBaseSemaCodec(registry=private)
+    assert codec.from_dict(AppReading(watts=1).to_dict()) == AppReading(watts=1)
+    with pytest.raises(ValueError, match="Unknown type heartbeat.a"):
+        codec.from_dict(HeartbeatA(my_hex="1").to_dict())
+    assert "app.reading" not in default_registry()
+
+
+def test_legacy_registry_writes_pin_the_codec() -> None:
+    """``codec.registry`` / ``codec.old_versions`` were plain dicts that
+    applications filled in; writing them still works, deprecated."""
+    codec = GwBaseSemaCodec()
+    with pytest.deprecated_call():
+        codec.registry["app.reading"] = AppReading
+    assert codec.from_dict(AppReading(watts=1).to_dict()) == AppReading(watts=1)
+    assert "app.reading" not in default_registry()
+
+    with pytest.deprecated_call():
+        codec.old_versions.update({"app.reading": {"000": AppReading000}})
+    assert codec.from_dict(AppReading000(kilowatts=2).to_dict()) == AppReading(
+        watts=2000
+    )
+
+    with pytest.deprecated_call():
+        codec.registry = {"app.reading": AppReading}
+    assert set(codec.registry) == {"app.reading"}
+    assert dict(codec.old_versions) == {"app.reading": {"000": AppReading000}}
+    with pytest.deprecated_call():
+        del codec.registry["app.reading"]
+        codec.old_versions = {}
+    assert len(codec.registry) == 0
+
+
+class Chain002(GwBaseSemaType):
+    watts: int
+    unit: str
+    type_name: Literal["app.chain"] = "app.chain"
+    version: Literal["002"] = "002"
+
+
+class Chain001(GwBaseSemaType):
+    watts: int
+    type_name: Literal["app.chain"] = "app.chain"
+    version: Literal["001"] = "001"
+
+    def upgrade(self) -> GwBaseSemaType:
+        return Chain002(watts=self.watts, unit="W")
+
+
+class Chain000(GwBaseSemaType):
+    kilowatts: int
+    type_name: Literal["app.chain"] = "app.chain"
+    version: Literal["000"] = "000"
+
+    def upgrade(self) -> GwBaseSemaType:
+        # skips 001
+        return Chain002(watts=self.kilowatts * 1000, unit="W")
+
+
+def test_upgrade_chains_are_precomputed() -> None:
+    registry = SemaRegistry.build(
+        [Chain002, AppReading], old_versions=[Chain001, Chain000, AppReading000]
+    )
+    assert dict(registry.upgrade_chains) == {
+        ("app.chain", "000"): (Chain001, Chain002),
+        ("app.chain", "001"): (Chain002,),
+        ("app.reading", "000"): (AppReading,),
+    }
+    assert registry.to_latest(Chain001(watts=5)) == Chain002(watts=5, unit="W")
+    # Chain000 skips a version: the chain hands over to to_latest.
+    assert registry.to_latest(Chain000(kilowatts=2)) == Chain002(watts=2000, unit="W")
+    assert GwBaseSemaCodec(registry=registry).from_dict(
+        Chain000(kilowatts=2).to_dict()
+    ) == Chain000(kilowatts=2).to_latest(registry.current)
@@ -0,0 +1,166 @@
+"""The compiled strict decode accepts exactly what the original two-walk
+path (``recursively_pascal`` + ``model_validate``) accepts."""
+
+import copy
+import json
+import uuid
+from collections.abc import Iterator
+from typing import Any, Literal
+
+import pytest
+from pydantic import ValidationError
+
+from gwbase.sema import GwBaseSemaCodec, GwBaseSemaError, GwBaseSemaType, types
+from gwbase.sema.base import pascal_to_snake, recursively_pascal
+from gwbase.sema.enums import BaseGNodeClass, GNodeStatus
+from gwbase.sema.wrapped import wrap_bytes
+
+MIN_MUTANTS = 10
+
+
+def _samples() -> list[GwBaseSemaType]:
+    timestep = types.SimTimestep(
+        from_g_node_alias="d1.time",
+        from_g_node_instance_id=str(uuid.uuid4()),
+        time_unix_s=1_700_000_000,
+        timestep_created_ms=1_700_000_000_000,
+        message_id=str(uuid.uuid4()),
+    )
+    gw = GwBaseSemaCodec().from_bytes(
+        wrap_bytes(
+            src="d1.time",
+            dst="d1.isone.ltn",
+            inner_type_name=timestep.type_name,
+            inner_payload_dict={**timestep.to_dict(), "Nested": {"InnerKey": [1]}},
+        )
+    )
+    assert isinstance(gw, GwBaseSemaType)
+    return [
+        types.HeartbeatA(my_hex="a", your_last_hex="3"),
+        types.GNodeGt(
+            g_node_id=str(uuid.uuid4()),
+            alias="d1.isone.ltn",
+            base_class=BaseGNodeClass.LeafTransactiveNode,
+            g_node_class="LeafTransactiveNode",
+            status=GNodeStatus.Active,
+            position_point_id=str(uuid.uuid4()),
+        ),
+        types.Ready(
+            from_g_node_alias="d1.isone.ltn",
+            from_g_node_instance_id=str(uuid.uuid4()),
+            time_unix_s=1_700_000_000,
+        ),
+        timestep,
+        types.GridworksHeader(
+            src="d1.a",
+            dst={"Node": "d1.b", "Hops": [{"Via": "d1.c"}]},
+            message_type="report.event",
+            message_id=str(uuid.uuid4()),
+            ack_required=False,
+        ),
+        gw,
+    ]
+
+
+def _paths(d: Any, prefix: tuple[Any, ...] = ()) -> Iterator[tuple[Any, ...]]:
+    """Every dict reachable in ``d`` (through dicts and lists)."""
+    if isinstance(d, dict):
+        yield prefix
+        for key, value in d.items():
+            yield from _paths(value, (*prefix, key))
+    elif isinstance(d, list):
+        for i, item in enumerate(d):
+            yield from _paths(item, (*prefix, i))
+
+
+def _at(d: Any, path: tuple[Any, ...]) -> Any:
+    for step in path:
+        d = d[step]
+    return d
+
+
+def _mutants(d: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield d
+    for path in _paths(d):
+        target = _at(d, path)
+        for key in list(target):
+            for new_key in (key[0].lower() + key[1:], f"{key}_x", f"_{key}"):
+                m = copy.deepcopy(d)
+                t = _at(m, path)
+                t[new_key] = t.pop(key)
+                yield m
+            m = copy.deepcopy(d)  # the field name next to its alias
+            t = _at(m, path)
+            t[pascal_to_snake(key)] = t[key]
+            yield m
+        for extra in ("Extra", "extra", "_extra", "1extra"):
+            m = copy.deepcopy(d)
+            _at(m, path)[extra] = 1
+            yield m
+
+
+def _reference(cls: type[GwBaseSemaType], d: dict[str, Any]) -> GwBaseSemaType | None:
+    """The pre-compiled semantics: full PascalCase walk, then validate."""
+    if not recursively_pascal(d):
+        return None
+    try:
+        return cls.model_validate(d)
+    except ValidationError:
+        return None
+
+
+@pytest.mark.parametrize("sample", _samples(), ids=lambda s: s.type_name)
+def test_compiled_decode_matches_reference(sample: GwBaseSemaType) -> None:
+    cls = type(sample)
+    assert cls.compiled_from_dict(sample.to_dict()) == sample
+    mutants = list(_mutants(sample.to_dict()))
+    assert len(mutants) > MIN_MUTANTS
+    for d in mutants:
+        assert cls.compiled_from_dict(d) == _reference(cls, d), d
+
+
+@pytest.mark.parametrize("sample", _samples(), ids=lambda s: s.type_name)
+def test_json_decode_matches_dict_decode(sample: GwBaseSemaType) -> None:
+    cls = type(sample)
+    for d in _mutants(sample.to_dict()):
+        expected = cls.compiled_from_dict(d) if cls.validates_from_json() else None
+        assert cls.compiled_from_json(json.dumps(d).encode()) == expected, d
+
+
+def test_codec_errors_are_unchanged() -> None:
+    codec = GwBaseSemaCodec()
+    hb = types.HeartbeatA(my_hex="a").to_dict()
+    with pytest.raises(ValueError, match="Input must be PascalCase"):
+        codec.from_dict({**hb, "my_hex": "b"})
+    with pytest.raises(GwBaseSemaError, match="Validation failed"):
+        codec.from_dict({**hb, "Extra": 1})
+    with pytest.raises(GwBaseSemaError, match="must be recursively PascalCase"):
+        types.HeartbeatA.from_dict({"type_name": "heartbeat.a", "MyHex": "a"})
+
+
+def test_free_form_subtrees_are_still_walked() -> None:
+    header = types.GridworksHeader(
+        src="d1.a",
+        dst={"Node": "d1.b"},
+        message_type="report.event",
+        message_id=str(uuid.uuid4()),
+        ack_required=False,
+    ).to_dict()
+    header["Dst"] = {"node": "d1.b"}  # Dst is Any: validation can't see it
+    assert types.GridworksHeader.compiled_from_dict(header) is None
+    with pytest.raises(ValueError, match="PascalCase"):
+        GwBaseSemaCodec().from_dict(header)
+
+
+class _OddAlias(GwBaseSemaType):
+    odd: int
+    type_name: Literal["odd.alias"] = "odd.alias"
+
+    model_config = {**GwBaseSemaType.model_config, "alias_generator": None}
+
+
+def test_non_pascal_aliases_use_the_slow_path() -> None:
+    valid = {"type_name": "odd.alias", "odd": 1}
+    assert _OddAlias.compiled_from_dict(valid) is None  # not compiled
+    with pytest.raises(GwBaseSemaError, match="must be recursively PascalCase"):
+        _OddAlias.from_dict(valid)
@@ -0,0 +1,158 @@
+"""Trusted-peer validation policy: skipped messages build the same object
+validation would, shape mismatches and untrusted decodes still validate,
+and sampled failures are counted and reported."""
+
+import uuid
+from typing import Any
+
+import pytest
+
+from gwbase.sema import (
+    GwBaseSemaCodec,
+    GwBaseSemaError,
+    GwBaseSemaType,
+    ValidationPolicy,
+    ValidationRule,
+    types,
+)
+from gwbase.sema.enums import BaseGNodeClass, GNodeStatus
+from gwbase.sema.types.gw import Payload
+from gwbase.sema.validation import SampleFailure
+
+PEER = "d1.isone.ltn.telemetry"
+SAMPLE_EVERY = 4
+N_MESSAGES = 12
+
+HB = types.HeartbeatA(my_hex="a", your_last_hex="3")
+G_NODE = types.GNodeGt(
+    g_node_id=str(uuid.uuid4()),
+    alias="d1.isone.ltn",
+    base_class=BaseGNodeClass.Logical,
+    g_node_class="app.meter.group",
+    status=GNodeStatus.Active,
+    display_name="Lt North",
+)
+TIMESTEP = types.SimTimestep(
+    from_g_node_alias="d1.time",
+    from_g_node_instance_id=str(uuid.uuid4()),
+    time_unix_s=1_700_000_000,
+    timestep_created_ms=1_700_000_000_000,
+    message_id=str(uuid.uuid4()),
+)
+
+
+def _codec(rule: ValidationRule, **kwargs: Any) -> GwBaseSemaCodec:
+    return GwBaseSemaCodec(validation=ValidationPolicy({("*", PEER): rule}, **kwargs))
+
+
+@pytest.mark.parametrize("msg", [HB, G_NODE, TIMESTEP])
+def test_trusted_construct_matches_validation(msg: GwBaseSemaType) -> None:
+    built = type(msg).trusted_from_dict(msg.to_dict())
+    validated = type(msg).from_dict(msg.to_dict())
+    assert built == validated
+    assert built is not None
+    assert built.to_bytes() == validated.to_bytes()
+    assert built.model_fields_set == validated.model_fields_set
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"Surprise": 1},  # unknown key
+        {"Alias": None},  # None where not allowed
+        {"Alias": 5},  # wrong scalar
+        {"DisplayName": 7},  # wrong scalar
+        {"Version": "003"},  # wrong Literal
+    ],
+)
+def test_shape_mismatch_is_not_built(change: dict[str, Any]) -> None:
+    assert types.GNodeGt.trusted_from_dict({**G_NODE.to_dict(), **change}) is None
+    d = G_NODE.to_dict()
+    del d["GNodeId"]  # missing required key
+    assert types.GNodeGt.trusted_from_dict(d) is None
+
+
+@pytest.mark.parametrize("value", [True, False, 1.7e9, "1700000000"])
+def test_an_int_field_takes_only_an_int(value: Any) -> None:
+    d = {**TIMESTEP.to_dict(), "TimeUnixS": value}
+    assert types.SimTimestep.trusted_from_dict(d) is None
+    codec = _codec(ValidationRule("never"))
+    with pytest.raises(GwBaseSemaError):
+        codec.from_dict(d, from_alias=PEER)
+
+
+def test_never_skips_validation_for_the_trusted_sender() -> None:
+    codec = _codec(ValidationRule("never"))
+    # axiom 1 fails; only validation notices
+    bad = {**G_NODE.to_dict(), "GNodeClass": BaseGNodeClass.MarketMaker.value}
+    assert codec.from_dict(bad, from_alias=PEER).g_node_class == "MarketMaker"  # type: ignore[union-attr]
+    with pytest.raises(GwBaseSemaError, match="Axiom 1"):
+        codec.from_dict(bad, from_alias="someone.else")
+    with pytest.raises(GwBaseSemaError, match="Axiom 1"):
+        codec.from_dict(bad)
+    assert codec.validation is not None
+    assert codec.validation.metrics()["Skipped"] == 1
+
+
+def test_skipped_bytes_decode_like_validated_ones() -> None:
+    codec = _codec(ValidationRule("never"))
+    for msg in [HB, G_NODE, TIMESTEP]:
+        assert codec.from_bytes(msg.to_bytes(), from_alias=PEER) == msg
+
+
+def test_shape_mismatch_falls_back_to_validation() -> None:
+    codec = _codec(ValidationRule("never"))
+    with pytest.raises(GwBaseSemaError, match="Surprise"):
+        codec.from_dict({**HB.to_dict(), "Surprise": 1}, from_alias=PEER)
+    assert codec.validation is not None
+    assert codec.validation.metrics()["Validated"] == 1
+
+
+def test_sampled_validates_one_in_n() -> None:
+    codec = _codec(ValidationRule("sampled", every=SAMPLE_EVERY))
+    for _ in range(N_MESSAGES):
+        codec.from_bytes(HB.to_bytes(), from_alias=PEER)
+    assert codec.validation is not None
+    metrics = codec.validation.metrics()
+    assert metrics["Sampled"] == N_MESSAGES // SAMPLE_EVERY
+    assert metrics["Skipped"] == N_MESSAGES - N_MESSAGES // SAMPLE_EVERY
+
+
+def test_sampled_failure_is_reported_and_raised() -> None:
+    failures: list[SampleFailure] = []
+    codec = _codec(
+        ValidationRule("sampled", every=SAMPLE_EVERY),
+        on_sample_failure=failures.append,
+    )
+    bad = {**G_NODE.to_dict(), "GNodeClass": BaseGNodeClass.MarketMaker.value}
+    with pytest.raises(GwBaseSemaError, match="Axiom 1"):
+        codec.from_dict(bad, from_alias=PEER)  # the first one is sampled
+    codec.from_dict(bad, from_alias=PEER)  # skipped
+    assert [(f.type_name, f.from_alias) for f in failures] == [("g.node.gt", PEER)]
+    assert codec.validation is not None
+    assert codec.validation.metrics()["SampleFailures"] == 1
+
+
+def test_most_specific_rule_wins() -> None:
+    policy = ValidationPolicy({
+        ("*", PEER): ValidationRule("never"),
+        ("g.node.gt", PEER): ValidationRule("always"),
+    })
+    assert policy.verdict("heartbeat.a", PEER) == "skip"
+    assert policy.verdict("g.node.gt", PEER) == "validate"
+    assert policy.verdict("heartbeat.a", "someone.else") == "validate"
+    with pytest.raises(ValueError, match="every"):
+        ValidationRule("sampled", every=0)
+
+
+def test_free_form_types_are_not_constructible() -> None:
+    header = types.GridworksHeader(
+        src="d1.a",
+        dst={"Node": "d1.b"},
+        message_type="heartbeat.a",
+        message_id=str(uuid.uuid4()),
+        ack_required=False,
+    )
+    gw = types.Gw(header=header, payload=Payload.model_validate(HB.to_dict()))
+    assert types.GridworksHeader.trusted_from_dict(header.to_dict()) == header
+    assert types.Gw.trusted_from_dict(gw.to_dict()) is None
@@ -13,11 +13,27 @@ Wire form::
         "Header":   { GridworksHeader fields },
         "Payload":  { "TypeName": "<inner>", ... }
     }
+
+``wrap_encoded`` builds the same envelope around payload bytes that are
+already encoded (``obj.to_bytes()``, or a payload from ``unwrap_view``),
+splicing them in instead of re-serializing them.
+
+``unwrap_bytes`` decodes all of it. ``unwrap_view`` decodes only the
+``Header`` and hands the ``Payload`` back as a ``memoryview`` of the body,
+for a bridge that forwards it unchanged or a codec that validates it
+straight from JSON.
 """
 
+import functools
 import json
+import re
 import uuid
+from typing import Any
 
+from pydantic import BaseModel, ConfigDict, Field
+
+from gwbase.sema import json_backend
+from gwbase.sema.peek import peek_type
 from gwbase.sema.property_format import LeftRightDot, UUID4Str
 from gwbase.sema.types.gridworks_header import GridworksHeader
 
@@ -59,11 +75,65 @@ def wrap_bytes(  # noqa: PLR0913 — keyword-only envelope builder
     return json.dumps(envelope).encode()
 
 
+def wrap_encoded(  # noqa: PLR0913 — keyword-only envelope builder
+    *,
+    src: LeftRightDot,
+    dst: LeftRightDot,
+    inner_type_name: str,
+    inner_bytes: bytes | memoryview,
+    message_id: UUID4Str | None = None,
+    ack_required: bool = False,
+) -> bytes:
+    """``wrap_bytes`` for a payload that is already JSON: ``inner_bytes``
+    is spliced into the envelope as is, and must be a JSON object whose
+    ``TypeName`` is ``inner_type_name``. Only that ``TypeName`` is read.
+
+    The header is encoded once per ``(src, dst, inner_type_name,
+    ack_required)`` and cached; each call fills in the message id. Given
+    ``json.dumps(d).encode()``, the result is byte-for-byte what
+    ``wrap_bytes`` returns for ``d``."""
+    inner = bytes(inner_bytes) if isinstance(inner_bytes, memoryview) else inner_bytes
+    got = peek_type(inner)[0]
+    if got != inner_type_name:
+        raise ValueError(
+            f"inner_bytes TypeName {got!r} does not match inner_type_name "
+            f"{inner_type_name!r}"
+        )
+    before_id, after_id = _header_template(src, dst, inner_type_name, ack_required)
+    quoted_id = (
+        json.dumps(message_id).encode()
+        if message_id
+        else b'"%s"' % str(uuid.uuid4()).encode()
+    )
+    return b"".join((before_id, quoted_id, after_id, inner, b"}"))
+
+
+_TEMPLATE_ID = str(uuid.UUID(int=0, version=4))
+
+
+@functools.lru_cache(maxsize=1024)
+def _header_template(
+    src: str, dst: str, inner_type_name: str, ack_required: bool
+) -> tuple[bytes, bytes]:
+    """The envelope up to the quoted message id, and from it to the
+    payload: ``wrap_bytes``'s own encoding, split at a placeholder id."""
+    header = GridworksHeader(
+        src=src,
+        dst=dst,
+        message_type=inner_type_name,
+        message_id=_TEMPLATE_ID,
+        ack_required=ack_required,
+    )
+    envelope = json.dumps({"TypeName": "gw", "Header": header.to_dict(), "Payload": 0})
+    before_id, after_id = envelope.encode().split(b'"%s"' % _TEMPLATE_ID.encode())
+    return before_id, after_id.removesuffix(b"0}")
+
+
 def unwrap_bytes(body: bytes) -> tuple[GridworksHeader, dict]:
     """Parse a ``gw`` envelope. Returns ``(header, inner_payload_dict)`` and
     asserts ``header.message_type == payload['TypeName']``."""
     try:
-        d = json.loads(body)
+        d = json_backend.loads(body)
     except Exception as e:
         raise ValueError(f"Invalid JSON: {e}") from e
     if not isinstance(d, dict):
@@ -83,3 +153,183 @@ def unwrap_bytes(body: bytes) -> tuple[GridworksHeader, dict]:
             f"payload TypeName {inner_type!r}"
         )
     return header, payload
+
+
+def unwrap_view(body: bytes) -> tuple[GridworksHeader, memoryview]:
+    """``unwrap_bytes`` without decoding the payload: returns ``(header,
+    payload)`` where ``payload`` is the inner object's bytes, a zero-copy
+    slice of ``body`` (``bytes(payload)`` to keep it past ``body``).
+
+    The envelope is checked as ``unwrap_bytes`` checks it (a ``gw`` object
+    with a valid ``Header`` and an object ``Payload`` whose ``TypeName`` is
+    ``Header.MessageType``), and a repeated key counts once, last wins, as
+    in ``json.loads``. The payload's JSON is checked by pydantic-core, but
+    only its ``TypeName`` becomes a Python object.
+
+    A body the scan rejects goes to ``unwrap_bytes``, so this accepts
+    exactly the bodies it accepts. The JSON backend may take what the
+    scan does not (with ``stdlib``: ``NaN``, a lone surrogate escape, a
+    leading BOM). For such a body the payload is re-encoded with
+    ``json.dumps``, not sliced."""
+    try:
+        found = _canonical_layout(body) or _scanned_layout(body)
+    except ValueError:
+        header, payload = unwrap_bytes(body)  # raises unless only the scan balked
+        return header, memoryview(json.dumps(payload).encode())
+    header_dict, inner_type, start, end = found
+    header = GridworksHeader.from_dict(header_dict)
+    if header.message_type != inner_type:
+        raise ValueError(
+            f"gw header.message_type {header.message_type!r} does not match "
+            f"payload TypeName {inner_type!r}"
+        )
+    return header, memoryview(body)[start:end]
+
+
+# ----------------------------------------------------------------------------
+# Envelope layout: the Header as a dict, the payload TypeName, and where the
+# payload starts and ends. wrap_bytes (and most writers) emit TypeName,
+# Header, Payload in that order, so that layout is guessed with bytes.find
+# and confirmed by pydantic-core, which parses the payload slice in Rust and
+# keeps only its TypeName. Anything else is scanned member by member with C
+# regex matches between brackets; the brackets only find where a member
+# ends, so every key and every member not parsed for the layout is parsed
+# once to check it.
+# ----------------------------------------------------------------------------
+
+_Layout = tuple[Any, Any, int, int]
+_PARSED_MEMBERS = frozenset({"Header", "Payload"})  # by _scanned_layout
+
+_OPEN_OBJECT, _CLOSE_OBJECT, _COMMA = b"{},"
+_CLOSERS = {ord("{"): ord("}"), ord("["): ord("]")}
+_WS_BYTES = b" \t\r\n"
+_STRING = rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"'  # unrolled: no per-char alternation
+_WS = re.compile(rb"[ \t\r\n]*+")
+_KEY = re.compile(rb"(" + _STRING + rb")[ \t\r\n]*+:[ \t\r\n]*+", re.DOTALL)
+_SCALAR = re.compile(_STRING + rb"|-?[0-9][0-9.eE+-]*+|true|false|null", re.DOTALL)
+_TO_BRACKET = re.compile(rb'[^"{}\[\]]*+(?:' + _STRING + rb'[^"{}\[\]]*+)*+', re.DOTALL)
+_CANONICAL_HEAD = re.compile(
+    rb'[ \t\r\n]*+\{[ \t\r\n]*+"TypeName"[ \t\r\n]*+:[ \t\r\n]*+"gw"'
+    rb'[ \t\r\n]*+,[ \t\r\n]*+"Header"[ \t\r\n]*+:'
+)
+_CANONICAL_PAYLOAD_KEY = re.compile(
+    rb',[ \t\r\n]*+"Payload"[ \t\r\n]*+:[ \t\r\n]*+(?=\{)'
+)
+
+
+class _PayloadTypeName(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    type_name: Any = Field(None, alias="TypeName")
+
+
+def _payload_type_name(payload: bytes) -> Any:
+    """The payload's ``TypeName`` (None if absent), checking that
+    ``payload`` is exactly one JSON object. Only the ``TypeName`` value
+    becomes a Python object."""
+    return _PayloadTypeName.model_validate_json(payload).type_name
+
+
+def _canonical_layout(body: bytes) -> _Layout | None:
+    """The layout of ``{"TypeName": "gw", "Header": H, "Payload": P}``, or
+    None. Sound however the split points are guessed: H and P each parse as
+    exactly one JSON value, so the body can only be that object."""
+    head = _CANONICAL_HEAD.match(body)
+    if head is None:
+        return None
+    header_start = head.end()
+    key = body.find(b'"Payload"', header_start)
+    header_end = body.rfind(b",", header_start, key)
+    if key == -1 or header_end == -1:
+        return None
+    payload = _CANONICAL_PAYLOAD_KEY.match(body, header_end)
+    end = len(body)
+    while end and body[end - 1] in _WS_BYTES:
+        end -= 1
+    if payload is None or not end or body[end - 1] != _CLOSE_OBJECT:
+        return None
+    end -= 1
+    while body[end - 1] in _WS_BYTES:
+        end -= 1
+    try:
+        header_dict = json_backend.loads(body[header_start:header_end])
+        inner_type = _payload_type_name(body[payload.end() : end])
+    except ValueError:  # includes pydantic's ValidationError
+        return None
+    return header_dict, inner_type, payload.end(), end
+
+
+def _scanned_layout(body: bytes) -> _Layout:
+    try:
+        members = _top_level_members(body)
+    except (IndexError, ValueError) as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
+    type_name = members.get("TypeName")
+    if type_name is None or body[type_name[0] : type_name[1]] != b'"gw"':
+        got = json_backend.loads(body[slice(*type_name)]) if type_name else None
+        if got != "gw":
+            raise ValueError(f"Expected TypeName 'gw', got {got!r}")
+    if "Header" not in members or "Payload" not in members:
+        raise ValueError("gw body missing Header or Payload")
+    start, end = members["Payload"]
+    if body[start] != _OPEN_OBJECT:
+        raise ValueError("gw Payload must be a JSON object")
+    try:
+        header_dict = json_backend.loads(body[slice(*members["Header"])])
+        inner_type = _payload_type_name(body[start:end])
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
+    return header_dict, inner_type, start, end
+
+
+def _skip_ws(body: bytes, pos: int) -> int:
+    return _WS.match(body, pos).end()  # type: ignore[union-attr] # matches ""
+
+
+def _top_level_members(body: bytes) -> dict[str, tuple[int, int]]:
+    pos = _skip_ws(body, 0)
+    if body[pos] != _OPEN_OBJECT:
+        raise ValueError("not an object")
+    members: dict[str, tuple[int, int]] = {}
+    pos = _skip_ws(body, pos + 1)
+    while body[pos] != _CLOSE_OBJECT:
+        m = _KEY.match(body, pos)
+        if m is None:
+            raise ValueError(f"expected a key at {pos}")
+        name = json_backend.loads(m.group(1))
+        start, end = m.end(), _skip_value(body, m.end())
+        if name not in _PARSED_MEMBERS:
+            json_backend.loads(body[start:end])
+        elif name in members:  # repeated: only the last one is parsed
+            json_backend.loads(body[slice(*members[name])])
+        members[name] = (start, end)
+        pos = _skip_ws(body, end)
+        if body[pos] == _COMMA:
+            pos = _skip_ws(body, pos + 1)
+            if body[pos] == _CLOSE_OBJECT:
+                raise ValueError(f"trailing ',' at {pos}")
+        elif body[pos] != _CLOSE_OBJECT:
+            raise ValueError(f"expected ',' or '}}' at {pos}")
+    if _skip_ws(body, pos + 1) != len(body):
+        raise ValueError(f"extra data at {pos + 1}")
+    return members
+
+
+def _skip_value(body: bytes, pos: int) -> int:
+    """End of the JSON value at ``pos``: a scalar, or a bracket-balanced
+    object or array (strings skipped whole)."""
+    closer = _CLOSERS.get(body[pos])
+    if closer is None:
+        m = _SCALAR.match(body, pos)
+        if m is None:
+            raise ValueError(f"expected a value at {pos}")
+        return m.end()
+    expected = [closer]
+    while expected:
+        pos = _TO_BRACKET.match(body, pos + 1).end()  # type: ignore[union-attr]
+        c = body[pos]
+        if c in _CLOSERS:
+            expected.append(_CLOSERS[c])
+        elif c != expected.pop():
+            raise ValueError(f"unbalanced {chr(c)!r} at {pos}")
+    return pos + 1
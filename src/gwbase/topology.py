@@ -68,11 +68,12 @@ def publish_exchange(rc: RoutingClass) -> str:
 
 
 def direct_binding_key(src: RoutingClass, dst: RoutingClass) -> str:
-    """Topic pattern matching JsonDirect keys from class ``src`` to ``dst``.
+    """Topic pattern matching JsonDirect (and Serial) keys from class ``src``
+    to ``dst``.
 
     JsonDirect grammar is ``rj.<from>.<from-class>.<type>.<to-class>.<to-alias>``
-    (6 tokens); this filters on the from-class and to-class positions and
-    wildcards the rest.
+    (6 tokens; Serial is the same with ``s``); this filters on the from-class
+    and to-class positions and wildcards the rest.
     """
     return f"*.*.{src.value}.*.{dst.value}.*"
 
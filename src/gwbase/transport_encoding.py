@@ -1,9 +1,11 @@
 import re
 from dataclasses import dataclass
 from enum import StrEnum
+from typing import Self
 
 # Routing-key token counts per envelope grammar (see executor/transport.md).
 _DIRECT_TOKEN_COUNT = 6
+_SERIAL_TOKEN_COUNT = 6
 _BROADCAST_MIN_TOKEN_COUNT = 4
 _WRAPPED_TOKEN_COUNT = 5
 
@@ -105,13 +107,15 @@ class MessageCategory(StrEnum):
       arrives even when the class token is an unrecognized short form.
     - ``JsonDirect`` (``rj``): point-to-point; class tokens are hints the
       cross-class fabric binds on, but dispatch keys on type + from-alias.
-    - ``Serial`` (``s``): reserved.
+    - ``Serial`` (``s``): point-to-point like ``rj``, with the same key
+      grammar, but the body is the compact binary form of its Sema type
+      (``gwbase.sema.binary``) rather than JSON.
     """
 
     JsonDirect = "rj"
     JsonBroadcast = "rjb"
     GridworksWrapped = "gw"
-    Serial = "s"  # reserved
+    Serial = "s"
 
 
 class PayloadEncoding(StrEnum):
@@ -144,6 +148,10 @@ class RoutingEnvelope:
     def routing_key(self) -> str:
         raise NotImplementedError
 
+    @property
+    def payload_encoding(self) -> PayloadEncoding:
+        return PayloadEncoding.Json
+
 
 @dataclass(frozen=True)
 class DirectRoutingEnvelope(RoutingEnvelope):
@@ -163,7 +171,7 @@ class DirectRoutingEnvelope(RoutingEnvelope):
         from_class: TransportClass,
         to_class: TransportClass,
         to_alias: str,
-    ) -> "DirectRoutingEnvelope":
+    ) -> Self:
         """Build-side constructor: emit long-form class tokens from typed classes."""
         return cls(
             type_name=type_name,
@@ -196,6 +204,30 @@ class DirectRoutingEnvelope(RoutingEnvelope):
         )
 
 
+@dataclass(frozen=True)
+class SerialRoutingEnvelope(DirectRoutingEnvelope):
+    """Routing for an ``s`` (Serial) message: addressed like a JsonDirect
+    one, with a binary body (``GwBaseSemaCodec.to_binary``)."""
+
+    @property
+    def category(self) -> MessageCategory:
+        return MessageCategory.Serial
+
+    @property
+    def payload_encoding(self) -> PayloadEncoding:
+        return PayloadEncoding.Binary
+
+    @property
+    def routing_key(self) -> str:
+        return serial_routing_key(
+            from_alias=self.from_alias,
+            from_class_token=self.from_class_token,
+            type_name=self.type_name,
+            to_class_token=self.to_class_token,
+            to_alias=self.to_alias,
+        )
+
+
 @dataclass(frozen=True)
 class BroadcastRoutingEnvelope(RoutingEnvelope):
     # ``from_class_token`` is the raw wire token; ``from_class`` is the derived
@@ -337,6 +369,20 @@ def _parse_json_direct_envelope(
     )
 
 
+def _parse_serial_envelope(
+    tokens: list[str], routing_key: str
+) -> SerialRoutingEnvelope:
+    if len(tokens) != _SERIAL_TOKEN_COUNT:
+        raise ValueError(f"Expect Serial messages to have 6 words! {routing_key}")
+    return SerialRoutingEnvelope(
+        from_alias=_parse_alias_token(tokens[1], routing_key, "FromAlias"),
+        from_class_token=tokens[2],
+        type_name=_parse_alias_token(tokens[3], routing_key, "TypeName"),
+        to_class_token=tokens[4],
+        to_alias=_parse_alias_token(tokens[5], routing_key, "ToAlias"),
+    )
+
+
 def _parse_json_broadcast_envelope(
     tokens: list[str], routing_key: str
 ) -> BroadcastRoutingEnvelope:
@@ -387,6 +433,8 @@ def parse_routing_key(routing_key: str) -> RoutingEnvelope:
         return _parse_json_broadcast_envelope(tokens, routing_key)
     if category == MessageCategory.GridworksWrapped:
         return _parse_scada_wrapped_envelope(tokens, routing_key)
+    if category == MessageCategory.Serial:
+        return _parse_serial_envelope(tokens, routing_key)
     raise ValueError(f"Rabbit messages do not handle {category.value}")
 
 
@@ -417,6 +465,24 @@ def json_direct_routing_key(
     ])
 
 
+def serial_routing_key(
+    *,
+    from_alias: str,
+    from_class_token: str,
+    type_name: str,
+    to_class_token: str,
+    to_alias: str,
+) -> str:
+    return ".".join([
+        MessageCategory.Serial.value,
+        from_alias.replace(".", "-"),
+        from_class_token,
+        type_name.replace(".", "-"),
+        to_class_token,
+        to_alias.replace(".", "-"),
+    ])
+
+
 def json_broadcast_routing_key(
     *,
     from_alias: str,
@@ -7,47 +7,31 @@ the sema codec. The architectural commitment (see
 strict separation between transport and codec: the transport layer is
 sema-shape-aware but does not depend on ``gwbase.sema``.
 
-``gwbase.sema.property_format`` is the authority on these formats; the
-patterns here mirror it verbatim. Keep the two in sync — the same convention
-already governs ``LRH_ALIAS_PATTERN`` in ``transport_encoding.py``.
+The checks themselves live in ``gwbase._format_checks``, shared with
+``gwbase.sema.property_format`` (the authority on these formats), so the two
+cannot drift. ``LRH_ALIAS_PATTERN`` in ``transport_encoding.py`` still
+mirrors ``LEFT_RIGHT_DOT_PATTERN`` by hand.
 """
 
-import re
-import uuid
 from typing import Annotated
 
 from pydantic import BeforeValidator
 
-# Mirrors gwbase.sema.property_format (the authority). Keep in sync.
-LEFT_RIGHT_DOT_PATTERN = re.compile(r"^[a-z][a-z0-9]*(\.[a-z0-9]+)*$")
-UUID4_STR_PATTERN = re.compile(
-    r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$"
+from gwbase._format_checks import (
+    LEFT_RIGHT_DOT_PATTERN,
+    UUID4_STR_PATTERN,
+    is_left_right_dot,
+    is_uuid4_str,
 )
 
-
-def is_left_right_dot(v: str) -> str:
-    if not isinstance(v, str):
-        raise ValueError(f"<{v}>: LeftRightDot must be a string.")
-    if not LEFT_RIGHT_DOT_PATTERN.fullmatch(v):
-        raise ValueError(f"<{v}>: Fails LeftRightDot format.")
-    return v
-
-
-def is_uuid4_str(v: str) -> str:
-    if not isinstance(v, str):
-        raise ValueError(f"<{v}>: uuid4.str must be a string.")
-    if not UUID4_STR_PATTERN.fullmatch(v):
-        raise ValueError(f"<{v}>: Fails uuid4.str format.")
-    try:
-        u = uuid.UUID(v)
-    except Exception as e:
-        raise ValueError(f"Invalid UUID4: {v}  <{e}>") from e
-    if u.version != 4:  # noqa: PLR2004 — UUID version 4
-        raise ValueError(
-            f"{v} is valid uid, but of version {u.version}. Fails UuidCanonicalTextual"
-        )
-    return str(u)
-
+__all__ = [
+    "LEFT_RIGHT_DOT_PATTERN",
+    "UUID4_STR_PATTERN",
+    "LeftRightDot",
+    "UUID4Str",
+    "is_left_right_dot",
+    "is_uuid4_str",
+]
 
 LeftRightDot = Annotated[str, BeforeValidator(is_left_right_dot)]
 UUID4Str = Annotated[str, BeforeValidator(is_uuid4_str)]
@@ -1,5 +1,6 @@
 """Stub actors used to exercise ActorBase / Orchestrator / GridworksActor
-against a live rabbit broker.
+against a live rabbit broker or the in-process ``LoopbackBroker`` (pass its
+``connect`` as ``connection_factory``).
 
 Note the tier split: the GNode under test (``GNodeStubRecorder``) is a
 ``GridworksActor`` (real GNode identity, g.node.gt.json), while Supervisor and
@@ -10,8 +11,10 @@ TimeCoordinator — which are NOT GNodes — are ``Orchestrator`` stubs that rid
 import pika
 
 from gwbase import topology
+from gwbase.actor_base import ConnectionFactory
 from gwbase.config import GNodeSettings, ServiceSettings
 from gwbase.gridworks_actor import GridworksActor
+from gwbase.loopback import LoopbackBroker
 from gwbase.orchestrator import Orchestrator
 from gwbase.sema import GwBaseSemaCodec
 from gwbase.sema.types import HeartbeatA, Ready
@@ -97,12 +100,14 @@ class GNodeStubRecorder(_RecorderMixin, GridworksActor):
         transport_class: TransportClass,
         my_super_alias: str,
         my_time_coordinator_alias: str,
+        connection_factory: ConnectionFactory | None = None,
     ):
         super().__init__(
             settings=settings,
             transport_class=transport_class,
             my_super_alias=my_super_alias,
             my_time_coordinator_alias=my_time_coordinator_alias,
+            connection_factory=connection_factory,
         )
         self._init_recorder()
 
@@ -118,12 +123,14 @@ class OrchestratorStubRecorder(_RecorderMixin, Orchestrator):
         transport_class: TransportClass,
         my_super_alias: str,
         my_time_coordinator_alias: str,
+        connection_factory: ConnectionFactory | None = None,
     ):
         super().__init__(
             settings=settings,
             transport_class=transport_class,
             my_super_alias=my_super_alias,
             my_time_coordinator_alias=my_time_coordinator_alias,
+            connection_factory=connection_factory,
         )
         self._init_recorder()
 
@@ -140,12 +147,14 @@ class SupervisorStubRecorder(OrchestratorStubRecorder):
         my_super_alias: str,
         my_time_coordinator_alias: str,
         subordinate_alias: str,
+        connection_factory: ConnectionFactory | None = None,
     ):
         super().__init__(
             settings=settings,
             transport_class=transport_class,
             my_super_alias=my_super_alias,
             my_time_coordinator_alias=my_time_coordinator_alias,
+            connection_factory=connection_factory,
         )
         self.my_single_sub: str = subordinate_alias
         self.got_heartbeat_from_sub: bool = False
@@ -171,12 +180,14 @@ class TimeCoordinatorStubRecorder(OrchestratorStubRecorder):
         my_time_coordinator_alias: str,
         current_time_unix_s: int,
         my_actor_aliases: list[str],
+        connection_factory: ConnectionFactory | None = None,
     ):
         super().__init__(
             settings=settings,
             transport_class=transport_class,
             my_super_alias=my_super_alias,
             my_time_coordinator_alias=my_time_coordinator_alias,
+            connection_factory=connection_factory,
         )
         self.my_actors: list[str] = my_actor_aliases
         self.ready: list[str] = []
@@ -199,3 +210,9 @@ class TimeCoordinatorStubRecorder(OrchestratorStubRecorder):
 
     def is_ready(self) -> bool:
         return set(self.ready) == set(self.my_actors)
+
+
+def loopback_connection_factory() -> ConnectionFactory:
+    """A fresh provisioned ``LoopbackBroker`` for this process. ``Fleet``
+    workers resolve this by name, so each worker gets its own broker."""
+    return LoopbackBroker.provisioned().connect
@@ -9,6 +9,7 @@ import pytest
 
 from gwbase.config import GNodeSettings, ServiceSettings
 from gwbase.config.rabbit_settings import RabbitBrokerClient
+from gwbase.loopback import LoopbackBroker
 
 # GNodeClass values that ARE base.g.node.class members → Physical GNodes
 # (BaseClass == GNodeClass, PositionPointId required per Axiom 1a/2).
@@ -107,3 +108,11 @@ def make_service_settings() -> Callable[..., ServiceSettings]:
         )
 
     return _build
+
+
+@pytest.fixture
+def loopback_broker() -> LoopbackBroker:
+    """An in-process broker with the full gwbase topology provisioned. Pass
+    ``loopback_broker.connect`` as an actor's ``connection_factory`` to run
+    it with no RabbitMQ."""
+    return LoopbackBroker.provisioned()
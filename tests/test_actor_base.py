@@ -15,7 +15,6 @@ from tests._stubs import (
     GNodeStubRecorder,
     SupervisorStubRecorder,
     TimeCoordinatorStubRecorder,
-    provision_topology,
 )
 from tests._wait import wait_for
 
@@ -55,7 +54,7 @@ def test_parse_routing_key_supervisor() -> None:
 
 
 def test_actor_base(
-    make_g_node_json, make_gnode_settings, make_service_settings
+    loopback_broker, make_g_node_json, make_gnode_settings, make_service_settings
 ) -> None:
     codec = GwBaseSemaCodec()
 
@@ -70,15 +69,16 @@ def test_actor_base(
     su_settings = make_service_settings(service_alias="d1.super")
     tc_settings = make_service_settings(service_alias="d1.time")
 
-    # Infra owns the fabric: provision exchanges + bindings BEFORE any actor
-    # starts (actors only passively assert their consume exchange exists).
-    provision_topology(gn_settings.rabbit.url.get_secret_value())
+    # Infra owns the fabric: the loopback broker comes provisioned with the
+    # exchanges + bindings (actors only passively assert their consume
+    # exchange exists), so this runs with no RabbitMQ.
 
     gn = GNodeStubRecorder(
         settings=gn_settings,
         transport_class=TransportClass.LeafTransactiveNode,
         my_super_alias="d1.super",
         my_time_coordinator_alias="d1.time",
+        connection_factory=loopback_broker.connect,
     )
     gn.start()
     su = SupervisorStubRecorder(
@@ -87,6 +87,7 @@ def test_actor_base(
         my_super_alias="d1.super.parent",
         my_time_coordinator_alias="d1.time",
         subordinate_alias=gn.alias,
+        connection_factory=loopback_broker.connect,
     )
     su.start()
     tc = TimeCoordinatorStubRecorder(
@@ -98,12 +99,15 @@ def test_actor_base(
             datetime.datetime(2020, 1, 1, 5, tzinfo=datetime.UTC).timestamp(),
         ),
         my_actor_aliases=[gn.alias],
+        connection_factory=loopback_broker.connect,
     )
     tc.start()
     try:
         wait_for(lambda: su._consuming, 4, "supervisor is consuming")
         wait_for(lambda: gn._consuming, 4, "gnode is consuming")
         wait_for(lambda: tc._consuming, 4, "timecoordinator is consuming")
+        # Subscriptions are bound in local_rabbit_startup, after consuming.
+        loopback_broker.wait_idle()
 
         hb = HeartbeatA(my_hex="0", your_last_hex="0")
         gn.send(
@@ -0,0 +1,223 @@
+"""ActorHost: many actors over a few shared connections, on the loopback
+broker. Each hosted actor keeps its own queue, bindings and send path."""
+
+import logging
+
+import pytest
+
+from gwbase import ActorHost
+from gwbase.config import paths
+from gwbase.sema import GwBaseSemaCodec, compact
+from gwbase.sema.types import HeartbeatA
+from gwbase.transport_encoding import TransportClass
+from tests._stubs import GNodeStubRecorder, SupervisorStubRecorder
+from tests._wait import wait_for
+
+SUPER = "d1.super"
+N_GNODES = 12
+
+
+@pytest.fixture
+def fleet(
+    loopback_broker, make_g_node_json, make_gnode_settings, make_service_settings
+):
+    """A host with one supervisor and N_GNODES LTNs on two connections."""
+    host = ActorHost(
+        settings=make_service_settings(service_alias="d1.host"),
+        connections=2,
+        connection_factory=loopback_broker.connect,
+    )
+    su = SupervisorStubRecorder(
+        settings=make_service_settings(service_alias=SUPER),
+        my_super_alias="d1.super.parent",
+        my_time_coordinator_alias="d1.time",
+        subordinate_alias="d1.isone.ltn0",
+    )
+    gnodes = []
+    for i in range(N_GNODES):
+        alias = f"d1.isone.ltn{i}"
+        gnodes.append(
+            GNodeStubRecorder(
+                settings=make_gnode_settings(
+                    make_g_node_json(f"ltn{i}.json", alias=alias),
+                    service_alias=alias,
+                ),
+                transport_class=TransportClass.LeafTransactiveNode,
+                my_super_alias=SUPER,
+                my_time_coordinator_alias="d1.time",
+            )
+        )
+    for actor in (su, *gnodes):
+        host.add(actor)
+    host.start()
+    try:
+        wait_for(lambda: host.consuming, 3, "every hosted actor consuming")
+        loopback_broker.wait_idle()
+        yield host, su, gnodes
+    finally:
+        host.stop()
+
+
+def _ping(su, to_alias: str, my_hex: str = "7") -> None:
+    hb = HeartbeatA(my_hex=my_hex)
+    su.send(
+        envelope=su.direct_envelope(
+            type_name=hb.type_name,
+            to_class=TransportClass.LeafTransactiveNode,
+            to_alias=to_alias,
+        ),
+        body=GwBaseSemaCodec().to_bytes(hb),
+    )
+
+
+def test_actors_share_the_connection_pool(fleet, loopback_broker) -> None:
+    host, _su, gnodes = fleet
+    assert len(host) == N_GNODES + 1
+    assert len(loopback_broker.open_connections()) == 2
+    # Queues and bindings are each actor's own, exactly as stand-alone.
+    for gn in gnodes:
+        assert loopback_broker.consumer_count(gn.queue_name) == 1
+        lrh = gn.alias.replace(".", "-")
+        assert ("ltn_tx", f"rj.*.*.*.*.{lrh}") in loopback_broker.queue_bindings(
+            gn.queue_name
+        )
+
+
+def test_direct_traffic_reaches_only_its_addressee(fleet, loopback_broker) -> None:
+    _host, su, gnodes = fleet
+    _ping(su, gnodes[0].alias)
+    wait_for(lambda: su.got_heartbeat_from_sub, 2, "pong from ltn0")
+    loopback_broker.wait_idle()
+    assert gnodes[0].got_heartbeat_from_super
+    assert not any(gn.got_heartbeat_from_super for gn in gnodes[1:])
+
+
+def test_serial_ping_is_decoded_from_binary(fleet, loopback_broker) -> None:
+    _host, su, gnodes = fleet
+    hb = HeartbeatA(my_hex="7")
+    su.send(
+        envelope=su.serial_envelope(
+            type_name=hb.type_name,
+            to_class=TransportClass.LeafTransactiveNode,
+            to_alias=gnodes[0].alias,
+        ),
+        body=GwBaseSemaCodec().to_binary(hb),
+    )
+    wait_for(lambda: su.got_heartbeat_from_sub, 2, "pong from ltn0")
+    loopback_broker.wait_idle()
+    assert gnodes[0].got_heartbeat_from_super
+    assert not any(gn.got_heartbeat_from_super for gn in gnodes[1:])
+
+
+def test_compact_content_type_reaches_the_addressee(fleet, loopback_broker) -> None:
+    _host, su, gnodes = fleet
+    hb = HeartbeatA(my_hex="7")
+    su.send(
+        envelope=su.direct_envelope(
+            type_name=hb.type_name,
+            to_class=TransportClass.LeafTransactiveNode,
+            to_alias=gnodes[0].alias,
+        ),
+        body=GwBaseSemaCodec().to_compact(hb),
+        content_type=compact.CONTENT_TYPE,
+    )
+    wait_for(lambda: su.got_heartbeat_from_sub, 2, "pong from ltn0")
+    assert gnodes[0].latest_content_type == compact.CONTENT_TYPE
+    assert su.latest_content_type is None  # the pong is plain JSON
+
+
+def test_closed_channel_is_reopened_alone(fleet, loopback_broker) -> None:
+    host, _su, gnodes = fleet
+    victim = gnodes[3]
+    old_queue_consumers = loopback_broker.consumer_count(victim.queue_name)
+    conns = loopback_broker.open_connections()
+
+    # Publishing to an internal exchange is a channel error (403): only the
+    # victim's channel closes; the shared connection stays up.
+    channel = victim._single_channel
+    victim._consume_connection.ioloop.add_callback_threadsafe(
+        lambda: channel.basic_publish(exchange="ltn_tx", routing_key="x", body=b"")
+    )
+    wait_for(lambda: channel.is_closed, 2, "victim channel closed")
+    wait_for(lambda: victim.consuming, 2, "victim channel reopened")
+
+    assert loopback_broker.open_connections() == conns
+    assert victim._single_channel is not channel
+    assert loopback_broker.consumer_count(victim.queue_name) == old_queue_consumers
+    assert host.consuming
+
+
+def test_dropped_connections_reattach_every_actor(fleet, loopback_broker) -> None:
+    host, su, gnodes = fleet
+    first = set(loopback_broker.open_connections())
+    loopback_broker.drop_connections()
+
+    def reattached() -> bool:
+        conns = set(loopback_broker.open_connections())
+        return len(conns) == 2 and not conns & first and host.consuming
+
+    wait_for(reattached, 3, "host reconnected and re-attached")
+    loopback_broker.wait_idle()
+    _ping(su, gnodes[-1].alias)
+    wait_for(lambda: gnodes[-1].got_heartbeat_from_super, 2, "ping after reconnect")
+
+
+def test_stop_detaches_one_actor_only(fleet, loopback_broker) -> None:
+    host, su, gnodes = fleet
+    leaving = gnodes[5]
+    leaving.stop()  # a hosted actor's stop() detaches it from the host
+
+    assert leaving.host is None
+    assert not leaving.consuming
+    assert leaving.queue_name not in loopback_broker.queue_names()  # auto-delete
+    assert len(host) == N_GNODES
+    assert len(loopback_broker.open_connections()) == 2
+    assert host.consuming
+    _ping(su, gnodes[0].alias)
+    wait_for(lambda: su.got_heartbeat_from_sub, 2, "others still served")
+
+
+def test_hosted_actors_log_to_the_host_file(fleet) -> None:
+    host, _su, gnodes = fleet
+    gn = gnodes[0]
+    assert gn.logger.handlers == host.logger.handlers
+    gn.logger.warning("hello from a hosted actor")
+    for handler in gn.logger.handlers:
+        handler.flush()
+    text = (paths.log_dir("gridworks") / "d1.host.log").read_text()
+    assert f"{gn.alias} > hello from a hosted actor" in text
+
+
+def test_add_rejects_hosted_and_running_actors(fleet, make_service_settings) -> None:
+    host, su, _gnodes = fleet
+    with pytest.raises(ValueError, match="already hosted"):
+        host.add(su)
+    with pytest.raises(RuntimeError, match="is hosted"):
+        su.start()
+
+
+def test_full_host_refuses_more_actors(loopback_broker, make_service_settings) -> None:
+    host = ActorHost(
+        settings=make_service_settings(service_alias="d1.host"),
+        connections=1,
+        max_channels_per_connection=1,
+        connection_factory=loopback_broker.connect,
+    )
+    host.add(
+        SupervisorStubRecorder(
+            settings=make_service_settings(service_alias="d1.super.a"),
+            my_super_alias=SUPER,
+            my_time_coordinator_alias="d1.time",
+            subordinate_alias="d1.sub",
+        )
+    )
+    with pytest.raises(RuntimeError, match="is full"):
+        host.add(
+            SupervisorStubRecorder(
+                settings=make_service_settings(service_alias="d1.super.b"),
+                my_super_alias=SUPER,
+                my_time_coordinator_alias="d1.time",
+                subordinate_alias="d1.sub",
+            )
+        )
+    logging.getLogger("gwbase.host.d1.host").handlers[0].close()
@@ -0,0 +1,121 @@
+"""The benchmark harness: report math, regression gating, and a tiny actor
+run over the loopback broker (so the harness itself cannot rot)."""
+
+import json
+
+import pytest
+
+from benchmarks import actors, codec, samples
+from benchmarks.__main__ import main as bench_main
+from benchmarks.report import (
+    compare_reports,
+    flatten,
+    latency_summary,
+    percentile,
+)
+
+
+def _report(results: dict) -> dict:
+    return {"Suite": "actors", "Results": results}
+
+
+def test_percentile_is_nearest_rank() -> None:
+    samples = [float(i) for i in range(1, 101)]
+    assert percentile(samples, 0.50) == 50.0
+    assert percentile(samples, 0.99) == 99.0
+    assert percentile(samples, 0.999) == 100.0
+    assert percentile([7.0], 0.999) == 7.0
+
+
+def test_latency_summary_reports_microseconds() -> None:
+    summary = latency_summary([1_000, 2_000, 3_000])
+    assert summary["P50"] == 2.0
+    assert summary["P999"] == 3.0
+    assert summary["Mean"] == 2.0
+
+
+def test_flatten_keeps_numeric_leaves_only() -> None:
+    flat = flatten({"rj": {"MsgsPerS": 10, "LatencyUs": {"P99": 3.5}, "Note": "x"}})
+    assert flat == {"rj.MsgsPerS": 10.0, "rj.LatencyUs.P99": 3.5}
+
+
+@pytest.mark.parametrize(
+    ("metric", "base", "cur", "regressed"),
+    [
+        ("MsgsPerS", 100.0, 85.0, True),  # throughput fell 15%
+        ("MsgsPerS", 100.0, 95.0, False),  # within threshold
+        ("MsgsPerS", 100.0, 150.0, False),  # improvement
+        ("LatencyUs.P99", 100.0, 115.0, True),  # latency rose 15%
+        ("LatencyUs.P99", 100.0, 60.0, False),  # latency improved
+    ],
+)
+def test_metric_direction_and_threshold(
+    metric: str, base: float, cur: float, regressed: bool
+) -> None:
+    def nest(value: float) -> dict:
+        head, *rest = metric.split(".")
+        return {"rj": {head: {rest[0]: value}} if rest else {head: value}}
+
+    [delta] = compare_reports(_report(nest(base)), _report(nest(cur)))
+    assert delta.is_regression(0.10) is regressed
+
+
+def test_counts_are_context_not_gated() -> None:
+    deltas = compare_reports(
+        _report({"rj": {"Messages": 10}}), _report({"rj": {"Messages": 1}})
+    )
+    assert deltas == []
+
+
+def test_compare_command_exit_codes(tmp_path, capsys) -> None:
+    base = tmp_path / "base.json"
+    good = tmp_path / "good.json"
+    bad = tmp_path / "bad.json"
+    base.write_text(json.dumps(_report({"rj": {"MsgsPerS": 1000.0}})))
+    good.write_text(json.dumps(_report({"rj": {"MsgsPerS": 980.0}})))
+    bad.write_text(json.dumps(_report({"rj": {"MsgsPerS": 500.0}})))
+
+    assert bench_main(["compare", str(base), str(good)]) == 0
+    assert bench_main(["compare", str(base), str(bad)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+    assert bench_main(["compare", str(base), str(bad), "--threshold", "0.6"]) == 0
+
+
+def test_actor_suite_runs_over_loopback() -> None:
+    cfg = actors.ActorBenchConfig(
+        messages=20, latency_samples=5, fanout=[2], rounds=3, timeout_s=10.0
+    )
+    report = actors.run(cfg, log=lambda _msg: None)
+
+    assert report["Suite"] == "actors"
+    assert report["Environment"]["Broker"] == "loopback"
+    results = report["Results"]
+    assert set(results) == {"rj", "rjb", "gw", "heartbeat", "fanout-2"}
+    for name in ("rj", "rjb", "gw"):
+        assert results[name]["MsgsPerS"] > 0
+        assert results[name]["LatencyUs"]["P50"] > 0
+    assert results["heartbeat"]["RoundTripsPerS"] > 0
+    assert results["fanout-2"]["ReadyPerS"] > 0
+
+
+def test_samples_cover_every_registered_type() -> None:
+    assert samples.missing_types() == set()
+    for label, obj in samples.sample_instances().items():
+        assert obj.type_name == samples.type_name_of(label)
+
+
+def test_upgrade_chain_reaches_current_version() -> None:
+    up = codec.upgrade_codec()
+    latest = up.from_dict(codec.BenchUpgrade000(value_kw=2).to_dict())
+    assert latest == codec.BenchUpgrade003(value=2000, unit="W")
+
+
+def test_codec_suite_reports_stage_split() -> None:
+    report = codec.run(
+        min_time_s=0.0, repeat=1, only=["heartbeat.a", "upgrade"], log=lambda _: None
+    )
+    hb = report["Results"]["heartbeat.a"]
+    assert set(hb["Stages"]) == {"ScanTypeNs", "ValidateJsonNs", "DispatchNs"}
+    assert hb["FromBytesNs"] > 0
+    assert hb["UnwrapBytesNs"] > 0
+    assert report["Results"]["upgrade"]["ThreeStepsNs"] > 0
@@ -0,0 +1,127 @@
+"""Fleet: actors sharded over worker processes, each an ActorHost. Every
+worker gets its own LoopbackBroker (``tests._stubs.loopback_connection_factory``),
+so these exercise sharding, supervision, metrics, logs and drain -- not
+cross-worker traffic."""
+
+import os
+import signal
+from collections import Counter
+
+import pytest
+
+from gwbase.config import paths
+from gwbase.fleet import ActorSpec, Fleet, shard_of
+from gwbase.transport_encoding import TransportClass
+from tests._wait import wait_for
+
+N_ACTORS = 8
+GNODE_FACTORY = "tests._stubs:GNodeStubRecorder"
+
+
+def _specs(make_g_node_json, make_gnode_settings, n: int = N_ACTORS):
+    specs = []
+    for i in range(n):
+        alias = f"d1.isone.ltn{i}"
+        specs.append(
+            ActorSpec(
+                factory=GNODE_FACTORY,
+                settings=make_gnode_settings(
+                    make_g_node_json(f"ltn{i}.json", alias=alias),
+                    service_alias=alias,
+                ),
+                kwargs={
+                    "transport_class": TransportClass.LeafTransactiveNode,
+                    "my_super_alias": "d1.super",
+                    "my_time_coordinator_alias": "d1.time",
+                },
+            )
+        )
+    return specs
+
+
+@pytest.fixture
+def fleet(make_g_node_json, make_gnode_settings, make_service_settings):
+    fleet = Fleet(
+        _specs(make_g_node_json, make_gnode_settings),
+        settings=make_service_settings(service_alias="d1.fleet"),
+        workers=2,
+        connections_per_worker=1,
+        connection_factory="tests._stubs:loopback_connection_factory",
+        status_interval_s=0.1,
+    )
+    fleet.start()
+    try:
+        wait_for(lambda: fleet.consuming, 30, "every worker consuming")
+        yield fleet
+    finally:
+        fleet.stop()
+
+
+def test_shard_of_is_stable_and_spreads() -> None:
+    # blake2b, not hash(): the same answer in every process and every run.
+    assert [shard_of(f"d1.isone.ltn{i}", 4) for i in range(6)] == [
+        shard_of(f"d1.isone.ltn{i}", 4) for i in range(6)
+    ]
+    assert shard_of("d1.isone.ltn0", 1) == 0
+    counts = Counter(shard_of(f"d1.isone.ta{i}", 4) for i in range(4000))
+    assert set(counts) == {0, 1, 2, 3}
+    assert min(counts.values()) > 900
+
+
+def test_fleet_rejects_bad_specs(
+    make_g_node_json, make_gnode_settings, make_service_settings
+) -> None:
+    specs = _specs(make_g_node_json, make_gnode_settings, n=2)
+    settings = make_service_settings(service_alias="d1.fleet")
+    with pytest.raises(ValueError, match="duplicate actor aliases"):
+        Fleet([*specs, specs[0]], settings=settings)
+    bad = ActorSpec(factory="tests._stubs.NoSuchActor", settings=specs[0].settings)
+    with pytest.raises(ValueError, match="package.module:callable"):
+        Fleet([bad], settings=settings)
+    with pytest.raises(AttributeError):
+        Fleet(
+            [ActorSpec(factory="tests._stubs:NoSuchActor", settings=specs[0].settings)],
+            settings=settings,
+        )
+
+
+def test_metrics_aggregate_every_worker(fleet) -> None:
+    m = fleet.metrics()
+    assert m["Actors"] == m["Consuming"] == N_ACTORS
+    assert m["OpenConnections"] == len(m["Workers"])
+    assert {w["Worker"] for w in m["Workers"]} == {
+        fleet.worker_of(f"d1.isone.ltn{i}") for i in range(N_ACTORS)
+    }
+    assert len({w["Pid"] for w in m["Workers"]}) == len(m["Workers"])
+    assert os.getpid() not in {w["Pid"] for w in m["Workers"]}
+
+
+def test_worker_logs_reach_the_fleet_file(fleet) -> None:
+    log = paths.log_dir("gridworks") / "d1.fleet.log"
+    workers = [f"d1.fleet.w{w['Worker']}" for w in fleet.metrics()["Workers"]]
+    wait_for(
+        lambda: all(f"{w} > Starting" in log.read_text() for w in workers),
+        10,
+        "a line from every worker in the fleet log",
+    )
+    assert "d1.fleet > Starting 2 workers" in log.read_text()
+
+
+def test_dead_worker_is_restarted_with_its_shard(fleet) -> None:
+    victim = fleet.metrics()["Workers"][0]
+    os.kill(victim["Pid"], signal.SIGKILL)
+
+    def restarted() -> bool:
+        w = fleet.metrics()["Workers"][0]
+        return w["Restarts"] == 1 and w.get("Pid") not in {None, victim["Pid"]}
+
+    wait_for(restarted, 30, "worker restarted")
+    wait_for(lambda: fleet.consuming, 30, "restarted worker consuming")
+    assert fleet.metrics()["Consuming"] == N_ACTORS
+
+
+def test_stop_drains_every_worker(fleet) -> None:
+    fleet.stop()
+    m = fleet.metrics()
+    assert all(w["Drained"] and not w["Alive"] for w in m["Workers"])
+    assert m["Consuming"] == 0
@@ -0,0 +1,171 @@
+"""The shared property-format checks against the implementations they
+replaced: same result, or the same exception with the same message, on
+valid values, near misses and random junk."""
+
+import random
+import string
+import uuid
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from gwbase import transport_format
+from gwbase.sema import property_format
+
+N_RANDOM = 3000
+SEED = 20260101
+
+
+# --- the implementations before the shared module (verbatim) ---------------
+
+
+def ref_is_hex_char(v: Any) -> Any:
+    if not isinstance(v, str):
+        raise ValueError(f"<{v}>: hex.char must be a string.")
+    if not property_format.HEX_CHAR_PATTERN.fullmatch(v):
+        raise ValueError(f"<{v}>: Fails hex.char format.")
+    return v
+
+
+def ref_is_left_right_dot(v: Any) -> Any:
+    if not isinstance(v, str):
+        raise ValueError(f"<{v}>: LeftRightDot must be a string.")
+    if not property_format.LEFT_RIGHT_DOT_PATTERN.fullmatch(v):
+        raise ValueError(f"<{v}>: Fails LeftRightDot format.")
+    return v
+
+
+def ref_is_utc_milliseconds(v: Any) -> Any:
+    if not isinstance(v, int):
+        raise TypeError("Not an int!")
+    start_date = datetime(2000, 1, 1, tzinfo=UTC)
+    end_date = datetime(3000, 1, 1, tzinfo=UTC)
+    start_timestamp_ms = int(start_date.timestamp() * 1000)
+    end_timestamp_ms = int(end_date.timestamp() * 1000)
+    if v < start_timestamp_ms:
+        raise ValueError(f"{v} must be after Jan 1 2000")
+    if v > end_timestamp_ms:
+        raise ValueError(f"{v} must be before Jan 1 3000")
+    return v
+
+
+def ref_is_utc_seconds(v: Any) -> Any:
+    if not isinstance(v, int):
+        raise ValueError("Not an int!")
+    start_date = datetime(2000, 1, 1, tzinfo=UTC)
+    end_date = datetime(3000, 1, 1, tzinfo=UTC)
+    start_timestamp = int(start_date.timestamp())
+    end_timestamp = int(end_date.timestamp())
+    if v < start_timestamp:
+        raise ValueError(f"{v}: Fails UTCSeconds format! Must be after Jan 1 2000")
+    if v > end_timestamp:
+        raise ValueError(f"{v}: Fails UTCSeconds format! Must be before Jan 1 3000")
+    return v
+
+
+def ref_is_uuid4_str(v: Any) -> Any:
+    if not isinstance(v, str):
+        raise ValueError(f"<{v}>: uuid4.str must be a string.")
+    if not property_format.UUID4_STR_PATTERN.fullmatch(v):
+        raise ValueError(f"<{v}>: Fails uuid4.str format.")
+    try:
+        u = uuid.UUID(v)
+    except Exception as e:
+        raise ValueError(f"Invalid UUID4: {v}  <{e}>") from e
+    if u.version != 4:
+        raise ValueError(
+            f"{v} is valid uid, but of version {u.version}. Fails UuidCanonicalTextual"
+        )
+    return str(u)
+
+
+# --- inputs ----------------------------------------------------------------
+
+JUNK: list[Any] = [None, True, False, 0, -1, 1.5, b"a", [], {}, "", " ", "\n"]
+
+
+def _mutations(rng: random.Random, valid: str) -> Iterator[str]:
+    alphabet = string.ascii_letters + string.digits + ".-_ \n"
+    yield valid
+    yield valid.upper()
+    yield valid + "\n"
+    yield " " + valid
+    for _ in range(N_RANDOM // 10):
+        chars = list(valid)
+        for _ in range(rng.randint(1, 2)):
+            op = rng.randrange(3)
+            i = rng.randrange(len(chars) + 1)
+            if op == 0:
+                chars.insert(i, rng.choice(alphabet))
+            elif chars:
+                del chars[min(i, len(chars) - 1)]
+                if op == 1:
+                    chars.insert(min(i, len(chars)), rng.choice(alphabet))
+        yield "".join(chars)
+
+
+def _strings(rng: random.Random, kind: str) -> Iterator[Any]:
+    yield from JUNK
+    if kind == "hex":
+        yield from string.printable
+        yield from ["ab", "0x", "Ff"]
+    elif kind == "lrd":
+        for valid in ["d1", "d1.isone.ver.keene.holly", "a.0.b1"]:
+            yield from _mutations(rng, valid)
+    else:
+        for version in (1, 3, 4, 5):
+            u = uuid.UUID(int=rng.getrandbits(128), version=version)
+            yield from _mutations(rng, str(u))
+        yield str(uuid.uuid4()).replace("-", "")
+        yield "{" + str(uuid.uuid4()) + "}"
+
+
+def _ints(rng: random.Random, lo: int, hi: int) -> Iterator[Any]:
+    yield from JUNK
+    for edge in (lo, hi):
+        yield from (edge - 1, edge, edge + 1, float(edge))
+    for _ in range(N_RANDOM):
+        yield rng.randint(lo - (hi - lo), hi + (hi - lo))
+
+
+def _outcome(fn: Callable[[Any], Any], v: Any) -> tuple[str, Any]:
+    try:
+        return "ok", fn(v)
+    except Exception as e:  # compared by type and message
+        return type(e).__name__, str(e)
+
+
+SECONDS = (946_684_800, 32_503_680_000)
+CASES = [
+    ("hex", property_format.is_hex_char, ref_is_hex_char, "hex"),
+    ("lrd", property_format.is_left_right_dot, ref_is_left_right_dot, "lrd"),
+    ("lrd/transport", transport_format.is_left_right_dot, ref_is_left_right_dot, "lrd"),
+    ("uuid4", property_format.is_uuid4_str, ref_is_uuid4_str, "uuid4"),
+    ("uuid4/transport", transport_format.is_uuid4_str, ref_is_uuid4_str, "uuid4"),
+    ("seconds", property_format.is_utc_seconds, ref_is_utc_seconds, SECONDS),
+    (
+        "milliseconds",
+        property_format.is_utc_milliseconds,
+        ref_is_utc_milliseconds,
+        (SECONDS[0] * 1000, SECONDS[1] * 1000),
+    ),
+]
+
+
+@pytest.mark.parametrize(("name", "check", "reference", "inputs"), CASES)
+def test_matches_the_reference(
+    name: str,
+    check: Callable[[Any], Any],
+    reference: Callable[[Any], Any],
+    inputs: str | tuple[int, int],
+) -> None:
+    rng = random.Random(f"{SEED}/{name}")
+    values = _ints(rng, *inputs) if isinstance(inputs, tuple) else _strings(rng, inputs)
+    n_ok = 0
+    for v in values:
+        expected = _outcome(reference, v)
+        assert _outcome(check, v) == expected, repr(v)
+        n_ok += expected[0] == "ok"
+    assert n_ok, "no input was valid"
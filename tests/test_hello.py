@@ -2,19 +2,25 @@ from gwbase.gridworks_actor import GridworksActor
 from gwbase.sema import GwBaseSemaCodec
 from gwbase.sema.types import HeartbeatA
 from gwbase.transport_encoding import RoutingEnvelope, TransportClass
-from tests._stubs import provision_topology
 from tests._wait import wait_for
 
 
 class HelloGNode(GridworksActor):
     def __init__(
-        self, *, settings, transport_class, my_super_alias, my_time_coordinator_alias
+        self,
+        *,
+        settings,
+        transport_class,
+        my_super_alias,
+        my_time_coordinator_alias,
+        connection_factory=None,
     ):
         super().__init__(
             settings=settings,
             transport_class=transport_class,
             my_super_alias=my_super_alias,
             my_time_coordinator_alias=my_time_coordinator_alias,
+            connection_factory=connection_factory,
         )
         self._codec = GwBaseSemaCodec()
 
@@ -22,21 +28,21 @@ class HelloGNode(GridworksActor):
         return
 
 
-def test_hello(make_g_node_json, make_gnode_settings) -> None:
+def test_hello(loopback_broker, make_g_node_json, make_gnode_settings) -> None:
     # scada is MQTT-only (no AMQP exchanges); the demo actor is a
     # LeafTransactiveNode, which has a ltn_tx / ltnmic_tx pair.
     json_path = make_g_node_json(alias="d1.hello", g_node_class="LeafTransactiveNode")
     settings = make_gnode_settings(json_path, service_alias="d1.hello")
 
-    # Provision the fabric before the actor starts (passive consume-exchange
-    # assert needs ltn_tx to already exist).
-    provision_topology(settings.rabbit.url.get_secret_value())
+    # The loopback broker comes provisioned (the passive consume-exchange
+    # assert needs ltn_tx to already exist), so this runs with no RabbitMQ.
 
     gn = HelloGNode(
         settings=settings,
         transport_class=TransportClass.LeafTransactiveNode,
         my_super_alias="d1.super1",
         my_time_coordinator_alias="d1.time",
+        connection_factory=loopback_broker.connect,
     )
     gn.start()
     try:
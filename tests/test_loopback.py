@@ -0,0 +1,282 @@
+"""The in-process loopback broker: AMQP semantics, then the actor tiers
+running end-to-end over it with no RabbitMQ."""
+
+import datetime
+import time
+import uuid
+
+import pytest
+from pika.exceptions import ChannelClosedByBroker
+
+from gwbase import topology
+from gwbase.loopback import LoopbackBroker, topic_matches
+from gwbase.sema import GwBaseSemaCodec
+from gwbase.sema.types import HeartbeatA, Ready, SimTimestep
+from gwbase.transport_encoding import TransportClass
+from tests._stubs import (
+    GNodeStubRecorder,
+    SupervisorStubRecorder,
+    TimeCoordinatorStubRecorder,
+)
+from tests._wait import wait_for
+
+# --- broker semantics -----------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("binding_key", "routing_key", "expected"),
+    [
+        ("#", "rj.a.ltn.t.mm.b", True),
+        ("#", "", True),
+        ("rjb.#", "rjb.d1-time.time.sim-timestep", True),
+        ("rjb.#", "rjb", True),
+        ("rjb.#", "rj.a.b", False),
+        ("*.*.ltn.*.mm.*", "rj.d1-a.ltn.foo.mm.d1-b", True),
+        ("*.*.ltn.*.mm.*", "rj.d1-a.ltn.foo.super.d1-b", False),
+        ("*.*.ltn.*.mm.*", "rj.d1-a.ltn.foo.mm", False),
+        ("gw.*.to.ta.#", "gw.d1-a-scada.to.ta.report-event", True),
+        ("a.#.z", "a.z", True),
+        ("a.#.z", "a.b.c.z", True),
+        ("a.#.z", "a.b.c", False),
+    ],
+)
+def test_topic_matches(binding_key: str, routing_key: str, expected: bool) -> None:
+    assert topic_matches(binding_key, routing_key) is expected
+
+
+def _consume(broker: LoopbackBroker, queue: str, prefetch: int = 0):
+    """Open a channel consuming ``queue``; returns (conn, channel, got)."""
+    conn = broker.connect()
+    ch = conn.channel()
+    got: list[tuple[int, bytes]] = []
+    ch.basic_qos(prefetch_count=prefetch)
+    ch.basic_consume(queue, lambda _ch, d, _p, body: got.append((d.delivery_tag, body)))
+    conn.ioloop.process_pending()
+    return conn, ch, got
+
+
+def test_provisioned_fabric_routes_direct_across_classes() -> None:
+    """ltnmic_tx -> mm_tx is a ROUTING_EDGE; ltnmic_tx -> ta_tx is not."""
+    broker = LoopbackBroker.provisioned()
+    broker.queue_declare("mm-q")
+    broker.queue_bind(queue="mm-q", exchange="mm_tx", routing_key="rj.*.*.*.*.d1-mm")
+    broker.queue_declare("ear-q")
+    broker.queue_bind(queue="ear-q", exchange=topology.EAR_EXCHANGE, routing_key="#")
+
+    n = broker.publish(
+        exchange="ltnmic_tx", routing_key="rj.d1-a.ltn.foo.mm.d1-mm", body=b"x"
+    )
+    assert n == 2  # the mm queue + the universal ear tap
+    assert broker.queue_depth("mm-q") == 1
+    assert broker.queue_depth("ear-q") == 1
+
+    broker.publish(
+        exchange="ltnmic_tx", routing_key="rj.d1-a.ltn.foo.ta.d1-mm", body=b"y"
+    )
+    assert broker.queue_depth("mm-q") == 1
+
+
+def test_queue_reached_by_two_paths_gets_one_copy() -> None:
+    broker = LoopbackBroker.provisioned()
+    broker.queue_declare("q")
+    broker.queue_bind(queue="q", exchange="ltnmic_tx", routing_key="#")
+    broker.queue_bind(queue="q", exchange=topology.EAR_EXCHANGE, routing_key="#")
+    broker.publish(exchange="ltnmic_tx", routing_key="rjb.d1-a.ltn.foo", body=b"x")
+    assert broker.queue_depth("q") == 1
+
+
+def test_publish_to_internal_exchange_closes_channel() -> None:
+    broker = LoopbackBroker.provisioned()
+    conn = broker.connect()
+    ch = conn.channel()
+    reasons: list[Exception] = []
+    ch.add_on_close_callback(lambda _ch, reason: reasons.append(reason))
+
+    ch.basic_publish(exchange="ltn_tx", routing_key="rj.a.b.c.d.e", body=b"x")
+    conn.ioloop.process_pending()
+
+    assert ch.is_closed
+    assert isinstance(reasons[0], ChannelClosedByBroker)
+    assert reasons[0].reply_code == 403
+
+
+def test_passive_declare_of_missing_exchange_is_404() -> None:
+    broker = LoopbackBroker()  # NOT provisioned
+    conn = broker.connect()
+    ch = conn.channel()
+    reasons: list[Exception] = []
+    ch.add_on_close_callback(lambda _ch, reason: reasons.append(reason))
+    ch.exchange_declare("ltn_tx", exchange_type="topic", passive=True)
+    conn.ioloop.process_pending()
+    assert reasons[0].reply_code == 404
+
+
+def test_prefetch_holds_back_until_ack() -> None:
+    broker = LoopbackBroker()
+    broker.queue_declare("q")
+    for i in range(3):
+        broker.publish(exchange="", routing_key="q", body=str(i).encode())
+
+    conn, ch, got = _consume(broker, "q", prefetch=1)
+    assert [b for _, b in got] == [b"0"]
+    assert broker.queue_depth("q") == 2
+
+    ch.basic_ack(got[0][0])
+    conn.ioloop.process_pending()
+    assert [b for _, b in got] == [b"0", b"1"]
+
+
+def test_unacked_messages_are_requeued_when_channel_closes() -> None:
+    broker = LoopbackBroker()
+    broker.queue_declare("q")
+    broker.publish(exchange="", routing_key="q", body=b"x")
+    conn, ch, got = _consume(broker, "q", prefetch=1)
+    assert len(got) == 1
+
+    ch.close()
+    conn.ioloop.process_pending()
+    assert broker.queue_depth("q") == 1
+
+
+def test_auto_delete_queue_goes_with_its_last_consumer() -> None:
+    broker = LoopbackBroker.provisioned()
+    broker.queue_declare("tmp", auto_delete=True)
+    broker.queue_bind(queue="tmp", exchange=topology.EAR_EXCHANGE, routing_key="#")
+    conn, ch, _ = _consume(broker, "tmp")
+    assert "tmp" in broker.queue_names()
+
+    ch.basic_cancel(ch.consumer_tags[0])
+    conn.ioloop.process_pending()
+    assert "tmp" not in broker.queue_names()
+    assert broker.publish(exchange="ltnmic_tx", routing_key="x", body=b"") == 0
+
+
+# --- the actor tiers over loopback ----------------------------------------
+
+
+class _TimestepFollower(GNodeStubRecorder):
+    """A GNode that follows its time coordinator's broadcasts and answers
+    each new timestep with ``sim.ready``."""
+
+    def local_rabbit_startup(self) -> None:
+        self.subscribe_broadcast(
+            from_alias=self.my_time_coordinator_alias,
+            from_class=TransportClass.TimeCoordinator,
+            type_name=SimTimestep.type_name_value(),
+        )
+
+    def on_simulated_time(
+        self, *, time_unix_s: int, from_alias: str, is_new: bool
+    ) -> None:
+        if is_new:
+            self.send_ready()
+
+
+def test_heartbeat_and_timestep_round_trip_over_loopback(
+    loopback_broker, make_g_node_json, make_gnode_settings, make_service_settings
+) -> None:
+    codec = GwBaseSemaCodec()
+    sim_time = int(datetime.datetime(2020, 1, 1, 5, tzinfo=datetime.UTC).timestamp())
+
+    gn_alias = "d1.isone.unknown.gnode"
+    gn = _TimestepFollower(
+        settings=make_gnode_settings(
+            make_g_node_json(
+                "gn.json", alias=gn_alias, g_node_class="LeafTransactiveNode"
+            ),
+            service_alias=gn_alias,
+        ),
+        transport_class=TransportClass.LeafTransactiveNode,
+        my_super_alias="d1.super",
+        my_time_coordinator_alias="d1.time",
+        connection_factory=loopback_broker.connect,
+    )
+    su = SupervisorStubRecorder(
+        settings=make_service_settings(service_alias="d1.super"),
+        my_super_alias="d1.super.parent",
+        my_time_coordinator_alias="d1.time",
+        subordinate_alias=gn_alias,
+        connection_factory=loopback_broker.connect,
+    )
+    tc = TimeCoordinatorStubRecorder(
+        settings=make_service_settings(service_alias="d1.time"),
+        my_super_alias="d1.super",
+        my_time_coordinator_alias="d1.time",
+        current_time_unix_s=sim_time,
+        my_actor_aliases=[gn_alias],
+        connection_factory=loopback_broker.connect,
+    )
+    for actor in (gn, su, tc):
+        actor.start()
+    try:
+        wait_for(lambda: gn.consuming and su.consuming and tc.consuming, 2, "consuming")
+        # Subscriptions are bound in local_rabbit_startup, after consuming.
+        loopback_broker.wait_idle()
+
+        # Supervisor pings the GNode; the GNode pongs back (Orchestrator).
+        ping = HeartbeatA(my_hex="5")
+        su.send(
+            envelope=su.direct_envelope(
+                type_name=ping.type_name,
+                to_class=TransportClass.LeafTransactiveNode,
+                to_alias=gn_alias,
+            ),
+            body=codec.to_bytes(ping),
+        )
+        wait_for(lambda: su.got_heartbeat_from_sub, 2, "pong reached supervisor")
+        assert gn.got_heartbeat_from_super
+        pong = codec.from_bytes(su.latest_body)
+        assert isinstance(pong, HeartbeatA)
+        assert pong.your_last_hex == "5"
+
+        # Time coordinator broadcasts a timestep; the GNode answers Ready.
+        ts = SimTimestep(
+            from_g_node_alias="d1.time",
+            from_g_node_instance_id=tc.instance_id,
+            time_unix_s=sim_time,
+            timestep_created_ms=int(time.time() * 1000),
+            message_id=str(uuid.uuid4()),
+        )
+        tc.send(
+            envelope=tc.broadcast_envelope(type_name=ts.type_name),
+            body=codec.to_bytes(ts),
+        )
+        wait_for(tc.is_ready, 2, "time coordinator saw Ready")
+        assert gn.time_unix_s == sim_time
+        assert isinstance(codec.from_bytes(tc.latest_body), Ready)
+    finally:
+        for actor in (gn, su, tc):
+            actor.stop()
+
+    # Every actor queue is auto-delete: nothing is left behind on the broker.
+    assert not any(
+        q.startswith(("d1.", gn_alias)) for q in loopback_broker.queue_names()
+    )
+
+
+def test_actor_reconnects_after_broker_drops_connections(
+    loopback_broker, make_service_settings
+) -> None:
+    su = SupervisorStubRecorder(
+        settings=make_service_settings(service_alias="d1.super"),
+        my_super_alias="d1.super.parent",
+        my_time_coordinator_alias="d1.time",
+        subordinate_alias="d1.sub",
+        connection_factory=loopback_broker.connect,
+    )
+    su.start()
+    try:
+        wait_for(lambda: su.consuming, 2, "consuming")
+        [first] = loopback_broker.open_connections()
+        loopback_broker.drop_connections()
+
+        def reconnected() -> bool:
+            conns = loopback_broker.open_connections()
+            return su.consuming and len(conns) == 1 and conns[0] is not first
+
+        wait_for(reconnected, 3, "reconnected")
+        # The FIS handshake properties ride the (re)connect.
+        props = loopback_broker.open_connections()[0].client_properties
+        assert props["ServiceAlias"] == "d1.super"
+    finally:
+        su.stop()
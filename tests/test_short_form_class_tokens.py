@@ -13,6 +13,9 @@ import pytest
 from gwbase.transport_encoding import (
     BroadcastRoutingEnvelope,
     DirectRoutingEnvelope,
+    MessageCategory,
+    PayloadEncoding,
+    SerialRoutingEnvelope,
     TransportClass,
     WrappedRoutingEnvelope,
     parse_routing_key,
@@ -83,6 +86,22 @@ def test_direct_short_form_class_tokens_parse_and_round_trip() -> None:
     assert env.routing_key == key
 
 
+def test_serial_key_parses_like_direct_with_a_binary_body() -> None:
+    key = "s.hw1-isone-keene-scada.s.report-event.ltn.hw1-isone-keene-atn"
+    env = parse_routing_key(key)
+    assert isinstance(env, SerialRoutingEnvelope)
+    assert env.category is MessageCategory.Serial
+    assert env.payload_encoding is PayloadEncoding.Binary
+    assert (env.from_class, env.to_class) == (None, TransportClass.LeafTransactiveNode)
+    assert env.from_alias == "hw1.isone.keene.scada"
+    assert env.to_alias == "hw1.isone.keene.atn"
+    assert env.type_name == "report.event"
+    assert env.routing_key == key
+    assert parse_routing_key(key.replace("s.", "rj.", 1)).payload_encoding is (
+        PayloadEncoding.Json
+    )
+
+
 def test_unknown_category_still_raises() -> None:
     # gwbase's main parser deliberately does NOT learn the LTN's legacy
     # `broadcast.*` hack as a category — that is the JournalKeeper `legacy_hack`'s
@@ -121,6 +140,16 @@ def test_from_classes_emits_long_form_tokens() -> None:
     )
     assert bcast.from_class_token == "mm"
 
+    serial = SerialRoutingEnvelope.from_classes(
+        type_name="bid",
+        from_alias="d1.ltn",
+        from_class=TransportClass.LeafTransactiveNode,
+        to_class=TransportClass.MarketMaker,
+        to_alias="d1.mm",
+    )
+    assert serial.routing_key == "s.d1-ltn.ltn.bid.mm.d1-mm"
+    assert parse_routing_key(serial.routing_key) == serial
+
 
 def test_structural_arity_still_raises() -> None:
     # The tolerance is for class *values*, not key *shape* — arity/structure
@@ -133,3 +162,5 @@ def test_structural_arity_still_raises() -> None:
         parse_routing_key("rjb.d1-source.scada")  # broadcast: 3 tokens
     with pytest.raises(ValueError, match="6 words"):
         parse_routing_key("rj.d1-source.scada.report-event.scada")  # direct: 5 tokens
+    with pytest.raises(ValueError, match="6 words"):
+        parse_routing_key("s.d1-source.scada.report-event.scada")  # serial: 5 tokens
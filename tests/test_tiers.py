@@ -16,6 +16,7 @@ top-to-bottom as a tour of the new capability.
 import json
 import uuid
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -141,6 +142,39 @@ def test_orchestrator_class_routes_without_a_gnode_file() -> None:
     assert not hasattr(orch, "g_node_id")  # still not a GNode
 
 
+class _RecordingOrch(_Orch):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.processed: list[bytes] = []
+
+    def process_message(self, *, envelope, body) -> None:
+        self.processed.append(body)
+
+
+def test_control_plane_body_needs_a_type_name() -> None:
+    """The fast control-plane decode accepts only what the codec accepts: a
+    heartbeat.a body without TypeName is dropped, not surfaced."""
+    orch = _RecordingOrch(
+        settings=ServiceSettings(service_alias="d1.super"),
+        transport_class=TransportClass.Supervisor,
+        my_super_alias="d1.super.parent",
+        my_time_coordinator_alias="d1.time",
+    )
+    envelope = DirectRoutingEnvelope.from_classes(
+        type_name="heartbeat.a",
+        from_alias="d1.sub",  # not the supervisor: surfaced to the app
+        from_class=TransportClass.Scada,
+        to_class=TransportClass.Supervisor,
+        to_alias="d1.super",
+    )
+    for body in [b'{"MyHex":"a","YourLastHex":"3"}', b'{"MyHex":"a","Version":"000"}']:
+        orch.dispatch_message(envelope=envelope, body=body)
+    assert orch.processed == []
+    ping = b'{"TypeName":"heartbeat.a","Version":"000","MyHex":"a"}'
+    orch.dispatch_message(envelope=envelope, body=ping)
+    assert orch.processed == [ping]
+
+
 # --- Tier 3: GridworksActor validates GNode identity at the boundary ------
 
 
@@ -2,12 +2,14 @@
 
 import json
 import uuid
+from typing import Any
 
 import pytest
 
+from gwbase.sema import GwBaseSemaError
 from gwbase.sema.types import HeartbeatA
 from gwbase.sema.types.gridworks_header import GridworksHeader
-from gwbase.sema.wrapped import unwrap_bytes, wrap_bytes
+from gwbase.sema.wrapped import unwrap_bytes, unwrap_view, wrap_bytes, wrap_encoded
 from gwbase.transport_encoding import (
     TransportClass,
     WrappedRoutingEnvelope,
@@ -121,6 +123,182 @@ def test_unwrap_rejects_header_payload_type_mismatch() -> None:
         unwrap_bytes(body)
 
 
+def _gw(**members: Any) -> dict[str, Any]:
+    header = GridworksHeader(
+        src="d1.a",
+        dst="d1.b",
+        message_type="heartbeat.a",
+        message_id=str(uuid.uuid4()),
+        ack_required=False,
+    )
+    return {
+        "TypeName": "gw",
+        "Header": header.to_dict(),
+        "Payload": HeartbeatA(my_hex="0").to_dict(),
+        **members,
+    }
+
+
+ODD_PAYLOAD = {
+    "TypeName": "heartbeat.a",
+    "Note": 'braces } ] { [ and "quotes" \\ in strings',
+    "Nested": {"A": [1, {"B": []}, "}"], "TypeName": "not.this.one"},
+    "N": -1.5e3,
+    "Flags": [True, False, None],
+}
+# accepted by the stdlib backend, but not by the scan
+BACKEND_ONLY_CASES = [
+    json.dumps(_gw(Extra=float("nan"))).encode(),
+    json.dumps(_gw(Extra=[float("inf"), float("-inf")])).encode(),
+    json.dumps(_gw(Payload={**ODD_PAYLOAD, "Note": "\ud800"})).encode(),
+    b"\xef\xbb\xbf" + json.dumps(_gw()).encode(),
+]
+VIEW_CASES = [
+    json.dumps(_gw()).encode(),
+    json.dumps(_gw(), separators=(",", ":")).encode(),
+    json.dumps(_gw(), indent=2).encode() + b"\n",
+    json.dumps({"Payload": ODD_PAYLOAD, **_gw(Payload=ODD_PAYLOAD)}).encode(),
+    json.dumps(_gw(Extra={"Payload": 1})).encode(),
+    json.dumps({k: _gw()[k] for k in ("Payload", "Header", "TypeName")}).encode(),
+    b'{"TypeName": "gw", "Payload": 1, ' + json.dumps(_gw()).encode()[1:],
+    b'{"TypeName": "\\u0067w", ' + json.dumps(_gw()).encode()[19:],
+    json.dumps(
+        _gw(Header={**_gw()["Header"], "Dst": {"Payload": {"TypeName": "x"}}})
+    ).encode(),
+    json.dumps(_gw()).encode()[:-1]
+    + b', "Payload": '
+    + json.dumps(ODD_PAYLOAD).encode()
+    + b"}",
+    *BACKEND_ONLY_CASES,
+    # rejected by both
+    json.dumps(_gw(TypeName="gw2")).encode(),
+    json.dumps(_gw(Payload=[1])).encode(),
+    json.dumps(_gw(Payload={"TypeName": "other"})).encode(),
+    json.dumps({"TypeName": "gw", "Header": _gw()["Header"]}).encode(),
+    json.dumps(_gw()).encode() + b" {}",
+    json.dumps(_gw()).encode().replace(b"}}", b"},}"),
+    json.dumps(_gw()).encode().replace(b'"Header"', b'"Header" 1'),
+    *(
+        json.dumps(_gw()).encode()[:-1] + member + b"}"
+        for member in [
+            b', "X": [1,,2]',
+            b', "X": 1..2',
+            b', "X": {"a" 1}',
+            b', "X": "\x01"',
+            b', "\x01": 1',
+            b', "\xff": 1',
+            b', "Header": [1,,2], "Header": {}',
+        ]
+    ),
+    b'{"Payload": 1..2, ' + json.dumps(_gw()).encode()[1:],
+    b"[]",
+    b"",
+]
+
+
+def _outcome(unwrap: Any, body: bytes) -> Any:
+    try:
+        header, payload = unwrap(body)
+    except (ValueError, GwBaseSemaError) as e:
+        return type(e)
+    return header, json.loads(bytes(payload)) if isinstance(
+        payload, memoryview
+    ) else payload
+
+
+@pytest.mark.parametrize("body", VIEW_CASES)
+def test_unwrap_view_agrees_with_unwrap_bytes(body: bytes) -> None:
+    assert _outcome(unwrap_view, body) == _outcome(unwrap_bytes, body)
+
+
+@pytest.mark.parametrize("body", BACKEND_ONLY_CASES)
+def test_unwrap_view_takes_what_only_the_backend_accepts(body: bytes) -> None:
+    header, payload = unwrap_view(body)
+    assert (header, json.loads(bytes(payload))) == unwrap_bytes(body)
+
+
+def test_unwrap_view_rejects_every_truncation() -> None:
+    body = json.dumps(_gw(Payload=ODD_PAYLOAD)).encode()
+    for n in range(len(body)):
+        with pytest.raises(ValueError):
+            unwrap_view(body[:n])
+
+
+def test_unwrap_view_payload_is_a_slice_of_the_body() -> None:
+    inner = HeartbeatA(my_hex="0", your_last_hex="a")
+    body = wrap_bytes(
+        src="d1.a",
+        dst="d1.b",
+        inner_type_name=inner.type_name,
+        inner_payload_dict=inner.to_dict(),
+    )
+    header, payload = unwrap_view(body)
+    assert payload.obj is body
+    assert header == unwrap_bytes(body)[0]
+    assert HeartbeatA.from_bytes(bytes(payload)) == inner
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        json.dumps(_gw()).encode().replace(b'"MyHex": "0"', b'"MyHex" "0"'),
+        json.dumps(_gw(Extra=1)).encode().replace(b'"MyHex": "0"', b'"MyHex" "0"'),
+    ],
+)
+def test_unwrap_view_rejects_an_invalid_payload(body: bytes) -> None:
+    for unwrap in (unwrap_bytes, unwrap_view):
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            unwrap(body)
+
+
+@pytest.mark.parametrize("ack_required", [False, True])
+def test_wrap_encoded_matches_wrap_bytes(ack_required: bool) -> None:
+    message_id = str(uuid.uuid4())
+    common: dict[str, Any] = {
+        "src": "d1.a",
+        "dst": "d1.b",
+        "inner_type_name": "heartbeat.a",
+        "message_id": message_id,
+        "ack_required": ack_required,
+    }
+    for payload in (HeartbeatA(my_hex="0").to_dict(), ODD_PAYLOAD):
+        assert wrap_encoded(
+            inner_bytes=json.dumps(payload).encode(), **common
+        ) == wrap_bytes(inner_payload_dict=payload, **common)
+
+
+def test_wrap_encoded_relays_a_payload_unchanged() -> None:
+    inner = HeartbeatA(my_hex="0", your_last_hex="a")
+    body = wrap_encoded(
+        src="d1.a",
+        dst="d1.b",
+        inner_type_name=inner.type_name,
+        inner_bytes=inner.to_bytes(),
+    )
+    header, payload = unwrap_view(body)
+    relayed = wrap_encoded(
+        src="d1.b", dst="d1.c", inner_type_name=inner.type_name, inner_bytes=payload
+    )
+    relayed_header, relayed_payload = unwrap_view(relayed)
+    assert bytes(relayed_payload) == inner.to_bytes()
+    assert (relayed_header.src, relayed_header.dst) == ("d1.b", "d1.c")
+    assert relayed_header.message_id != header.message_id
+    assert unwrap_bytes(relayed)[1] == inner.to_dict()
+
+
+@pytest.mark.parametrize(
+    "inner_bytes", [b'{"TypeName": "other"}', b'{"Version": "000"}', b"[]", b"{"]
+)
+def test_wrap_encoded_rejects_payload_typename_mismatch(inner_bytes: bytes) -> None:
+    with pytest.raises(ValueError):
+        wrap_encoded(
+            src="d1.a",
+            dst="d1.b",
+            inner_type_name="heartbeat.a",
+            inner_bytes=inner_bytes,
+        )
+
+
 def test_wrapped_routing_envelope_rejects_gw_as_type_name() -> None:
     with pytest.raises(ValueError, match="must be the inner type"):
         WrappedRoutingEnvelope.from_classes(